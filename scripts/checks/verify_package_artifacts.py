@@ -12,7 +12,7 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DIST_DIR = REPO_ROOT / "dist"
 PYPROJECT_PATH = REPO_ROOT / "pyproject.toml"
-EXPECTED_ENTRYPOINT = "mealplan = mealplan.cli.main:main"
+EXPECTED_ENTRYPOINT = "mealplan = mealplan.cli.client:main"
 
 
 def _read_project_metadata() -> tuple[str, str]:
@@ -1,6 +1,6 @@
 """Allow running the CLI with ``python -m mealplan``."""
 
-from mealplan.cli.main import main
+from mealplan.cli.client import main
 
 if __name__ == "__main__":
     main()
@@ -1,13 +1,48 @@
-"""Application layer for mealplan."""
+"""Application layer for mealplan.
 
-from mealplan.application.orchestration import (
-    MealPlanCalculationService,
-    validate_meal_plan_flow,
-    validate_response_invariants,
-)
+Public names are re-exported lazily (PEP 562), so importing one submodule such as
+``mealplan.application.contract_types`` does not load the pydantic contracts.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mealplan.application.orchestration import (
+        MealPlanCalculationService,
+        ValidatedMealPlanRequest,
+        validate_meal_plan_flow,
+        validate_meal_plan_request,
+        validate_response_invariants,
+    )
+
+_EXPORTS: dict[str, str] = {
+    "MealPlanCalculationService": "mealplan.application.orchestration",
+    "ValidatedMealPlanRequest": "mealplan.application.orchestration",
+    "validate_meal_plan_flow": "mealplan.application.orchestration",
+    "validate_meal_plan_request": "mealplan.application.orchestration",
+    "validate_response_invariants": "mealplan.application.orchestration",
+}
 
 __all__ = [
     "MealPlanCalculationService",
+    "ValidatedMealPlanRequest",
     "validate_meal_plan_flow",
+    "validate_meal_plan_request",
     "validate_response_invariants",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
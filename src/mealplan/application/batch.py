@@ -0,0 +1,64 @@
+"""Streaming batch orchestration for newline-delimited meal plan requests."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from mealplan.application.contracts import MealPlanRequest
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.application.parsing import parse_contract
+from mealplan.application.stage_timer import DISABLED_STAGE_TIMER
+from mealplan.shared.errors import MealPlanError, ValidationError
+
+
+@dataclass(frozen=True, slots=True)
+class BatchRecord:
+    """Serialized response JSON and non-fatal warnings for one batch input line.
+
+    Responses are serialized where they are calculated, so records stay cheap to
+    pass between processes and every executor emits byte-identical output.
+    """
+
+    line_number: int
+    response_json: str
+    warnings: tuple[str, ...]
+
+
+def iter_batch_records(
+    lines: Iterable[str],
+    service: MealPlanCalculationService,
+    *,
+    first_line_number: int = 1,
+) -> Iterator[BatchRecord]:
+    """Yield one calculated record per non-blank NDJSON request line.
+
+    Contract:
+    - Consumes ``lines`` lazily, so memory stays bounded by a single request.
+    - Reuses the supplied ``service`` for every line.
+    - Stops at the first failing line and re-raises the same error class with a
+      ``line <n>:`` prefix so CLI exit-code mapping is preserved.
+    - JSON decoding plus contract parsing and response serialization are timed as
+      the ``parse`` and ``render`` stages on the service's ``stage_timer``.
+    """
+    timer = getattr(service, "stage_timer", DISABLED_STAGE_TIMER)
+    for line_number, line in enumerate(lines, start=first_line_number):
+        if not line.strip():
+            continue
+        try:
+            with timer.stage("parse"):
+                payload = json.loads(line)
+                request = parse_contract(MealPlanRequest, payload)
+            response = service.calculate(request)
+        except json.JSONDecodeError as error:
+            raise ValidationError(f"line {line_number}: invalid JSON: {error.msg}") from error
+        except MealPlanError as error:
+            raise type(error)(f"line {line_number}: {error}") from error
+        with timer.stage("render"):
+            response_json = response.model_dump_json()
+        yield BatchRecord(
+            line_number=line_number,
+            response_json=response_json,
+            warnings=tuple(getattr(service, "warnings", ())),
+        )
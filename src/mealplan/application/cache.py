@@ -0,0 +1,195 @@
+"""Result caching in front of ``MealPlanCalculationService``."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Protocol, cast
+
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
+from mealplan.application.orchestration import (
+    MealPlanCalculationService,
+    ValidatedMealPlanRequest,
+)
+from mealplan.application.validation import normalize_training_zones
+
+DEFAULT_CACHE_ENTRIES = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResult:
+    """A calculated response together with the warnings emitted while computing it."""
+
+    response: MealPlanResponse
+    warnings: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Point-in-time cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_entries: int
+
+
+class ResultCache(Protocol):
+    """Storage used by ``CachingCalculationService``, keyed by ``request_fingerprint``."""
+
+    def get(self, key: str) -> CachedResult | None: ...
+
+    def put(self, key: str, result: CachedResult) -> None: ...
+
+    def stats(self) -> CacheStats: ...
+
+    def close(self) -> None: ...
+
+
+def request_fingerprint(request: MealPlanRequest) -> str:
+    """Return a stable hex fingerprint of everything that influences the calculation.
+
+    Contract:
+    - Requests that the service treats identically fingerprint identically: zone
+      keys and omitted zones are normalized with ``normalize_training_zones`` and
+      a missing ``training_session`` equals all-zero zones with no training meal.
+    - ``vo2max=None`` is encoded explicitly, so it never collides with a value.
+    - Raises ``ValidationError`` for zones the service would also reject.
+    """
+    session = request.training_session
+    zones = (
+        normalize_training_zones(cast(dict[int | str, object], session.zones_minutes))
+        if session is not None
+        else dict.fromkeys(range(1, 6), 0)
+    )
+    training_before_meal = None if session is None else session.training_before_meal
+    return _fingerprint(request, zones, training_before_meal)
+
+
+def validated_request_fingerprint(validated: ValidatedMealPlanRequest) -> str:
+    """Return ``request_fingerprint`` from the zones normalized during validation."""
+    session = validated.training_session
+    return _fingerprint(validated.request, session.zones_minutes, session.training_before_meal)
+
+
+def _fingerprint(
+    request: MealPlanRequest,
+    zones: dict[int, int],
+    training_before_meal: object,
+) -> str:
+    canonical = [
+        request.age,
+        request.gender.value,
+        request.height_cm,
+        request.weight_kg,
+        request.vo2max,
+        request.activity_level.value,
+        request.carb_mode.value,
+        request.training_load_tomorrow.value,
+        [zones[zone] for zone in range(1, 6)],
+        None if training_before_meal is None else str(training_before_meal),
+    ]
+    encoded = json.dumps(canonical, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class LruResultCache:
+    """Bounded, thread-safe least-recently-used result cache.
+
+    Contract:
+    - Holds at most ``max_entries`` results; inserting beyond that evicts the
+      least recently read or written entry.
+    - All operations take one lock, so a single cache can back services used
+      from several threads.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than or equal to 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> CachedResult | None:
+        """Return the cached result for ``key`` and mark it most recently used."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(self, key: str, result: CachedResult) -> None:
+        """Store ``result`` under ``key``, evicting the oldest entry when full."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        """Return current hit/miss/eviction counters and occupancy."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Release resources; an in-memory cache holds none."""
+
+
+class CachingCalculationService(MealPlanCalculationService):
+    """``MealPlanCalculationService`` that memoizes results by request fingerprint.
+
+    Contract:
+    - Hits return the cached response and restore its warnings on ``self.warnings``,
+      exactly as a fresh calculation would have left them.
+    - Cached responses are shared between hits and must be treated as read-only.
+    - Requests are validated before lookup, so invalid requests raise the canonical
+      error on every call and are never cached.
+    - ``warnings`` is per-instance state, so concurrent callers should use one
+      service each and share the ``cache``.
+    """
+
+    def __init__(
+        self,
+        cache: ResultCache | None = None,
+        *,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+    ) -> None:
+        super().__init__()
+        self.cache: ResultCache = cache if cache is not None else LruResultCache(max_entries)
+
+    def calculate_validated(self, validated: ValidatedMealPlanRequest) -> MealPlanResponse:
+        """Return the cached result for ``validated`` or calculate and cache it."""
+        key = validated_request_fingerprint(validated)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.warnings = cached.warnings
+            return cached.response
+        response = super().calculate_validated(validated)
+        self.cache.put(key, CachedResult(response=response, warnings=self.warnings))
+        return response
+
+    def close(self) -> None:
+        """Close the underlying cache (persisting counters for on-disk caches)."""
+        self.cache.close()
@@ -0,0 +1,119 @@
+"""Columnar batch orchestration over vectorized roster chunks."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+import numpy as np
+
+from mealplan.domain.vectorized import (
+    CARB_STRATEGY_CODES,
+    MEAL_COLUMN_ORDER,
+    MealPlanColumns,
+    ProfileColumns,
+    calculate_many,
+)
+
+# Field order and separators match ``MealPlanResponse.model_dump_json``; ``repr`` of a
+# float is the same shortest round-trip form pydantic emits.
+_MEAL_PREFIXES = tuple(
+    f'{{"meal":"{meal}","carbs_strategy":"{strategy.value}","carbs_g":'
+    for meal in MEAL_COLUMN_ORDER
+    for strategy in CARB_STRATEGY_CODES
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnarChunk:
+    """Calculated meal plans for one roster chunk starting at global row ``first_row``."""
+
+    first_row: int
+    result: MealPlanColumns
+
+    def iter_warnings(self) -> Iterator[tuple[int, str]]:
+        """Yield ``(global_row, warning)`` pairs in row order."""
+        for row in sorted(self.result.warnings):
+            for warning in self.result.warnings[row]:
+                yield self.first_row + row, warning
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnarRecord:
+    """Serialized response JSON and non-fatal warnings for one roster row."""
+
+    row: int
+    response_json: str
+    warnings: tuple[str, ...]
+
+
+def iter_calculated_chunks(chunks: Iterable[ProfileColumns]) -> Iterator[ColumnarChunk]:
+    """Calculate each roster chunk with ``calculate_many`` in input order.
+
+    Contract:
+    - Consumes ``chunks`` lazily, so memory stays bounded by a single chunk.
+    - Rows are numbered globally from zero across chunks.
+    - Stops at the first failing row with the scalar error class and a
+      ``row <n>:`` prefix, like ``iter_batch_records`` does for lines.
+    """
+    first_row = 0
+    for columns in chunks:
+        result = calculate_many(columns, first_row=first_row)
+        yield ColumnarChunk(first_row=first_row, result=result)
+        first_row += columns.row_count
+
+
+def iter_chunk_records(chunk: ColumnarChunk) -> Iterator[ColumnarRecord]:
+    """Yield one NDJSON-ready record per row, byte-identical to ``model_dump_json``."""
+    result = chunk.result
+    for row, response_json in enumerate(render_response_json(result)):
+        yield ColumnarRecord(
+            row=chunk.first_row + row,
+            response_json=response_json,
+            warnings=result.warnings.get(row, ()),
+        )
+
+
+def render_response_json(result: MealPlanColumns) -> list[str]:
+    """Render every row of ``result`` as compact ``MealPlanResponse`` JSON.
+
+    Columns are converted to Python floats once per chunk and formatted with
+    fixed templates, avoiding a payload dict and a ``json.dumps`` call per row.
+    """
+    order, emitted = result.response_meal_order()
+    meal_rows, _ = np.nonzero(emitted)
+    meal_columns = order[emitted]
+    prefix_indexes = (
+        meal_columns * len(CARB_STRATEGY_CODES)
+        + result.meal_carbs_strategy[meal_rows, meal_columns]
+    )
+    meal_fragments = [
+        f'{_MEAL_PREFIXES[prefix]}{carbs!r},"protein_g":{protein!r},"fat_g":{fat!r},'
+        f'"kcal":{kcal!r}}}'
+        for prefix, carbs, protein, fat, kcal in zip(
+            prefix_indexes.tolist(),
+            result.meal_carbs_g[meal_rows, meal_columns].tolist(),
+            result.meal_protein_g[meal_rows, meal_columns].tolist(),
+            result.meal_fat_g[meal_rows, meal_columns].tolist(),
+            result.meal_kcal[meal_rows, meal_columns].tolist(),
+            strict=True,
+        )
+    ]
+    meal_ends = np.cumsum(emitted.sum(axis=1)).tolist()
+    meal_starts = [0, *meal_ends[:-1]]
+    return [
+        f'{{"TDEE":{tdee!r},"training_kcal":{training!r},"protein_g":{protein!r},'
+        f'"carbs_g":{carbs!r},"fat_g":{fat!r},"total_kcal":{total!r},'
+        f'"meals":[{",".join(meal_fragments[start:end])}]}}'
+        for tdee, training, protein, carbs, fat, total, start, end in zip(
+            result.tdee_kcal.tolist(),
+            result.training_kcal.tolist(),
+            result.protein_g.tolist(),
+            result.carbs_g.tolist(),
+            result.fat_g.tolist(),
+            result.total_kcal.tolist(),
+            meal_starts,
+            meal_ends,
+            strict=True,
+        )
+    ]
@@ -0,0 +1,15 @@
+"""Literal types shared by the boundary contracts, importable without pydantic.
+
+The CLI resolves command annotations such as ``SimulatedErrorKind`` while building
+``--help``, so they live here rather than in ``contracts``.
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from mealplan.domain.enums import MealName
+
+SimulatedErrorKind = Literal["validation", "domain", "config", "output", "runtime"]
+TrainingZoneKey = Literal["1", "2", "3", "4", "5"]
+TrainingBeforeMeal = MealName | Literal["training"]
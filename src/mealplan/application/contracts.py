@@ -5,8 +5,21 @@ from __future__ import annotations
 from collections import Counter
 from typing import Final, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StrictFloat,
+    StrictInt,
+    ValidationInfo,
+    model_validator,
+)
 
+from mealplan.application.contract_types import (
+    SimulatedErrorKind,
+    TrainingBeforeMeal,
+    TrainingZoneKey,
+)
 from mealplan.domain.enums import (
     ActivityLevel,
     CarbMode,
@@ -17,9 +30,10 @@ from mealplan.domain.enums import (
 )
 from mealplan.domain.model import CANONICAL_MEAL_ORDER
 
-SimulatedErrorKind = Literal["validation", "domain", "config", "output", "runtime"]
-TrainingZoneKey = Literal["1", "2", "3", "4", "5"]
-TrainingBeforeMeal = MealName | Literal["training"]
+# Validation context key marking engine-built responses, whose meal order and meal kcal
+# sum hold by construction; those model validators are skipped (field types are still
+# checked). ``total_kcal == TDEE + training_kcal`` depends on rounding and is always checked.
+TRUSTED_ENGINE_OUTPUT: Final = "trusted_engine_output"
 CONTRACT_UNITS_POLICY: Final[dict[str, str]] = {
     "age": "years",
     "height_cm": "cm",
@@ -102,8 +116,10 @@ class MealPlanResponse(BoundaryModel):
     meals: list[MealAllocation]
 
     @model_validator(mode="after")
-    def _ensure_canonical_meal_order(self) -> MealPlanResponse:
+    def _ensure_canonical_meal_order(self, info: ValidationInfo) -> MealPlanResponse:
         """Require canonical order plus optional single training meal."""
+        if _is_trusted_engine_output(info):
+            return self
         meal_sequence = [entry.meal for entry in self.meals]
         counts = Counter(meal_sequence)
         training_count = counts["training"]
@@ -116,19 +132,48 @@ class MealPlanResponse(BoundaryModel):
         return self
 
     @model_validator(mode="after")
-    def _ensure_total_kcal_matches_meal_sum(self) -> MealPlanResponse:
+    def _ensure_total_kcal_matches_meal_sum(self, info: ValidationInfo) -> MealPlanResponse:
+        if _is_trusted_engine_output(info):
+            return self
         displayed_total = round(sum(entry.kcal for entry in self.meals), 2)
         if round(self.total_kcal, 2) != displayed_total:
             raise ValueError("total_kcal must equal sum(meals[*].kcal)")
         return self
 
     @model_validator(mode="after")
-    def _ensure_total_kcal_matches_tdee_plus_training(self) -> MealPlanResponse:
+    def _ensure_total_kcal_matches_tdee_plus_training(
+        self, info: ValidationInfo
+    ) -> MealPlanResponse:
+        # Runs for trusted engine output too: rounded meal kcal can miss the rounded
+        # day total, and ``calculate_many`` rejects the same rows.
         expected_total = round(self.TDEE + self.training_kcal, 2)
         if round(self.total_kcal, 2) != expected_total:
             raise ValueError("total_kcal must equal TDEE + training_kcal")
         return self
 
+    @classmethod
+    def from_engine_payload(cls, payload: object) -> MealPlanResponse:
+        """Build a response from domain assembly output, skipping the structural validators.
+
+        Contract:
+        - ``payload`` must come from the domain assembly stage, whose meal order and
+          meal kcal sum are correct by construction; other input must use
+          ``model_validate``.
+        - Field types and shape are still checked, and so is ``total_kcal == TDEE +
+          training_kcal``, which rounding can break. The result equals
+          ``model_validate(payload)``.
+        """
+        return cls.model_validate(payload, context={TRUSTED_ENGINE_OUTPUT: True})
+
+    @classmethod
+    def from_engine_json(cls, data: str | bytes) -> MealPlanResponse:
+        """Decode ``model_dump_json`` output of a trusted response, as ``from_engine_payload``.
+
+        Result caches store only engine-built responses, so a stored entry always
+        reads back exactly as it was written.
+        """
+        return cls.model_validate_json(data, context={TRUSTED_ENGINE_OUTPUT: True})
+
     @classmethod
     def placeholder(cls) -> MealPlanResponse:
         """Build a zeroed response shape usable before calculation phases are implemented."""
@@ -153,6 +198,10 @@ class MealPlanResponse(BoundaryModel):
         )
 
 
+def _is_trusted_engine_output(info: ValidationInfo) -> bool:
+    return bool(info.context and info.context.get(TRUSTED_ENGINE_OUTPUT))
+
+
 class ProbeRequest(BoundaryModel):
     """Placeholder probe request payload for CLI-to-application boundary."""
 
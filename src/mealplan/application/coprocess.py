@@ -0,0 +1,84 @@
+"""Line-delimited request/response protocol for long-lived embedded workers."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TextIO
+
+from mealplan.application.contracts import MealPlanRequest
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.application.parsing import parse_contract
+from mealplan.shared.errors import ValidationError
+from mealplan.shared.exit_codes import ExitCode, map_exception_to_exit_code
+
+
+@dataclass(frozen=True, slots=True)
+class Envelope:
+    """Serialized reply envelope plus the exit code classifying its outcome."""
+
+    body: str
+    exit_code: ExitCode
+
+
+def calculate_envelope(text: str, service: MealPlanCalculationService) -> Envelope:
+    """Calculate one JSON request document and wrap the outcome in an envelope.
+
+    Contract:
+    - The envelope is ``{"response": ..., "warnings": [...], "error": ...}``.
+    - On success ``response`` is the ``MealPlanResponse`` payload and ``error`` is ``null``.
+    - On failure ``response`` is ``null`` and ``error`` is
+      ``{"message": str, "exit_code": int}``, mapped exactly like CLI exit codes.
+    - Failures never escape, so one bad request cannot end a long-lived worker.
+    """
+    try:
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError as error:
+            raise ValidationError(f"invalid JSON: {error.msg}") from error
+        request = parse_contract(MealPlanRequest, payload)
+        response_json = service.calculate(request).model_dump_json()
+    except Exception as error:  # noqa: BLE001
+        exit_code = map_exception_to_exit_code(error)
+        return Envelope(body=error_envelope(str(error), exit_code), exit_code=exit_code)
+    warnings = _compact_json(list(getattr(service, "warnings", ())))
+    # The response is already canonical JSON, so it is spliced in rather than re-encoded.
+    return Envelope(
+        body=f'{{"response":{response_json},"warnings":{warnings},"error":null}}',
+        exit_code=ExitCode.SUCCESS,
+    )
+
+
+def error_envelope(message: str, exit_code: ExitCode) -> str:
+    """Serialize a failure envelope carrying ``message`` and ``exit_code``."""
+    failure = _compact_json({"message": message, "exit_code": int(exit_code)})
+    return f'{{"response":null,"warnings":[],"error":{failure}}}'
+
+
+def handle_coprocess_line(line: str, service: MealPlanCalculationService) -> str:
+    """Calculate one request line and return its JSON envelope (without a newline)."""
+    return calculate_envelope(line, service).body
+
+
+def run_coprocess(
+    lines: Iterable[str],
+    output: TextIO,
+    service: MealPlanCalculationService,
+) -> None:
+    """Answer each non-blank request line with one envelope line, flushing after every reply.
+
+    Contract:
+    - Replies are written in request order, exactly one per non-blank input line.
+    - Returns when ``lines`` is exhausted (the parent closed the worker's stdin).
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        output.write(handle_coprocess_line(line, service))
+        output.write("\n")
+        output.flush()
+
+
+def _compact_json(value: object) -> str:
+    return json.dumps(value, separators=(",", ":"))
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import cast
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Any, cast
 
-from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse, TrainingSession
 from mealplan.application.parsing import parse_contract
-from mealplan.application.validation import normalize_training_zones, validate_semantic_input
-from mealplan.domain.enums import CarbMode, Gender, MealName, TrainingLoadTomorrow
+from mealplan.application.scenarios import ScenarioAxes, ScenarioComparison, ScenarioResult
+from mealplan.application.stage_timer import DISABLED_STAGE_TIMER, StageTimer
+from mealplan.application.validation import (
+    normalize_training_zones,
+    validate_semantic_input,
+    validated_training_zones,
+)
+from mealplan.domain.enums import CarbMode, CarbStrategy, Gender, MealName, TrainingLoadTomorrow
 from mealplan.domain.model import MacroTargets, MealAllocation, UserProfile
 from mealplan.domain.services import (
+    MealAssemblyResult,
+    calculate_carb_strategy_by_meal,
     calculate_macro_targets,
     calculate_meal_split_and_response_payload_with_warnings,
     calculate_periodized_carb_allocation,
@@ -23,6 +33,8 @@ from mealplan.domain.validation import (
     validate_macro_targets_invariants,
     validate_meal_allocation_invariants,
 )
+from mealplan.shared.checks import paranoid_checks_enabled
+from mealplan.shared.errors import DomainRuleError
 
 
 @dataclass(frozen=True, slots=True)
@@ -33,6 +45,18 @@ class ValidatedTrainingSession:
     training_before_meal: MealName | None
 
 
+@dataclass(frozen=True, slots=True)
+class ValidatedMealPlanRequest:
+    """A request that passed schema and semantic validation, with its normalized session.
+
+    Build it with ``validate_meal_plan_request``; ``calculate_validated`` trusts it
+    and runs no further input validation.
+    """
+
+    request: MealPlanRequest
+    training_session: ValidatedTrainingSession
+
+
 @dataclass(frozen=True, slots=True)
 class TrainingDemandContext:
     """Athlete context required by the training-demand stage."""
@@ -44,6 +68,72 @@ class TrainingDemandContext:
     zones_minutes: dict[int, int]
 
 
+@dataclass(frozen=True, slots=True)
+class StageNode:
+    """One memoized stage of the meal-plan dependency graph.
+
+    ``inputs`` are the request inputs the stage reads and ``dependencies`` the
+    upstream stages whose outputs it consumes; ``output`` names the
+    ``MealPlanComputation`` field holding its result.
+    """
+
+    name: str
+    output: str
+    inputs: tuple[str, ...]
+    dependencies: tuple[str, ...] = ()
+
+
+_PROFILE_INPUTS = ("age", "gender", "height_cm", "weight_kg", "activity_level")
+
+# Stages in topological order. ``zones_minutes`` and ``training_before_meal`` are
+# read from the normalized training session, every other input from the request.
+MEAL_PLAN_STAGE_GRAPH: tuple[StageNode, ...] = (
+    StageNode("energy", "tdee_kcal", _PROFILE_INPUTS),
+    StageNode("macro", "macro_targets", (*_PROFILE_INPUTS, "carb_mode"), ("energy",)),
+    StageNode("fueling", "training_carbs_g", ("zones_minutes",)),
+    StageNode(
+        "training_demand",
+        "training_calorie_demand_kcal",
+        ("age", "gender", "weight_kg", "vo2max", "zones_minutes"),
+    ),
+    StageNode(
+        "carb_strategy",
+        "carbs_strategy_by_meal",
+        ("carb_mode", "training_before_meal", "training_load_tomorrow"),
+    ),
+    StageNode(
+        "assembly",
+        "response",
+        ("training_before_meal",),
+        ("energy", "macro", "fueling", "training_demand", "carb_strategy"),
+    ),
+)
+# Stages another stage consumes; only their outputs are compared for early cutoff.
+_UPSTREAM_STAGES = frozenset(
+    dependency for node in MEAL_PLAN_STAGE_GRAPH for dependency in node.dependencies
+)
+
+
+@dataclass(frozen=True, slots=True)
+class MealPlanComputation:
+    """Handle to one calculation with the memoized output of every stage.
+
+    Pass it to ``MealPlanCalculationService.recalculate`` with a request delta
+    to rerun only the stages whose inputs changed.
+    """
+
+    validated: ValidatedMealPlanRequest
+    inputs: dict[str, object]
+    tdee_kcal: float
+    macro_targets: MacroTargets
+    training_carbs_g: float
+    training_calorie_demand_kcal: float
+    carbs_strategy_by_meal: dict[MealName, CarbStrategy]
+    response: MealPlanResponse
+    warnings: tuple[str, ...]
+    recomputed_stages: tuple[str, ...]
+
+
 class MealPlanCalculationService:
     """Canonical application orchestration boundary for meal plan calculation.
 
@@ -54,35 +144,232 @@ class MealPlanCalculationService:
 
     def __init__(self) -> None:
         self.warnings: tuple[str, ...] = ()
+        # Replace with an enabled ``StageTimer`` to time validation and each stage.
+        self.stage_timer: StageTimer = DISABLED_STAGE_TIMER
 
     def calculate(self, request: MealPlanRequest) -> MealPlanResponse:
-        """Run deterministic meal-plan calculation for a validated request."""
+        """Validate ``request`` once and run deterministic meal-plan calculation."""
+        with self.stage_timer.stage("validate"):
+            validated = validate_meal_plan_request(request)
+        return self.calculate_validated(validated)
+
+    def calculate_validated(self, validated: ValidatedMealPlanRequest) -> MealPlanResponse:
+        """Run deterministic meal-plan calculation for an already validated request."""
         self.warnings = ()
-        validated_request = validate_meal_plan_flow(
-            request_payload=request,
-            response=MealPlanResponse.placeholder(),
-        )
-        training_session = _validated_training_session(validated_request)
-
-        tdee_kcal = self._run_energy_stage(validated_request)
-        macro_targets = self._run_macro_stage(validated_request, tdee_kcal)
-        training_carbs_g = self._run_fueling_stage(training_session)
-        training_calorie_demand_kcal = self._run_training_demand_stage(
-            _training_demand_context(
-                request=validated_request,
-                training_session=training_session,
-            ),
+        request = validated.request
+        training_session = validated.training_session
+        timer = self.stage_timer
+
+        with timer.stage("energy"):
+            tdee_kcal = self._run_energy_stage(request)
+        with timer.stage("macro"):
+            macro_targets = self._run_macro_stage(request, tdee_kcal)
+        with timer.stage("fueling"):
+            training_carbs_g = self._run_fueling_stage(training_session)
+        with timer.stage("training_demand"):
+            training_calorie_demand_kcal = self._run_training_demand_stage(
+                _training_demand_context(
+                    request=request,
+                    training_session=training_session,
+                ),
+            )
+        with timer.stage("assembly"):
+            return self._run_assembly_stage(
+                tdee_kcal=tdee_kcal,
+                training_carbs_g=training_carbs_g,
+                training_calorie_demand_kcal=training_calorie_demand_kcal,
+                carb_mode=request.carb_mode,
+                training_before_meal=training_session.training_before_meal,
+                training_load_tomorrow=request.training_load_tomorrow,
+                macro_targets=macro_targets,
+            )
+
+    def calculate_incremental(self, request: MealPlanRequest) -> MealPlanComputation:
+        """Validate and calculate ``request``, keeping every stage output for reuse."""
+        with self.stage_timer.stage("validate"):
+            validated = validate_meal_plan_request(request)
+        return self._evaluate_stage_graph(validated, previous=None)
+
+    def recalculate(
+        self,
+        previous: MealPlanComputation,
+        delta: Mapping[str, object],
+    ) -> MealPlanComputation:
+        """Apply ``delta`` to the request behind ``previous`` and rerun only affected stages.
+
+        Contract:
+        - ``delta`` holds ``MealPlanRequest`` fields. A ``training_session`` mapping
+          is merged into the previous session, so ``{"training_session":
+          {"training_before_meal": "dinner"}}`` keeps the zone minutes.
+        - The updated request is validated in full and raises the same
+          ``ValidationError`` messages as ``calculate``.
+        - A stage reruns when one of its inputs changed or an upstream stage
+          produced a different output; every other stage output is reused. The
+          response equals ``calculate`` on the updated request.
+        """
+        with self.stage_timer.stage("validate"):
+            validated = validate_meal_plan_request(
+                _request_payload_with_delta(previous.validated.request, delta)
+            )
+        return self._evaluate_stage_graph(validated, previous=previous)
+
+    def stage_runner(self, name: str, computation: MealPlanComputation) -> Callable[[], object]:
+        """Return a call that reruns stage ``name`` on the memoized inputs of ``computation``.
+
+        Upstream outputs come from ``computation``, so the call measures one stage
+        of ``MEAL_PLAN_STAGE_GRAPH`` in isolation; it is not timed by ``stage_timer``.
+        """
+        if name not in {node.name for node in MEAL_PLAN_STAGE_GRAPH}:
+            raise ValueError(f"unknown stage {name}")
+        outputs = {node.output: getattr(computation, node.output) for node in MEAL_PLAN_STAGE_GRAPH}
+        return partial(self._run_stage_node, name, computation.validated, outputs)
+
+    def compare_scenarios(
+        self,
+        request: MealPlanRequest,
+        axes: ScenarioAxes,
+    ) -> ScenarioComparison:
+        """Calculate every scenario of ``axes`` for one athlete in a single pass.
+
+        Contract:
+        - ``request`` is validated once. Energy, fueling and training demand run
+          once, macro targets once per carb mode, and carb strategy once per
+          scenario.
+        - Assembly runs once per distinct carb strategy and training meal: a
+          scenario starts from the last one with the same carb mode and training
+          meal, so a training load that leaves the strategy unchanged reuses its
+          response.
+        - Each response equals ``calculate`` on the request with that scenario's
+          inputs. ``self.warnings`` holds the warnings of the last scenario.
+        - A scenario that breaks a domain rule gets ``response=None`` and the
+          ``DomainRuleError`` message as ``error``; the other scenarios still run.
+          Validation errors of ``request`` itself are raised.
+        """
+        with self.stage_timer.stage("validate"):
+            validated = validate_meal_plan_request(request)
+        by_carb_mode: dict[CarbMode, MealPlanComputation] = {}
+        by_training_meal: dict[tuple[CarbMode, MealName | None], MealPlanComputation] = {}
+        latest: MealPlanComputation | None = None
+        results: list[ScenarioResult] = []
+        for training_before_meal, carb_mode, training_load_tomorrow in axes.scenarios(
+            training_before_meal=validated.training_session.training_before_meal,
+            carb_mode=request.carb_mode,
+            training_load_tomorrow=request.training_load_tomorrow,
+        ):
+            try:
+                computation = self._evaluate_stage_graph(
+                    _scenario_request(
+                        validated,
+                        training_before_meal=training_before_meal,
+                        carb_mode=carb_mode,
+                        training_load_tomorrow=training_load_tomorrow,
+                    ),
+                    previous=by_training_meal.get(
+                        (carb_mode, training_before_meal), by_carb_mode.get(carb_mode, latest)
+                    ),
+                )
+            except DomainRuleError as error:
+                self.warnings = ()
+                results.append(
+                    ScenarioResult(
+                        training_before_meal=training_before_meal,
+                        carb_mode=carb_mode,
+                        training_load_tomorrow=training_load_tomorrow,
+                        response=None,
+                        warnings=(),
+                        error=str(error),
+                    )
+                )
+                continue
+            latest = computation
+            by_carb_mode.setdefault(carb_mode, computation)
+            by_training_meal[carb_mode, training_before_meal] = computation
+            results.append(
+                ScenarioResult(
+                    training_before_meal=training_before_meal,
+                    carb_mode=carb_mode,
+                    training_load_tomorrow=training_load_tomorrow,
+                    response=computation.response,
+                    warnings=computation.warnings,
+                )
+            )
+        return ScenarioComparison(results=tuple(results))
+
+    def _evaluate_stage_graph(
+        self,
+        validated: ValidatedMealPlanRequest,
+        *,
+        previous: MealPlanComputation | None,
+    ) -> MealPlanComputation:
+        inputs = _stage_graph_inputs(validated)
+        changed_inputs = (
+            set(inputs)
+            if previous is None
+            else {name for name, value in inputs.items() if previous.inputs[name] != value}
         )
-        return self._run_assembly_stage(
-            tdee_kcal=tdee_kcal,
-            training_carbs_g=training_carbs_g,
-            training_calorie_demand_kcal=training_calorie_demand_kcal,
-            carb_mode=validated_request.carb_mode,
-            training_before_meal=training_session.training_before_meal,
-            training_load_tomorrow=validated_request.training_load_tomorrow,
-            macro_targets=macro_targets,
+        outputs: dict[str, Any] = {}
+        changed_stages: set[str] = set()
+        recomputed: list[str] = []
+        warnings = () if previous is None else previous.warnings
+        for node in MEAL_PLAN_STAGE_GRAPH:
+            if (
+                previous is not None
+                and changed_inputs.isdisjoint(node.inputs)
+                and changed_stages.isdisjoint(node.dependencies)
+            ):
+                outputs[node.output] = getattr(previous, node.output)
+                continue
+            with self.stage_timer.stage(node.name):
+                outputs[node.output] = self._run_stage_node(node.name, validated, outputs)
+            recomputed.append(node.name)
+            if node.name == "assembly":
+                warnings = self.warnings
+            if node.name in _UPSTREAM_STAGES and (
+                previous is None or outputs[node.output] != getattr(previous, node.output)
+            ):
+                changed_stages.add(node.name)
+        self.warnings = warnings
+        return MealPlanComputation(
+            validated=validated,
+            inputs=inputs,
+            warnings=warnings,
+            recomputed_stages=tuple(recomputed),
+            **outputs,
         )
 
+    def _run_stage_node(
+        self,
+        name: str,
+        validated: ValidatedMealPlanRequest,
+        outputs: dict[str, Any],
+    ) -> object:
+        request = validated.request
+        training_session = validated.training_session
+        match name:
+            case "energy":
+                return self._run_energy_stage(request)
+            case "macro":
+                return self._run_macro_stage(request, outputs["tdee_kcal"])
+            case "fueling":
+                return self._run_fueling_stage(training_session)
+            case "training_demand":
+                return self._run_training_demand_stage(
+                    _training_demand_context(request=request, training_session=training_session)
+                )
+            case "carb_strategy":
+                return self._run_carb_strategy_stage(request, training_session)
+            case "assembly":
+                return self._run_strategy_assembly_stage(
+                    tdee_kcal=outputs["tdee_kcal"],
+                    training_carbs_g=outputs["training_carbs_g"],
+                    training_calorie_demand_kcal=outputs["training_calorie_demand_kcal"],
+                    request=request,
+                    training_before_meal=training_session.training_before_meal,
+                    carbs_strategy_by_meal=outputs["carbs_strategy_by_meal"],
+                    macro_targets=outputs["macro_targets"],
+                )
+        raise ValueError(f"unknown stage {name}")
+
     def _run_energy_stage(self, request: MealPlanRequest) -> float:
         """Return canonical TDEE using typed user-profile input."""
         profile = _user_profile_from_request(request)
@@ -133,6 +420,18 @@ class MealPlanCalculationService:
             training_load_tomorrow=request.training_load_tomorrow,
         )
 
+    def _run_carb_strategy_stage(
+        self,
+        request: MealPlanRequest,
+        training_session: ValidatedTrainingSession,
+    ) -> dict[MealName, CarbStrategy]:
+        """Return the carb strategy of each canonical meal for meal assembly."""
+        return calculate_carb_strategy_by_meal(
+            carb_mode=request.carb_mode,
+            training_before_meal=training_session.training_before_meal,
+            training_load_tomorrow=request.training_load_tomorrow,
+        )
+
     def _run_assembly_stage(
         self,
         *,
@@ -144,7 +443,11 @@ class MealPlanCalculationService:
         training_load_tomorrow: TrainingLoadTomorrow,
         macro_targets: MacroTargets,
     ) -> MealPlanResponse:
-        """Return validated response model from canonical meal assembly payload."""
+        """Return the response model for the canonical meal assembly payload.
+
+        The payload is trusted; paranoid mode re-validates it against the contract
+        and the domain invariants.
+        """
         assembly_result = calculate_meal_split_and_response_payload_with_warnings(
             tdee_kcal=tdee_kcal,
             training_carbs_g=training_carbs_g,
@@ -156,8 +459,41 @@ class MealPlanCalculationService:
             carbs_g=macro_targets.carbs_g,
             fat_g=macro_targets.fat_g,
         )
+        return self._assembly_response(assembly_result)
+
+    def _run_strategy_assembly_stage(
+        self,
+        *,
+        tdee_kcal: float,
+        training_carbs_g: float,
+        training_calorie_demand_kcal: float,
+        request: MealPlanRequest,
+        training_before_meal: MealName | None,
+        carbs_strategy_by_meal: dict[MealName, CarbStrategy],
+        macro_targets: MacroTargets,
+    ) -> MealPlanResponse:
+        """Return the assembly stage response for a precomputed carb strategy."""
+        assembly_result = calculate_meal_split_and_response_payload_with_warnings(
+            tdee_kcal=tdee_kcal,
+            training_carbs_g=training_carbs_g,
+            training_calorie_demand_kcal=training_calorie_demand_kcal,
+            carb_mode=request.carb_mode,
+            training_before_meal=training_before_meal,
+            training_load_tomorrow=request.training_load_tomorrow,
+            protein_g=macro_targets.protein_g,
+            carbs_g=macro_targets.carbs_g,
+            fat_g=macro_targets.fat_g,
+            carbs_strategy_by_meal=carbs_strategy_by_meal,
+        )
+        return self._assembly_response(assembly_result)
+
+    def _assembly_response(self, assembly_result: MealAssemblyResult) -> MealPlanResponse:
         self.warnings = assembly_result["warnings"]
-        return MealPlanResponse.model_validate(assembly_result["payload"])
+        if paranoid_checks_enabled():
+            response = MealPlanResponse.model_validate(assembly_result["payload"])
+            validate_response_invariants(response)
+            return response
+        return MealPlanResponse.from_engine_payload(assembly_result["payload"])
 
 
 def _validated_training_session(request: MealPlanRequest) -> ValidatedTrainingSession:
@@ -193,6 +529,63 @@ def _training_demand_context(
     )
 
 
+def _stage_graph_inputs(validated: ValidatedMealPlanRequest) -> dict[str, object]:
+    request = validated.request
+    training_session = validated.training_session
+    return {
+        "age": request.age,
+        "gender": request.gender,
+        "height_cm": request.height_cm,
+        "weight_kg": request.weight_kg,
+        "vo2max": request.vo2max,
+        "activity_level": request.activity_level,
+        "carb_mode": request.carb_mode,
+        "training_load_tomorrow": request.training_load_tomorrow,
+        "zones_minutes": _canonical_training_zones(training_session.zones_minutes),
+        "training_before_meal": training_session.training_before_meal,
+    }
+
+
+def _request_payload_with_delta(
+    request: MealPlanRequest,
+    delta: Mapping[str, object],
+) -> dict[str, object]:
+    payload = request.model_dump()
+    previous_session = payload["training_session"]
+    payload.update(delta)
+    session_delta = delta.get("training_session")
+    if isinstance(session_delta, Mapping) and previous_session is not None:
+        payload["training_session"] = {**previous_session, **session_delta}
+    return payload
+
+
+def _scenario_request(
+    validated: ValidatedMealPlanRequest,
+    *,
+    training_before_meal: MealName | None,
+    carb_mode: CarbMode,
+    training_load_tomorrow: TrainingLoadTomorrow,
+) -> ValidatedMealPlanRequest:
+    request = validated.request
+    update: dict[str, object] = {
+        "carb_mode": carb_mode,
+        "training_load_tomorrow": training_load_tomorrow,
+    }
+    training_session = validated.training_session
+    if training_before_meal != training_session.training_before_meal:
+        session = request.training_session
+        update["training_session"] = (
+            TrainingSession(zones_minutes={}, training_before_meal=training_before_meal)
+            if session is None
+            else session.model_copy(update={"training_before_meal": training_before_meal})
+        )
+        training_session = replace(training_session, training_before_meal=training_before_meal)
+    return ValidatedMealPlanRequest(
+        request=request.model_copy(update=update),
+        training_session=training_session,
+    )
+
+
 def _user_profile_from_request(request: MealPlanRequest) -> UserProfile:
     return UserProfile(
         age=request.age,
@@ -203,6 +596,32 @@ def _user_profile_from_request(request: MealPlanRequest) -> UserProfile:
     )
 
 
+def validate_meal_plan_request(request_payload: object) -> ValidatedMealPlanRequest:
+    """Parse and semantically validate a request once, normalizing its training zones.
+
+    Contract:
+    - ``MealPlanRequest`` instances are already schema-valid and are not re-parsed;
+      any other payload goes through ``parse_contract``.
+    - Raises the same ``ValidationError`` messages as ``validate_meal_plan_flow``.
+    """
+    request = (
+        request_payload
+        if isinstance(request_payload, MealPlanRequest)
+        else parse_contract(MealPlanRequest, request_payload)
+    )
+    zones_minutes = validated_training_zones(request)
+    session = request.training_session
+    return ValidatedMealPlanRequest(
+        request=request,
+        training_session=ValidatedTrainingSession(
+            zones_minutes=zones_minutes,
+            training_before_meal=cast(
+                MealName | None, None if session is None else session.training_before_meal
+            ),
+        ),
+    )
+
+
 def validate_meal_plan_flow(
     request_payload: object,
     response: MealPlanResponse,
@@ -215,15 +634,21 @@ def validate_meal_plan_flow(
 
 
 def validate_response_invariants(response: MealPlanResponse) -> None:
-    """Map response contract data to domain models and enforce domain invariants."""
+    """Map response contract data to domain models and enforce domain invariants.
+
+    The training meal is not a canonical meal, but its carbs are part of the daily
+    target, so they are set aside before reconciling the canonical meals.
+    """
     macro_targets = MacroTargets(
         protein_g=float(response.protein_g),
         carbs_g=float(response.carbs_g),
         fat_g=float(response.fat_g),
     )
     meal_allocations: list[MealAllocation] = []
+    training_carbs_g = 0.0
     for allocation in response.meals:
         if allocation.meal == "training":
+            training_carbs_g += float(allocation.carbs_g)
             continue
         meal_allocations.append(
             MealAllocation(
@@ -236,4 +661,11 @@ def validate_response_invariants(response: MealPlanResponse) -> None:
 
     validate_macro_targets_invariants(macro_targets)
     validate_meal_allocation_invariants(meal_allocations)
-    validate_carb_reconciliation_invariants(macro_targets, meal_allocations)
+    validate_carb_reconciliation_invariants(
+        MacroTargets(
+            protein_g=macro_targets.protein_g,
+            carbs_g=macro_targets.carbs_g - training_carbs_g,
+            fat_g=macro_targets.fat_g,
+        ),
+        meal_allocations,
+    )
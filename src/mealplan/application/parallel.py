@@ -0,0 +1,145 @@
+"""Process-pool batch execution with deterministic output order.
+
+The process pool, batch and orchestration modules are imported on first use, so the CLI can read
+``DEFAULT_BATCH_CHUNK_SIZE`` for its option help without loading the calculation stack.
+"""
+
+from __future__ import annotations
+
+import signal
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from mealplan.application.stage_timer import StageTimer
+from mealplan.shared.errors import MealPlanError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from mealplan.application.batch import BatchRecord
+    from mealplan.application.orchestration import MealPlanCalculationService
+
+DEFAULT_BATCH_CHUNK_SIZE = 256
+# Chunks submitted per worker ahead of the reorder buffer head; bounds parent memory.
+IN_FLIGHT_CHUNKS_PER_WORKER = 2
+
+ServiceFactory = Callable[[], "MealPlanCalculationService"]
+
+_worker_service: MealPlanCalculationService | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkResult:
+    """Records calculated by one worker for one chunk, plus the error that stopped it."""
+
+    records: list[BatchRecord]
+    error: Exception | None
+    # Stage durations recorded for this chunk when the worker times stages.
+    stage_samples: dict[str, list[int]]
+
+
+class ProcessPoolBatchExecutor:
+    """Spread NDJSON batch chunks across worker processes.
+
+    Contract:
+    - Each worker builds one service at startup via ``service_factory`` (default
+      ``MealPlanCalculationService``) and reuses it.
+    - Records are yielded in input order (a reorder buffer over submitted chunks),
+      so rendered output is byte-identical to serial ``iter_batch_records``.
+    - At most ``workers * IN_FLIGHT_CHUNKS_PER_WORKER`` chunks are pending at once.
+    - The first failing line stops submission; records before it are still yielded
+      and then its error is re-raised, matching serial fail-fast semantics.
+    - Workers ignore ``SIGINT``; on Ctrl-C the parent cancels pending chunks and
+      shuts the pool down before the interrupt propagates.
+    - With a ``stage_timer``, workers time their stages and the parent merges each
+      chunk's samples into it.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        service_factory: ServiceFactory | None = None,
+        stage_timer: StageTimer | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be greater than or equal to 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than or equal to 1")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        if service_factory is None:
+            from mealplan.application.orchestration import MealPlanCalculationService
+
+            service_factory = MealPlanCalculationService
+        self.service_factory = service_factory
+        self.stage_timer = stage_timer
+
+    def iter_records(self, lines: Iterable[str]) -> Iterator[BatchRecord]:
+        """Yield calculated records for ``lines`` in input order."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = _iter_chunks(lines, chunk_size=self.chunk_size)
+        max_in_flight = self.workers * IN_FLIGHT_CHUNKS_PER_WORKER
+        pending: deque[Future[ChunkResult]] = deque()
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initialize_worker,
+            initargs=(self.service_factory, self.stage_timer is not None),
+        )
+        try:
+            for chunk in islice(chunks, max_in_flight):
+                pending.append(executor.submit(_calculate_chunk, *chunk))
+            while pending:
+                result = pending.popleft().result()
+                if self.stage_timer is not None:
+                    self.stage_timer.merge(result.stage_samples)
+                yield from result.records
+                if result.error is not None:
+                    raise result.error
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    pending.append(executor.submit(_calculate_chunk, *next_chunk))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_chunks(lines: Iterable[str], *, chunk_size: int) -> Iterator[tuple[int, list[str]]]:
+    iterator = iter(lines)
+    first_line_number = 1
+    while chunk := list(islice(iterator, chunk_size)):
+        yield first_line_number, chunk
+        first_line_number += len(chunk)
+
+
+def _initialize_worker(service_factory: ServiceFactory, time_stages: bool) -> None:
+    global _worker_service
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_service = service_factory()
+    if time_stages:
+        _worker_service.stage_timer = StageTimer()
+
+
+def _calculate_chunk(first_line_number: int, lines: list[str]) -> ChunkResult:
+    from mealplan.application.batch import iter_batch_records
+
+    service = _worker_service
+    if service is None:
+        raise RuntimeError("batch worker used before initialization")
+
+    records: list[BatchRecord] = []
+    error: Exception | None = None
+    try:
+        for record in iter_batch_records(lines, service, first_line_number=first_line_number):
+            records.append(record)
+    except MealPlanError as mealplan_error:
+        error = mealplan_error
+    except Exception as unexpected_error:  # noqa: BLE001
+        # Third-party exceptions may not survive pickling back to the parent.
+        error = RuntimeError(str(unexpected_error))
+    stage_samples = service.stage_timer.drain() if service.stage_timer.enabled else {}
+    return ChunkResult(records=records, error=error, stage_samples=stage_samples)
@@ -0,0 +1,244 @@
+"""Seeded synthetic athlete populations for load and scale testing.
+
+Every column of a chunk is drawn in one vectorized NumPy call, so generation
+cost is dominated by serialization. Populations are built in fixed-size chunks,
+each from its own ``(seed, chunk)`` random stream, so the first ``n`` rows are
+the same whatever the total size: a 1,000-row population is a prefix of the
+10,000,000-row one with the same seed.
+
+Requires NumPy (``mealplan-cli[vectorized]``).
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from dataclasses import fields
+from typing import Any, TypeVar
+
+import numpy as np
+
+from mealplan.domain.enums import ActivityLevel, CarbMode, Gender, MealName, TrainingLoadTomorrow
+from mealplan.domain.vectorized import (
+    ACTIVITY_LEVEL_CODES,
+    CARB_MODE_CODES,
+    GENDER_CODES,
+    MEAL_CODES,
+    NO_TRAINING_BEFORE_MEAL,
+    TRAINING_LOAD_TOMORROW_CODES,
+    VO2MAX_MAX,
+    VO2MAX_MIN,
+    ProfileColumns,
+    rejected_rows,
+)
+
+# Rows per generated chunk; part of the population definition, since each chunk
+# has its own random stream. Changing it changes every population.
+POPULATION_CHUNK_ROWS = 65_536
+
+# Enum mixes; every member of the ``mealplan.domain.enums`` type must be listed.
+GENDER_MIX: dict[Gender, float] = {Gender.MALE: 0.55, Gender.FEMALE: 0.45}
+ACTIVITY_LEVEL_MIX: dict[ActivityLevel, float] = {
+    ActivityLevel.LOW: 0.30,
+    ActivityLevel.MEDIUM: 0.45,
+    ActivityLevel.HIGH: 0.25,
+}
+CARB_MODE_MIX: dict[CarbMode, float] = {
+    CarbMode.LOW: 0.20,
+    CarbMode.NORMAL: 0.40,
+    CarbMode.PERIODIZED: 0.40,
+}
+TRAINING_LOAD_TOMORROW_MIX: dict[TrainingLoadTomorrow, float] = {
+    TrainingLoadTomorrow.LOW: 0.35,
+    TrainingLoadTomorrow.MEDIUM: 0.40,
+    TrainingLoadTomorrow.HIGH: 0.25,
+}
+TRAINING_BEFORE_MEAL_MIX: dict[MealName, float] = {
+    MealName.BREAKFAST: 0.25,
+    MealName.MORNING_SNACK: 0.10,
+    MealName.LUNCH: 0.25,
+    MealName.AFTERNOON_SNACK: 0.15,
+    MealName.DINNER: 0.20,
+    MealName.EVENING_SNACK: 0.05,
+}
+# Share of athletes with a training session today and with a known VO2max.
+TRAINING_SHARE = 0.65
+VO2MAX_SHARE = 0.70
+# Dirichlet weights for splitting session minutes across zones 1..5: mostly easy.
+ZONE_SPLIT_ALPHA = (2.0, 4.0, 1.5, 0.7, 0.3)
+
+AGE_RANGE = (16, 80)
+# Mean and standard deviation of height in centimeters, per gender code.
+HEIGHT_CM_BY_GENDER: dict[Gender, tuple[float, float]] = {
+    Gender.MALE: (177.0, 7.0),
+    Gender.FEMALE: (164.0, 6.5),
+}
+HEIGHT_CM_RANGE = (140, 210)
+# Log-normal body-mass index: median 23.5, clipped to plausible athletic bounds.
+BMI_MEDIAN = 23.5
+BMI_SIGMA = 0.12
+BMI_RANGE = (17.0, 35.0)
+# Log-normal session length in minutes.
+SESSION_MINUTES_MEDIAN = 60.0
+SESSION_MINUTES_SIGMA = 0.5
+SESSION_MINUTES_RANGE = (10, 300)
+
+EnumT = TypeVar("EnumT")
+
+
+def generate_population(n: int, *, seed: int) -> Iterator[ProfileColumns]:
+    """Yield ``n`` synthetic athletes as ``ProfileColumns`` chunks.
+
+    Contract:
+    - The same ``seed`` always yields the same rows, and a smaller ``n`` yields a
+      prefix of a larger one.
+    - Rows pass ``validate_semantic_input``: positive age, height and weight,
+      non-negative zone minutes, ``vo2max`` within ``10..100`` or omitted, and a
+      ``training_before_meal`` meal exactly when the session has minutes.
+    - Rows are also calculable: draws ``calculate_many`` would reject (a negative
+      residual fat target, or a failed output reconciliation) are redrawn, so the
+      enum mixes describe accepted rows only.
+    - Memory stays bounded by one chunk of ``POPULATION_CHUNK_ROWS`` rows.
+    """
+    if n < 0:
+        raise ValueError("n must be greater than or equal to 0")
+    if seed < 0:
+        raise ValueError("seed must be greater than or equal to 0")
+    for chunk, start in enumerate(range(0, n, POPULATION_CHUNK_ROWS)):
+        columns = _generate_chunk(np.random.default_rng([seed, chunk]))
+        rows = min(POPULATION_CHUNK_ROWS, n - start)
+        yield columns if rows == POPULATION_CHUNK_ROWS else _take(columns, slice(rows))
+
+
+def render_request_json(columns: ProfileColumns) -> list[str]:
+    """Render every row of ``columns`` as compact ``MealPlanRequest`` JSON.
+
+    ``vo2max`` is omitted when unknown and ``training_session`` when the athlete
+    does not train; zone keys are the canonical strings ``"1"`` to ``"5"``.
+    """
+    genders = _labels(GENDER_CODES)[columns.gender].tolist()
+    activity_levels = _labels(ACTIVITY_LEVEL_CODES)[columns.activity_level].tolist()
+    carb_modes = _labels(CARB_MODE_CODES)[columns.carb_mode].tolist()
+    loads = _labels(TRAINING_LOAD_TOMORROW_CODES)[columns.training_load_tomorrow].tolist()
+    vo2max_fields = [
+        "" if value != value else f',"vo2max":{int(value)}' for value in columns.vo2max.tolist()
+    ]
+    before_meals = [*(json.dumps(meal.value) for meal in MEAL_CODES), "null"]
+    session_fields = [
+        ""
+        if not any(zones)
+        else (
+            ',"training_session":{"zones_minutes":{'
+            + ",".join(f'"{zone}":{minutes}' for zone, minutes in enumerate(zones, start=1))
+            + f'}},"training_before_meal":{before_meals[before_meal]}}}'
+        )
+        for zones, before_meal in zip(
+            columns.zones_minutes.tolist(), columns.training_before_meal.tolist(), strict=True
+        )
+    ]
+    return [
+        f'{{"age":{age},"gender":"{gender}","height_cm":{height},"weight_kg":{weight!r}'
+        f'{vo2max},"activity_level":"{activity}","carb_mode":"{carb_mode}",'
+        f'"training_load_tomorrow":"{load}"{session}}}'
+        for age, gender, height, weight, vo2max, activity, carb_mode, load, session in zip(
+            columns.age.tolist(),
+            genders,
+            columns.height_cm.tolist(),
+            columns.weight_kg.tolist(),
+            vo2max_fields,
+            activity_levels,
+            carb_modes,
+            loads,
+            session_fields,
+            strict=True,
+        )
+    ]
+
+
+def _generate_chunk(rng: np.random.Generator) -> ProfileColumns:
+    accepted: list[ProfileColumns] = []
+    missing = POPULATION_CHUNK_ROWS
+    while missing:
+        drawn = _draw_rows(rng, missing)
+        calculable = _take(drawn, ~rejected_rows(drawn))
+        accepted.append(calculable)
+        missing -= calculable.row_count
+    if len(accepted) == 1:
+        return accepted[0]
+    return ProfileColumns.from_arrays(
+        **{
+            field.name: np.concatenate([getattr(part, field.name) for part in accepted])
+            for field in fields(ProfileColumns)
+        }
+    )
+
+
+def _draw_rows(rng: np.random.Generator, rows: int) -> ProfileColumns:
+    gender = _draw_codes(rng, GENDER_CODES, GENDER_MIX, rows)
+    age = np.clip(np.rint(rng.normal(38.0, 12.0, rows)), *AGE_RANGE).astype(np.int64)
+
+    height_mean = np.empty(rows)
+    height_sd = np.empty(rows)
+    for code, member in enumerate(GENDER_CODES):
+        selected = gender == code
+        height_mean[selected], height_sd[selected] = HEIGHT_CM_BY_GENDER[member]
+    height_cm = np.clip(np.rint(rng.normal(height_mean, height_sd)), *HEIGHT_CM_RANGE).astype(
+        np.int64
+    )
+    bmi = np.clip(rng.lognormal(np.log(BMI_MEDIAN), BMI_SIGMA, rows), *BMI_RANGE)
+    weight_kg = np.round(bmi * (height_cm / 100.0) ** 2, 1)
+
+    # VO2max falls with age and is lower for women; unknown for some athletes.
+    male = gender == GENDER_CODES.index(Gender.MALE)
+    vo2max_mean = np.where(male, 48.0, 42.0) - 0.3 * (age - 35)
+    vo2max = np.clip(np.rint(rng.normal(vo2max_mean, 7.0)), VO2MAX_MIN, VO2MAX_MAX)
+    vo2max[rng.random(rows) >= VO2MAX_SHARE] = np.nan
+
+    session_minutes = np.clip(
+        rng.lognormal(np.log(SESSION_MINUTES_MEDIAN), SESSION_MINUTES_SIGMA, rows),
+        *SESSION_MINUTES_RANGE,
+    )
+    session_minutes[rng.random(rows) >= TRAINING_SHARE] = 0.0
+    zone_shares = rng.dirichlet(ZONE_SPLIT_ALPHA, rows)
+    zones_minutes = np.floor(zone_shares * session_minutes[:, None]).astype(np.int64)
+    trains = zones_minutes.sum(axis=1) > 0
+    training_before_meal = np.where(
+        trains,
+        _draw_codes(rng, MEAL_CODES, TRAINING_BEFORE_MEAL_MIX, rows),
+        NO_TRAINING_BEFORE_MEAL,
+    )
+
+    return ProfileColumns.from_arrays(
+        age=age,
+        gender=gender,
+        height_cm=height_cm,
+        weight_kg=weight_kg,
+        activity_level=_draw_codes(rng, ACTIVITY_LEVEL_CODES, ACTIVITY_LEVEL_MIX, rows),
+        carb_mode=_draw_codes(rng, CARB_MODE_CODES, CARB_MODE_MIX, rows),
+        training_load_tomorrow=_draw_codes(
+            rng, TRAINING_LOAD_TOMORROW_CODES, TRAINING_LOAD_TOMORROW_MIX, rows
+        ),
+        zones_minutes=zones_minutes,
+        training_before_meal=training_before_meal,
+        vo2max=vo2max,
+    )
+
+
+def _draw_codes(
+    rng: np.random.Generator,
+    members: tuple[EnumT, ...],
+    mix: dict[EnumT, float],
+    rows: int,
+) -> np.ndarray[tuple[int], np.dtype[np.int8]]:
+    weights = np.array([mix[member] for member in members])
+    return rng.choice(len(members), size=rows, p=weights / weights.sum()).astype(np.int8)
+
+
+def _labels(members: tuple[object, ...]) -> np.ndarray[tuple[int], np.dtype[np.str_]]:
+    return np.array([str(member) for member in members])
+
+
+def _take(columns: ProfileColumns, rows: slice | np.ndarray[Any, Any]) -> ProfileColumns:
+    return ProfileColumns.from_arrays(
+        **{field.name: getattr(columns, field.name)[rows] for field in fields(ProfileColumns)}
+    )
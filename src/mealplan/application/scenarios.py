@@ -0,0 +1,202 @@
+"""Scenario axes and comparison matrices for one athlete profile.
+
+A scenario fixes the meal before training, the carb mode and tomorrow's training
+load; every other input comes from the base request. Input validation does not
+depend on these values, so the base request is validated once for all of them,
+but a scenario can still break a domain rule (for example a carb mode that
+leaves no room for fat); it is then reported as an error row.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from typing import TypeVar
+
+from mealplan.application.contracts import MealPlanResponse
+from mealplan.domain.enums import CarbMode, CarbStrategy, MealName, TrainingLoadTomorrow
+from mealplan.domain.model import CANONICAL_MEAL_ORDER
+from mealplan.shared.errors import ValidationError
+
+# Spec dimension names; they mirror the ``calculate`` flags they override.
+SCENARIO_DIMENSIONS = ("training_before", "carbs", "training_tomorrow")
+SCENARIO_MATRIX_COLUMNS: tuple[str, ...] = (
+    "training_before_meal",
+    "carb_mode",
+    "training_load_tomorrow",
+    "total_kcal",
+    "protein_g",
+    "carbs_g",
+    "fat_g",
+    "high_carb_meals",
+    *(str(meal) for meal in CANONICAL_MEAL_ORDER),
+    "training",
+    "error",
+)
+
+_EnumT = TypeVar("_EnumT", MealName, CarbMode, TrainingLoadTomorrow)
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioAxes:
+    """Values to compare per input; ``None`` keeps the base request's value."""
+
+    training_before_meals: tuple[MealName, ...] | None = None
+    carb_modes: tuple[CarbMode, ...] | None = None
+    training_loads_tomorrow: tuple[TrainingLoadTomorrow, ...] | None = None
+
+    def scenarios(
+        self,
+        *,
+        training_before_meal: MealName | None,
+        carb_mode: CarbMode,
+        training_load_tomorrow: TrainingLoadTomorrow,
+    ) -> list[tuple[MealName | None, CarbMode, TrainingLoadTomorrow]]:
+        """Return every scenario in axis order, filling unset axes from the base values."""
+        return list(
+            product(
+                (training_before_meal,)
+                if self.training_before_meals is None
+                else self.training_before_meals,
+                (carb_mode,) if self.carb_modes is None else self.carb_modes,
+                (training_load_tomorrow,)
+                if self.training_loads_tomorrow is None
+                else self.training_loads_tomorrow,
+            )
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioResult:
+    """One scenario and the response calculated for it, or the domain rule it broke."""
+
+    training_before_meal: MealName | None
+    carb_mode: CarbMode
+    training_load_tomorrow: TrainingLoadTomorrow
+    response: MealPlanResponse | None
+    warnings: tuple[str, ...]
+    error: str | None = None
+
+    @property
+    def label(self) -> str:
+        """Return the scenario as ``training_before=... carbs=... training_tomorrow=...``."""
+        training_before = "none" if self.training_before_meal is None else self.training_before_meal
+        return (
+            f"training_before={training_before} carbs={self.carb_mode} "
+            f"training_tomorrow={self.training_load_tomorrow}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioComparison:
+    """Scenario results in ``ScenarioAxes.scenarios`` order."""
+
+    results: tuple[ScenarioResult, ...]
+
+    def matrix(self) -> list[list[object]]:
+        """Return one row per scenario with the values of ``SCENARIO_MATRIX_COLUMNS``.
+
+        Contract:
+        - ``training_before_meal`` is ``None`` when the scenario has no training meal.
+        - ``high_carb_meals`` lists the canonical meals with a high carb strategy.
+        - Meal columns hold carbs in grams; ``training`` is ``0.0`` without a
+          training meal.
+        - ``error`` is ``None``, or the domain rule message of a failed scenario,
+          whose result columns are all ``None``.
+        """
+        rows: list[list[object]] = []
+        for result in self.results:
+            response = result.response
+            if response is None:
+                rows.append(
+                    [
+                        *self._scenario_cells(result),
+                        *[None] * (len(SCENARIO_MATRIX_COLUMNS) - 4),
+                        result.error,
+                    ]
+                )
+                continue
+            carbs_g_by_meal = dict.fromkeys((*CANONICAL_MEAL_ORDER, "training"), 0.0)
+            high_carb_meals: list[str] = []
+            for allocation in response.meals:
+                carbs_g_by_meal[allocation.meal] = allocation.carbs_g
+                if allocation.meal != "training" and (
+                    allocation.carbs_strategy is CarbStrategy.HIGH
+                ):
+                    high_carb_meals.append(str(allocation.meal))
+            rows.append(
+                [
+                    *self._scenario_cells(result),
+                    response.total_kcal,
+                    response.protein_g,
+                    response.carbs_g,
+                    response.fat_g,
+                    high_carb_meals,
+                    *carbs_g_by_meal.values(),
+                    None,
+                ]
+            )
+        return rows
+
+    @staticmethod
+    def _scenario_cells(result: ScenarioResult) -> list[object]:
+        return [
+            None if result.training_before_meal is None else str(result.training_before_meal),
+            str(result.carb_mode),
+            str(result.training_load_tomorrow),
+        ]
+
+
+def parse_scenario_axes(spec: str) -> ScenarioAxes:
+    """Parse ``DIMENSION=VALUE[,DIMENSION=VALUE...]`` into scenario axes.
+
+    Contract:
+    - Dimensions are ``training_before`` (canonical meals), ``carbs`` (carb
+      modes) and ``training_tomorrow`` (training loads).
+    - ``all`` selects every value of a dimension. Repeating a dimension adds
+      values, so ``carbs=low,carbs=periodized`` compares two carb modes.
+    - Values keep their first-seen order; unknown dimensions or values raise
+      ``ValidationError``.
+    """
+    selected: dict[str, list[str]] = {}
+    for entry in spec.split(","):
+        dimension, separator, value = (part.strip() for part in entry.partition("="))
+        if not separator or not dimension or not value:
+            raise ValidationError(f"compare: expected DIMENSION=VALUE, got {entry.strip()!r}")
+        if dimension not in SCENARIO_DIMENSIONS:
+            raise ValidationError(
+                f"compare: unknown dimension {dimension}; "
+                f"expected one of {', '.join(SCENARIO_DIMENSIONS)}"
+            )
+        selected.setdefault(dimension, []).append(value)
+    return ScenarioAxes(
+        training_before_meals=_axis_values(
+            "training_before", selected.get("training_before"), CANONICAL_MEAL_ORDER
+        ),
+        carb_modes=_axis_values("carbs", selected.get("carbs"), tuple(CarbMode)),
+        training_loads_tomorrow=_axis_values(
+            "training_tomorrow", selected.get("training_tomorrow"), tuple(TrainingLoadTomorrow)
+        ),
+    )
+
+
+def _axis_values(
+    dimension: str,
+    values: list[str] | None,
+    members: tuple[_EnumT, ...],
+) -> tuple[_EnumT, ...] | None:
+    if values is None:
+        return None
+    by_value = {str(member): member for member in members}
+    chosen: dict[_EnumT, None] = {}
+    for value in values:
+        if value == "all":
+            chosen.update(dict.fromkeys(members))
+        elif value in by_value:
+            chosen[by_value[value]] = None
+        else:
+            raise ValidationError(
+                f"compare: invalid {dimension} value {value}; "
+                f"expected all or one of {', '.join(by_value)}"
+            )
+    return tuple(chosen)
@@ -0,0 +1,144 @@
+"""Low-overhead wall-clock timers for the calculation pipeline stages."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Mapping, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from time import perf_counter_ns
+from types import TracebackType
+from typing import TypeVar
+
+# Pipeline stages in execution order; reports list known stages in this order.
+# ``carb_strategy`` is timed only by stage-graph evaluation (``calculate_incremental``,
+# ``recalculate``, ``compare_scenarios``); ``calculate`` folds it into ``assembly``.
+STAGE_ORDER = (
+    "parse",
+    "validate",
+    "energy",
+    "macro",
+    "fueling",
+    "training_demand",
+    "carb_strategy",
+    "assembly",
+    "render",
+)
+
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+_Number = TypeVar("_Number", int, float)
+
+
+@dataclass(frozen=True, slots=True)
+class StageSummary:
+    """Aggregated durations of one stage, in nanoseconds."""
+
+    stage: str
+    count: int
+    total_ns: int
+    min_ns: int
+    p50_ns: int
+    p99_ns: int
+
+
+class _Span:
+    """Reusable context manager appending one duration sample per use."""
+
+    __slots__ = ("_samples", "_start")
+
+    def __init__(self, samples: array[int]) -> None:
+        self._samples = samples
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._samples.append(perf_counter_ns() - self._start)
+
+
+class StageTimer:
+    """Collect per-stage durations across one or many calculations.
+
+    Contract:
+    - ``stage(name)`` returns a reusable context manager that records one sample
+      per use; a stage must not be nested inside itself.
+    - Samples are stored compactly (8 bytes each), so a batch run keeps one
+      sample per stage per request in memory.
+    - Stages that raise still record their duration.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._samples: dict[str, array[int]] = {}
+        self._spans: dict[str, _Span] = {}
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        """Return the timing context manager for stage ``name``."""
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = _Span(self._samples.setdefault(name, array("q")))
+        return span
+
+    def samples(self) -> dict[str, list[int]]:
+        """Return a copy of the recorded samples per stage."""
+        return {stage: list(values) for stage, values in self._samples.items()}
+
+    def drain(self) -> dict[str, list[int]]:
+        """Return the recorded samples and start over, keeping stage spans usable."""
+        drained = self.samples()
+        for values in self._samples.values():
+            del values[:]
+        return drained
+
+    def merge(self, samples: Mapping[str, list[int]]) -> None:
+        """Add samples recorded elsewhere, e.g. by batch worker processes."""
+        for stage, values in samples.items():
+            self._samples.setdefault(stage, array("q")).extend(values)
+
+    def summaries(self) -> list[StageSummary]:
+        """Return one summary per stage with samples, in pipeline order."""
+        ordered = [stage for stage in STAGE_ORDER if stage in self._samples]
+        ordered += sorted(stage for stage in self._samples if stage not in STAGE_ORDER)
+        summaries: list[StageSummary] = []
+        for stage in ordered:
+            values = sorted(self._samples[stage])
+            if not values:
+                continue
+            summaries.append(
+                StageSummary(
+                    stage=stage,
+                    count=len(values),
+                    total_ns=sum(values),
+                    min_ns=values[0],
+                    p50_ns=nearest_rank_percentile(values, 50),
+                    p99_ns=nearest_rank_percentile(values, 99),
+                )
+            )
+        return summaries
+
+
+class _DisabledStageTimer(StageTimer):
+    """Timer that records nothing; its spans are a shared no-op context."""
+
+    enabled = False
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        return _NULL_SPAN
+
+
+# Default timer for services; costs one no-op context manager per stage.
+DISABLED_STAGE_TIMER: StageTimer = _DisabledStageTimer()
+
+
+def nearest_rank_percentile(sorted_values: Sequence[_Number], percent: float) -> _Number:
+    """Return the nearest-rank percentile of an ascending, non-empty sequence."""
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
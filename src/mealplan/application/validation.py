@@ -11,6 +11,15 @@ from mealplan.shared.errors import ValidationError
 
 def validate_semantic_input(request: MealPlanRequest) -> None:
     """Validate semantic constraints that are out of scope for schema parsing."""
+    validated_training_zones(request)
+
+
+def validated_training_zones(request: MealPlanRequest) -> dict[int, int]:
+    """Run ``validate_semantic_input`` checks and return the normalized zone minutes.
+
+    A request without a training session yields all-zero zones, so callers can
+    carry the result forward instead of normalizing the zones again.
+    """
     if request.age <= 0:
         raise ValidationError("age: must be greater than 0")
     if request.height_cm <= 0:
@@ -18,7 +27,7 @@ def validate_semantic_input(request: MealPlanRequest) -> None:
     if request.weight_kg <= 0:
         raise ValidationError("weight_kg: must be greater than 0")
     if request.training_session is None:
-        return
+        return dict.fromkeys(range(1, 6), 0)
 
     normalized_zones = normalize_training_zones(
         cast(Mapping[int | str, object], request.training_session.zones_minutes)
@@ -32,6 +41,7 @@ def validate_semantic_input(request: MealPlanRequest) -> None:
         raise ValidationError(
             "training_session.training_before_meal: required when total zones_minutes > 0"
         )
+    return normalized_zones
 
 
 def normalize_training_zones(zones_minutes: Mapping[int | str, object]) -> dict[int, int]:
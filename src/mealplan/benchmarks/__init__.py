@@ -0,0 +1,5 @@
+"""Benchmark suites for the calculation hot paths, run via ``mealplan bench``.
+
+Nothing here is imported by the calculation path; the suites import the layers
+they measure.
+"""
@@ -0,0 +1,293 @@
+"""Benchmark baselines: repeated-trial metrics saved as JSON and compared for regressions.
+
+Every metric is a latency (lower is better) measured once per trial. Trials of
+all suites are interleaved, so slow drift of the machine affects every metric
+alike instead of whichever suite happened to run last.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from mealplan.shared.errors import ConfigError
+
+BASELINE_FORMAT_VERSION = 1
+BENCHMARK_SUITES = ("stage", "service", "render", "startup")
+DEFAULT_TRIALS = 5
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+DEFAULT_SUITE_MIN_TIME_S = 0.1
+DEFAULT_SUITE_STARTUP_RUNS = 5
+# Calculations per fixed request and trial in the ``stage`` suite.
+STAGE_CALLS_PER_REQUEST = 200
+
+ComparisonStatus = Literal["ok", "regression", "improvement", "new", "missing"]
+
+
+@dataclass(frozen=True, slots=True)
+class Metric:
+    """One latency metric with its value from every trial."""
+
+    name: str
+    unit: str
+    trials: tuple[float, ...]
+
+    @property
+    def median(self) -> float:
+        """Median over trials."""
+        return statistics.median(self.trials)
+
+    @property
+    def noise(self) -> float:
+        """Relative spread of the trials, ``(max - min) / median``."""
+        median = self.median
+        return (max(self.trials) - min(self.trials)) / median if median else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """Baseline and current medians of one metric and the verdict."""
+
+    name: str
+    unit: str
+    baseline: float | None
+    current: float | None
+    change: float
+    allowed: float
+    status: ComparisonStatus
+
+
+def collect_metrics(
+    suites: Sequence[str] = BENCHMARK_SUITES,
+    *,
+    trials: int = DEFAULT_TRIALS,
+    min_time_s: float = DEFAULT_SUITE_MIN_TIME_S,
+    startup_runs: int = DEFAULT_SUITE_STARTUP_RUNS,
+) -> dict[str, Metric]:
+    """Measure ``suites`` ``trials`` times and return metrics keyed by name.
+
+    Contract:
+    - ``stage`` reports the p50 of each timed service stage (``stage.<stage>``)
+      over every fixed benchmark request.
+    - ``service`` and ``render`` report the p50 per-call latency of the
+      ``service.*`` and ``render.*`` microbenchmarks.
+    - ``startup`` reports the p50 wall time of each startup scenario.
+    - Unknown suite names raise ``ValueError``.
+    """
+    unknown = sorted(set(suites) - set(BENCHMARK_SUITES))
+    if unknown:
+        raise ValueError(f"unknown benchmark suite {', '.join(unknown)}")
+    if trials < 1:
+        raise ValueError("trials must be greater than or equal to 1")
+    values: dict[str, list[float]] = {}
+    units: dict[str, str] = {}
+    for _ in range(trials):
+        for suite in suites:
+            for name, unit, value in _measure_suite(
+                suite, min_time_s=min_time_s, startup_runs=startup_runs
+            ):
+                values.setdefault(name, []).append(value)
+                units[name] = unit
+    return {
+        name: Metric(name=name, unit=units[name], trials=tuple(trial_values))
+        for name, trial_values in values.items()
+    }
+
+
+def compare_metrics(
+    baseline: Mapping[str, Metric],
+    current: Mapping[str, Metric],
+    *,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[Comparison]:
+    """Compare medians metric by metric.
+
+    Contract:
+    - A metric regresses when its median grew by more than the allowed change:
+      ``threshold`` or the larger trial noise of the two runs, whichever is
+      larger, so noisy metrics need a proportionally larger slowdown to fail.
+    - A symmetric drop is an improvement; metrics in only one run are ``new`` or
+      ``missing`` and never fail the comparison.
+    """
+    comparisons: list[Comparison] = []
+    for name in [*baseline, *(name for name in current if name not in baseline)]:
+        before = baseline.get(name)
+        after = current.get(name)
+        if before is None or after is None:
+            comparisons.append(_unpaired_comparison(name, before, after, threshold=threshold))
+            continue
+        allowed = max(threshold, before.noise, after.noise)
+        change = after.median / before.median - 1 if before.median else 0.0
+        status: ComparisonStatus = "ok"
+        if change > allowed:
+            status = "regression"
+        elif change < -allowed:
+            status = "improvement"
+        comparisons.append(
+            Comparison(
+                name=name,
+                unit=before.unit,
+                baseline=before.median,
+                current=after.median,
+                change=change,
+                allowed=allowed,
+                status=status,
+            )
+        )
+    return comparisons
+
+
+def save_baseline(path: str, metrics: Mapping[str, Metric]) -> None:
+    """Write ``metrics`` and the measuring environment to ``path`` as JSON."""
+    document = {
+        "format": BASELINE_FORMAT_VERSION,
+        "environment": benchmark_environment(),
+        "metrics": {
+            name: {"unit": metric.unit, "median": metric.median, "trials": list(metric.trials)}
+            for name, metric in metrics.items()
+        },
+    }
+    try:
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(document, output, indent=2)
+            output.write("\n")
+    except OSError as error:
+        raise ConfigError(f"baseline {path}: {error}") from error
+
+
+def load_baseline(path: str) -> tuple[dict[str, str], dict[str, Metric]]:
+    """Return the environment and metrics saved at ``path``.
+
+    Raises ``ConfigError`` for unreadable files, other format versions and
+    malformed documents.
+    """
+    try:
+        with open(path, encoding="utf-8") as source:
+            document: Any = json.load(source)
+    except (OSError, json.JSONDecodeError) as error:
+        raise ConfigError(f"baseline {path}: {error}") from error
+    try:
+        if document["format"] != BASELINE_FORMAT_VERSION:
+            raise ConfigError(
+                f"baseline {path}: format {document['format']} is not supported; "
+                f"re-record it with 'mealplan bench run --save'"
+            )
+        metrics = {
+            name: Metric(
+                name=name,
+                unit=str(entry["unit"]),
+                trials=tuple(float(value) for value in entry["trials"]),
+            )
+            for name, entry in document["metrics"].items()
+        }
+        environment = {str(key): str(value) for key, value in document["environment"].items()}
+    except (KeyError, TypeError, ValueError, AttributeError) as error:
+        raise ConfigError(f"baseline {path}: malformed baseline document") from error
+    if any(not metric.trials for metric in metrics.values()):
+        raise ConfigError(f"baseline {path}: malformed baseline document")
+    return environment, metrics
+
+
+def benchmark_environment() -> dict[str, str]:
+    """Describe the interpreter and machine; results only compare within one environment."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def format_metrics(metrics: Iterable[Metric]) -> str:
+    """Render metric medians and noise as a Markdown table."""
+    lines = ["| metric | unit | median | noise | trials |", "| --- | --- | --- | --- | --- |"]
+    for metric in metrics:
+        lines.append(
+            f"| {metric.name} | {metric.unit} | {metric.median:.2f} | {metric.noise:.1%} | "
+            f"{len(metric.trials)} |"
+        )
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: Iterable[Comparison]) -> str:
+    """Render comparisons as a Markdown table."""
+    lines = [
+        "| metric | unit | baseline | current | change | allowed | status |",
+        "| --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    for comparison in comparisons:
+        baseline = "-" if comparison.baseline is None else f"{comparison.baseline:.2f}"
+        current = "-" if comparison.current is None else f"{comparison.current:.2f}"
+        lines.append(
+            f"| {comparison.name} | {comparison.unit} | {baseline} | {current} | "
+            f"{comparison.change:+.1%} | {comparison.allowed:.1%} | {comparison.status} |"
+        )
+    return "\n".join(lines)
+
+
+def _measure_suite(
+    suite: str,
+    *,
+    min_time_s: float,
+    startup_runs: int,
+) -> list[tuple[str, str, float]]:
+    if suite == "stage":
+        return _measure_stages()
+    if suite == "startup":
+        from mealplan.benchmarks.startup import STARTUP_SCENARIOS, measure_startup
+
+        return [
+            (f"startup.{name}", "ms", measure_startup(name, argv, runs=startup_runs).p50_ms)
+            for name, argv in STARTUP_SCENARIOS.items()
+        ]
+    from mealplan.benchmarks.harness import run_case
+    from mealplan.benchmarks.micro import microbenchmark_cases
+
+    return [
+        (case.name, "us", run_case(case, min_time_s=min_time_s).p50_us)
+        for case in microbenchmark_cases()
+        if case.name.startswith(f"{suite}.")
+    ]
+
+
+def _measure_stages() -> list[tuple[str, str, float]]:
+    from mealplan.application.orchestration import (
+        MealPlanCalculationService,
+        validate_meal_plan_request,
+    )
+    from mealplan.application.stage_timer import StageTimer
+    from mealplan.benchmarks.micro import BENCHMARK_REQUESTS
+
+    service = MealPlanCalculationService()
+    service.stage_timer = StageTimer()
+    requests = [
+        validate_meal_plan_request(payload).request for payload in BENCHMARK_REQUESTS.values()
+    ]
+    for request in requests:
+        service.calculate(request)
+    service.stage_timer.drain()
+    for request in requests:
+        for _ in range(STAGE_CALLS_PER_REQUEST):
+            service.calculate(request)
+    return [
+        (f"stage.{summary.stage}", "us", summary.p50_ns / 1000)
+        for summary in service.stage_timer.summaries()
+    ]
+
+
+def _unpaired_comparison(
+    name: str,
+    before: Metric | None,
+    after: Metric | None,
+    *,
+    threshold: float,
+) -> Comparison:
+    if before is not None:
+        return Comparison(name, before.unit, before.median, None, 0.0, threshold, "missing")
+    if after is not None:
+        return Comparison(name, after.unit, None, after.median, 0.0, threshold, "new")
+    raise ValueError(f"{name}: metric missing from both runs")
@@ -0,0 +1,107 @@
+"""Timing loop and report formatting shared by the benchmark suites."""
+
+from __future__ import annotations
+
+import gc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import repeat
+from time import perf_counter_ns
+
+from mealplan.application.stage_timer import nearest_rank_percentile
+
+# Minimum measured time per case; raise it on noisy machines.
+DEFAULT_MIN_TIME_S = 0.2
+# Calls are timed in batches lasting at least this long, so timer overhead stays negligible.
+TARGET_SAMPLE_NS = 50_000
+MIN_SAMPLES = 20
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCase:
+    """One named, argument-less callable to time."""
+
+    name: str
+    func: Callable[[], object]
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """Throughput and per-call latency of one case, latencies in microseconds."""
+
+    name: str
+    calls: int
+    ops_per_sec: float
+    min_us: float
+    p50_us: float
+    p99_us: float
+
+
+def run_case(case: BenchmarkCase, *, min_time_s: float = DEFAULT_MIN_TIME_S) -> BenchmarkResult:
+    """Time ``case`` for at least ``min_time_s`` seconds and summarize per-call latency.
+
+    Contract:
+    - One untimed warm-up call runs first, and garbage is collected before timing.
+    - Calls are timed in batches of a calibrated size; each batch yields one
+      per-call latency sample, and at least ``MIN_SAMPLES`` samples are taken.
+    - Percentiles are nearest-rank over those samples.
+    """
+    func = case.func
+    func()
+    batch_size = _calibrated_batch_size(func)
+    min_time_ns = int(min_time_s * 1e9)
+    samples: list[float] = []
+    calls = 0
+    elapsed_ns = 0
+    gc.collect()
+    while elapsed_ns < min_time_ns or len(samples) < MIN_SAMPLES:
+        start = perf_counter_ns()
+        for _ in repeat(None, batch_size):
+            func()
+        duration_ns = perf_counter_ns() - start
+        samples.append(duration_ns / batch_size)
+        calls += batch_size
+        elapsed_ns += duration_ns
+    samples.sort()
+    return BenchmarkResult(
+        name=case.name,
+        calls=calls,
+        ops_per_sec=calls / (elapsed_ns / 1e9),
+        min_us=samples[0] / 1000,
+        p50_us=nearest_rank_percentile(samples, 50) / 1000,
+        p99_us=nearest_rank_percentile(samples, 99) / 1000,
+    )
+
+
+def run_cases(
+    cases: Iterable[BenchmarkCase],
+    *,
+    min_time_s: float = DEFAULT_MIN_TIME_S,
+) -> list[BenchmarkResult]:
+    """Run every case in order."""
+    return [run_case(case, min_time_s=min_time_s) for case in cases]
+
+
+def format_results(results: Iterable[BenchmarkResult]) -> str:
+    """Render results as a Markdown table."""
+    lines = [
+        "| benchmark | ops/s | min_us | p50_us | p99_us |",
+        "| --- | --- | --- | --- | --- |",
+    ]
+    for result in results:
+        lines.append(
+            f"| {result.name} | {result.ops_per_sec:,.0f} | {result.min_us:.2f} | "
+            f"{result.p50_us:.2f} | {result.p99_us:.2f} |"
+        )
+    return "\n".join(lines)
+
+
+def _calibrated_batch_size(func: Callable[[], object]) -> int:
+    batch_size = 1
+    while True:
+        start = perf_counter_ns()
+        for _ in repeat(None, batch_size):
+            func()
+        if perf_counter_ns() - start >= TARGET_SAMPLE_NS or batch_size >= 1 << 20:
+            return batch_size
+        batch_size *= 2
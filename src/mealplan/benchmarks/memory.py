@@ -0,0 +1,214 @@
+"""Memory benchmarks: ``tracemalloc`` allocations per call and peak RSS of a streaming batch.
+
+``tracemalloc`` sees live memory only, so each call reports two figures:
+
+- ``peak``: the high-water mark above the pre-call level, i.e. the transient
+  memory (intermediate dicts, rows, models, dumps) a call needs at once;
+- ``retained``: bytes and blocks still held once the call returns, i.e. the
+  size of its result, measured while the results of all calls are kept alive.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import partial
+from itertools import cycle, islice
+
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
+from mealplan.application.orchestration import (
+    MEAL_PLAN_STAGE_GRAPH,
+    MealPlanCalculationService,
+    validate_meal_plan_request,
+)
+from mealplan.application.parsing import parse_contract
+from mealplan.benchmarks.harness import BenchmarkCase
+from mealplan.benchmarks.micro import BENCHMARK_REQUESTS, RENDER_FORMATS
+from mealplan.cli.client import NO_DAEMON_ENV_VAR
+from mealplan.domain.services import calculate_meal_split_and_response_payload_with_warnings
+from mealplan.shared.errors import ConfigError
+
+DEFAULT_ALLOCATION_CALLS = 200
+DEFAULT_BATCH_REQUEST_COUNTS = (1_000, 10_000, 100_000)
+_IGNORED_ALLOCATION_FILES = (tracemalloc.__file__, __file__)
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationResult:
+    """Median transient peak and mean retained allocations of one call."""
+
+    name: str
+    peak_bytes: int
+    retained_bytes: int
+    retained_blocks: float
+
+
+@dataclass(frozen=True, slots=True)
+class BatchMemoryResult:
+    """Peak resident set size of one streaming ``mealplan batch`` process."""
+
+    requests: int
+    peak_rss_bytes: int
+
+
+def allocation_cases(request_name: str = "periodized_training") -> list[BenchmarkCase]:
+    """Return per-stage, assembly-breakdown, render and service cases for one request.
+
+    ``stage.*`` cases rerun each ``MEAL_PLAN_STAGE_GRAPH`` stage through
+    ``MealPlanCalculationService.stage_runner`` on the outputs of one real
+    calculation. ``assembly.*`` splits the assembly stage into the domain meal
+    split (dicts and ``MealPayloadRow`` rows), the trusted response model, the
+    paranoid ``model_validate`` path and a ``model_dump`` copy.
+    """
+    from mealplan.cli.main import render_response
+
+    payload = BENCHMARK_REQUESTS[request_name]
+    request = parse_contract(MealPlanRequest, payload)
+    service = MealPlanCalculationService()
+    computation = service.calculate_incremental(request)
+    request = computation.validated.request
+    response = computation.response
+    macro_targets = computation.macro_targets
+    meal_split = partial(
+        calculate_meal_split_and_response_payload_with_warnings,
+        tdee_kcal=computation.tdee_kcal,
+        training_carbs_g=computation.training_carbs_g,
+        training_calorie_demand_kcal=computation.training_calorie_demand_kcal,
+        carb_mode=request.carb_mode,
+        training_before_meal=computation.validated.training_session.training_before_meal,
+        training_load_tomorrow=request.training_load_tomorrow,
+        protein_g=macro_targets.protein_g,
+        carbs_g=macro_targets.carbs_g,
+        fat_g=macro_targets.fat_g,
+    )
+    engine_payload = meal_split()["payload"]
+
+    functions: dict[str, Callable[[], object]] = {
+        "stage.parse": partial(parse_contract, MealPlanRequest, payload),
+        "stage.validate": partial(validate_meal_plan_request, request),
+    }
+    for node in MEAL_PLAN_STAGE_GRAPH:
+        functions[f"stage.{node.name}"] = service.stage_runner(node.name, computation)
+    functions.update(
+        {
+            "assembly.meal_split": meal_split,
+            "assembly.response_model": partial(
+                MealPlanResponse.from_engine_payload, engine_payload
+            ),
+            "assembly.response_validate": partial(MealPlanResponse.model_validate, engine_payload),
+            "assembly.model_dump": partial(response.model_dump, mode="json"),
+            "service.calculate": partial(service.calculate, request),
+        }
+    )
+    for output_format in RENDER_FORMATS:
+        functions[f"render.{output_format}"] = partial(
+            render_response, response=response, output_format=output_format
+        )
+    return [BenchmarkCase(name=name, func=func) for name, func in functions.items()]
+
+
+def measure_allocations(
+    case: BenchmarkCase,
+    *,
+    calls: int = DEFAULT_ALLOCATION_CALLS,
+) -> AllocationResult:
+    """Trace ``calls`` calls of ``case`` and report their peak and retained memory.
+
+    Contract:
+    - One untraced warm-up call runs first, so lazily built caches are excluded.
+    - Every result is kept alive until the end, so ``retained`` is the result
+      size rather than whatever happened to survive garbage collection.
+    - Allocations made by ``tracemalloc`` itself and by this module are ignored.
+    """
+    if calls < 1:
+        raise ValueError("calls must be greater than or equal to 1")
+    func = case.func
+    func()
+    results: list[object] = [None] * calls
+    peaks: list[int] = [0] * calls
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for index in range(calls):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            results[index] = func()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks[index] = peak - current
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    ignored = [tracemalloc.Filter(False, path) for path in _IGNORED_ALLOCATION_FILES]
+    differences = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "filename")
+    return AllocationResult(
+        name=case.name,
+        peak_bytes=int(statistics.median(peaks)),
+        retained_bytes=sum(difference.size_diff for difference in differences) // calls,
+        retained_blocks=sum(difference.count_diff for difference in differences) / calls,
+    )
+
+
+def measure_batch_peak_rss(requests: int, *, workers: int = 1) -> BatchMemoryResult:
+    """Stream ``requests`` request lines through ``mealplan batch`` and report its peak RSS.
+
+    Contract:
+    - The batch runs in a fresh interpreter fed through a pipe and writing to
+      ``/dev/null``, so neither input nor output is held in memory by this process.
+    - Requests cycle through the fixed benchmark requests.
+    - RSS is the child's own ``ru_maxrss`` from ``wait4``; with ``workers > 1``
+      it covers the parent process only.
+    - A non-zero exit status raises ``ConfigError``.
+    """
+    if requests < 1:
+        raise ValueError("requests must be greater than or equal to 1")
+    lines = [f"{json.dumps(payload)}\n" for payload in BENCHMARK_REQUESTS.values()]
+    process = subprocess.Popen(
+        [sys.executable, "-m", "mealplan", "batch", "--workers", str(workers)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        env={**os.environ, NO_DAEMON_ENV_VAR: "1"},
+    )
+    assert process.stdin is not None
+    try:
+        process.stdin.writelines(islice(cycle(lines), requests))
+    finally:
+        process.stdin.close()
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise ConfigError(f"batch memory benchmark: exit {process.returncode}")
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return BatchMemoryResult(requests=requests, peak_rss_bytes=usage.ru_maxrss * scale)
+
+
+def format_allocation_results(results: Iterable[AllocationResult]) -> str:
+    """Render allocation results as a Markdown table."""
+    lines = [
+        "| benchmark | peak_bytes | retained_bytes | retained_blocks |",
+        "| --- | --- | --- | --- |",
+    ]
+    for result in results:
+        lines.append(
+            f"| {result.name} | {result.peak_bytes:,} | {result.retained_bytes:,} | "
+            f"{result.retained_blocks:.1f} |"
+        )
+    return "\n".join(lines)
+
+
+def format_batch_memory_results(results: Iterable[BatchMemoryResult]) -> str:
+    """Render batch peak RSS results as a Markdown table."""
+    lines = ["| requests | peak_rss_mib |", "| --- | --- |"]
+    for result in results:
+        lines.append(f"| {result.requests:,} | {result.peak_rss_bytes / 2**20:.1f} |")
+    return "\n".join(lines)
@@ -0,0 +1,171 @@
+"""Microbenchmarks of domain functions, contract parsing, the service and renderers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
+from mealplan.application.orchestration import (
+    MealPlanCalculationService,
+    validate_meal_plan_request,
+)
+from mealplan.application.parsing import parse_contract
+from mealplan.benchmarks.harness import BenchmarkCase
+from mealplan.domain.model import UserProfile
+from mealplan.domain.services import (
+    calculate_macro_targets,
+    calculate_meal_split_and_response_payload_with_warnings,
+    calculate_tdee_kcal,
+    calculate_training_calorie_demand_kcal,
+    calculate_training_carbs_g,
+)
+
+if TYPE_CHECKING:
+    from mealplan.cli.main import OutputFormat
+
+# Fixed requests covering the assembly branches; never change them in place, or
+# saved baselines stop being comparable. Add new entries instead.
+BENCHMARK_REQUESTS: dict[str, dict[str, Any]] = {
+    "periodized_training": {
+        "age": 35,
+        "gender": "male",
+        "height_cm": 178,
+        "weight_kg": 72.5,
+        "vo2max": 55,
+        "activity_level": "medium",
+        "carb_mode": "periodized",
+        "training_load_tomorrow": "high",
+        "training_session": {
+            "zones_minutes": {"1": 20, "2": 40, "3": 15},
+            "training_before_meal": "lunch",
+        },
+    },
+    "periodized_rest": {
+        "age": 42,
+        "gender": "female",
+        "height_cm": 165,
+        "weight_kg": 60.0,
+        "activity_level": "low",
+        "carb_mode": "periodized",
+        "training_load_tomorrow": "low",
+    },
+    "low_carbs": {
+        "age": 29,
+        "gender": "male",
+        "height_cm": 185,
+        "weight_kg": 82.0,
+        "activity_level": "high",
+        "carb_mode": "low",
+        "training_load_tomorrow": "medium",
+        "training_session": {"zones_minutes": {"2": 60}, "training_before_meal": "breakfast"},
+    },
+    "normal_carbs": {
+        "age": 51,
+        "gender": "female",
+        "height_cm": 170,
+        "weight_kg": 64.0,
+        "vo2max": 40,
+        "activity_level": "high",
+        "carb_mode": "normal",
+        "training_load_tomorrow": "medium",
+        "training_session": {"zones_minutes": {"3": 30, "4": 10}, "training_before_meal": "dinner"},
+    },
+    # Training demand exceeds the meal budget, so assembly reduces protein and warns.
+    "protein_reduction": {
+        "age": 70,
+        "gender": "female",
+        "height_cm": 150,
+        "weight_kg": 45.0,
+        "vo2max": 12,
+        "activity_level": "low",
+        "carb_mode": "low",
+        "training_load_tomorrow": "low",
+        "training_session": {"zones_minutes": {"2": 240}, "training_before_meal": "lunch"},
+    },
+}
+RENDER_FORMATS: tuple[OutputFormat, ...] = ("json", "text", "table")
+
+
+def microbenchmark_cases(request_names: Iterable[str] | None = None) -> list[BenchmarkCase]:
+    """Return the domain, contract, service and render cases for each fixed request.
+
+    Case names are ``<group>.<function>[<request>]``; a name filter on the group
+    or request selects a subset.
+    """
+    from mealplan.cli.main import render_response
+
+    cases: list[BenchmarkCase] = []
+    for request_name in request_names or BENCHMARK_REQUESTS:
+        payload = BENCHMARK_REQUESTS[request_name]
+        validated = validate_meal_plan_request(payload)
+        request = validated.request
+        session = validated.training_session
+        profile = UserProfile(
+            age=request.age,
+            gender=request.gender,
+            height_cm=request.height_cm,
+            weight_kg=request.weight_kg,
+            activity_level=request.activity_level,
+        )
+        tdee_kcal = calculate_tdee_kcal(profile)
+        macro_targets = calculate_macro_targets(
+            profile=profile, carb_mode=request.carb_mode, tdee_kcal=tdee_kcal
+        )
+        training_carbs_g = calculate_training_carbs_g(session.zones_minutes)
+        training_demand_kcal = calculate_training_calorie_demand_kcal(
+            age=request.age,
+            gender=request.gender,
+            weight_kg=request.weight_kg,
+            vo2max=request.vo2max,
+            zones_minutes=session.zones_minutes,
+        )
+        service = MealPlanCalculationService()
+        response = service.calculate_validated(validated)
+        response_payload = response.model_dump(mode="json")
+
+        functions: dict[str, Callable[[], object]] = {
+            "domain.tdee": partial(calculate_tdee_kcal, profile),
+            "domain.macro_targets": partial(
+                calculate_macro_targets,
+                profile=profile,
+                carb_mode=request.carb_mode,
+                tdee_kcal=tdee_kcal,
+            ),
+            "domain.training_carbs": partial(calculate_training_carbs_g, session.zones_minutes),
+            "domain.training_demand": partial(
+                calculate_training_calorie_demand_kcal,
+                age=request.age,
+                gender=request.gender,
+                weight_kg=request.weight_kg,
+                vo2max=request.vo2max,
+                zones_minutes=session.zones_minutes,
+            ),
+            "domain.meal_split": partial(
+                calculate_meal_split_and_response_payload_with_warnings,
+                tdee_kcal=tdee_kcal,
+                training_carbs_g=training_carbs_g,
+                training_calorie_demand_kcal=training_demand_kcal,
+                carb_mode=request.carb_mode,
+                training_before_meal=session.training_before_meal,
+                training_load_tomorrow=request.training_load_tomorrow,
+                protein_g=macro_targets.protein_g,
+                carbs_g=macro_targets.carbs_g,
+                fat_g=macro_targets.fat_g,
+            ),
+            "contract.parse_request": partial(parse_contract, MealPlanRequest, payload),
+            "contract.validate_response": partial(
+                MealPlanResponse.model_validate, response_payload
+            ),
+            "service.calculate": partial(service.calculate, request),
+        }
+        for output_format in RENDER_FORMATS:
+            functions[f"render.{output_format}"] = partial(
+                render_response, response=response, output_format=output_format
+            )
+        cases.extend(
+            BenchmarkCase(name=f"{name}[{request_name}]", func=func)
+            for name, func in functions.items()
+        )
+    return cases
@@ -0,0 +1,208 @@
+"""Cold-start benchmarks: fresh-interpreter wall time and ``-X importtime`` breakdown."""
+
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from time import perf_counter_ns
+
+from mealplan.application.stage_timer import nearest_rank_percentile
+from mealplan.cli.client import NO_DAEMON_ENV_VAR
+from mealplan.shared.errors import ConfigError
+
+DEFAULT_STARTUP_RUNS = 20
+DEFAULT_IMPORT_RUNS = 5
+# Invocations timed by ``mealplan bench startup``: scenario name -> CLI argv.
+STARTUP_SCENARIOS: dict[str, tuple[str, ...]] = {
+    "help": ("--help",),
+    "probe": ("probe",),
+    "calculate": (
+        "calculate",
+        "--age",
+        "40",
+        "--gender",
+        "male",
+        "--height",
+        "180",
+        "--weight",
+        "75",
+        "--activity",
+        "medium",
+        "--carbs",
+        "periodized",
+        "--training-tomorrow",
+        "high",
+    ),
+}
+_IMPORT_TIME_PREFIX = "import time:"
+
+
+@dataclass(frozen=True, slots=True)
+class StartupResult:
+    """Wall-time distribution of one scenario over fresh interpreters, in milliseconds."""
+
+    name: str
+    runs: int
+    min_ms: float
+    p50_ms: float
+    p90_ms: float
+    max_ms: float
+
+
+@dataclass(frozen=True, slots=True)
+class ImportCost:
+    """Median import cost of one module group across ``-X importtime`` runs.
+
+    ``self_ms`` sums the self time of every module in the group; ``cumulative_ms``
+    sums the cumulative time of the group's outermost imports (those not nested
+    inside another import of the same group), so it includes what they pulled in.
+    """
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+
+
+def startup_command(argv: Sequence[str], *, import_time: bool = False) -> list[str]:
+    """Return the interpreter command line running ``mealplan`` with ``argv``."""
+    flags = ["-X", "importtime"] if import_time else []
+    return [sys.executable, *flags, "-m", "mealplan", *argv]
+
+
+def measure_startup(
+    name: str,
+    argv: Sequence[str],
+    *,
+    runs: int = DEFAULT_STARTUP_RUNS,
+) -> StartupResult:
+    """Spawn ``runs`` fresh interpreters for ``argv`` and summarize their wall time.
+
+    Contract:
+    - The warm daemon is bypassed, so every run pays the full in-process startup.
+    - One untimed run precedes the timed ones to warm the OS file cache.
+    - A non-zero exit status raises ``ConfigError`` with the captured stderr.
+    """
+    if runs < 1:
+        raise ValueError("runs must be greater than or equal to 1")
+    command = startup_command(argv)
+    _run(command)
+    samples: list[float] = []
+    for _ in range(runs):
+        start = perf_counter_ns()
+        _run(command)
+        samples.append((perf_counter_ns() - start) / 1e6)
+    samples.sort()
+    return StartupResult(
+        name=name,
+        runs=runs,
+        min_ms=samples[0],
+        p50_ms=nearest_rank_percentile(samples, 50),
+        p90_ms=nearest_rank_percentile(samples, 90),
+        max_ms=samples[-1],
+    )
+
+
+def measure_import_costs(
+    argv: Sequence[str],
+    *,
+    runs: int = DEFAULT_IMPORT_RUNS,
+) -> list[ImportCost]:
+    """Return per-group import costs of ``argv``, most expensive self time first.
+
+    Contract:
+    - Each ``mealplan`` module is its own group; every other module is grouped
+      under its top-level package (``typer._click`` counts as ``typer``).
+    - Each figure is the median over ``runs`` fresh interpreters.
+    """
+    if runs < 1:
+        raise ValueError("runs must be greater than or equal to 1")
+    command = startup_command(argv, import_time=True)
+    per_run = [parse_import_times(_run(command).splitlines()) for _ in range(runs)]
+    modules = {module for costs in per_run for module in costs}
+    costs = [
+        ImportCost(
+            module=module,
+            self_ms=statistics.median(run.get(module, (0.0, 0.0))[0] for run in per_run),
+            cumulative_ms=statistics.median(run.get(module, (0.0, 0.0))[1] for run in per_run),
+        )
+        for module in modules
+    ]
+    return sorted(costs, key=lambda cost: (-cost.self_ms, cost.module))
+
+
+def parse_import_times(lines: Iterable[str]) -> dict[str, tuple[float, float]]:
+    """Group ``-X importtime`` lines into ``{group: (self_ms, cumulative_ms)}``."""
+    entries: list[tuple[int, str, float, float]] = []
+    for line in lines:
+        if not line.startswith(_IMPORT_TIME_PREFIX):
+            continue
+        fields = line[len(_IMPORT_TIME_PREFIX) :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The header row.
+        name_field = fields[2].rstrip()
+        module = name_field.lstrip()
+        depth = (len(name_field) - len(module) - 1) // 2
+        group = module if module.startswith("mealplan") else module.partition(".")[0]
+        entries.append((depth, group, int(fields[0]) / 1000, int(fields[1]) / 1000))
+
+    grouped: dict[str, list[float]] = defaultdict(lambda: [0.0, 0.0])
+    # Lines are printed children first; walking them backwards visits parents first.
+    ancestors: list[tuple[int, str]] = []
+    for depth, group, self_ms, cumulative_ms in reversed(entries):
+        while ancestors and ancestors[-1][0] >= depth:
+            ancestors.pop()
+        totals = grouped[group]
+        totals[0] += self_ms
+        if all(ancestor_group != group for _, ancestor_group in ancestors):
+            totals[1] += cumulative_ms
+        ancestors.append((depth, group))
+    return {group: (totals[0], totals[1]) for group, totals in grouped.items()}
+
+
+def format_startup_results(results: Iterable[StartupResult]) -> str:
+    """Render startup distributions as a Markdown table."""
+    lines = [
+        "| scenario | runs | min_ms | p50_ms | p90_ms | max_ms |",
+        "| --- | --- | --- | --- | --- | --- |",
+    ]
+    for result in results:
+        lines.append(
+            f"| {result.name} | {result.runs} | {result.min_ms:.1f} | {result.p50_ms:.1f} | "
+            f"{result.p90_ms:.1f} | {result.max_ms:.1f} |"
+        )
+    return "\n".join(lines)
+
+
+def format_import_costs(costs: Iterable[ImportCost]) -> str:
+    """Render import costs as a ranked Markdown table."""
+    lines = [
+        "| rank | module | self_ms | cumulative_ms |",
+        "| --- | --- | --- | --- |",
+    ]
+    for rank, cost in enumerate(costs, start=1):
+        lines.append(
+            f"| {rank} | {cost.module} | {cost.self_ms:.2f} | {cost.cumulative_ms:.2f} |"
+        )
+    return "\n".join(lines)
+
+
+def _run(command: list[str]) -> str:
+    """Run ``command`` in-process (no daemon) and return its stderr."""
+    completed = subprocess.run(
+        command,
+        check=False,
+        capture_output=True,
+        text=True,
+        env={**os.environ, NO_DAEMON_ENV_VAR: "1"},
+    )
+    if completed.returncode != 0:
+        raise ConfigError(
+            f"startup benchmark {' '.join(command[1:])}: exit {completed.returncode}: "
+            f"{completed.stderr.strip()}"
+        )
+    return completed.stderr
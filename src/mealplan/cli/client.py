@@ -0,0 +1,166 @@
+"""Thin console entrypoint that forwards invocations to a warm ``mealplan serve`` daemon.
+
+This module imports only the standard library so forwarded invocations skip
+loading typer, pydantic and the contract models. When no daemon answers, it
+falls back to the in-process CLI in ``mealplan.cli.main``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+from dataclasses import dataclass
+
+SOCKET_ENV_VAR = "MEALPLAN_SOCKET"
+# Set to any non-empty value to always run in-process.
+NO_DAEMON_ENV_VAR = "MEALPLAN_NO_DAEMON"
+# Commands whose behavior depends only on argv, so they run identically in the daemon.
+FORWARDED_COMMANDS = frozenset({"calculate", "probe"})
+LOCAL_ONLY_FLAGS = frozenset({"--help", "--install-completion", "--show-completion"})
+CLIENT_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class ForwardedResult:
+    """Captured output and exit status of one daemon-side CLI invocation."""
+
+    stdout: str
+    stderr: str
+    exit_code: int
+
+
+def default_socket_path() -> str:
+    """Return ``$MEALPLAN_SOCKET`` or a per-user socket in the runtime/temp directory.
+
+    The path is only a name; ``forward`` checks who owns the socket before using it.
+    """
+    configured = os.environ.get(SOCKET_ENV_VAR)
+    if configured:
+        return configured
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(runtime_dir, f"mealplan-{os.getuid()}.sock")
+
+
+def code_version_token() -> str:
+    """Return a token that changes whenever the installed ``mealplan`` sources change.
+
+    It is the newest modification time of the package's ``.py`` files, so edits and
+    reinstalls both change it without importing anything beyond the standard library.
+    """
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    newest = 0
+    for directory, _, filenames in os.walk(package_dir):
+        for filename in filenames:
+            if filename.endswith(".py"):
+                newest = max(newest, os.stat(os.path.join(directory, filename)).st_mtime_ns)
+    return str(newest)
+
+
+def should_forward(argv: list[str]) -> bool:
+    """Return whether ``argv`` may be answered by the daemon instead of in-process."""
+    if os.environ.get(NO_DAEMON_ENV_VAR):
+        return False
+    if not argv or argv[0] not in FORWARDED_COMMANDS:
+        return False
+    return not LOCAL_ONLY_FLAGS.intersection(argv)
+
+
+def is_trusted_socket(socket_path: str) -> bool:
+    """Return whether ``socket_path`` is a socket only the current user could have created.
+
+    Contract:
+    - The socket itself must be owned by the current user.
+    - Its directory must be owned by the current user or root, and must not be
+      group/other writable unless it is sticky (like ``/tmp``), so no other user
+      can have swapped the socket.
+    """
+    try:
+        socket_stat = os.lstat(socket_path)
+        directory_stat = os.stat(os.path.dirname(os.path.abspath(socket_path)))
+    except OSError:
+        return False
+    if not stat.S_ISSOCK(socket_stat.st_mode) or socket_stat.st_uid != os.getuid():
+        return False
+    if directory_stat.st_uid not in (0, os.getuid()):
+        return False
+    shared_writable = directory_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    return not shared_writable or bool(directory_stat.st_mode & stat.S_ISVTX)
+
+
+def forward(argv: list[str], *, prog_name: str, socket_path: str) -> ForwardedResult | None:
+    """Send one invocation to the daemon; return ``None`` if it could not answer.
+
+    Sockets failing ``is_trusted_socket``, or served by another user's process
+    where the platform reports peer credentials, are treated as absent. So is a
+    daemon started from different sources, which refuses our ``code_version_token``.
+    """
+    if not is_trusted_socket(socket_path):
+        return None
+    request = {"argv": argv, "prog_name": prog_name, "version": code_version_token()}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(CLIENT_TIMEOUT_SECONDS)
+            connection.connect(socket_path)
+            if not _peer_is_current_user(connection):
+                return None
+            connection.sendall(json.dumps(request).encode() + b"\n")
+            connection.shutdown(socket.SHUT_WR)
+            chunks: list[bytes] = []
+            while chunk := connection.recv(65536):
+                chunks.append(chunk)
+        payload = json.loads(b"".join(chunks))
+        if "error" in payload:
+            return None
+        return ForwardedResult(
+            stdout=payload["stdout"],
+            stderr=payload["stderr"],
+            exit_code=int(payload["exit_code"]),
+        )
+    except (OSError, ValueError, KeyError):
+        # No daemon, a stale socket, or a daemon that died mid-request: forwarded
+        # commands are side-effect free, so the caller can safely run in-process.
+        return None
+
+
+def _peer_is_current_user(connection: socket.socket) -> bool:
+    peer_credentials = getattr(socket, "SO_PEERCRED", None)
+    if peer_credentials is None:
+        # No portable peer-credential query (e.g. macOS); the path checks still apply.
+        return True
+    credentials = struct.Struct("3i")  # struct ucred: pid, uid, gid
+    _, uid, _ = credentials.unpack(
+        connection.getsockopt(socket.SOL_SOCKET, peer_credentials, credentials.size)
+    )
+    return bool(uid == os.getuid())
+
+
+def program_name() -> str:
+    """Mirror Click's program-name detection so usage lines match the in-process CLI."""
+    path = os.path.basename(sys.argv[0])
+    package = getattr(sys.modules.get("__main__"), "__package__", None)
+    if not package:
+        return path
+    module = os.path.splitext(path)[0]
+    if module != "__main__":
+        package = f"{package}.{module}"
+    return f"python -m {package.lstrip('.')}"
+
+
+def main() -> None:
+    """Run ``mealplan``, answering from the daemon when one is listening."""
+    argv = sys.argv[1:]
+    if should_forward(argv):
+        result = forward(argv, prog_name=program_name(), socket_path=default_socket_path())
+        if result is not None:
+            sys.stdout.write(result.stdout)
+            sys.stderr.write(result.stderr)
+            sys.stdout.flush()
+            raise SystemExit(result.exit_code)
+
+    from mealplan.cli.main import main as run_in_process
+
+    run_in_process()
@@ -0,0 +1,122 @@
+"""Unix-socket daemon that answers forwarded CLI invocations from a warm process."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+from collections.abc import Callable
+from types import FrameType
+
+from mealplan.cli.client import code_version_token
+from mealplan.shared.errors import ConfigError
+
+# Runs the CLI for ``argv`` under ``prog_name`` and returns its exit status.
+CliRunner = Callable[[list[str], str], int]
+# Connections are served one at a time, so a client that stalls mid-request is
+# dropped after this long instead of blocking every other invocation.
+DAEMON_CONNECTION_TIMEOUT_SECONDS = 5.0
+# Applied while binding so the socket is never reachable by other users.
+_SOCKET_UMASK = 0o177
+
+
+class _ForwardedInvocationHandler(socketserver.StreamRequestHandler):
+    server: CliDaemon
+    timeout = DAEMON_CONNECTION_TIMEOUT_SECONDS
+
+    def handle(self) -> None:
+        try:
+            line = self.rfile.readline()
+        except TimeoutError:
+            return
+        if not line:
+            # Liveness probes (see ``_remove_stale_socket``) connect and close without a request.
+            return
+        request = json.loads(line)
+        if request.get("version") != self.server.version_token:
+            # A daemon left running across an upgrade must not answer with old rules.
+            refusal = {"error": f"daemon runs code version {self.server.version_token}"}
+            self.wfile.write(json.dumps(refusal).encode())
+            return
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            exit_code = self.server.run_cli(list(request["argv"]), str(request["prog_name"]))
+        response = {
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "exit_code": exit_code,
+        }
+        self.wfile.write(json.dumps(response).encode())
+
+
+class CliDaemon(socketserver.UnixStreamServer):
+    """Serve one forwarded invocation per connection, one at a time.
+
+    Contract:
+    - Requests are a single JSON line ``{"argv": [...], "prog_name": "...", "version": "..."}``.
+    - A ``version`` other than the daemon's ``code_version_token()`` at startup is
+      refused with ``{"error": ...}``, so clients of newer sources run in-process.
+    - The reply is ``{"stdout", "stderr", "exit_code"}`` captured from ``run_cli``,
+      so output and exit codes are exactly those of the in-process CLI.
+    - Invocations are serialized because stdout/stderr capture is process-wide;
+      each connection must send its request within ``DAEMON_CONNECTION_TIMEOUT_SECONDS``.
+    - The socket is created with mode ``0600``.
+    """
+
+    def __init__(self, socket_path: str, run_cli: CliRunner) -> None:
+        self.run_cli = run_cli
+        self.version_token = code_version_token()
+        _remove_stale_socket(socket_path)
+        super().__init__(socket_path, _ForwardedInvocationHandler)
+
+    def server_bind(self) -> None:
+        previous_umask = os.umask(_SOCKET_UMASK)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous_umask)
+
+
+def serve(socket_path: str, run_cli: CliRunner, *, warmup_argv: list[str] | None = None) -> None:
+    """Run the daemon until SIGINT/SIGTERM, removing the socket file on exit."""
+    if warmup_argv is not None:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            run_cli(warmup_argv, "mealplan")
+
+    daemon = CliDaemon(socket_path, run_cli)
+    previous_handler = signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        daemon.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise ConfigError(f"socket {socket_path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return
+    raise ConfigError(f"socket {socket_path} is already served by a running daemon")
+
+
+def _raise_keyboard_interrupt(signum: int, frame: FrameType | None) -> None:
+    _ = signum, frame
+    raise KeyboardInterrupt
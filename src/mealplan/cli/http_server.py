@@ -0,0 +1,278 @@
+"""Stdlib asyncio HTTP/1.1 service answering single and bulk meal plan requests.
+
+Endpoints (request and reply bodies are UTF-8 JSON):
+
+- ``POST /v1/plan``: one ``MealPlanRequest`` document, answered with the
+  coprocess envelope ``{"response", "warnings", "error"}``. The status follows
+  the envelope's exit code through ``HTTP_STATUS_BY_EXIT_CODE``.
+- ``POST /v1/plans``: NDJSON requests, answered ``200`` with one envelope line per
+  non-blank request line (per-request failures stay inside their envelopes). Lines
+  are calculated in slices of ``BULK_YIELD_LINES``, yielding to the event loop
+  between slices so other connections are served while a large body is processed.
+- ``GET /healthz``: liveness probe.
+
+Connections are persistent by default (HTTP/1.1 semantics, ``Connection: close``
+honored), and pipelined requests are answered in order because each connection
+is served by one sequential read/respond loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from mealplan.application.coprocess import calculate_envelope, error_envelope
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.shared.exit_codes import HTTP_STATUS_BY_EXIT_CODE, ExitCode
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_HEADER_COUNT = 100
+# Bounds any single request/header line; longer lines get 431 and the connection is closed.
+MAX_LINE_BYTES = 16 * 1024
+# Bounds the wait for the next request line on an idle connection.
+KEEP_ALIVE_TIMEOUT_SECONDS = 60.0
+# Bounds reading the headers and body once a request has started; generous enough for
+# a ``MAX_BODY_BYTES`` upload over a slow link.
+REQUEST_READ_TIMEOUT_SECONDS = 300.0
+# Bulk lines calculated between event-loop yields: about 1-2 ms of work per slice,
+# while a yield costs a few microseconds.
+BULK_YIELD_LINES = 16
+
+SINGLE_PLAN_PATH = "/v1/plan"
+BULK_PLAN_PATH = "/v1/plans"
+HEALTH_PATH = "/healthz"
+
+
+class _ProtocolError(Exception):
+    """Malformed or unsupported HTTP framing, answered with ``status`` before closing."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(frozen=True, slots=True)
+class _Request:
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+    keep_alive: bool
+
+
+class MealPlanHttpServer:
+    """Serve meal plan endpoints from one reused ``MealPlanCalculationService``.
+
+    Contract:
+    - Calculations run on the event loop, so the shared service is never used from
+      two threads; each is CPU-bound and short, and threads would only add
+      overhead under the GIL. Bulk bodies yield to the loop every
+      ``BULK_YIELD_LINES`` lines so they do not stall other connections.
+    - Framing errors are answered once with ``Connection: close``.
+    - Idle keep-alive connections are closed after ``keep_alive_timeout`` seconds
+      without a request line. Headers and body must then arrive within
+      ``request_read_timeout`` seconds, so slow large uploads are not cut off.
+    """
+
+    def __init__(
+        self,
+        service: MealPlanCalculationService | None = None,
+        *,
+        keep_alive_timeout: float = KEEP_ALIVE_TIMEOUT_SECONDS,
+        request_read_timeout: float = REQUEST_READ_TIMEOUT_SECONDS,
+    ) -> None:
+        self.service = service or MealPlanCalculationService()
+        self.keep_alive_timeout = keep_alive_timeout
+        self.request_read_timeout = request_read_timeout
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        """Bind the listening socket and start accepting connections."""
+        return await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_BYTES)
+
+    async def handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answer requests on one connection until the client or the protocol ends it."""
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(
+                        _read_request_line(reader), timeout=self.keep_alive_timeout
+                    )
+                    if not request_line:
+                        return
+                    request = await asyncio.wait_for(
+                        _read_request(request_line, reader, writer),
+                        timeout=self.request_read_timeout,
+                    )
+                except _ProtocolError as error:
+                    body = error_envelope(str(error), ExitCode.VALIDATION)
+                    writer.write(_response_bytes(error.status, body, keep_alive=False))
+                    await writer.drain()
+                    return
+                status, content_type, body = await self.dispatch(request)
+                writer.write(
+                    _response_bytes(
+                        status, body, keep_alive=request.keep_alive, content_type=content_type
+                    )
+                )
+                await writer.drain()
+                if not request.keep_alive:
+                    return
+        except (TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+            return
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def dispatch(self, request: _Request) -> tuple[HTTPStatus, str, str]:
+        """Route one request and return ``(status, content type, body)``."""
+        routes = {
+            SINGLE_PLAN_PATH: "POST",
+            BULK_PLAN_PATH: "POST",
+            HEALTH_PATH: "GET",
+        }
+        if request.path not in routes:
+            return (
+                HTTPStatus.NOT_FOUND,
+                "application/json",
+                error_envelope(f"no route for {request.path}", ExitCode.VALIDATION),
+            )
+        if request.method != routes[request.path]:
+            return (
+                HTTPStatus.METHOD_NOT_ALLOWED,
+                "application/json",
+                error_envelope(
+                    f"{request.path} accepts {routes[request.path]} only", ExitCode.VALIDATION
+                ),
+            )
+        if request.path == HEALTH_PATH:
+            return HTTPStatus.OK, "application/json", '{"status":"ok"}'
+
+        try:
+            text = request.body.decode("utf-8")
+        except UnicodeDecodeError:
+            return (
+                HTTPStatus.BAD_REQUEST,
+                "application/json",
+                error_envelope("request body is not valid UTF-8", ExitCode.VALIDATION),
+            )
+        if request.path == SINGLE_PLAN_PATH:
+            envelope = calculate_envelope(text, self.service)
+            return HTTP_STATUS_BY_EXIT_CODE[envelope.exit_code], "application/json", envelope.body
+        lines = [line for line in text.splitlines() if line.strip()]
+        envelopes: list[str] = []
+        for start in range(0, len(lines), BULK_YIELD_LINES):
+            if start:
+                await asyncio.sleep(0)
+            envelopes.extend(
+                f"{calculate_envelope(line, self.service).body}\n"
+                for line in lines[start : start + BULK_YIELD_LINES]
+            )
+        return HTTPStatus.OK, "application/x-ndjson", "".join(envelopes)
+
+
+async def serve_http(host: str, port: int, *, server: MealPlanHttpServer | None = None) -> None:
+    """Serve until cancelled."""
+    listener = await (server or MealPlanHttpServer()).start(host, port)
+    async with listener:
+        await listener.serve_forever()
+
+
+async def _read_request_line(reader: asyncio.StreamReader) -> bytes:
+    """Return the next request line, or ``b""`` once the client closed the connection."""
+    try:
+        request_line = await reader.readline()
+        # Tolerate stray CRLFs between pipelined requests (RFC 9112 section 2.2).
+        while request_line in (b"\r\n", b"\n"):
+            request_line = await reader.readline()
+    except (asyncio.LimitOverrunError, ValueError) as error:
+        raise _ProtocolError(
+            HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "request line or header too long"
+        ) from error
+    return request_line
+
+
+async def _read_request(
+    request_line: bytes,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> _Request:
+    try:
+        headers = await _read_headers(reader)
+    except (asyncio.LimitOverrunError, ValueError) as error:
+        raise _ProtocolError(
+            HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "request line or header too long"
+        ) from error
+
+    parts = request_line.decode("latin-1").split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+        raise _ProtocolError(HTTPStatus.BAD_REQUEST, "malformed request line")
+    method, target, version = parts
+
+    connection = headers.get("connection", "").lower()
+    # HTTP/1.1 connections persist unless closed explicitly; HTTP/1.0 ones only on request.
+    keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+    if "transfer-encoding" in headers:
+        raise _ProtocolError(HTTPStatus.NOT_IMPLEMENTED, "chunked request bodies are not supported")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError as error:
+        raise _ProtocolError(HTTPStatus.BAD_REQUEST, "invalid Content-Length") from error
+    if length < 0:
+        raise _ProtocolError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise _ProtocolError(
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"request body exceeds {MAX_BODY_BYTES} bytes"
+        )
+    if length and headers.get("expect", "").lower() == "100-continue":
+        writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+        await writer.drain()
+    body = await reader.readexactly(length) if length else b""
+
+    return _Request(
+        method=method,
+        path=target.split("?", 1)[0],
+        headers=headers,
+        body=body,
+        keep_alive=keep_alive,
+    )
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    for _ in range(MAX_HEADER_COUNT + 1):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            return headers
+        if not line:
+            raise asyncio.IncompleteReadError(partial=b"", expected=None)
+        name, separator, value = line.decode("latin-1").partition(":")
+        if not separator:
+            raise _ProtocolError(HTTPStatus.BAD_REQUEST, "malformed header line")
+        headers[name.strip().lower()] = value.strip()
+    raise _ProtocolError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "too many request headers")
+
+
+def _response_bytes(
+    status: HTTPStatus,
+    body: str,
+    *,
+    keep_alive: bool,
+    content_type: str = "application/json",
+) -> bytes:
+    payload = body.encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + payload
@@ -1,30 +1,68 @@
-"""CLI entrypoint for the mealplan command."""
+"""CLI entrypoint for the mealplan command.
+
+At module load this imports Typer, the domain enums, the light contract types and
+three stdlib-only helpers used by command signatures and defaults
+(``application.parallel``, ``application.stage_timer`` and ``cli.profiling``), so
+``--help`` and argument errors never pay for pydantic or the calculation stack.
+Commands import every other application module inside their bodies.
+"""
 
 from __future__ import annotations
 
-import json
 import sys
-import traceback
-from typing import Literal
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, TextIO, get_args
 
 import typer
 
-from mealplan.application.contracts import (
-    MealPlanRequest,
-    MealPlanResponse,
-    ProbeRequest,
-    SimulatedErrorKind,
-)
-from mealplan.application.orchestration import MealPlanCalculationService
-from mealplan.application.parsing import parse_contract
-from mealplan.application.stub import run_probe
+from mealplan.application.contract_types import SimulatedErrorKind
+from mealplan.application.parallel import DEFAULT_BATCH_CHUNK_SIZE
+from mealplan.application.stage_timer import DISABLED_STAGE_TIMER, StageTimer
+from mealplan.cli.profiling import ProfileMode
 from mealplan.domain.enums import ActivityLevel, CarbMode, Gender, TrainingLoadTomorrow
-from mealplan.shared.errors import ValidationError
+from mealplan.shared.errors import ConfigError, ValidationError
 from mealplan.shared.exit_codes import map_exception_to_exit_code
 
+if TYPE_CHECKING:
+    from mealplan.application.batch import BatchRecord
+    from mealplan.application.contracts import MealPlanResponse
+    from mealplan.application.orchestration import MealPlanCalculationService
+    from mealplan.application.parallel import ServiceFactory
+    from mealplan.application.scenarios import ScenarioComparison
+    from mealplan.domain.vectorized import ProfileColumns
+    from mealplan.infrastructure.roster import RosterChunk
+    from mealplan.infrastructure.sqlite_cache import SqliteResultCache
+
+# Rows per vectorized chunk; large enough to amortize per-chunk overhead, small enough to stream.
+DEFAULT_COLUMNAR_CHUNK_ROWS = 65_536
+# ``bench compare`` exit status when a metric regressed. It reports a result, not an
+# error, so it is not an ``ExitCode`` member.
+BENCH_REGRESSION_EXIT_CODE = 1
+
 app = typer.Typer(no_args_is_help=True, help="Mealplan command-line interface.")
+roster_app = typer.Typer(no_args_is_help=True, help="Build and query binary athlete rosters.")
+app.add_typer(roster_app, name="roster")
+cache_app = typer.Typer(no_args_is_help=True, help="Inspect and maintain the persistent cache.")
+app.add_typer(cache_app, name="cache")
+bench_app = typer.Typer(no_args_is_help=True, help="Measure calculation and startup performance.")
+app.add_typer(bench_app, name="bench")
 _DEBUG_MODE = False
 
+PROFILE_OPTION = typer.Option(
+    None,
+    "--profile",
+    help="Profile the command and write the result to PATH (.pstats, or collapsed stacks).",
+)
+PROFILE_MODE_OPTION = typer.Option(
+    "deterministic",
+    "--profile-mode",
+    help=(
+        "Profiler for --profile: deterministic (cProfile .pstats) or sample "
+        "(low-overhead stack sampler writing flamegraph-ready collapsed stacks)."
+    ),
+)
 SIMULATED_ERROR_OPTION = typer.Option(
     default=None,
     help="Simulate a named error pathway for scaffolding tests.",
@@ -55,6 +93,15 @@ TRAINING_BEFORE_OPTION = typer.Option(
     "--training-before",
     help="Meal before training.",
 )
+COMPARE_OPTION = typer.Option(
+    None,
+    "--compare",
+    help=(
+        "Compare scenarios instead of one plan: comma-separated DIMENSION=VALUE pairs over "
+        "training_before, carbs and training_tomorrow, where VALUE may be all "
+        "(e.g. 'training_before=all,carbs=all')."
+    ),
+)
 OUTPUT_FORMAT_OPTION = typer.Option(
     "json",
     "--format",
@@ -65,12 +112,301 @@ DEBUG_OPTION = typer.Option(
     "--debug",
     help="Enable debug output placeholder.",
 )
+PROFILE_STAGES_OPTION = typer.Option(
+    False,
+    "--profile-stages",
+    help="Report per-stage wall-clock timings to stderr (aggregated min/p50/p99 for batch).",
+)
+BATCH_INPUT_OPTION = typer.Option(
+    "-",
+    "--input",
+    help="NDJSON file with one MealPlanRequest per line, or '-' for stdin.",
+)
+BATCH_OUTPUT_OPTION = typer.Option(
+    "-",
+    "--output",
+    help="NDJSON file receiving one MealPlanResponse per line, or '-' for stdout.",
+)
+BATCH_WORKERS_OPTION = typer.Option(
+    1,
+    "--workers",
+    min=1,
+    help="Worker processes; 1 runs serially in-process.",
+)
+BATCH_CHUNK_SIZE_OPTION = typer.Option(
+    None,
+    "--chunk-size",
+    min=1,
+    help=(
+        f"Request lines per worker chunk when --workers > 1 (default {DEFAULT_BATCH_CHUNK_SIZE}), "
+        f"or roster rows per vectorized chunk for columnar input "
+        f"(default {DEFAULT_COLUMNAR_CHUNK_ROWS})."
+    ),
+)
+BATCH_INPUT_FORMAT_OPTION = typer.Option(
+    "ndjson",
+    "--input-format",
+    help=(
+        "Input format: ndjson (one request per line), or csv|parquet|binary (columnar roster)."
+    ),
+)
+BATCH_COLUMN_OPTION = typer.Option(
+    None,
+    "--column",
+    help="Map a roster field to a differently named CSV header, as FIELD=HEADER (repeatable).",
+)
+BATCH_OUTPUT_FORMAT_OPTION = typer.Option(
+    "ndjson",
+    "--output-format",
+    help=(
+        "Output format: ndjson, or parquet (--output is a directory receiving "
+        "plans.parquet and meals.parquet)."
+    ),
+)
+CACHE_SIZE_OPTION = typer.Option(
+    0,
+    "--cache-size",
+    min=0,
+    help=(
+        "Memoize up to N results by request fingerprint (in-memory LRU per process, or the "
+        "entry limit of --cache-db/--shared-cache); 0 disables the in-memory cache."
+    ),
+)
+CACHE_DB_OPTION = typer.Option(
+    None,
+    "--cache-db",
+    help="SQLite file persisting results across runs, keyed by request and rule version.",
+)
+SHARED_CACHE_OPTION = typer.Option(
+    None,
+    "--shared-cache",
+    help=(
+        "Memory-mapped cache file shared by every process that opens it (e.g. on /dev/shm), "
+        "so batch workers share one hit pool."
+    ),
+)
+CACHE_DB_PATH_OPTION = typer.Option(
+    None,
+    "--db",
+    help="Cache database (default: $MEALPLAN_CACHE_DB or the user cache directory).",
+)
+ROSTER_BUILD_INPUT_OPTION = typer.Option(
+    ...,
+    "--input",
+    help="CSV or Parquet roster to convert ('-' reads CSV from stdin).",
+)
+ROSTER_BUILD_INPUT_FORMAT_OPTION = typer.Option(
+    "csv",
+    "--input-format",
+    help="Source roster format: csv|parquet.",
+)
+ROSTER_BUILD_OUTPUT_OPTION = typer.Option(
+    ...,
+    "--output",
+    help="Binary roster file to write; the id index is written next to it as <output>.idx.",
+)
+ROSTER_PATH_OPTION = typer.Option(..., "--roster", help="Binary roster file.")
+ATHLETE_ID_OPTION = typer.Option(..., "--athlete-id", help="Athlete id to calculate.")
+POPULATION_SIZE_OPTION = typer.Option(..., "--n", min=0, help="Number of athletes to generate.")
+POPULATION_SEED_OPTION = typer.Option(
+    0,
+    "--seed",
+    min=0,
+    help="Random seed; the same seed always yields the same athletes.",
+)
+POPULATION_FORMAT_OPTION = typer.Option(
+    "ndjson",
+    "--format",
+    help=(
+        "Output format: ndjson (one MealPlanRequest per line), csv, parquet or binary "
+        "(columnar rosters for 'batch --input-format')."
+    ),
+)
+POPULATION_OUTPUT_OPTION = typer.Option(
+    "-",
+    "--output",
+    help="Output file, or '-' for stdout (ndjson and csv only).",
+)
+SERVE_SOCKET_OPTION = typer.Option(
+    None,
+    "--socket",
+    help="Unix socket path (default: $MEALPLAN_SOCKET or a per-user runtime socket).",
+)
+BENCH_FILTER_OPTION = typer.Option(
+    None,
+    "--filter",
+    help="Run only benchmarks whose name contains TEXT (repeatable).",
+)
+BENCH_MIN_TIME_OPTION = typer.Option(
+    0.2,
+    "--min-time",
+    min=0.0,
+    help="Minimum measured seconds per benchmark.",
+)
+BENCH_RUNS_OPTION = typer.Option(
+    20,
+    "--runs",
+    min=1,
+    help="Fresh interpreters spawned per startup scenario.",
+)
+BENCH_SCENARIO_OPTION = typer.Option(
+    None,
+    "--scenario",
+    help="Startup scenario to time: help|probe|calculate (repeatable; default all).",
+)
+BENCH_IMPORTS_OPTION = typer.Option(
+    "calculate",
+    "--imports",
+    help="Scenario whose -X importtime output is ranked per module.",
+)
+BENCH_IMPORT_RUNS_OPTION = typer.Option(
+    5,
+    "--import-runs",
+    min=1,
+    help="-X importtime runs; each module reports its median.",
+)
+BENCH_TOP_OPTION = typer.Option(
+    30,
+    "--top",
+    min=1,
+    help="Rows of the ranked import table.",
+)
+BENCH_REQUEST_OPTION = typer.Option(
+    "periodized_training",
+    "--request",
+    help="Fixed benchmark request whose calculation is traced.",
+)
+BENCH_CALLS_OPTION = typer.Option(
+    200,
+    "--calls",
+    min=1,
+    help="Traced calls per allocation benchmark.",
+)
+BENCH_BATCH_REQUESTS_OPTION = typer.Option(
+    None,
+    "--batch-requests",
+    min=1,
+    help="Requests streamed through one batch process (repeatable; default 1000, 10000, 100000).",
+)
+BENCH_SUITE_OPTION = typer.Option(
+    None,
+    "--suite",
+    help="Suite to measure: stage|service|render|startup (repeatable; default all).",
+)
+BENCH_TRIALS_OPTION = typer.Option(
+    5,
+    "--trials",
+    min=1,
+    help="Repeated trials per metric; comparisons use the median.",
+)
+BENCH_SUITE_MIN_TIME_OPTION = typer.Option(
+    0.1,
+    "--min-time",
+    min=0.0,
+    help="Minimum measured seconds per service/render benchmark and trial.",
+)
+BENCH_STARTUP_RUNS_OPTION = typer.Option(
+    5,
+    "--startup-runs",
+    min=1,
+    help="Fresh interpreters per startup scenario and trial.",
+)
+BENCH_SAVE_OPTION = typer.Option(
+    None,
+    "--save",
+    help="Write the measured metrics to this baseline JSON file.",
+)
+BENCH_BASELINE_ARGUMENT = typer.Argument(
+    ...,
+    help="Baseline JSON written by 'mealplan bench run --save'.",
+)
+BENCH_THRESHOLD_OPTION = typer.Option(
+    0.10,
+    "--threshold",
+    min=0.0,
+    help="Relative slowdown tolerated before a metric regresses (raised to its trial noise).",
+)
+HTTP_HOST_OPTION = typer.Option("127.0.0.1", "--host", help="Interface to bind.")
+HTTP_PORT_OPTION = typer.Option(8080, "--port", min=0, max=65535, help="TCP port to bind.")
 OutputFormat = Literal["json", "text", "table"]
+# One representative calculation run at daemon startup to warm imports and validators.
+_WARMUP_ARGV = [
+    "calculate",
+    "--age",
+    "40",
+    "--gender",
+    "male",
+    "--height",
+    "180",
+    "--weight",
+    "75",
+    "--activity",
+    "medium",
+    "--carbs",
+    "periodized",
+    "--training-tomorrow",
+    "high",
+]
+BatchInputFormat = Literal["ndjson", "csv", "parquet", "binary"]
+RosterSourceFormat = Literal["csv", "parquet"]
+PopulationFormat = Literal["ndjson", "csv", "parquet", "binary"]
+BatchOutputFormat = Literal["ndjson", "parquet"]
+StartupScenario = Literal["help", "probe", "calculate"]
+
+
+def _output_format(value: str) -> OutputFormat:
+    if value not in get_args(OutputFormat):
+        raise ValueError(value)
+    return value  # type: ignore[return-value]
+
+
+# ``calculate`` flags understood by the fast path: flag -> (parameter, converter).
+# Converters mirror Typer's: ``int``/``float`` for numbers, exact enum values for choices.
+_FAST_CALCULATE_OPTIONS: dict[str, tuple[str, Callable[[str], object]]] = {
+    "--age": ("age", int),
+    "--gender": ("gender", Gender),
+    "--height": ("height", int),
+    "--weight": ("weight", float),
+    "--vo2max": ("vo2max", int),
+    "--activity": ("activity", ActivityLevel),
+    "--carbs": ("carbs", CarbMode),
+    "--training-tomorrow": ("training_tomorrow", TrainingLoadTomorrow),
+    "--training-zones": ("training_zones", str),
+    "--training-before": ("training_before", str),
+    "--compare": ("compare", str),
+    "--format": ("output_format", _output_format),
+}
+_FAST_CALCULATE_REQUIRED = frozenset(
+    {"age", "gender", "height", "weight", "activity", "carbs", "training_tomorrow"}
+)
+_FAST_CALCULATE_DEFAULTS: dict[str, object] = {
+    "vo2max": None,
+    "training_zones": None,
+    "training_before": None,
+    "compare": None,
+    "output_format": "json",
+    "debug": False,
+    "profile_stages": False,
+}
+# Boolean ``calculate`` flags understood by the fast path: flag -> parameter.
+_FAST_CALCULATE_SWITCHES = {"--debug": "debug", "--profile-stages": "profile_stages"}
 
 
 @app.callback()
-def root() -> None:
+def root(
+    ctx: typer.Context,
+    profile: str | None = PROFILE_OPTION,
+    profile_mode: ProfileMode = PROFILE_MODE_OPTION,
+) -> None:
     """Root CLI namespace for mealplan commands."""
+    if profile is None:
+        return
+    from mealplan.cli.profiling import create_profiler
+
+    profiler = create_profiler(profile_mode, profile)
+    # The root context closes after the command returns or raises, so failures are profiled too.
+    ctx.call_on_close(profiler.stop)
+    profiler.start()
 
 
 @app.command("probe")
@@ -78,6 +414,10 @@ def probe_command(
     simulate_error: SimulatedErrorKind | None = SIMULATED_ERROR_OPTION,
 ) -> None:
     """Run a deterministic placeholder command."""
+    from mealplan.application.contracts import ProbeRequest
+    from mealplan.application.parsing import parse_contract
+    from mealplan.application.stub import run_probe
+
     request = parse_contract(ProbeRequest, {"simulate_error": simulate_error})
     response = run_probe(request)
     typer.echo(response.message)
@@ -95,35 +435,712 @@ def calculate_command(
     training_tomorrow: TrainingLoadTomorrow = TRAINING_TOMORROW_OPTION,
     training_zones: str | None = TRAINING_ZONES_OPTION,
     training_before: str | None = TRAINING_BEFORE_OPTION,
+    compare: str | None = COMPARE_OPTION,
     output_format: OutputFormat = OUTPUT_FORMAT_OPTION,
     debug: bool = DEBUG_OPTION,
+    profile_stages: bool = PROFILE_STAGES_OPTION,
 ) -> None:
     """Run production mealplan calculation from typed CLI inputs."""
     global _DEBUG_MODE
     _DEBUG_MODE = debug
-    request_payload: dict[str, object] = {
-        "age": age,
-        "gender": gender,
-        "height_cm": height,
-        "weight_kg": weight,
-        "vo2max": vo2max,
-        "activity_level": activity,
-        "carb_mode": carbs,
-        "training_load_tomorrow": training_tomorrow,
-    }
-    training_session = _build_training_session_payload(
-        training_zones=training_zones,
-        training_before=training_before,
+    from mealplan.application.contracts import MealPlanRequest
+    from mealplan.application.parsing import parse_contract
+
+    stage_timer = StageTimer() if profile_stages else DISABLED_STAGE_TIMER
+    with stage_timer.stage("parse"):
+        request_payload: dict[str, object] = {
+            "age": age,
+            "gender": gender,
+            "height_cm": height,
+            "weight_kg": weight,
+            "vo2max": vo2max,
+            "activity_level": activity,
+            "carb_mode": carbs,
+            "training_load_tomorrow": training_tomorrow,
+        }
+        training_session = _build_training_session_payload(
+            training_zones=training_zones,
+            training_before=training_before,
+        )
+        if training_session is not None:
+            request_payload["training_session"] = training_session
+        request = parse_contract(MealPlanRequest, request_payload)
+        if compare is not None:
+            from mealplan.application.scenarios import parse_scenario_axes
+
+            scenario_axes = parse_scenario_axes(compare)
+
+    service = _calculation_service_class()()
+    if profile_stages:
+        service.stage_timer = stage_timer
+    if compare is not None:
+        comparison = service.compare_scenarios(request, scenario_axes)
+        for result in comparison.results:
+            for warning in result.warnings:
+                typer.echo(f"Warning: {result.label}: {warning}", err=True)
+            if result.error is not None:
+                typer.echo(f"Error: {result.label}: {result.error}", err=True)
+        with stage_timer.stage("render"):
+            output = _render_comparison_output(comparison, output_format=output_format)
+        typer.echo(output)
+        if profile_stages:
+            typer.echo(_render_stage_timings(stage_timer), err=True)
+        return
+    response = service.calculate(request)
+    for warning in getattr(service, "warnings", ()):
+        typer.echo(f"Warning: {warning}", err=True)
+    with stage_timer.stage("render"):
+        output = render_response(response, output_format)
+    typer.echo(output)
+    if profile_stages:
+        typer.echo(_render_stage_timings(stage_timer), err=True)
+
+
+@app.command("serve")
+def serve_command(socket_path: str | None = SERVE_SOCKET_OPTION) -> None:
+    """Keep a warm process answering forwarded calculate/probe invocations on a socket."""
+    from mealplan.cli.client import default_socket_path
+    from mealplan.cli.daemon import serve
+
+    path = socket_path or default_socket_path()
+    typer.echo(f"Serving on {path}", err=True)
+    serve(path, lambda argv, prog_name: run(argv, prog_name=prog_name), warmup_argv=_WARMUP_ARGV)
+
+
+@app.command("http")
+def http_command(
+    host: str = HTTP_HOST_OPTION,
+    port: int = HTTP_PORT_OPTION,
+    cache_size: int = CACHE_SIZE_OPTION,
+    cache_db: str | None = CACHE_DB_OPTION,
+    shared_cache: str | None = SHARED_CACHE_OPTION,
+) -> None:
+    """Serve single (POST /v1/plan) and bulk (POST /v1/plans) calculations over HTTP."""
+    import asyncio
+
+    from mealplan.cli.http_server import MealPlanHttpServer, serve_http
+
+    service = _calculation_service_factory(cache_size, cache_db, shared_cache)()
+    typer.echo(f"Listening on http://{host}:{port}", err=True)
+    try:
+        with suppress(KeyboardInterrupt):
+            asyncio.run(serve_http(host, port, server=MealPlanHttpServer(service)))
+    finally:
+        _close_service(service)
+
+
+@app.command("coprocess")
+def coprocess_command(
+    cache_size: int = CACHE_SIZE_OPTION,
+    cache_db: str | None = CACHE_DB_OPTION,
+    shared_cache: str | None = SHARED_CACHE_OPTION,
+) -> None:
+    """Answer JSON request lines on stdin with JSON envelope lines on stdout until EOF."""
+    from mealplan.application.coprocess import run_coprocess
+
+    service = _calculation_service_factory(cache_size, cache_db, shared_cache)()
+    try:
+        run_coprocess(sys.stdin, sys.stdout, service)
+    finally:
+        _close_service(service)
+
+
+@app.command("batch")
+def batch_command(
+    input_path: str = BATCH_INPUT_OPTION,
+    output_path: str = BATCH_OUTPUT_OPTION,
+    input_format: BatchInputFormat = BATCH_INPUT_FORMAT_OPTION,
+    output_format: BatchOutputFormat = BATCH_OUTPUT_FORMAT_OPTION,
+    column: list[str] | None = BATCH_COLUMN_OPTION,
+    workers: int = BATCH_WORKERS_OPTION,
+    chunk_size: int | None = BATCH_CHUNK_SIZE_OPTION,
+    cache_size: int = CACHE_SIZE_OPTION,
+    cache_db: str | None = CACHE_DB_OPTION,
+    shared_cache: str | None = SHARED_CACHE_OPTION,
+    debug: bool = DEBUG_OPTION,
+    profile_stages: bool = PROFILE_STAGES_OPTION,
+) -> None:
+    """Stream NDJSON requests or a columnar roster into NDJSON or Parquet meal plans."""
+    global _DEBUG_MODE
+    _DEBUG_MODE = debug
+    if input_format == "ndjson":
+        if output_format != "ndjson":
+            raise ValidationError(
+                "--output-format: parquet output requires a columnar input format"
+            )
+        _run_ndjson_batch(
+            input_path=input_path,
+            output_path=output_path,
+            workers=workers,
+            chunk_size=chunk_size or DEFAULT_BATCH_CHUNK_SIZE,
+            service_factory=_calculation_service_factory(cache_size, cache_db, shared_cache),
+            stage_timer=StageTimer() if profile_stages else None,
+        )
+        return
+    if profile_stages:
+        raise ValidationError("--profile-stages: stage timing applies to ndjson input only")
+    if cache_size or cache_db is not None or shared_cache is not None:
+        raise ValidationError(
+            "--cache-size/--cache-db/--shared-cache: result caching applies to ndjson input only"
+        )
+    if workers != 1:
+        raise ValidationError("--workers: columnar input is vectorized in-process; use --workers 1")
+    if column and input_format != "csv":
+        raise ValidationError("--column: header mapping applies to csv input only")
+    _run_columnar_batch(
+        input_path=input_path,
+        input_format=input_format,
+        output_path=output_path,
+        output_format=output_format,
+        chunk_rows=chunk_size or DEFAULT_COLUMNAR_CHUNK_ROWS,
+        column_mapping=_parse_column_mapping(column),
     )
-    if training_session is not None:
-        request_payload["training_session"] = training_session
 
+
+@app.command("generate-population")
+def generate_population_command(
+    n: int = POPULATION_SIZE_OPTION,
+    seed: int = POPULATION_SEED_OPTION,
+    output_format: PopulationFormat = POPULATION_FORMAT_OPTION,
+    output_path: str = POPULATION_OUTPUT_OPTION,
+) -> None:
+    """Write a seeded synthetic athlete population for load and scale testing."""
+    try:
+        from mealplan.application.population import generate_population, render_request_json
+    except ModuleNotFoundError as error:
+        raise ConfigError(
+            f"population generation requires the optional 'vectorized' extra "
+            f"(pip install 'mealplan-cli[vectorized]'): {error}"
+        ) from error
+
+    chunks = generate_population(n, seed=seed)
+    if output_format in ("parquet", "binary") and output_path == "-":
+        raise ValidationError(f"--output: {output_format} output requires a file path")
+    if output_format == "binary":
+        from mealplan.infrastructure.binary_roster import BinaryRosterWriter
+
+        with BinaryRosterWriter(output_path) as writer:
+            for columns in chunks:
+                writer.write(columns)
+        return
+    if output_format == "parquet":
+        try:
+            from mealplan.infrastructure.arrow_roster import ParquetRosterWriter
+        except ModuleNotFoundError as error:
+            raise _arrow_extra_error(error) from error
+        with ParquetRosterWriter(output_path) as parquet_writer:
+            for columns in chunks:
+                parquet_writer.write(columns)
+        return
+
+    from mealplan.infrastructure.csv_roster import CSV_ROSTER_HEADER, csv_roster_lines
+
+    render = csv_roster_lines if output_format == "csv" else render_request_json
+    with _open_text_stream(output_path, "w") as output_file:
+        if output_format == "csv":
+            output_file.write(f"{CSV_ROSTER_HEADER}\n")
+        for columns in chunks:
+            lines = render(columns)
+            output_file.write("\n".join(lines))
+            output_file.write("\n")
+
+
+@roster_app.command("build")
+def roster_build_command(
+    input_path: str = ROSTER_BUILD_INPUT_OPTION,
+    input_format: RosterSourceFormat = ROSTER_BUILD_INPUT_FORMAT_OPTION,
+    output_path: str = ROSTER_BUILD_OUTPUT_OPTION,
+    column: list[str] | None = BATCH_COLUMN_OPTION,
+    chunk_size: int | None = BATCH_CHUNK_SIZE_OPTION,
+    debug: bool = DEBUG_OPTION,
+) -> None:
+    """Convert a CSV or Parquet roster into a fixed-width binary roster with an id index."""
+    global _DEBUG_MODE
+    _DEBUG_MODE = debug
+    if column and input_format != "csv":
+        raise ValidationError("--column: header mapping applies to csv input only")
+    try:
+        from mealplan.infrastructure.binary_roster import BinaryRosterWriter
+    except ModuleNotFoundError as error:
+        raise ConfigError(
+            f"binary rosters require the optional 'vectorized' extra "
+            f"(pip install 'mealplan-cli[vectorized]'): {error}"
+        ) from error
+
+    with (
+        _open_roster_chunks(
+            input_path,
+            input_format=input_format,
+            chunk_rows=chunk_size or DEFAULT_COLUMNAR_CHUNK_ROWS,
+            column_mapping=_parse_column_mapping(column),
+        ) as chunks,
+        BinaryRosterWriter(output_path) as writer,
+    ):
+        for chunk in chunks:
+            writer.write(chunk.columns, chunk.athlete_ids)
+
+
+@roster_app.command("calculate")
+def roster_calculate_command(
+    roster_path: str = ROSTER_PATH_OPTION,
+    athlete_id: str = ATHLETE_ID_OPTION,
+    output_format: OutputFormat = OUTPUT_FORMAT_OPTION,
+    debug: bool = DEBUG_OPTION,
+) -> None:
+    """Calculate one athlete's meal plan straight from a memory-mapped binary roster."""
+    global _DEBUG_MODE
+    _DEBUG_MODE = debug
+    from mealplan.application.contracts import MealPlanRequest
+    from mealplan.application.parsing import parse_contract
+
+    try:
+        from mealplan.infrastructure.binary_roster import BinaryRoster
+    except ModuleNotFoundError as error:
+        raise ConfigError(
+            f"binary rosters require the optional 'vectorized' extra "
+            f"(pip install 'mealplan-cli[vectorized]'): {error}"
+        ) from error
+
+    with BinaryRoster(roster_path) as roster:
+        request_payload = roster.request_payload(athlete_id)
     request = parse_contract(MealPlanRequest, request_payload)
-    service = MealPlanCalculationService()
+    service = _calculation_service_class()()
     response = service.calculate(request)
     for warning in getattr(service, "warnings", ()):
         typer.echo(f"Warning: {warning}", err=True)
-    typer.echo(_render_output(response=response, output_format=output_format))
+    typer.echo(render_response(response, output_format))
+
+
+@cache_app.command("stats")
+def cache_stats_command(db_path: str | None = CACHE_DB_PATH_OPTION) -> None:
+    """Print entry count, size, rule version and hit/miss/eviction counters as JSON."""
+    import json
+
+    with _open_sqlite_cache(db_path) as cache:
+        stats = cache.stats()
+        payload = {
+            "path": cache.path,
+            "rule_version": cache.rule_version,
+            "entries": stats.size,
+            "size_bytes": cache.size_bytes(),
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "evictions": stats.evictions,
+        }
+    typer.echo(json.dumps(payload, indent=2))
+
+
+@cache_app.command("clear")
+def cache_clear_command(db_path: str | None = CACHE_DB_PATH_OPTION) -> None:
+    """Delete every cached result and reset the counters."""
+    with _open_sqlite_cache(db_path) as cache:
+        removed = cache.clear()
+    typer.echo(f"Removed {removed} cached results")
+
+
+@cache_app.command("vacuum")
+def cache_vacuum_command(db_path: str | None = CACHE_DB_PATH_OPTION) -> None:
+    """Rebuild the cache database to reclaim space freed by evictions and clears."""
+    with _open_sqlite_cache(db_path) as cache:
+        before = cache.size_bytes()
+        cache.vacuum()
+        after = cache.size_bytes()
+    typer.echo(f"Vacuumed {cache.path}: {before} -> {after} bytes")
+
+
+@bench_app.command("micro")
+def bench_micro_command(
+    name_filter: list[str] | None = BENCH_FILTER_OPTION,
+    min_time: float = BENCH_MIN_TIME_OPTION,
+) -> None:
+    """Time domain functions, contract parsing, the service and each output format."""
+    from mealplan.benchmarks.harness import format_results, run_cases
+    from mealplan.benchmarks.micro import microbenchmark_cases
+
+    cases = [
+        case
+        for case in microbenchmark_cases()
+        if not name_filter or any(text in case.name for text in name_filter)
+    ]
+    if not cases:
+        raise ValidationError("--filter: no benchmark matches")
+    typer.echo(format_results(run_cases(cases, min_time_s=min_time)))
+
+
+@bench_app.command("startup")
+def bench_startup_command(
+    scenario: list[str] | None = BENCH_SCENARIO_OPTION,
+    runs: int = BENCH_RUNS_OPTION,
+    imports: StartupScenario = BENCH_IMPORTS_OPTION,
+    import_runs: int = BENCH_IMPORT_RUNS_OPTION,
+    top: int = BENCH_TOP_OPTION,
+) -> None:
+    """Time fresh-interpreter startup and rank per-module import cost."""
+    from mealplan.benchmarks.startup import (
+        STARTUP_SCENARIOS,
+        format_import_costs,
+        format_startup_results,
+        measure_import_costs,
+        measure_startup,
+    )
+
+    unknown = sorted(set(scenario or ()) - set(STARTUP_SCENARIOS))
+    if unknown:
+        raise ValidationError(f"--scenario: unknown scenario {', '.join(unknown)}")
+    results = [
+        measure_startup(name, STARTUP_SCENARIOS[name], runs=runs)
+        for name in scenario or STARTUP_SCENARIOS
+    ]
+    typer.echo(format_startup_results(results))
+    typer.echo("")
+    costs = measure_import_costs(STARTUP_SCENARIOS[imports], runs=import_runs)
+    typer.echo(f"Import cost of '{imports}' (median of {import_runs} runs):")
+    typer.echo(format_import_costs(costs[:top]))
+
+
+@bench_app.command("memory")
+def bench_memory_command(
+    request: str = BENCH_REQUEST_OPTION,
+    calls: int = BENCH_CALLS_OPTION,
+    batch_requests: list[int] | None = BENCH_BATCH_REQUESTS_OPTION,
+) -> None:
+    """Trace allocations per stage and output format; show batch peak RSS staying flat."""
+    from mealplan.benchmarks.memory import (
+        DEFAULT_BATCH_REQUEST_COUNTS,
+        allocation_cases,
+        format_allocation_results,
+        format_batch_memory_results,
+        measure_allocations,
+        measure_batch_peak_rss,
+    )
+    from mealplan.benchmarks.micro import BENCHMARK_REQUESTS
+
+    if request not in BENCHMARK_REQUESTS:
+        raise ValidationError(
+            f"--request: unknown request {request}; expected one of {', '.join(BENCHMARK_REQUESTS)}"
+        )
+    allocations = [measure_allocations(case, calls=calls) for case in allocation_cases(request)]
+    typer.echo(f"Allocations per call of '{request}' ({calls} traced calls):")
+    typer.echo(format_allocation_results(allocations))
+    typer.echo("")
+    batches = [
+        measure_batch_peak_rss(count) for count in batch_requests or DEFAULT_BATCH_REQUEST_COUNTS
+    ]
+    typer.echo("Peak RSS of a streaming 'mealplan batch':")
+    typer.echo(format_batch_memory_results(batches))
+
+
+@bench_app.command("run")
+def bench_run_command(
+    suite: list[str] | None = BENCH_SUITE_OPTION,
+    trials: int = BENCH_TRIALS_OPTION,
+    min_time: float = BENCH_SUITE_MIN_TIME_OPTION,
+    startup_runs: int = BENCH_STARTUP_RUNS_OPTION,
+    save: str | None = BENCH_SAVE_OPTION,
+) -> None:
+    """Measure the stage, service, render and startup suites; optionally save a baseline."""
+    from mealplan.benchmarks.baseline import collect_metrics, format_metrics, save_baseline
+
+    metrics = collect_metrics(
+        _bench_suites(suite), trials=trials, min_time_s=min_time, startup_runs=startup_runs
+    )
+    typer.echo(format_metrics(metrics.values()))
+    if save is not None:
+        save_baseline(save, metrics)
+        typer.echo(f"Saved baseline to {save}", err=True)
+
+
+@bench_app.command("compare")
+def bench_compare_command(
+    baseline_path: str = BENCH_BASELINE_ARGUMENT,
+    suite: list[str] | None = BENCH_SUITE_OPTION,
+    trials: int = BENCH_TRIALS_OPTION,
+    min_time: float = BENCH_SUITE_MIN_TIME_OPTION,
+    startup_runs: int = BENCH_STARTUP_RUNS_OPTION,
+    threshold: float = BENCH_THRESHOLD_OPTION,
+) -> None:
+    """Re-measure a saved baseline's suites and exit 1 if any metric regressed."""
+    from mealplan.benchmarks.baseline import (
+        benchmark_environment,
+        collect_metrics,
+        compare_metrics,
+        format_comparisons,
+        load_baseline,
+    )
+
+    environment, baseline = load_baseline(baseline_path)
+    if environment != benchmark_environment():
+        typer.echo(
+            "Warning: baseline was recorded in a different environment "
+            f"({environment.get('python')} on {environment.get('platform')}); "
+            "results may not be comparable",
+            err=True,
+        )
+    suites = _bench_suites(suite or sorted({name.partition(".")[0] for name in baseline}))
+    baseline = {
+        name: metric for name, metric in baseline.items() if name.partition(".")[0] in suites
+    }
+    current = collect_metrics(
+        suites, trials=trials, min_time_s=min_time, startup_runs=startup_runs
+    )
+    comparisons = compare_metrics(baseline, current, threshold=threshold)
+    typer.echo(format_comparisons(comparisons))
+    regressions = [comparison for comparison in comparisons if comparison.status == "regression"]
+    if regressions:
+        typer.echo(f"{len(regressions)} metric(s) regressed", err=True)
+        raise typer.Exit(code=BENCH_REGRESSION_EXIT_CODE)
+
+
+def _bench_suites(names: list[str] | None) -> list[str]:
+    from mealplan.benchmarks.baseline import BENCHMARK_SUITES
+
+    unknown = sorted(set(names or ()) - set(BENCHMARK_SUITES))
+    if unknown:
+        raise ValidationError(f"--suite: unknown suite {', '.join(unknown)}")
+    return [name for name in BENCHMARK_SUITES if not names or name in names]
+
+
+def _open_sqlite_cache(db_path: str | None) -> SqliteResultCache:
+    from mealplan.infrastructure.sqlite_cache import SqliteResultCache, default_cache_path
+
+    return SqliteResultCache(db_path or default_cache_path())
+
+
+def _run_ndjson_batch(
+    *,
+    input_path: str,
+    output_path: str,
+    workers: int,
+    chunk_size: int,
+    service_factory: ServiceFactory,
+    stage_timer: StageTimer | None = None,
+) -> None:
+    service = service_factory() if workers == 1 else None
+    if service is not None and stage_timer is not None:
+        service.stage_timer = stage_timer
+    try:
+        with (
+            _open_text_stream(input_path, "r") as input_file,
+            _open_text_stream(output_path, "w") as output_file,
+        ):
+            records: Iterator[BatchRecord]
+            if service is not None:
+                from mealplan.application.batch import iter_batch_records
+
+                records = iter_batch_records(input_file, service)
+            else:
+                from mealplan.application.parallel import ProcessPoolBatchExecutor
+
+                executor = ProcessPoolBatchExecutor(
+                    workers=workers,
+                    chunk_size=chunk_size,
+                    service_factory=service_factory,
+                    stage_timer=stage_timer,
+                )
+                records = executor.iter_records(input_file)
+            for record in records:
+                for warning in record.warnings:
+                    typer.echo(f"Warning: line {record.line_number}: {warning}", err=True)
+                output_file.write(record.response_json)
+                output_file.write("\n")
+    finally:
+        if service is not None:
+            _close_service(service)
+    if stage_timer is not None:
+        typer.echo(_render_stage_aggregates(stage_timer), err=True)
+
+
+def _calculation_service_factory(
+    cache_size: int,
+    cache_db: str | None = None,
+    shared_cache: str | None = None,
+) -> ServiceFactory:
+    # Factories are partials of module-level callables so process-pool workers can unpickle them.
+    if cache_db is not None and shared_cache is not None:
+        raise ValidationError("--cache-db and --shared-cache are mutually exclusive")
+    if shared_cache is not None:
+        return partial(_shared_caching_service, shared_cache, cache_size or None)
+    if cache_db is not None:
+        return partial(_sqlite_caching_service, cache_db, cache_size or None)
+    if not cache_size:
+        return _calculation_service_class()
+    from mealplan.application.cache import CachingCalculationService
+
+    return partial(CachingCalculationService, max_entries=cache_size)
+
+
+def _sqlite_caching_service(path: str, max_entries: int | None) -> MealPlanCalculationService:
+    from mealplan.application.cache import CachingCalculationService
+    from mealplan.infrastructure.sqlite_cache import (
+        DEFAULT_SQLITE_CACHE_ENTRIES,
+        SqliteResultCache,
+    )
+
+    cache = SqliteResultCache(path, max_entries=max_entries or DEFAULT_SQLITE_CACHE_ENTRIES)
+    return CachingCalculationService(cache)
+
+
+def _shared_caching_service(path: str, max_entries: int | None) -> MealPlanCalculationService:
+    from mealplan.application.cache import CachingCalculationService
+    from mealplan.infrastructure.shared_cache import (
+        DEFAULT_SHARED_CACHE_ENTRIES,
+        SharedMemoryResultCache,
+    )
+
+    cache = SharedMemoryResultCache(path, max_entries=max_entries or DEFAULT_SHARED_CACHE_ENTRIES)
+    return CachingCalculationService(cache)
+
+
+def _calculation_service_class() -> type[MealPlanCalculationService]:
+    # Resolved through the module attribute so tests can monkeypatch
+    # ``mealplan.cli.main.MealPlanCalculationService``.
+    module = sys.modules[__name__]
+    service_class: type[MealPlanCalculationService] = module.MealPlanCalculationService
+    return service_class
+
+
+def _close_service(service: MealPlanCalculationService) -> None:
+    from mealplan.application.cache import CachingCalculationService
+
+    if isinstance(service, CachingCalculationService):
+        service.close()
+
+
+def _run_columnar_batch(
+    *,
+    input_path: str,
+    input_format: BatchInputFormat,
+    output_path: str,
+    output_format: BatchOutputFormat,
+    chunk_rows: int,
+    column_mapping: dict[str, str],
+) -> None:
+    try:
+        from mealplan.application.columnar import iter_calculated_chunks, iter_chunk_records
+    except ModuleNotFoundError as error:
+        raise ConfigError(
+            f"{input_format} input requires the optional 'vectorized' extra "
+            f"(pip install 'mealplan-cli[vectorized]'): {error}"
+        ) from error
+
+    with _open_roster(
+        input_path,
+        input_format=input_format,
+        chunk_rows=chunk_rows,
+        column_mapping=column_mapping,
+    ) as rosters:
+        chunks = iter_calculated_chunks(rosters)
+        if output_format == "parquet":
+            try:
+                from mealplan.infrastructure.arrow_roster import ParquetPlanWriter
+            except ModuleNotFoundError as error:
+                raise _arrow_extra_error(error) from error
+            if output_path == "-":
+                raise ValidationError("--output: parquet output requires a directory path")
+            with ParquetPlanWriter(output_path) as writer:
+                for chunk in chunks:
+                    for row, warning in chunk.iter_warnings():
+                        typer.echo(f"Warning: row {row}: {warning}", err=True)
+                    writer.write(chunk.result, first_row=chunk.first_row)
+            return
+        with _open_text_stream(output_path, "w") as output_file:
+            for chunk in chunks:
+                for record in iter_chunk_records(chunk):
+                    for warning in record.warnings:
+                        typer.echo(f"Warning: row {record.row}: {warning}", err=True)
+                    output_file.write(record.response_json)
+                    output_file.write("\n")
+
+
+@contextmanager
+def _open_roster(
+    input_path: str,
+    *,
+    input_format: BatchInputFormat,
+    chunk_rows: int,
+    column_mapping: dict[str, str],
+) -> Iterator[Iterator[ProfileColumns]]:
+    if input_format == "csv":
+        from mealplan.infrastructure.csv_roster import iter_csv_profile_columns
+
+        with _open_text_stream(input_path, "r", newline="") as stream:
+            yield iter_csv_profile_columns(
+                stream, batch_rows=chunk_rows, column_mapping=column_mapping
+            )
+        return
+    if input_format == "binary":
+        from mealplan.infrastructure.binary_roster import BinaryRoster
+
+        if input_path == "-":
+            raise ValidationError("--input: binary input requires a file path")
+        with BinaryRoster(input_path) as roster:
+            yield roster.iter_profile_columns(batch_rows=chunk_rows)
+        return
+
+    try:
+        from mealplan.infrastructure.arrow_roster import iter_parquet_profile_columns
+    except ModuleNotFoundError as error:
+        raise _arrow_extra_error(error) from error
+    if input_path == "-":
+        raise ValidationError("--input: parquet input requires a file path")
+    yield iter_parquet_profile_columns(input_path, batch_rows=chunk_rows)
+
+
+@contextmanager
+def _open_roster_chunks(
+    input_path: str,
+    *,
+    input_format: RosterSourceFormat,
+    chunk_rows: int,
+    column_mapping: dict[str, str],
+) -> Iterator[Iterator[RosterChunk]]:
+    if input_format == "csv":
+        from mealplan.infrastructure.csv_roster import iter_csv_roster_chunks
+
+        with _open_text_stream(input_path, "r", newline="") as stream:
+            yield iter_csv_roster_chunks(
+                stream, batch_rows=chunk_rows, column_mapping=column_mapping
+            )
+        return
+
+    try:
+        from mealplan.infrastructure.arrow_roster import iter_parquet_roster_chunks
+    except ModuleNotFoundError as error:
+        raise _arrow_extra_error(error) from error
+    if input_path == "-":
+        raise ValidationError("--input: parquet input requires a file path")
+    yield iter_parquet_roster_chunks(input_path, batch_rows=chunk_rows)
+
+
+def _arrow_extra_error(error: ModuleNotFoundError) -> ConfigError:
+    return ConfigError(
+        f"parquet support requires the optional 'arrow' extra "
+        f"(pip install 'mealplan-cli[arrow]'): {error}"
+    )
+
+
+def _parse_column_mapping(entries: list[str] | None) -> dict[str, str]:
+    mapping: dict[str, str] = {}
+    for entry in entries or ():
+        field, separator, header = entry.partition("=")
+        if not separator or not field.strip() or not header.strip():
+            raise ValidationError(f"--column: expected FIELD=HEADER, got {entry!r}")
+        mapping[field.strip()] = header.strip()
+    return mapping
+
+
+@contextmanager
+def _open_text_stream(
+    path: str,
+    mode: Literal["r", "w"],
+    *,
+    newline: str | None = None,
+) -> Iterator[TextIO]:
+    if path == "-":
+        yield sys.stdin if mode == "r" else sys.stdout
+        return
+    with open(path, mode, encoding="utf-8", newline=newline) as stream:
+        yield stream
 
 
 def _build_training_session_payload(
@@ -136,6 +1153,8 @@ def _build_training_session_payload(
 
     zones_minutes: object = {}
     if training_zones is not None:
+        import json
+
         try:
             zones_minutes = json.loads(training_zones)
         except json.JSONDecodeError as error:
@@ -150,13 +1169,13 @@ def _build_training_session_payload(
     return payload
 
 
-def _render_output(*, response: MealPlanResponse, output_format: OutputFormat) -> str:
-    mealplan_response = response
+def render_response(response: MealPlanResponse, output_format: OutputFormat) -> str:
+    """Render ``response`` exactly as ``calculate --format output_format`` prints it."""
     if output_format == "json":
-        return mealplan_response.model_dump_json()
+        return response.model_dump_json()
     if output_format == "text":
-        return _render_text_output(mealplan_response)
-    return _render_table_output(mealplan_response)
+        return _render_text_output(response)
+    return _render_table_output(response)
 
 
 def _render_text_output(response: MealPlanResponse) -> str:
@@ -203,12 +1222,150 @@ def _render_table_output(response: MealPlanResponse) -> str:
     return "\n".join(lines)
 
 
-def main() -> None:
-    """Run the root Typer application."""
+def _render_comparison_output(
+    comparison: ScenarioComparison,
+    *,
+    output_format: OutputFormat,
+) -> str:
+    from mealplan.application.scenarios import SCENARIO_MATRIX_COLUMNS
+
+    rows = comparison.matrix()
+    if output_format == "json":
+        import json
+
+        return json.dumps({"columns": SCENARIO_MATRIX_COLUMNS, "rows": rows}, separators=(",", ":"))
+    if output_format == "text":
+        return "\n".join(
+            f"{result.label}: error={result.error}"
+            if result.error is not None
+            else f"{result.label}: "
+            + " ".join(
+                f"{column}={_comparison_cell(value)}"
+                for column, value in zip(SCENARIO_MATRIX_COLUMNS[3:-1], row[3:-1], strict=True)
+            )
+            for result, row in zip(comparison.results, rows, strict=True)
+        )
+    lines = [
+        f"| {' | '.join(SCENARIO_MATRIX_COLUMNS)} |",
+        f"|{' --- |' * len(SCENARIO_MATRIX_COLUMNS)}",
+    ]
+    for row in rows:
+        lines.append(f"| {' | '.join(_comparison_cell(value) for value in row)} |")
+    return "\n".join(lines)
+
+
+def _comparison_cell(value: object) -> str:
+    if value is None:
+        return "none"
+    if isinstance(value, list):
+        return ",".join(value) or "none"
+    return str(value)
+
+
+def _render_stage_timings(stage_timer: StageTimer) -> str:
+    summaries = stage_timer.summaries()
+    total_ns = sum(summary.total_ns for summary in summaries)
+    lines = ["| stage | us | share |", "| --- | --- | --- |"]
+    for summary in summaries:
+        share = summary.total_ns / total_ns if total_ns else 0.0
+        lines.append(f"| {summary.stage} | {summary.total_ns / 1000:.1f} | {share:.1%} |")
+    lines.append(f"| total | {total_ns / 1000:.1f} | 100.0% |")
+    return "\n".join(lines)
+
+
+def _render_stage_aggregates(stage_timer: StageTimer) -> str:
+    lines = [
+        "| stage | count | min_us | p50_us | p99_us | total_ms |",
+        "| --- | --- | --- | --- | --- | --- |",
+    ]
+    for summary in stage_timer.summaries():
+        lines.append(
+            f"| {summary.stage} | {summary.count} | {summary.min_ns / 1000:.1f} | "
+            f"{summary.p50_ns / 1000:.1f} | {summary.p99_ns / 1000:.1f} | "
+            f"{summary.total_ns / 1_000_000:.1f} |"
+        )
+    return "\n".join(lines)
+
+
+def __getattr__(name: str) -> Any:
+    # Orchestration loads on first access and is not bound into the module namespace.
+    if name == "MealPlanCalculationService":
+        from mealplan.application.orchestration import MealPlanCalculationService
+
+        return MealPlanCalculationService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _fast_calculate_arguments(argv: list[str]) -> dict[str, object] | None:
+    """Return ``calculate_command`` arguments for a plain, well-formed ``calculate`` argv.
+
+    Contract:
+    - Accepts only ``calculate`` followed by known flags, each given once as
+      ``--flag value`` or ``--flag=value``, plus ``--debug`` and
+      ``--profile-stages``; all required flags
+      must be present and every value must convert as Typer would convert it.
+    - Returns ``None`` for anything else (help, unknown or repeated flags, values
+      that look like flags, conversion failures), so Typer produces the usage
+      error or help text exactly as before.
+    """
+    if not argv or argv[0] != "calculate":
+        return None
+    arguments: dict[str, object] = {}
+    tokens = iter(argv[1:])
+    for token in tokens:
+        value: object
+        if token in _FAST_CALCULATE_SWITCHES:
+            name, value = _FAST_CALCULATE_SWITCHES[token], True
+        else:
+            flag, separator, text = token.partition("=")
+            option = _FAST_CALCULATE_OPTIONS.get(flag)
+            if option is None:
+                return None
+            if not separator:
+                next_token = next(tokens, None)
+                if next_token is None or next_token.startswith("-"):
+                    return None
+                text = next_token
+            name, convert = option
+            try:
+                value = convert(text)
+            except ValueError:
+                return None
+        if name in arguments:
+            return None
+        arguments[name] = value
+    if not _FAST_CALCULATE_REQUIRED.issubset(arguments):
+        return None
+    return {**_FAST_CALCULATE_DEFAULTS, **arguments}
+
+
+def run(argv: list[str] | None = None, *, prog_name: str | None = None) -> int:
+    """Run the CLI once and return its exit status instead of exiting.
+
+    Well-formed ``calculate`` invocations skip building the Typer app and call
+    ``calculate_command`` directly; everything else goes through Typer.
+    """
+    global _DEBUG_MODE
+    _DEBUG_MODE = False
     try:
-        app()
+        fast_arguments = _fast_calculate_arguments(sys.argv[1:] if argv is None else argv)
+        if fast_arguments is not None:
+            calculate_command(**fast_arguments)  # type: ignore[arg-type]
+            return 0
+        app(args=argv, prog_name=prog_name)
+    except SystemExit as exit_request:
+        code = exit_request.code
+        return code if isinstance(code, int) else int(code is not None)
     except Exception as error:  # noqa: BLE001
         typer.echo(f"Error: {error}", err=True)
         if _DEBUG_MODE:
+            import traceback
+
             traceback.print_exception(type(error), error, error.__traceback__, file=sys.stderr)
-        raise SystemExit(int(map_exception_to_exit_code(error))) from None
+        return int(map_exception_to_exit_code(error))
+    return 0
+
+
+def main() -> None:
+    """Run the root Typer application."""
+    raise SystemExit(run())
@@ -0,0 +1,123 @@
+"""Whole-command profilers behind the global ``--profile`` option.
+
+``deterministic`` wraps the command in ``cProfile`` and writes a ``.pstats``
+file for ``pstats``/snakeviz. ``sample`` interrupts the process on a CPU-time
+interval timer and counts the Python stacks it lands in, then writes them as
+collapsed stacks (``root;caller;callee count`` per line) for flamegraph tools.
+Both use only the standard library; sampling is POSIX only. ``cProfile`` is
+imported on use, so the CLI can import this module at startup.
+"""
+
+from __future__ import annotations
+
+import signal
+from collections import Counter
+from collections.abc import Callable
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+from mealplan.shared.errors import ConfigError
+
+if TYPE_CHECKING:
+    import cProfile
+
+ProfileMode = Literal["deterministic", "sample"]
+SignalHandler = Callable[[int, FrameType | None], Any] | int | None
+# 200 Hz keeps sampling overhead around one percent on the calculation hot path.
+DEFAULT_SAMPLE_INTERVAL_S = 0.005
+
+
+class CommandProfiler(Protocol):
+    """Profiler started before a command runs and stopped once it finishes."""
+
+    def start(self) -> None: ...
+
+    def stop(self) -> None: ...
+
+
+class DeterministicProfiler:
+    """Record every call with ``cProfile`` and dump the stats to ``path``."""
+
+    def __init__(self, path: str) -> None:
+        import cProfile
+
+        self.path = path
+        self._profile: cProfile.Profile = cProfile.Profile()
+
+    def start(self) -> None:
+        """Begin recording calls."""
+        self._profile.enable()
+
+    def stop(self) -> None:
+        """Stop recording and write the ``.pstats`` file."""
+        self._profile.disable()
+        try:
+            self._profile.dump_stats(self.path)
+        except OSError as error:
+            raise ConfigError(f"--profile {self.path}: {error}") from error
+
+
+class StackSampler:
+    """Count the Python stacks of the main thread on a ``SIGPROF`` interval timer.
+
+    Contract:
+    - Samples every ``interval_s`` seconds of process CPU time, so idle waits
+      (reading stdin, waiting on worker processes) are not sampled.
+    - The handler only walks frames and bumps a counter keyed by code objects;
+      stack labels are formatted once, when the profile is written.
+    - Only the main thread of this process is sampled; batch worker processes
+      are not followed.
+    - ``stop`` restores the previous ``SIGPROF`` handler and writes collapsed
+      stacks, most frequent first.
+    """
+
+    def __init__(self, path: str, *, interval_s: float = DEFAULT_SAMPLE_INTERVAL_S) -> None:
+        if interval_s <= 0:
+            raise ValueError("interval_s must be greater than 0")
+        self.path = path
+        self.interval_s = interval_s
+        self.stacks: Counter[tuple[CodeType, ...]] = Counter()
+        self._previous_handler: SignalHandler = signal.SIG_DFL
+
+    def start(self) -> None:
+        """Install the ``SIGPROF`` handler and arm the interval timer."""
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval_s, self.interval_s)
+
+    def stop(self) -> None:
+        """Disarm the timer, restore the previous handler and write the stacks."""
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+        try:
+            with open(self.path, "w", encoding="utf-8") as output:
+                for line in self.collapsed_stacks():
+                    output.write(f"{line}\n")
+        except OSError as error:
+            raise ConfigError(f"--profile {self.path}: {error}") from error
+
+    def collapsed_stacks(self) -> list[str]:
+        """Return ``frame;frame;... count`` lines, root frame first."""
+        return [
+            f"{';'.join(_frame_label(code) for code in reversed(stack))} {count}"
+            for stack, count in self.stacks.most_common()
+        ]
+
+    def _sample(self, signum: int, frame: FrameType | None) -> None:
+        codes: list[CodeType] = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        self.stacks[tuple(codes)] += 1
+
+
+def create_profiler(mode: ProfileMode, path: str) -> CommandProfiler:
+    """Return the profiler for ``mode`` writing to ``path``."""
+    if mode == "sample":
+        return StackSampler(path)
+    return DeterministicProfiler(path)
+
+
+def _frame_label(code: CodeType) -> str:
+    # Semicolons separate frames in the collapsed format, so keep them out of labels.
+    label = f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})"
+    return label.replace(";", ":")
@@ -1,46 +1,90 @@
-"""Domain layer for mealplan."""
+"""Domain layer for mealplan.
 
-from mealplan.domain.energy import (
-    ACTIVITY_FACTOR_BY_LEVEL,
-    activity_factor_for,
-    bmr_kcal_per_day_for,
-    tdee_kcal_per_day_for,
-)
-from mealplan.domain.enums import (
-    ActivityLevel,
-    CarbMode,
-    CarbStrategy,
-    Gender,
-    MealName,
-    TrainingLoadTomorrow,
-)
-from mealplan.domain.macros import (
-    CARBS_FACTOR_BY_MODE,
-    carbs_target_g_for,
-    fat_target_g_for,
-    protein_target_g_for,
-)
-from mealplan.domain.model import (
-    CANONICAL_MEAL_ORDER,
-    MacroTargets,
-    MealAllocation,
-    UserProfile,
-)
-from mealplan.domain.services import (
-    calculate_macro_targets,
-    calculate_meal_split_and_response_payload,
-    calculate_normal_meal_calorie_pool_kcal,
-    calculate_periodized_carb_allocation,
-    calculate_tdee_kcal,
-    calculate_training_calorie_demand_kcal,
-    calculate_training_carbs_g,
-    select_vo2max_used,
-)
-from mealplan.domain.validation import (
-    validate_carb_reconciliation_invariants,
-    validate_macro_targets_invariants,
-    validate_meal_allocation_invariants,
-)
+Public names are re-exported lazily (PEP 562), so importing one submodule such as
+``mealplan.domain.enums`` does not load the rest of the layer.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mealplan.domain.energy import (
+        ACTIVITY_FACTOR_BY_LEVEL,
+        activity_factor_for,
+        bmr_kcal_per_day_for,
+        tdee_kcal_per_day_for,
+    )
+    from mealplan.domain.enums import (
+        ActivityLevel,
+        CarbMode,
+        CarbStrategy,
+        Gender,
+        MealName,
+        TrainingLoadTomorrow,
+    )
+    from mealplan.domain.macros import (
+        CARBS_FACTOR_BY_MODE,
+        carbs_target_g_for,
+        fat_target_g_for,
+        protein_target_g_for,
+    )
+    from mealplan.domain.model import (
+        CANONICAL_MEAL_ORDER,
+        MacroTargets,
+        MealAllocation,
+        UserProfile,
+    )
+    from mealplan.domain.services import (
+        calculate_carb_strategy_by_meal,
+        calculate_macro_targets,
+        calculate_meal_split_and_response_payload,
+        calculate_normal_meal_calorie_pool_kcal,
+        calculate_periodized_carb_allocation,
+        calculate_tdee_kcal,
+        calculate_training_calorie_demand_kcal,
+        calculate_training_carbs_g,
+        select_vo2max_used,
+    )
+    from mealplan.domain.validation import (
+        validate_carb_reconciliation_invariants,
+        validate_macro_targets_invariants,
+        validate_meal_allocation_invariants,
+    )
+
+_EXPORTS: dict[str, str] = {
+    "ACTIVITY_FACTOR_BY_LEVEL": "mealplan.domain.energy",
+    "activity_factor_for": "mealplan.domain.energy",
+    "bmr_kcal_per_day_for": "mealplan.domain.energy",
+    "tdee_kcal_per_day_for": "mealplan.domain.energy",
+    "ActivityLevel": "mealplan.domain.enums",
+    "CarbMode": "mealplan.domain.enums",
+    "CarbStrategy": "mealplan.domain.enums",
+    "Gender": "mealplan.domain.enums",
+    "MealName": "mealplan.domain.enums",
+    "TrainingLoadTomorrow": "mealplan.domain.enums",
+    "CARBS_FACTOR_BY_MODE": "mealplan.domain.macros",
+    "carbs_target_g_for": "mealplan.domain.macros",
+    "fat_target_g_for": "mealplan.domain.macros",
+    "protein_target_g_for": "mealplan.domain.macros",
+    "CANONICAL_MEAL_ORDER": "mealplan.domain.model",
+    "MacroTargets": "mealplan.domain.model",
+    "MealAllocation": "mealplan.domain.model",
+    "UserProfile": "mealplan.domain.model",
+    "calculate_carb_strategy_by_meal": "mealplan.domain.services",
+    "calculate_macro_targets": "mealplan.domain.services",
+    "calculate_meal_split_and_response_payload": "mealplan.domain.services",
+    "calculate_normal_meal_calorie_pool_kcal": "mealplan.domain.services",
+    "calculate_periodized_carb_allocation": "mealplan.domain.services",
+    "calculate_tdee_kcal": "mealplan.domain.services",
+    "calculate_training_calorie_demand_kcal": "mealplan.domain.services",
+    "calculate_training_carbs_g": "mealplan.domain.services",
+    "select_vo2max_used": "mealplan.domain.services",
+    "validate_carb_reconciliation_invariants": "mealplan.domain.validation",
+    "validate_macro_targets_invariants": "mealplan.domain.validation",
+    "validate_meal_allocation_invariants": "mealplan.domain.validation",
+}
 
 __all__ = [
     "ActivityLevel",
@@ -57,6 +101,7 @@ __all__ = [
     "UserProfile",
     "activity_factor_for",
     "bmr_kcal_per_day_for",
+    "calculate_carb_strategy_by_meal",
     "calculate_meal_split_and_response_payload",
     "calculate_macro_targets",
     "calculate_normal_meal_calorie_pool_kcal",
@@ -73,3 +118,16 @@ __all__ = [
     "validate_meal_allocation_invariants",
     "validate_macro_targets_invariants",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
@@ -10,6 +10,12 @@ ACTIVITY_FACTOR_BY_LEVEL: dict[ActivityLevel, float] = {
     ActivityLevel.MEDIUM: 1.375,
     ActivityLevel.HIGH: 1.55,
 }
+# Mifflin-St Jeor BMR: weight (kg), height (cm) and age (years) terms plus a sex offset.
+MIFFLIN_ST_JEOR_WEIGHT_KCAL_PER_KG = 10
+MIFFLIN_ST_JEOR_HEIGHT_KCAL_PER_CM = 6.25
+MIFFLIN_ST_JEOR_AGE_KCAL_PER_YEAR = 5
+MIFFLIN_ST_JEOR_MALE_OFFSET_KCAL = 5
+MIFFLIN_ST_JEOR_FEMALE_OFFSET_KCAL = -161
 
 
 def activity_factor_for(activity_level: ActivityLevel) -> float:
@@ -25,10 +31,14 @@ def bmr_kcal_per_day_for(
     age: int,
 ) -> float:
     """Return BMR in kcal/day using canonical Mifflin-St Jeor equations."""
-    base_value = 10 * weight_kg + 6.25 * height_cm - 5 * age
+    base_value = (
+        MIFFLIN_ST_JEOR_WEIGHT_KCAL_PER_KG * weight_kg
+        + MIFFLIN_ST_JEOR_HEIGHT_KCAL_PER_CM * height_cm
+        - MIFFLIN_ST_JEOR_AGE_KCAL_PER_YEAR * age
+    )
     if gender is Gender.MALE:
-        return base_value + 5
-    return base_value - 161
+        return base_value + MIFFLIN_ST_JEOR_MALE_OFFSET_KCAL
+    return base_value + MIFFLIN_ST_JEOR_FEMALE_OFFSET_KCAL
 
 
 def tdee_kcal_per_day_for(profile: UserProfile) -> float:
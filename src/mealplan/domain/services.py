@@ -34,6 +34,15 @@ ZONE_INTENSITY_BY_ZONE: dict[int, float] = {
     4: 0.80,
     5: 0.925,
 }
+# Kg-based VO2max prediction (ml/kg/min) used when the request omits vo2max; the sex
+# term applies to female athletes.
+VO2MAX_PREDICTION_INTERCEPT = 79.9
+VO2MAX_PREDICTION_PER_YEAR = 0.39
+VO2MAX_PREDICTION_FEMALE = 13.7
+VO2MAX_PREDICTION_PER_KG = 0.28
+# Resting oxygen uptake subtracted from VO2max, and energy per ml of oxygen consumed.
+RESTING_VO2_ML_PER_KG_MIN = 3.5
+KCAL_PER_ML_OXYGEN = 0.005
 
 
 class MealPayloadRow(TypedDict):
@@ -98,7 +107,12 @@ def select_vo2max_used(
         return float(vo2max)
 
     sex = 0 if gender is Gender.MALE else 1
-    return 79.9 - (0.39 * age) - (13.7 * sex) - (0.28 * weight_kg)
+    return (
+        VO2MAX_PREDICTION_INTERCEPT
+        - (VO2MAX_PREDICTION_PER_YEAR * age)
+        - (VO2MAX_PREDICTION_FEMALE * sex)
+        - (VO2MAX_PREDICTION_PER_KG * weight_kg)
+    )
 
 
 def calculate_training_calorie_demand_kcal(
@@ -123,8 +137,8 @@ def calculate_training_calorie_demand_kcal(
         weight_kg=weight_kg,
         vo2max=vo2max,
     )
-    net_vo2max = max(vo2max_used - 3.5, 0.0)
-    base_kcal_per_min = weight_kg * 0.005 * net_vo2max
+    net_vo2max = max(vo2max_used - RESTING_VO2_ML_PER_KG_MIN, 0.0)
+    base_kcal_per_min = weight_kg * KCAL_PER_ML_OXYGEN * net_vo2max
     return sum(
         float(zones_minutes.get(zone, 0)) * base_kcal_per_min * intensity
         for zone, intensity in ZONE_INTENSITY_BY_ZONE.items()
@@ -185,6 +199,29 @@ def calculate_periodized_carb_allocation(
     return allocation
 
 
+def calculate_carb_strategy_by_meal(
+    *,
+    carb_mode: CarbMode,
+    training_before_meal: MealName | None,
+    training_load_tomorrow: TrainingLoadTomorrow,
+) -> dict[MealName, CarbStrategy]:
+    """Return the carb strategy of each canonical meal used by meal assembly."""
+    strategy_by_meal = _baseline_carb_strategy_by_meal(carb_mode=carb_mode)
+    if carb_mode is not CarbMode.PERIODIZED or training_before_meal is None:
+        if carb_mode is CarbMode.PERIODIZED and training_load_tomorrow is TrainingLoadTomorrow.HIGH:
+            strategy_by_meal[MealName.DINNER] = CarbStrategy.HIGH
+        return strategy_by_meal
+
+    high_meals = _periodized_strategy_high_meals(
+        training_before_meal=training_before_meal,
+        training_load_tomorrow=training_load_tomorrow,
+    )
+    for meal in high_meals:
+        strategy_by_meal[meal] = CarbStrategy.HIGH
+
+    return strategy_by_meal
+
+
 def calculate_meal_split_and_response_payload(
     tdee_kcal: float,
     training_carbs_g: float,
@@ -221,8 +258,13 @@ def calculate_meal_split_and_response_payload_with_warnings(
     protein_g: float,
     carbs_g: float,
     fat_g: float,
+    carbs_strategy_by_meal: Mapping[MealName, CarbStrategy] | None = None,
 ) -> MealAssemblyResult:
-    """Return canonical response payload plus non-fatal assembly warnings."""
+    """Return canonical response payload plus non-fatal assembly warnings.
+
+    ``carbs_strategy_by_meal`` reuses a ``calculate_carb_strategy_by_meal`` result
+    computed for the same carb mode, training meal and next-day load.
+    """
     normal_meal_calorie_pool_kcal = calculate_normal_meal_calorie_pool_kcal(
         tdee_kcal=tdee_kcal,
         training_calorie_demand_kcal=training_calorie_demand_kcal,
@@ -231,11 +273,12 @@ def calculate_meal_split_and_response_payload_with_warnings(
 
     protein_g_by_meal = _allocate_total_by_canonical_meal_shares(total=protein_g)
     kcal_by_meal = _allocate_total_by_canonical_meal_shares(total=normal_meal_calorie_pool_kcal)
-    carbs_strategy_by_meal = _carbs_strategy_by_meal(
-        carb_mode=carb_mode,
-        training_before_meal=training_before_meal,
-        training_load_tomorrow=training_load_tomorrow,
-    )
+    if carbs_strategy_by_meal is None:
+        carbs_strategy_by_meal = calculate_carb_strategy_by_meal(
+            carb_mode=carb_mode,
+            training_before_meal=training_before_meal,
+            training_load_tomorrow=training_load_tomorrow,
+        )
 
     warnings: list[str] = []
     meal_allocations = [
@@ -469,28 +512,6 @@ def _baseline_carb_strategy_by_meal(*, carb_mode: CarbMode) -> dict[MealName, Ca
     return dict.fromkeys(CANONICAL_MEAL_ORDER, strategy)
 
 
-def _carbs_strategy_by_meal(
-    *,
-    carb_mode: CarbMode,
-    training_before_meal: MealName | None,
-    training_load_tomorrow: TrainingLoadTomorrow,
-) -> dict[MealName, CarbStrategy]:
-    strategy_by_meal = _baseline_carb_strategy_by_meal(carb_mode=carb_mode)
-    if carb_mode is not CarbMode.PERIODIZED or training_before_meal is None:
-        if carb_mode is CarbMode.PERIODIZED and training_load_tomorrow is TrainingLoadTomorrow.HIGH:
-            strategy_by_meal[MealName.DINNER] = CarbStrategy.HIGH
-        return strategy_by_meal
-
-    high_meals = _periodized_strategy_high_meals(
-        training_before_meal=training_before_meal,
-        training_load_tomorrow=training_load_tomorrow,
-    )
-    for meal in high_meals:
-        strategy_by_meal[meal] = CarbStrategy.HIGH
-
-    return strategy_by_meal
-
-
 def _periodized_strategy_high_meals(
     *,
     training_before_meal: MealName,
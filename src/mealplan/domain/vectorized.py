@@ -0,0 +1,692 @@
+"""Vectorized struct-of-arrays meal plan engine.
+
+This module mirrors the scalar pipeline in ``energy.py``, ``macros.py`` and
+``services.py`` column-wise with NumPy so whole rosters can be calculated in one
+pass. Every arithmetic step keeps the scalar evaluation order, and rounding goes
+through ``_round2`` (Python ``round(..., 2)`` semantics), so each row is
+bit-for-bit identical to ``MealPlanCalculationService.calculate``.
+
+NumPy is an optional dependency (``mealplan-cli[vectorized]``); this module is
+intentionally not re-exported from ``mealplan.domain``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from mealplan.domain.energy import (
+    ACTIVITY_FACTOR_BY_LEVEL,
+    MIFFLIN_ST_JEOR_AGE_KCAL_PER_YEAR,
+    MIFFLIN_ST_JEOR_FEMALE_OFFSET_KCAL,
+    MIFFLIN_ST_JEOR_HEIGHT_KCAL_PER_CM,
+    MIFFLIN_ST_JEOR_MALE_OFFSET_KCAL,
+    MIFFLIN_ST_JEOR_WEIGHT_KCAL_PER_KG,
+)
+from mealplan.domain.enums import (
+    ActivityLevel,
+    CarbMode,
+    CarbStrategy,
+    Gender,
+    MealName,
+    TrainingLoadTomorrow,
+)
+from mealplan.domain.macros import CARBS_FACTOR_BY_MODE
+from mealplan.domain.model import CANONICAL_MEAL_ORDER
+from mealplan.domain.services import (
+    CANONICAL_MEAL_SHARE_TOTAL,
+    CANONICAL_MEAL_SHARE_UNITS,
+    CARB_CALORIE_SHARE_BY_STRATEGY,
+    KCAL_PER_ML_OXYGEN,
+    MEAL_ASSEMBLY_RECONCILIATION_MACRO_ORDER,
+    MEAL_ASSEMBLY_RECONCILIATION_TOLERANCE,
+    RESTING_VO2_ML_PER_KG_MIN,
+    VO2MAX_PREDICTION_FEMALE,
+    VO2MAX_PREDICTION_INTERCEPT,
+    VO2MAX_PREDICTION_PER_KG,
+    VO2MAX_PREDICTION_PER_YEAR,
+    ZONE_INTENSITY_BY_ZONE,
+    MealPayloadRow,
+)
+from mealplan.shared.errors import DomainRuleError, MealPlanError, OutputError, ValidationError
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+CodeArray = npt.NDArray[np.int8]
+BoolArray = npt.NDArray[np.bool_]
+EnumT = TypeVar("EnumT")
+
+# Small-int enum encodings: a code is the member index in these tuples.
+GENDER_CODES: tuple[Gender, ...] = tuple(Gender)
+ACTIVITY_LEVEL_CODES: tuple[ActivityLevel, ...] = tuple(ActivityLevel)
+CARB_MODE_CODES: tuple[CarbMode, ...] = tuple(CarbMode)
+TRAINING_LOAD_TOMORROW_CODES: tuple[TrainingLoadTomorrow, ...] = tuple(TrainingLoadTomorrow)
+CARB_STRATEGY_CODES: tuple[CarbStrategy, ...] = tuple(CarbStrategy)
+MEAL_CODES: tuple[MealName, ...] = CANONICAL_MEAL_ORDER
+NO_TRAINING_BEFORE_MEAL = -1
+
+# Meal matrix columns: six canonical meals followed by the optional training row.
+MEAL_COLUMN_ORDER: tuple[MealName | Literal["training"], ...] = (
+    *CANONICAL_MEAL_ORDER,
+    "training",
+)
+TRAINING_MEAL_COLUMN = len(CANONICAL_MEAL_ORDER)
+TRAINING_ZONE_COUNT = len(ZONE_INTENSITY_BY_ZONE)
+VO2MAX_MIN = 10
+VO2MAX_MAX = 100
+
+_MALE_CODE = GENDER_CODES.index(Gender.MALE)
+_NORMAL_CODE = CARB_MODE_CODES.index(CarbMode.NORMAL)
+_PERIODIZED_CODE = CARB_MODE_CODES.index(CarbMode.PERIODIZED)
+_TOMORROW_HIGH_CODE = TRAINING_LOAD_TOMORROW_CODES.index(TrainingLoadTomorrow.HIGH)
+_LOW_STRATEGY_CODE = CARB_STRATEGY_CODES.index(CarbStrategy.LOW)
+_MEDIUM_STRATEGY_CODE = CARB_STRATEGY_CODES.index(CarbStrategy.MEDIUM)
+_HIGH_STRATEGY_CODE = CARB_STRATEGY_CODES.index(CarbStrategy.HIGH)
+_DINNER_COLUMN = CANONICAL_MEAL_ORDER.index(MealName.DINNER)
+_EVENING_SNACK_COLUMN = CANONICAL_MEAL_ORDER.index(MealName.EVENING_SNACK)
+# Index ``x * 100`` values this close to a half-integer are re-rounded in Python.
+_ROUND_HALF_GUARD = 1e-6
+
+
+@dataclass(frozen=True, slots=True)
+class _RowFailure:
+    """Row mask for one rule plus the scalar-path error it maps to."""
+
+    mask: BoolArray
+    error_type: type[MealPlanError]
+    message: Callable[[int], str]
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileColumns:
+    """Struct-of-arrays request input; one row per athlete.
+
+    Enum columns hold codes into the ``*_CODES`` tuples, ``zones_minutes`` is an
+    ``(N, 5)`` matrix for zones ``1..5``, ``training_before_meal`` holds
+    ``MEAL_CODES`` indexes or ``NO_TRAINING_BEFORE_MEAL``, and ``vo2max`` uses
+    ``NaN`` for omitted values.
+    """
+
+    age: IntArray
+    gender: CodeArray
+    height_cm: IntArray
+    weight_kg: FloatArray
+    activity_level: CodeArray
+    carb_mode: CodeArray
+    training_load_tomorrow: CodeArray
+    zones_minutes: IntArray
+    training_before_meal: CodeArray
+    vo2max: FloatArray
+
+    @classmethod
+    def from_arrays(
+        cls,
+        *,
+        age: npt.ArrayLike,
+        gender: npt.ArrayLike,
+        height_cm: npt.ArrayLike,
+        weight_kg: npt.ArrayLike,
+        activity_level: npt.ArrayLike,
+        carb_mode: npt.ArrayLike,
+        training_load_tomorrow: npt.ArrayLike,
+        zones_minutes: npt.ArrayLike | None = None,
+        training_before_meal: npt.ArrayLike | None = None,
+        vo2max: npt.ArrayLike | None = None,
+    ) -> ProfileColumns:
+        """Coerce array-likes to canonical dtypes, defaulting optional training columns."""
+        age_array = np.asarray(age, dtype=np.int64)
+        row_count = age_array.shape[0]
+        if zones_minutes is None:
+            zones_array = np.zeros((row_count, TRAINING_ZONE_COUNT), dtype=np.int64)
+        else:
+            zones_array = np.asarray(zones_minutes, dtype=np.int64)
+        if training_before_meal is None:
+            before_array = np.full(row_count, NO_TRAINING_BEFORE_MEAL, dtype=np.int8)
+        else:
+            before_array = np.asarray(training_before_meal, dtype=np.int8)
+        if vo2max is None:
+            vo2max_array = np.full(row_count, np.nan, dtype=np.float64)
+        else:
+            vo2max_array = np.asarray(vo2max, dtype=np.float64)
+        columns = cls(
+            age=age_array,
+            gender=np.asarray(gender, dtype=np.int8),
+            height_cm=np.asarray(height_cm, dtype=np.int64),
+            weight_kg=np.asarray(weight_kg, dtype=np.float64),
+            activity_level=np.asarray(activity_level, dtype=np.int8),
+            carb_mode=np.asarray(carb_mode, dtype=np.int8),
+            training_load_tomorrow=np.asarray(training_load_tomorrow, dtype=np.int8),
+            zones_minutes=zones_array,
+            training_before_meal=before_array,
+            vo2max=vo2max_array,
+        )
+        columns.validate_shapes()
+        return columns
+
+    @property
+    def row_count(self) -> int:
+        """Return the number of athlete rows."""
+        return int(self.age.shape[0])
+
+    def validate_shapes(self) -> None:
+        """Require aligned one-dimensional columns and an ``(N, 5)`` zone matrix."""
+        row_count = self.row_count
+        for name in (
+            "age",
+            "gender",
+            "height_cm",
+            "weight_kg",
+            "activity_level",
+            "carb_mode",
+            "training_load_tomorrow",
+            "training_before_meal",
+            "vo2max",
+        ):
+            column = getattr(self, name)
+            if column.shape != (row_count,):
+                raise ValidationError(
+                    f"{name}: expected shape ({row_count},), got {column.shape}"
+                )
+        if self.zones_minutes.shape != (row_count, TRAINING_ZONE_COUNT):
+            raise ValidationError(
+                f"zones_minutes: expected shape ({row_count}, {TRAINING_ZONE_COUNT}), "
+                f"got {self.zones_minutes.shape}"
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class MealPlanColumns:
+    """Struct-of-arrays calculation output aligned with ``MealPlanResponse``.
+
+    Meal matrices are ``(N, 7)`` with columns in ``MEAL_COLUMN_ORDER``; the
+    ``training`` column is only emitted where ``training_meal_present`` is true,
+    immediately before ``training_before_meal`` in response order.
+    """
+
+    tdee_kcal: FloatArray
+    training_kcal: FloatArray
+    protein_g: FloatArray
+    carbs_g: FloatArray
+    fat_g: FloatArray
+    total_kcal: FloatArray
+    meal_carbs_strategy: CodeArray
+    meal_carbs_g: FloatArray
+    meal_protein_g: FloatArray
+    meal_fat_g: FloatArray
+    meal_kcal: FloatArray
+    training_meal_present: BoolArray
+    training_before_meal: CodeArray
+    warnings: dict[int, tuple[str, ...]] = field(default_factory=dict)
+
+    @property
+    def row_count(self) -> int:
+        """Return the number of calculated rows."""
+        return int(self.tdee_kcal.shape[0])
+
+    def meal_columns_at(self, row: int) -> list[int]:
+        """Return meal matrix column indexes for ``row`` in response ``meals`` order."""
+        columns = list(range(TRAINING_MEAL_COLUMN))
+        if not self.training_meal_present[row]:
+            return columns
+        before_meal = int(self.training_before_meal[row])
+        insert_at = TRAINING_MEAL_COLUMN if before_meal < 0 else before_meal
+        columns.insert(insert_at, TRAINING_MEAL_COLUMN)
+        return columns
+
+    def response_meal_order(self) -> tuple[IntArray, BoolArray]:
+        """Return ``meal_columns_at`` for every row as ``(N, 7)`` index and emitted masks.
+
+        Row ``i`` of the index matrix lists meal matrix columns in response order;
+        the mask is false only for the trailing ``training`` slot of rows without
+        a training meal.
+        """
+        insert_at = np.where(
+            self.training_before_meal < 0, TRAINING_MEAL_COLUMN, self.training_before_meal
+        ).astype(np.int64)
+        canonical = np.arange(TRAINING_MEAL_COLUMN, dtype=np.int64)
+        present = self.training_meal_present
+        positions = np.empty((self.row_count, TRAINING_MEAL_COLUMN + 1), dtype=np.int64)
+        positions[:, :TRAINING_MEAL_COLUMN] = canonical + (
+            present[:, None] & (canonical >= insert_at[:, None])
+        )
+        positions[:, TRAINING_MEAL_COLUMN] = np.where(present, insert_at, TRAINING_MEAL_COLUMN)
+        order = np.argsort(positions, axis=1, kind="stable")
+        emitted = (order != TRAINING_MEAL_COLUMN) | present[:, None]
+        return order, emitted
+
+    def payload_at(self, row: int) -> dict[str, object]:
+        """Return the canonical response payload for one row.
+
+        The shape matches ``calculate_meal_split_and_response_payload``.
+        """
+        meals: list[MealPayloadRow] = [
+            {
+                "meal": MEAL_COLUMN_ORDER[column],
+                "carbs_strategy": CARB_STRATEGY_CODES[self.meal_carbs_strategy[row, column]],
+                "carbs_g": float(self.meal_carbs_g[row, column]),
+                "protein_g": float(self.meal_protein_g[row, column]),
+                "fat_g": float(self.meal_fat_g[row, column]),
+                "kcal": float(self.meal_kcal[row, column]),
+            }
+            for column in self.meal_columns_at(row)
+        ]
+        return {
+            "TDEE": float(self.tdee_kcal[row]),
+            "training_kcal": float(self.training_kcal[row]),
+            "protein_g": float(self.protein_g[row]),
+            "carbs_g": float(self.carbs_g[row]),
+            "fat_g": float(self.fat_g[row]),
+            "total_kcal": float(self.total_kcal[row]),
+            "meals": meals,
+        }
+
+
+def calculate_many(columns: ProfileColumns, *, first_row: int = 0) -> MealPlanColumns:
+    """Return meal plans for every row, matching the scalar service row-for-row.
+
+    Contract:
+    - Applies the semantic guards of ``validate_semantic_input`` column-wise.
+    - Raises the error the scalar path would raise for the first failing row,
+      prefixed with ``row <first_row + index>:`` and keeping the same error class.
+    - Protein-reduction warnings are keyed by chunk-local row index in ``warnings``.
+    """
+    result, failures = _calculate_unchecked(columns)
+    _raise_first_failure(failures, row_count=columns.row_count, first_row=first_row)
+    return result
+
+
+def rejected_rows(columns: ProfileColumns) -> BoolArray:
+    """Return a mask of the rows ``calculate_many`` would reject, without raising."""
+    _, failures = _calculate_unchecked(columns)
+    return _failed_mask(failures, row_count=columns.row_count)
+
+
+def _calculate_unchecked(columns: ProfileColumns) -> tuple[MealPlanColumns, list[_RowFailure]]:
+    """Calculate every row and collect the rule failures instead of raising them."""
+    columns.validate_shapes()
+    row_count = columns.row_count
+    failures = _input_failures(columns)
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        age = columns.age.astype(np.float64)
+        height_cm = columns.height_cm.astype(np.float64)
+        weight_kg = columns.weight_kg
+        zones = columns.zones_minutes
+        is_male = columns.gender == _MALE_CODE
+
+        # Energy stage (Mifflin-St Jeor BMR times activity factor).
+        bmr_kcal = (
+            MIFFLIN_ST_JEOR_WEIGHT_KCAL_PER_KG * weight_kg
+            + MIFFLIN_ST_JEOR_HEIGHT_KCAL_PER_CM * height_cm
+            - MIFFLIN_ST_JEOR_AGE_KCAL_PER_YEAR * age
+        ) + np.where(
+            is_male,
+            float(MIFFLIN_ST_JEOR_MALE_OFFSET_KCAL),
+            float(MIFFLIN_ST_JEOR_FEMALE_OFFSET_KCAL),
+        )
+        activity_factor = _lookup(
+            ACTIVITY_FACTOR_BY_LEVEL,
+            ACTIVITY_LEVEL_CODES,
+            columns.activity_level,
+        )
+        tdee_kcal = bmr_kcal * activity_factor
+
+        # Macro stage.
+        protein_target_g = 2 * weight_kg
+        carbs_factor = _lookup(CARBS_FACTOR_BY_MODE, CARB_MODE_CODES, columns.carb_mode)
+        carbs_target_g = carbs_factor * weight_kg
+        fat_target_g = (tdee_kcal - (protein_target_g * 4) - (carbs_target_g * 4)) / 9
+        failures.append(
+            _RowFailure(
+                mask=fat_target_g < 0,
+                error_type=DomainRuleError,
+                message=_static_message(
+                    "macro_targets.fat_g: residual fat target must be greater than or equal to 0"
+                ),
+            )
+        )
+
+        # Fueling stage.
+        total_minutes = zones.sum(axis=1)
+        z1_only = np.all(zones[:, 1:] == 0, axis=1)
+        training_carbs_g = np.where(
+            (total_minutes == 0) | z1_only,
+            0.0,
+            total_minutes.astype(np.float64),
+        )
+
+        # Training-demand stage.
+        sex = np.where(is_male, 0.0, 1.0)
+        predicted_vo2max = (
+            VO2MAX_PREDICTION_INTERCEPT
+            - (VO2MAX_PREDICTION_PER_YEAR * age)
+            - (VO2MAX_PREDICTION_FEMALE * sex)
+            - (VO2MAX_PREDICTION_PER_KG * weight_kg)
+        )
+        vo2max_used = np.where(np.isnan(columns.vo2max), predicted_vo2max, columns.vo2max)
+        net_vo2max = np.maximum(vo2max_used - RESTING_VO2_ML_PER_KG_MIN, 0.0)
+        base_kcal_per_min = weight_kg * KCAL_PER_ML_OXYGEN * net_vo2max
+        training_demand_kcal = np.zeros(row_count, dtype=np.float64)
+        for zone_index, intensity in enumerate(ZONE_INTENSITY_BY_ZONE.values()):
+            minutes = zones[:, zone_index].astype(np.float64)
+            training_demand_kcal = training_demand_kcal + minutes * base_kcal_per_min * intensity
+
+        # Assembly stage.
+        training_meal_kcal = _round2(training_carbs_g * 4.0)
+        meal_pool_kcal = _round2(tdee_kcal + training_demand_kcal - training_meal_kcal)
+        strategy = _carbs_strategy_matrix(columns)
+        carb_share = np.asarray(
+            [CARB_CALORIE_SHARE_BY_STRATEGY[item] for item in CARB_STRATEGY_CODES],
+            dtype=np.float64,
+        )[strategy]
+        fat_share = np.asarray(
+            [1.0 - CARB_CALORIE_SHARE_BY_STRATEGY[item] for item in CARB_STRATEGY_CODES],
+            dtype=np.float64,
+        )[strategy]
+
+        meal_count = len(CANONICAL_MEAL_ORDER)
+        kcal_budget = np.empty((row_count, meal_count), dtype=np.float64)
+        initial_protein_g = np.empty((row_count, meal_count), dtype=np.float64)
+        for column, share_units in enumerate(CANONICAL_MEAL_SHARE_UNITS):
+            share = share_units / float(CANONICAL_MEAL_SHARE_TOTAL)
+            kcal_budget[:, column] = meal_pool_kcal * share
+            initial_protein_g[:, column] = protein_target_g * share
+
+        remaining_kcal = kcal_budget - initial_protein_g * 4.0
+        protein_reduced = remaining_kcal < 0.0
+        allocated_protein_g = np.where(protein_reduced, kcal_budget / 4.0, initial_protein_g)
+        remaining_kcal = np.where(
+            protein_reduced,
+            np.maximum(kcal_budget - allocated_protein_g * 4.0, 0.0),
+            remaining_kcal,
+        )
+        allocated = {
+            "carbs_g": (remaining_kcal * carb_share) / 4.0,
+            "protein_g": allocated_protein_g,
+            "fat_g": (remaining_kcal * fat_share) / 9.0,
+        }
+
+        displayed: dict[str, FloatArray] = {}
+        for macro in MEAL_ASSEMBLY_RECONCILIATION_MACRO_ORDER:
+            target = _sequential_sum(allocated[macro])
+            rounded = _round2(allocated[macro])
+            residual = _round2(target - _sequential_sum(rounded))
+            evening_snack = rounded[:, _EVENING_SNACK_COLUMN]
+            rounded[:, _EVENING_SNACK_COLUMN] = np.where(
+                residual != 0.0,
+                _round2(evening_snack + residual),
+                evening_snack,
+            )
+            reconciled_total = _sequential_sum(rounded)
+            delta = np.abs(reconciled_total - target)
+            failures.append(
+                _RowFailure(
+                    mask=delta > MEAL_ASSEMBLY_RECONCILIATION_TOLERANCE,
+                    error_type=DomainRuleError,
+                    message=_reconciliation_message(
+                        macro=macro,
+                        reconciled_total=reconciled_total,
+                        target=target,
+                        delta=delta,
+                    ),
+                )
+            )
+            displayed[macro] = rounded
+
+        displayed_kcal = _round2(kcal_budget)
+        kcal_residual = _round2(meal_pool_kcal - _round2(_sequential_sum(displayed_kcal)))
+        evening_snack_kcal = displayed_kcal[:, _EVENING_SNACK_COLUMN]
+        displayed_kcal[:, _EVENING_SNACK_COLUMN] = np.where(
+            kcal_residual != 0.0,
+            _round2(evening_snack_kcal + kcal_residual),
+            evening_snack_kcal,
+        )
+
+        training_meal_present = training_carbs_g > 0.0
+        insert_at = np.where(
+            columns.training_before_meal < 0,
+            TRAINING_MEAL_COLUMN,
+            columns.training_before_meal,
+        )
+        training_carbs_row = np.where(training_meal_present, training_carbs_g, 0.0)
+        training_kcal_row = np.where(training_meal_present, training_meal_kcal, 0.0)
+        response_carbs_g = _round2(
+            _sequential_sum_with_insert(displayed["carbs_g"], training_carbs_row, insert_at)
+        )
+        response_protein_g = _round2(_sequential_sum(displayed["protein_g"]))
+        response_fat_g = _round2(_sequential_sum(displayed["fat_g"]))
+        total_kcal = _round2(
+            _sequential_sum_with_insert(displayed_kcal, training_kcal_row, insert_at)
+        )
+        training_kcal = _round2(training_demand_kcal)
+        failures.append(
+            _RowFailure(
+                mask=_round2(total_kcal) != _round2(tdee_kcal + training_kcal),
+                error_type=OutputError,
+                message=_static_message("total_kcal must equal TDEE + training_kcal"),
+            )
+        )
+
+    result = MealPlanColumns(
+        tdee_kcal=tdee_kcal,
+        training_kcal=training_kcal,
+        protein_g=response_protein_g,
+        carbs_g=response_carbs_g,
+        fat_g=response_fat_g,
+        total_kcal=total_kcal,
+        meal_carbs_strategy=np.column_stack(
+            [strategy, np.full(row_count, _HIGH_STRATEGY_CODE, dtype=np.int8)]
+        ).astype(np.int8),
+        meal_carbs_g=np.column_stack([displayed["carbs_g"], training_carbs_row]),
+        meal_protein_g=np.column_stack([displayed["protein_g"], np.zeros(row_count)]),
+        meal_fat_g=np.column_stack([displayed["fat_g"], np.zeros(row_count)]),
+        meal_kcal=np.column_stack([displayed_kcal, training_kcal_row]),
+        training_meal_present=training_meal_present,
+        training_before_meal=columns.training_before_meal,
+        warnings=_protein_reduction_warnings(
+            protein_reduced=protein_reduced,
+            initial_protein_g=initial_protein_g,
+            allocated_protein_g=allocated_protein_g,
+            kcal_budget=kcal_budget,
+        ),
+    )
+    return result, failures
+
+
+def _input_failures(columns: ProfileColumns) -> list[_RowFailure]:
+    zones = columns.zones_minutes
+    before_meal = columns.training_before_meal
+    vo2max = columns.vo2max
+    checks: list[tuple[BoolArray, str]] = [
+        (_invalid_codes(columns.gender, GENDER_CODES), "gender: invalid enum code"),
+        (
+            ~np.isnan(vo2max) & (vo2max < VO2MAX_MIN),
+            f"vo2max: Input should be greater than or equal to {VO2MAX_MIN}",
+        ),
+        (
+            ~np.isnan(vo2max) & (vo2max > VO2MAX_MAX),
+            f"vo2max: Input should be less than or equal to {VO2MAX_MAX}",
+        ),
+        (
+            _invalid_codes(columns.activity_level, ACTIVITY_LEVEL_CODES),
+            "activity_level: invalid enum code",
+        ),
+        (_invalid_codes(columns.carb_mode, CARB_MODE_CODES), "carb_mode: invalid enum code"),
+        (
+            _invalid_codes(columns.training_load_tomorrow, TRAINING_LOAD_TOMORROW_CODES),
+            "training_load_tomorrow: invalid enum code",
+        ),
+        (
+            (before_meal < NO_TRAINING_BEFORE_MEAL) | (before_meal >= len(MEAL_CODES)),
+            "training_session.training_before_meal: invalid enum code",
+        ),
+        (columns.age <= 0, "age: must be greater than 0"),
+        (columns.height_cm <= 0, "height_cm: must be greater than 0"),
+        (~(columns.weight_kg > 0), "weight_kg: must be greater than 0"),
+    ]
+    checks.extend(
+        (
+            zones[:, zone_index] < 0,
+            f"training_session.zones_minutes.{zone_index + 1}: "
+            "minutes must be greater than or equal to 0",
+        )
+        for zone_index in range(TRAINING_ZONE_COUNT)
+    )
+    checks.append(
+        (
+            (zones.sum(axis=1) > 0) & (before_meal == NO_TRAINING_BEFORE_MEAL),
+            "training_session.training_before_meal: required when total zones_minutes > 0",
+        )
+    )
+    return [
+        _RowFailure(mask=mask, error_type=ValidationError, message=_static_message(message))
+        for mask, message in checks
+    ]
+
+
+def _static_message(message: str) -> Callable[[int], str]:
+    return lambda _row: message
+
+
+def _reconciliation_message(
+    *,
+    macro: str,
+    reconciled_total: FloatArray,
+    target: FloatArray,
+    delta: FloatArray,
+) -> Callable[[int], str]:
+    def message(row: int) -> str:
+        return (
+            "meal_assembly.reconciliation: "
+            f"sum(meals.{macro})={float(reconciled_total[row])} "
+            f"differs from target={float(target[row])} "
+            f"(delta={float(delta[row])}, tolerance={MEAL_ASSEMBLY_RECONCILIATION_TOLERANCE})"
+        )
+
+    return message
+
+
+def _raise_first_failure(
+    failures: list[_RowFailure],
+    *,
+    row_count: int,
+    first_row: int,
+) -> None:
+    failed = _failed_mask(failures, row_count=row_count)
+    if not failed.any():
+        return
+
+    row = int(np.argmax(failed))
+    for failure in failures:
+        if failure.mask[row]:
+            raise failure.error_type(f"row {first_row + row}: {failure.message(row)}")
+
+
+def _failed_mask(failures: list[_RowFailure], *, row_count: int) -> BoolArray:
+    failed = np.zeros(row_count, dtype=np.bool_)
+    for failure in failures:
+        failed |= failure.mask
+    return failed
+
+
+def _invalid_codes(codes: CodeArray, members: tuple[object, ...]) -> BoolArray:
+    return (codes < 0) | (codes >= len(members))
+
+
+def _lookup(
+    table: dict[EnumT, float],
+    members: tuple[EnumT, ...],
+    codes: CodeArray,
+) -> FloatArray:
+    values = np.asarray([table[member] for member in members], dtype=np.float64)
+    return values[np.clip(codes, 0, len(members) - 1)]
+
+
+def _carbs_strategy_matrix(columns: ProfileColumns) -> CodeArray:
+    row_count = columns.row_count
+    meal_count = len(CANONICAL_MEAL_ORDER)
+    periodized = columns.carb_mode == _PERIODIZED_CODE
+    baseline = np.where(
+        columns.carb_mode == _NORMAL_CODE,
+        _MEDIUM_STRATEGY_CODE,
+        _LOW_STRATEGY_CODE,
+    ).astype(np.int8)
+    strategy = np.repeat(baseline[:, np.newaxis], meal_count, axis=1)
+
+    tomorrow_high = periodized & (columns.training_load_tomorrow == _TOMORROW_HIGH_CODE)
+    strategy[tomorrow_high, _DINNER_COLUMN] = _HIGH_STRATEGY_CODE
+
+    before_meal = columns.training_before_meal.astype(np.int64)
+    post_training = periodized & (before_meal >= 0)
+    rows = np.arange(row_count)
+    strategy[rows[post_training], before_meal[post_training]] = _HIGH_STRATEGY_CODE
+    has_next_meal = post_training & (before_meal < _DINNER_COLUMN)
+    strategy[rows[has_next_meal], before_meal[has_next_meal] + 1] = _HIGH_STRATEGY_CODE
+    return strategy
+
+
+def _sequential_sum(matrix: FloatArray) -> FloatArray:
+    """Sum matrix columns left to right, matching Python ``sum`` evaluation order."""
+    total = matrix[:, 0].copy()
+    for column in range(1, matrix.shape[1]):
+        total = total + matrix[:, column]
+    return total
+
+
+def _sequential_sum_with_insert(
+    matrix: FloatArray,
+    inserted: FloatArray,
+    insert_at: npt.NDArray[np.int64] | CodeArray,
+) -> FloatArray:
+    """Sum columns left to right with ``inserted`` added before column ``insert_at``.
+
+    Adding ``0.0`` is exact, so rows without an inserted value are unaffected.
+    """
+    total = np.zeros(matrix.shape[0], dtype=np.float64)
+    for column in range(matrix.shape[1]):
+        total = total + np.where(insert_at == column, inserted, 0.0)
+        total = total + matrix[:, column]
+    return total + np.where(insert_at >= matrix.shape[1], inserted, 0.0)
+
+
+def _round2(values: FloatArray) -> FloatArray:
+    """Round to 2 decimals with the exact semantics of Python ``round(x, 2)``.
+
+    ``np.round`` scales by 100 before rounding, which can pick the wrong side of a
+    decimal half-way point; those rare near-tie elements fall back to ``round``.
+    """
+    scaled = values * 100.0
+    rounded = np.rint(scaled) / 100.0
+    distance_to_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5)
+    near_tie = np.flatnonzero(distance_to_tie < _ROUND_HALF_GUARD)
+    if near_tie.size:
+        flat_values = values.reshape(-1)
+        flat_rounded = rounded.reshape(-1)
+        for index in near_tie:
+            flat_rounded[index] = round(float(flat_values[index]), 2)
+    return rounded
+
+
+def _protein_reduction_warnings(
+    *,
+    protein_reduced: BoolArray,
+    initial_protein_g: FloatArray,
+    allocated_protein_g: FloatArray,
+    kcal_budget: FloatArray,
+) -> dict[int, tuple[str, ...]]:
+    warnings: dict[int, tuple[str, ...]] = {}
+    for row in np.flatnonzero(protein_reduced.any(axis=1)):
+        warnings[int(row)] = tuple(
+            "meal_assembly.protein_reduction: "
+            f"reduced {CANONICAL_MEAL_ORDER[column].value} protein from "
+            f"{float(initial_protein_g[row, column]):.2f}g to "
+            f"{float(allocated_protein_g[row, column]):.2f}g "
+            f"to fit {float(kcal_budget[row, column]):.2f} kcal budget"
+            for column in range(len(CANONICAL_MEAL_ORDER))
+            if protein_reduced[row, column]
+        )
+    return warnings
@@ -0,0 +1,415 @@
+"""Apache Arrow and Parquet adapters for columnar rosters and plan output.
+
+Rosters are read as record batches and converted to ``ProfileColumns`` with
+Arrow compute kernels, so enum parsing and validation run per column rather
+than per row; ``ParquetRosterWriter`` writes them back. Calculated chunks are
+written as two Parquet tables: one row per athlete in ``plans.parquet`` and one
+row per meal in ``meals.parquet``, joined on ``row_id``.
+
+PyArrow is an optional dependency (``mealplan-cli[arrow]``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from enum import StrEnum
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from mealplan.domain.vectorized import (
+    ACTIVITY_LEVEL_CODES,
+    CARB_MODE_CODES,
+    CARB_STRATEGY_CODES,
+    GENDER_CODES,
+    MEAL_CODES,
+    MEAL_COLUMN_ORDER,
+    NO_TRAINING_BEFORE_MEAL,
+    TRAINING_LOAD_TOMORROW_CODES,
+    MealPlanColumns,
+    ProfileColumns,
+)
+from mealplan.infrastructure.roster import (
+    MEAL_OUTPUT_COLUMNS,
+    PLAN_OUTPUT_COLUMNS,
+    ROSTER_COLUMNS,
+    ROSTER_ID_COLUMN,
+    ROW_ID_COLUMN,
+    ZONE_ROSTER_COLUMNS,
+    RosterChunk,
+    missing_required_columns,
+)
+from mealplan.shared.errors import ValidationError
+
+PLANS_FILE_NAME = "plans.parquet"
+MEALS_FILE_NAME = "meals.parquet"
+
+PLAN_SCHEMA = pa.schema(
+    [(ROW_ID_COLUMN, pa.int64()), *((name, pa.float64()) for name in PLAN_OUTPUT_COLUMNS)]
+)
+MEAL_SCHEMA = pa.schema(
+    [
+        (ROW_ID_COLUMN, pa.int64()),
+        ("meal", pa.dictionary(pa.int8(), pa.string())),
+        ("carbs_strategy", pa.dictionary(pa.int8(), pa.string())),
+        *((name, pa.float64()) for name in MEAL_OUTPUT_COLUMNS[2:]),
+    ]
+)
+
+ROSTER_SCHEMA = pa.schema(
+    [
+        ("age", pa.int64()),
+        ("gender", pa.dictionary(pa.int8(), pa.string())),
+        ("height_cm", pa.int64()),
+        ("weight_kg", pa.float64()),
+        ("activity_level", pa.dictionary(pa.int8(), pa.string())),
+        ("carb_mode", pa.dictionary(pa.int8(), pa.string())),
+        ("training_load_tomorrow", pa.dictionary(pa.int8(), pa.string())),
+        *((name, pa.int64()) for name in ZONE_ROSTER_COLUMNS),
+        ("training_before_meal", pa.dictionary(pa.int8(), pa.string())),
+        ("vo2max", pa.int64()),
+    ]
+)
+
+_MEAL_DICTIONARY = pa.array([str(meal) for meal in MEAL_COLUMN_ORDER], type=pa.string())
+_CARB_STRATEGY_DICTIONARY = pa.array(
+    [strategy.value for strategy in CARB_STRATEGY_CODES], type=pa.string()
+)
+
+
+def profile_columns_from_arrow(
+    data: pa.RecordBatch | pa.Table,
+    *,
+    first_row: int = 0,
+) -> ProfileColumns:
+    """Convert one Arrow roster batch to ``ProfileColumns``.
+
+    Contract:
+    - Required columns must be present and non-null; enum columns accept string
+      or dictionary-encoded values.
+    - Missing or null ``zone1..zone5`` count as zero minutes, null
+      ``training_before_meal`` means no training meal, and null or NaN ``vo2max`` is
+      omitted. ``vo2max`` must otherwise be integral, as in the JSON and CSV paths.
+    - Errors name the first offending row as ``row <first_row + index>``.
+    """
+    missing = missing_required_columns(data.schema.names)
+    if missing:
+        raise ValidationError(f"roster: missing required columns: {', '.join(missing)}")
+
+    zones = np.zeros((data.num_rows, len(ZONE_ROSTER_COLUMNS)), dtype=np.int64)
+    for index, name in enumerate(ZONE_ROSTER_COLUMNS):
+        if name in data.schema.names:
+            zones[:, index] = _numeric(data, name, pa.int64(), fill=0, first_row=first_row)
+
+    if "training_before_meal" in data.schema.names:
+        training_before_meal = _enum_codes(
+            data, "training_before_meal", MEAL_CODES, first_row=first_row, nullable=True
+        )
+    else:
+        training_before_meal = None
+    if "vo2max" in data.schema.names:
+        vo2max_column = data.column("vo2max")
+        omitted = pc.is_null(vo2max_column, nan_is_null=True)
+        # Cast to int64 like the other integer columns, so non-integral values are
+        # rejected instead of truncated; omitted rows become NaN afterwards.
+        vo2max = _cast_numeric(
+            pc.if_else(omitted, None, vo2max_column),
+            "vo2max",
+            pa.int64(),
+            fill=0,
+            first_row=first_row,
+        ).astype(np.float64)
+        vo2max[omitted.to_numpy(zero_copy_only=False)] = np.nan
+    else:
+        vo2max = None
+
+    return ProfileColumns.from_arrays(
+        age=_numeric(data, "age", pa.int64(), first_row=first_row),
+        gender=_enum_codes(data, "gender", GENDER_CODES, first_row=first_row),
+        height_cm=_numeric(data, "height_cm", pa.int64(), first_row=first_row),
+        weight_kg=_numeric(data, "weight_kg", pa.float64(), first_row=first_row),
+        activity_level=_enum_codes(
+            data, "activity_level", ACTIVITY_LEVEL_CODES, first_row=first_row
+        ),
+        carb_mode=_enum_codes(data, "carb_mode", CARB_MODE_CODES, first_row=first_row),
+        training_load_tomorrow=_enum_codes(
+            data, "training_load_tomorrow", TRAINING_LOAD_TOMORROW_CODES, first_row=first_row
+        ),
+        zones_minutes=zones,
+        training_before_meal=training_before_meal,
+        vo2max=vo2max,
+    )
+
+
+def iter_parquet_profile_columns(
+    path: str | Path,
+    *,
+    batch_rows: int,
+) -> Iterator[ProfileColumns]:
+    """Stream a Parquet roster as ``ProfileColumns`` chunks of at most ``batch_rows`` rows.
+
+    Only roster columns are read, and memory stays bounded by one record batch.
+    """
+    for chunk in iter_parquet_roster_chunks(path, batch_rows=batch_rows):
+        yield chunk.columns
+
+
+def iter_parquet_roster_chunks(path: str | Path, *, batch_rows: int) -> Iterator[RosterChunk]:
+    """Like ``iter_parquet_profile_columns``, also carrying ``athlete_id`` if present."""
+    try:
+        parquet_file = pq.ParquetFile(path)
+    except pa.ArrowInvalid as error:
+        raise ValidationError(f"{path}: not a Parquet file: {error}") from error
+    wanted = (*ROSTER_COLUMNS, ROSTER_ID_COLUMN)
+    names = [name for name in parquet_file.schema_arrow.names if name in wanted]
+    missing = missing_required_columns(names)
+    if missing:
+        raise ValidationError(f"roster: missing required columns: {', '.join(missing)}")
+
+    first_row = 0
+    for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=names):
+        columns = profile_columns_from_arrow(batch, first_row=first_row)
+        athlete_ids = None
+        if ROSTER_ID_COLUMN in names:
+            _reject_nulls(batch.column(ROSTER_ID_COLUMN), ROSTER_ID_COLUMN, first_row=first_row)
+            athlete_ids = pc.cast(batch.column(ROSTER_ID_COLUMN), pa.string()).to_pylist()
+        yield RosterChunk(columns=columns, athlete_ids=athlete_ids)
+        first_row += batch.num_rows
+
+
+def roster_table(columns: ProfileColumns) -> pa.Table:
+    """Return ``columns`` as an Arrow table with ``ROSTER_SCHEMA``.
+
+    Enum columns are dictionary-encoded over their member values; omitted
+    ``training_before_meal`` and ``vo2max`` become nulls, so
+    ``profile_columns_from_arrow`` reads the table back into equal columns.
+    """
+    no_training = columns.training_before_meal == NO_TRAINING_BEFORE_MEAL
+    omitted_vo2max = np.isnan(columns.vo2max)
+    return pa.Table.from_arrays(
+        [
+            pa.array(columns.age),
+            _dictionary(columns.gender, GENDER_CODES),
+            pa.array(columns.height_cm),
+            pa.array(columns.weight_kg),
+            _dictionary(columns.activity_level, ACTIVITY_LEVEL_CODES),
+            _dictionary(columns.carb_mode, CARB_MODE_CODES),
+            _dictionary(columns.training_load_tomorrow, TRAINING_LOAD_TOMORROW_CODES),
+            *(pa.array(zone_minutes) for zone_minutes in columns.zones_minutes.T),
+            _dictionary(
+                np.where(no_training, 0, columns.training_before_meal).astype(np.int8),
+                MEAL_CODES,
+                mask=no_training,
+            ),
+            pa.array(
+                np.where(omitted_vo2max, 0, np.nan_to_num(columns.vo2max)).astype(np.int64),
+                mask=omitted_vo2max,
+            ),
+        ],
+        schema=ROSTER_SCHEMA,
+    )
+
+
+class ParquetRosterWriter:
+    """Append ``ProfileColumns`` chunks to a Parquet roster file.
+
+    Contract:
+    - Each ``write`` appends one row group, so memory stays bounded by a chunk.
+    - The file is only complete after ``close`` (or leaving the ``with`` block).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._writer = pq.ParquetWriter(self.path, ROSTER_SCHEMA)
+
+    def write(self, columns: ProfileColumns) -> None:
+        """Append one chunk of roster rows."""
+        self._writer.write_table(roster_table(columns))
+
+    def close(self) -> None:
+        """Finalize the Parquet file."""
+        self._writer.close()
+
+    def __enter__(self) -> ParquetRosterWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def plan_tables(result: MealPlanColumns, *, first_row: int = 0) -> tuple[pa.Table, pa.Table]:
+    """Return ``(plans, meals)`` Arrow tables for one calculated chunk.
+
+    Meal rows follow response ``meals`` order within each athlete, so the tables
+    carry exactly the content of the NDJSON responses.
+    """
+    row_ids = np.arange(first_row, first_row + result.row_count, dtype=np.int64)
+    plans = pa.Table.from_arrays(
+        [
+            pa.array(row_ids),
+            pa.array(result.tdee_kcal),
+            pa.array(result.training_kcal),
+            pa.array(result.protein_g),
+            pa.array(result.carbs_g),
+            pa.array(result.fat_g),
+            pa.array(result.total_kcal),
+        ],
+        schema=PLAN_SCHEMA,
+    )
+
+    order, emitted = result.response_meal_order()
+    meal_rows, _ = np.nonzero(emitted)
+    meal_columns = order[emitted]
+
+    def gather(matrix: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        return matrix[meal_rows, meal_columns]
+
+    meals = pa.Table.from_arrays(
+        [
+            pa.array(row_ids[meal_rows]),
+            pa.DictionaryArray.from_arrays(
+                pa.array(meal_columns.astype(np.int8)), _MEAL_DICTIONARY
+            ),
+            pa.DictionaryArray.from_arrays(
+                pa.array(gather(result.meal_carbs_strategy)), _CARB_STRATEGY_DICTIONARY
+            ),
+            pa.array(gather(result.meal_carbs_g)),
+            pa.array(gather(result.meal_protein_g)),
+            pa.array(gather(result.meal_fat_g)),
+            pa.array(gather(result.meal_kcal)),
+        ],
+        schema=MEAL_SCHEMA,
+    )
+    return plans, meals
+
+
+class ParquetPlanWriter:
+    """Append calculated chunks to ``plans.parquet`` and ``meals.parquet`` in a directory.
+
+    Contract:
+    - The directory is created if needed; existing output files are replaced.
+    - Each ``write`` appends one row group per table, so memory stays bounded by a chunk.
+    - Files are only complete after ``close`` (or leaving the ``with`` block).
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._plans = pq.ParquetWriter(self.directory / PLANS_FILE_NAME, PLAN_SCHEMA)
+        self._meals = pq.ParquetWriter(self.directory / MEALS_FILE_NAME, MEAL_SCHEMA)
+
+    def write(self, result: MealPlanColumns, *, first_row: int) -> None:
+        """Append the plans and meals of one calculated chunk."""
+        plans, meals = plan_tables(result, first_row=first_row)
+        self._plans.write_table(plans)
+        self._meals.write_table(meals)
+
+    def close(self) -> None:
+        """Finalize both Parquet files."""
+        self._plans.close()
+        self._meals.close()
+
+    def __enter__(self) -> ParquetPlanWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _numeric(
+    data: pa.RecordBatch | pa.Table,
+    name: str,
+    target_type: pa.DataType,
+    *,
+    first_row: int,
+    fill: float | None = None,
+) -> np.ndarray[Any, Any]:
+    return _cast_numeric(data.column(name), name, target_type, first_row=first_row, fill=fill)
+
+
+def _cast_numeric(
+    column: pa.Array | pa.ChunkedArray,
+    name: str,
+    target_type: pa.DataType,
+    *,
+    first_row: int,
+    fill: float | None = None,
+) -> np.ndarray[Any, Any]:
+    if fill is None:
+        _reject_nulls(column, name, first_row=first_row)
+    try:
+        column = pc.cast(column, target_type)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as error:
+        raise ValidationError(f"{name}: expected {target_type} values: {error}") from error
+    if fill is not None and column.null_count:
+        column = pc.fill_null(column, pa.scalar(fill, type=target_type))
+    values: np.ndarray[Any, Any] = column.to_numpy()
+    return values
+
+
+def _enum_codes(
+    data: pa.RecordBatch | pa.Table,
+    name: str,
+    members: tuple[StrEnum, ...],
+    *,
+    first_row: int,
+    nullable: bool = False,
+) -> np.ndarray[Any, Any]:
+    column = data.column(name)
+    if pa.types.is_dictionary(column.type):
+        column = pc.cast(column, column.type.value_type)
+    elif pa.types.is_null(column.type):
+        column = pc.cast(column, pa.string())
+    if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+        raise ValidationError(f"{name}: expected string values, got {column.type}")
+    if not nullable:
+        _reject_nulls(column, name, first_row=first_row)
+
+    codes = pc.index_in(column, value_set=pa.array([member.value for member in members]))
+    unknown = pc.and_(pc.is_null(codes), pc.is_valid(column))
+    if pc.any(unknown).as_py():
+        row = _first_true(unknown)
+        allowed = ", ".join(repr(member.value) for member in members)
+        value = column[row].as_py()
+        raise ValidationError(
+            f"row {first_row + row}: {name}: invalid value {value!r}; expected one of {allowed}"
+        )
+    filled: np.ndarray[Any, Any] = pc.fill_null(codes, NO_TRAINING_BEFORE_MEAL).to_numpy()
+    return filled.astype(np.int8)
+
+
+def _dictionary(
+    codes: np.ndarray[Any, Any],
+    members: tuple[StrEnum, ...],
+    *,
+    mask: np.ndarray[Any, Any] | None = None,
+) -> pa.DictionaryArray:
+    return pa.DictionaryArray.from_arrays(
+        pa.array(codes, mask=mask),
+        pa.array([member.value for member in members], type=pa.string()),
+    )
+
+
+def _reject_nulls(column: pa.Array | pa.ChunkedArray, name: str, *, first_row: int) -> None:
+    if column.null_count:
+        row = _first_true(pc.is_null(column))
+        raise ValidationError(f"row {first_row + row}: {name}: required")
+
+
+def _first_true(mask: pa.Array | pa.ChunkedArray) -> int:
+    return int(np.flatnonzero(mask.to_numpy(zero_copy_only=False))[0])
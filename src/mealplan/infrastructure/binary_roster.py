@@ -0,0 +1,391 @@
+"""Fixed-width binary roster with a memory-mapped id -> offset sidecar index.
+
+Layout (all integers little-endian):
+
+- ``<roster>``: a 32-byte header (``ROSTER_MAGIC``, format version, record size,
+  record count) followed by 32-byte ``RECORD_DTYPE`` records. Records never
+  straddle a page boundary, so reading one athlete touches a single data page.
+- ``<roster>.idx``: a 32-byte header (``INDEX_MAGIC``, version, id width, count),
+  the athlete ids sorted as fixed-width bytes, then the matching ``uint64``
+  record byte offsets. Lookups binary-search the memory-mapped id column.
+
+Both files are opened with ``mmap`` and read through ``numpy.frombuffer``, so
+batch chunks are views over the mapped pages rather than parsed copies.
+Requires NumPy (``mealplan-cli[vectorized]``).
+"""
+
+from __future__ import annotations
+
+import mmap
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+
+import numpy as np
+import numpy.typing as npt
+
+from mealplan.domain.vectorized import (
+    ACTIVITY_LEVEL_CODES,
+    CARB_MODE_CODES,
+    GENDER_CODES,
+    MEAL_CODES,
+    NO_TRAINING_BEFORE_MEAL,
+    TRAINING_LOAD_TOMORROW_CODES,
+    TRAINING_ZONE_COUNT,
+    ProfileColumns,
+)
+from mealplan.shared.errors import ValidationError
+
+ROSTER_MAGIC = b"MPROSTR1"
+INDEX_MAGIC = b"MPRIDX01"
+FORMAT_VERSION = 1
+INDEX_SUFFIX = ".idx"
+# Stored in place of vo2max when it is omitted.
+VO2MAX_OMITTED = -1
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("width", "<u4"),
+        ("count", "<u8"),
+        ("reserved", "V8"),
+    ]
+)
+RECORD_DTYPE = np.dtype(
+    [
+        ("weight_kg", "<f8"),
+        ("age", "<u2"),
+        ("height_cm", "<u2"),
+        ("zones_minutes", "<u2", (TRAINING_ZONE_COUNT,)),
+        ("vo2max", "<i2"),
+        ("gender", "i1"),
+        ("activity_level", "i1"),
+        ("carb_mode", "i1"),
+        ("training_load_tomorrow", "i1"),
+        ("training_before_meal", "i1"),
+        ("reserved", "V3"),
+    ]
+)
+HEADER_SIZE = HEADER_DTYPE.itemsize
+RECORD_SIZE = RECORD_DTYPE.itemsize
+
+_UINT16_MAX = np.iinfo(np.uint16).max
+_INT16_MAX = np.iinfo(np.int16).max
+
+
+def index_path_for(path: str | Path) -> Path:
+    """Return the sidecar index path for a binary roster file."""
+    roster_path = Path(path)
+    return roster_path.with_name(roster_path.name + INDEX_SUFFIX)
+
+
+def encode_records(columns: ProfileColumns, *, first_row: int = 0) -> npt.NDArray[np.void]:
+    """Pack ``columns`` into ``RECORD_DTYPE`` records.
+
+    Values outside the fixed-width ranges (negative or above ``uint16`` for age,
+    height and zone minutes, or above ``int16`` for ``vo2max``) raise
+    ``ValidationError`` naming the first offending row. Semantic validation is
+    left to ``calculate_many`` so binary rosters fail exactly like other inputs.
+    """
+    zones = columns.zones_minutes
+    for name, out_of_range in (
+        ("age", (columns.age < 0) | (columns.age > _UINT16_MAX)),
+        ("height_cm", (columns.height_cm < 0) | (columns.height_cm > _UINT16_MAX)),
+        ("zones_minutes", ((zones < 0) | (zones > _UINT16_MAX)).any(axis=1)),
+    ):
+        _reject_rows(
+            out_of_range, f"{name}: must be between 0 and {_UINT16_MAX}", first_row=first_row
+        )
+    vo2max = columns.vo2max
+    omitted = np.isnan(vo2max)
+    _reject_rows(
+        ~omitted & ((vo2max < 0) | (vo2max > _INT16_MAX) | (vo2max != np.floor(vo2max))),
+        f"vo2max: must be an integer between 0 and {_INT16_MAX}",
+        first_row=first_row,
+    )
+
+    records = np.zeros(columns.row_count, dtype=RECORD_DTYPE)
+    records["weight_kg"] = columns.weight_kg
+    records["age"] = columns.age
+    records["height_cm"] = columns.height_cm
+    records["zones_minutes"] = columns.zones_minutes
+    records["vo2max"] = np.where(omitted, VO2MAX_OMITTED, np.nan_to_num(vo2max))
+    records["gender"] = columns.gender
+    records["activity_level"] = columns.activity_level
+    records["carb_mode"] = columns.carb_mode
+    records["training_load_tomorrow"] = columns.training_load_tomorrow
+    records["training_before_meal"] = columns.training_before_meal
+    return records
+
+
+def profile_columns_from_records(records: npt.NDArray[np.void]) -> ProfileColumns:
+    """Return ``ProfileColumns`` over ``records``.
+
+    Enum codes, ``training_before_meal`` and ``weight_kg`` already have the
+    canonical dtypes and stay zero-copy strided views; the ``uint16`` columns
+    and ``vo2max`` are widened, which costs one small copy per chunk.
+    """
+    vo2max = records["vo2max"].astype(np.float64)
+    vo2max[vo2max == VO2MAX_OMITTED] = np.nan
+    return ProfileColumns.from_arrays(
+        age=records["age"],
+        gender=records["gender"],
+        height_cm=records["height_cm"],
+        weight_kg=records["weight_kg"],
+        activity_level=records["activity_level"],
+        carb_mode=records["carb_mode"],
+        training_load_tomorrow=records["training_load_tomorrow"],
+        zones_minutes=records["zones_minutes"],
+        training_before_meal=records["training_before_meal"],
+        vo2max=vo2max,
+    )
+
+
+class BinaryRosterWriter:
+    """Stream ``ProfileColumns`` chunks into a binary roster and its sidecar index.
+
+    Contract:
+    - Records are appended chunk by chunk; only athlete ids are kept in memory
+      until ``close`` writes the sorted index.
+    - Chunks without ids are identified by their zero-based global row number.
+    - Duplicate athlete ids raise ``ValidationError`` at ``close``.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._stream: BinaryIO = open(self.path, "wb")  # noqa: SIM115
+        self._stream.write(_header(ROSTER_MAGIC, width=RECORD_SIZE, count=0).tobytes())
+        self._ids: list[npt.NDArray[np.bytes_]] = []
+        self._count = 0
+
+    def write(self, columns: ProfileColumns, athlete_ids: Sequence[str] | None = None) -> None:
+        """Append one chunk of records."""
+        records = encode_records(columns, first_row=self._count)
+        if athlete_ids is None:
+            athlete_ids = [str(row) for row in range(self._count, self._count + len(records))]
+        if len(athlete_ids) != len(records):
+            raise ValidationError(
+                f"athlete_id: expected {len(records)} ids, got {len(athlete_ids)}"
+            )
+        self._ids.append(
+            np.asarray([athlete_id.encode() for athlete_id in athlete_ids], dtype=np.bytes_)
+        )
+        self._stream.write(records.tobytes())
+        self._count += len(records)
+
+    def close(self) -> None:
+        """Finalize the record count and write the sorted sidecar index."""
+        if self._stream.closed:
+            return
+        self._stream.seek(0)
+        self._stream.write(_header(ROSTER_MAGIC, width=RECORD_SIZE, count=self._count).tobytes())
+        self._stream.close()
+        _write_index(index_path_for(self.path), self._ids, count=self._count)
+        self._ids = []
+
+    def __enter__(self) -> BinaryRosterWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._stream.close()
+
+
+class BinaryRoster:
+    """Read-only memory-mapped binary roster.
+
+    Contract:
+    - ``records`` is a zero-copy view over the mapped roster file.
+    - ``offset_of`` binary-searches the mapped index; ``record`` then reads a
+      single 32-byte record, touching one page of the roster file.
+    - ``iter_profile_columns`` yields batch chunks built from record views.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._roster_map = _map_file(self.path)
+        count = _read_header(self._roster_map, ROSTER_MAGIC, width=RECORD_SIZE, path=self.path)
+        self.records: npt.NDArray[np.void] = np.frombuffer(
+            self._roster_map, dtype=RECORD_DTYPE, count=count, offset=HEADER_SIZE
+        )
+
+        index_path = index_path_for(self.path)
+        self._index_map = _map_file(index_path)
+        header = np.frombuffer(self._index_map, dtype=HEADER_DTYPE, count=1)[0]
+        id_width = int(header["width"])
+        if _read_header(self._index_map, INDEX_MAGIC, width=id_width, path=index_path) != count:
+            raise ValidationError(f"{index_path}: index does not match roster record count")
+        self._ids: npt.NDArray[np.bytes_] = np.frombuffer(
+            self._index_map, dtype=f"S{id_width}", count=count, offset=HEADER_SIZE
+        )
+        self._offsets: npt.NDArray[np.uint64] = np.frombuffer(
+            self._index_map,
+            dtype="<u8",
+            count=count,
+            offset=_offsets_start(count, id_width),
+        )
+
+    def __len__(self) -> int:
+        return int(self.records.shape[0])
+
+    def offset_of(self, athlete_id: str) -> int:
+        """Return the byte offset of ``athlete_id``'s record in the roster file."""
+        key = athlete_id.encode()
+        # Longer keys would be truncated to the id width by searchsorted.
+        position = int(np.searchsorted(self._ids, key)) if len(key) <= self._ids.itemsize else -1
+        if not 0 <= position < len(self._ids) or self._ids[position] != key:
+            raise ValidationError(f"athlete_id: unknown athlete {athlete_id!r}")
+        return int(self._offsets[position])
+
+    def record(self, athlete_id: str) -> np.void:
+        """Return the record for ``athlete_id`` without touching any other record."""
+        record_index = (self.offset_of(athlete_id) - HEADER_SIZE) // RECORD_SIZE
+        record: np.void = self.records[record_index]
+        return record
+
+    def request_payload(self, athlete_id: str) -> dict[str, object]:
+        """Return a ``MealPlanRequest`` payload for one athlete.
+
+        Enum codes outside their code tables (a corrupt or foreign file) raise
+        ``ValidationError`` naming the athlete and field.
+        """
+        record = self.record(athlete_id)
+
+        def decode(field: str, codes: Sequence[str]) -> str:
+            code = int(record[field])
+            if not 0 <= code < len(codes):
+                raise ValidationError(
+                    f"athlete {athlete_id!r}: {field}: invalid code {code}; "
+                    f"expected 0 to {len(codes) - 1}"
+                )
+            return codes[code]
+
+        payload: dict[str, object] = {
+            "age": int(record["age"]),
+            "gender": decode("gender", GENDER_CODES),
+            "height_cm": int(record["height_cm"]),
+            "weight_kg": float(record["weight_kg"]),
+            "activity_level": decode("activity_level", ACTIVITY_LEVEL_CODES),
+            "carb_mode": decode("carb_mode", CARB_MODE_CODES),
+            "training_load_tomorrow": decode(
+                "training_load_tomorrow", TRAINING_LOAD_TOMORROW_CODES
+            ),
+        }
+        if int(record["vo2max"]) != VO2MAX_OMITTED:
+            payload["vo2max"] = int(record["vo2max"])
+        zones = {
+            str(zone): int(minutes)
+            for zone, minutes in enumerate(record["zones_minutes"].tolist(), start=1)
+            if minutes
+        }
+        before_meal = int(record["training_before_meal"])
+        if zones or before_meal != NO_TRAINING_BEFORE_MEAL:
+            session: dict[str, object] = {"zones_minutes": zones}
+            if before_meal != NO_TRAINING_BEFORE_MEAL:
+                session["training_before_meal"] = decode("training_before_meal", MEAL_CODES)
+            payload["training_session"] = session
+        return payload
+
+    def iter_profile_columns(self, *, batch_rows: int) -> Iterator[ProfileColumns]:
+        """Yield ``ProfileColumns`` chunks of at most ``batch_rows`` records in file order."""
+        for start in range(0, len(self), batch_rows):
+            yield profile_columns_from_records(self.records[start : start + batch_rows])
+
+    def close(self) -> None:
+        """Release the memory maps.
+
+        Maps still referenced by chunks handed out earlier stay open until those
+        views are garbage collected.
+        """
+        del self.records, self._ids, self._offsets
+        for buffer in (self._roster_map, self._index_map):
+            try:
+                buffer.close()
+            except BufferError:
+                continue
+
+    def __enter__(self) -> BinaryRoster:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _header(magic: bytes, *, width: int, count: int) -> npt.NDArray[np.void]:
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header["magic"] = magic
+    header["version"] = FORMAT_VERSION
+    header["width"] = width
+    header["count"] = count
+    return header
+
+
+def _read_header(buffer: mmap.mmap, magic: bytes, *, width: int, path: Path) -> int:
+    if len(buffer) < HEADER_SIZE:
+        raise ValidationError(f"{path}: not a mealplan binary roster file")
+    header = np.frombuffer(buffer, dtype=HEADER_DTYPE, count=1)[0]
+    if bytes(header["magic"]) != magic:
+        raise ValidationError(f"{path}: not a mealplan binary roster file")
+    if int(header["version"]) != FORMAT_VERSION or int(header["width"]) != width:
+        raise ValidationError(
+            f"{path}: unsupported binary roster layout "
+            f"(version {int(header['version'])}, width {int(header['width'])})"
+        )
+    return int(header["count"])
+
+
+def _map_file(path: Path) -> mmap.mmap:
+    with open(path, "rb") as stream:
+        return mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _offsets_start(count: int, id_width: int) -> int:
+    # Keep the uint64 offsets column 8-byte aligned after the variable-width ids.
+    ids_end = HEADER_SIZE + count * id_width
+    return ids_end + (-ids_end % 8)
+
+
+def _write_index(path: Path, id_chunks: list[npt.NDArray[np.bytes_]], *, count: int) -> None:
+    id_width = max((chunk.dtype.itemsize for chunk in id_chunks), default=1)
+    ids: npt.NDArray[np.bytes_] = (
+        np.concatenate([chunk.astype(f"S{id_width}") for chunk in id_chunks])
+        if id_chunks
+        else np.empty(0, dtype=f"S{id_width}")
+    )
+    order = np.argsort(ids, kind="stable")
+    sorted_ids = ids[order]
+    duplicates = sorted_ids[1:] == sorted_ids[:-1]
+    if duplicates.any():
+        duplicate = sorted_ids[int(np.argmax(duplicates))].decode()
+        raise ValidationError(f"athlete_id: duplicate athlete {duplicate!r}")
+    offsets = HEADER_SIZE + order.astype("<u8") * RECORD_SIZE
+
+    with open(path, "wb") as stream:
+        stream.write(_header(INDEX_MAGIC, width=id_width, count=count).tobytes())
+        stream.write(sorted_ids.tobytes())
+        stream.write(b"\0" * (_offsets_start(count, id_width) - stream.tell()))
+        stream.write(offsets.tobytes())
+
+
+def _reject_rows(
+    mask: npt.NDArray[np.bool_] | np.bool_,
+    message: str,
+    *,
+    first_row: int,
+) -> None:
+    if np.any(mask):
+        raise ValidationError(f"row {first_row + int(np.argmax(mask))}: {message}")
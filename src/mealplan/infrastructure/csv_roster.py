@@ -0,0 +1,323 @@
+"""Streaming CSV roster reader and writer for vectorized ``ProfileColumns`` chunks.
+
+Rows are read with ``csv.reader`` in fixed-size chunks and transposed into
+columns; numeric parsing and enum encoding then run per column with NumPy, so
+no per-row dict or request contract is ever built. Requires NumPy
+(``mealplan-cli[vectorized]``).
+"""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Callable, Iterator, Mapping
+from enum import StrEnum
+from itertools import islice
+from typing import TextIO
+
+import numpy as np
+import numpy.typing as npt
+
+from mealplan.domain.vectorized import (
+    ACTIVITY_LEVEL_CODES,
+    CARB_MODE_CODES,
+    GENDER_CODES,
+    MEAL_CODES,
+    NO_TRAINING_BEFORE_MEAL,
+    TRAINING_LOAD_TOMORROW_CODES,
+    ProfileColumns,
+)
+from mealplan.infrastructure.roster import (
+    ROSTER_COLUMNS,
+    ROSTER_ID_COLUMN,
+    ZONE_ROSTER_COLUMNS,
+    RosterChunk,
+    missing_required_columns,
+)
+from mealplan.shared.errors import ValidationError
+
+_INVALID_CODE = -2
+_INT64_MIN = int(np.iinfo(np.int64).min)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+# Header line for ``csv_roster_lines`` output: every roster column in canonical order.
+CSV_ROSTER_HEADER = ",".join(ROSTER_COLUMNS)
+
+StringColumn = npt.NDArray[np.str_]
+
+
+def resolve_csv_columns(
+    header: list[str],
+    column_mapping: Mapping[str, str] | None = None,
+) -> dict[str, int]:
+    """Map roster fields to CSV column positions.
+
+    Contract:
+    - Headers match roster field names (and ``athlete_id``) after stripping
+      whitespace, unless ``column_mapping`` names a different header for a field.
+    - Unknown headers are ignored; missing required fields raise ``ValidationError``.
+    """
+    fields = (*ROSTER_COLUMNS, ROSTER_ID_COLUMN)
+    mapping = dict(column_mapping or {})
+    unknown_fields = sorted(set(mapping) - set(fields))
+    if unknown_fields:
+        raise ValidationError(f"roster: unknown roster fields in column mapping: {unknown_fields}")
+
+    positions_by_header = {name.strip(): index for index, name in enumerate(header)}
+    positions: dict[str, int] = {}
+    for field in fields:
+        header_name = mapping.get(field, field)
+        if header_name in positions_by_header:
+            positions[field] = positions_by_header[header_name]
+        elif field in mapping:
+            raise ValidationError(f"roster: mapped CSV column {header_name!r} not found in header")
+    missing = missing_required_columns(tuple(positions))
+    if missing:
+        raise ValidationError(f"roster: missing required columns: {', '.join(missing)}")
+    return positions
+
+
+def iter_csv_profile_columns(
+    stream: TextIO,
+    *,
+    batch_rows: int,
+    column_mapping: Mapping[str, str] | None = None,
+) -> Iterator[ProfileColumns]:
+    """Stream a CSV roster as ``ProfileColumns`` chunks of at most ``batch_rows`` rows.
+
+    Contract:
+    - The first record is the header; blank lines are skipped.
+    - Values are stripped; empty optional cells mean zero zone minutes, no
+      training meal, or omitted ``vo2max``.
+    - Memory stays bounded by one chunk of rows regardless of file size.
+    - Errors name the first offending data row as ``row <n>`` (zero-based).
+    """
+    for chunk in iter_csv_roster_chunks(
+        stream, batch_rows=batch_rows, column_mapping=column_mapping
+    ):
+        yield chunk.columns
+
+
+def iter_csv_roster_chunks(
+    stream: TextIO,
+    *,
+    batch_rows: int,
+    column_mapping: Mapping[str, str] | None = None,
+) -> Iterator[RosterChunk]:
+    """Like ``iter_csv_profile_columns``, also carrying the ``athlete_id`` column if present."""
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        raise ValidationError("roster: empty CSV, expected a header row")
+    positions = resolve_csv_columns(header, column_mapping)
+
+    records = (record for record in reader if record)
+    first_row = 0
+    while rows := list(islice(records, batch_rows)):
+        columns = _profile_columns_from_rows(
+            rows, positions, field_count=len(header), first_row=first_row
+        )
+        athlete_ids = None
+        if ROSTER_ID_COLUMN in positions:
+            id_position = positions[ROSTER_ID_COLUMN]
+            athlete_ids = [row[id_position].strip() for row in rows]
+        yield RosterChunk(columns=columns, athlete_ids=athlete_ids)
+        first_row += len(rows)
+
+
+def csv_roster_lines(columns: ProfileColumns) -> list[str]:
+    """Render every row of ``columns`` as a CSV line under ``CSV_ROSTER_HEADER``.
+
+    Enum cells hold member values, and omitted ``training_before_meal`` and
+    ``vo2max`` are empty cells, so ``iter_csv_profile_columns`` reads the lines
+    back into equal columns. No value needs quoting.
+    """
+    labels = {
+        name: np.array([member.value for member in members])[getattr(columns, name)].tolist()
+        for name, members in (
+            ("gender", GENDER_CODES),
+            ("activity_level", ACTIVITY_LEVEL_CODES),
+            ("carb_mode", CARB_MODE_CODES),
+            ("training_load_tomorrow", TRAINING_LOAD_TOMORROW_CODES),
+        )
+    }
+    # Index ``NO_TRAINING_BEFORE_MEAL`` (-1) selects the trailing empty cell.
+    before_meals = np.array([*(meal.value for meal in MEAL_CODES), ""])
+    zone_cells = [",".join(map(str, zones)) for zones in columns.zones_minutes.tolist()]
+    vo2max_cells = ["" if value != value else str(int(value)) for value in columns.vo2max.tolist()]
+    return [
+        f"{age},{gender},{height},{weight!r},{activity},{carb_mode},{load},{zones},{before},{vo2max}"
+        for age, gender, height, weight, activity, carb_mode, load, zones, before, vo2max in zip(
+            columns.age.tolist(),
+            labels["gender"],
+            columns.height_cm.tolist(),
+            columns.weight_kg.tolist(),
+            labels["activity_level"],
+            labels["carb_mode"],
+            labels["training_load_tomorrow"],
+            zone_cells,
+            before_meals[columns.training_before_meal].tolist(),
+            vo2max_cells,
+            strict=True,
+        )
+    ]
+
+
+def _profile_columns_from_rows(
+    rows: list[list[str]],
+    positions: Mapping[str, int],
+    *,
+    field_count: int,
+    first_row: int,
+) -> ProfileColumns:
+    lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+    short = lengths < field_count
+    if short.any():
+        row = int(np.flatnonzero(short)[0])
+        raise ValidationError(
+            f"row {first_row + row}: expected {field_count} fields, got {lengths[row]}"
+        )
+
+    transposed = list(zip(*rows, strict=False))
+
+    def column(field: str) -> StringColumn | None:
+        if field not in positions:
+            return None
+        return np.char.strip(np.asarray(transposed[positions[field]], dtype=np.str_))
+
+    def required(field: str) -> StringColumn:
+        values = column(field)
+        if values is None:
+            raise ValidationError(f"roster: missing required column: {field}")
+        _reject_empty(values, field, first_row=first_row)
+        return values
+
+    zones = np.zeros((len(rows), len(ZONE_ROSTER_COLUMNS)), dtype=np.int64)
+    for index, field in enumerate(ZONE_ROSTER_COLUMNS):
+        values = column(field)
+        if values is not None:
+            zones[:, index] = _parse_integers(values, field, first_row=first_row, empty=0)
+
+    before_meal_values = column("training_before_meal")
+    training_before_meal = (
+        None
+        if before_meal_values is None
+        else _encode_enum(
+            before_meal_values, "training_before_meal", MEAL_CODES, first_row=first_row
+        )
+    )
+    vo2max_values = column("vo2max")
+    vo2max = None
+    if vo2max_values is not None:
+        omitted = vo2max_values == ""
+        vo2max = _parse_integers(vo2max_values, "vo2max", first_row=first_row, empty=0).astype(
+            np.float64
+        )
+        vo2max[omitted] = np.nan
+
+    return ProfileColumns.from_arrays(
+        age=_parse_integers(required("age"), "age", first_row=first_row),
+        gender=_encode_enum(required("gender"), "gender", GENDER_CODES, first_row=first_row),
+        height_cm=_parse_integers(required("height_cm"), "height_cm", first_row=first_row),
+        weight_kg=_parse_floats(required("weight_kg"), "weight_kg", first_row=first_row),
+        activity_level=_encode_enum(
+            required("activity_level"),
+            "activity_level",
+            ACTIVITY_LEVEL_CODES,
+            first_row=first_row,
+        ),
+        carb_mode=_encode_enum(
+            required("carb_mode"), "carb_mode", CARB_MODE_CODES, first_row=first_row
+        ),
+        training_load_tomorrow=_encode_enum(
+            required("training_load_tomorrow"),
+            "training_load_tomorrow",
+            TRAINING_LOAD_TOMORROW_CODES,
+            first_row=first_row,
+        ),
+        zones_minutes=zones,
+        training_before_meal=training_before_meal,
+        vo2max=vo2max,
+    )
+
+
+def _reject_empty(values: StringColumn, field: str, *, first_row: int) -> None:
+    empty = values == ""
+    if empty.any():
+        raise ValidationError(f"row {first_row + int(np.argmax(empty))}: {field}: required")
+
+
+def _parse_integers(
+    values: StringColumn,
+    field: str,
+    *,
+    first_row: int,
+    empty: int | None = None,
+) -> npt.NDArray[np.int64]:
+    if empty is not None:
+        values = np.where(values == "", str(empty), values)
+    try:
+        return values.astype(np.int64)
+    except (ValueError, OverflowError):
+        _raise_first_unparsable(values, field, _parse_int64, "integer", first_row=first_row)
+        raise
+
+
+def _parse_floats(values: StringColumn, field: str, *, first_row: int) -> npt.NDArray[np.float64]:
+    try:
+        parsed = values.astype(np.float64)
+    except ValueError:
+        _raise_first_unparsable(values, field, float, "number", first_row=first_row)
+        raise
+    non_finite = ~np.isfinite(parsed)
+    if non_finite.any():
+        row = int(np.argmax(non_finite))
+        raise ValidationError(
+            f"row {first_row + row}: {field}: expected finite number, got {str(values[row])!r}"
+        )
+    return parsed
+
+
+def _parse_int64(value: str) -> int:
+    parsed = int(value)
+    if not _INT64_MIN <= parsed <= _INT64_MAX:
+        raise ValueError(f"{value!r} is out of the 64-bit integer range")
+    return parsed
+
+
+def _raise_first_unparsable(
+    values: StringColumn,
+    field: str,
+    parse: Callable[[str], object],
+    expected: str,
+    *,
+    first_row: int,
+) -> None:
+    # Only reached on failure, so the per-value scan stays off the hot path.
+    for row, value in enumerate(values.tolist()):
+        try:
+            parse(value)
+        except ValueError:
+            raise ValidationError(
+                f"row {first_row + row}: {field}: expected {expected}, got {value!r}"
+            ) from None
+
+
+def _encode_enum(
+    values: StringColumn,
+    field: str,
+    members: tuple[StrEnum, ...],
+    *,
+    first_row: int,
+) -> npt.NDArray[np.int8]:
+    codes = np.full(values.shape, _INVALID_CODE, dtype=np.int8)
+    codes[values == ""] = NO_TRAINING_BEFORE_MEAL
+    for code, member in enumerate(members):
+        codes[values == member.value] = code
+    unknown = codes == _INVALID_CODE
+    if unknown.any():
+        row = int(np.argmax(unknown))
+        allowed = ", ".join(repr(member.value) for member in members)
+        raise ValidationError(
+            f"row {first_row + row}: {field}: invalid value {str(values[row])!r}; "
+            f"expected one of {allowed}"
+        )
+    return codes
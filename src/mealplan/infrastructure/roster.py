@@ -0,0 +1,61 @@
+"""Shared column layout for tabular athlete roster files."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from mealplan.domain.vectorized import TRAINING_ZONE_COUNT, ProfileColumns
+
+REQUIRED_ROSTER_COLUMNS: tuple[str, ...] = (
+    "age",
+    "gender",
+    "height_cm",
+    "weight_kg",
+    "activity_level",
+    "carb_mode",
+    "training_load_tomorrow",
+)
+ZONE_ROSTER_COLUMNS: tuple[str, ...] = tuple(
+    f"zone{zone}" for zone in range(1, TRAINING_ZONE_COUNT + 1)
+)
+OPTIONAL_ROSTER_COLUMNS: tuple[str, ...] = (
+    *ZONE_ROSTER_COLUMNS,
+    "training_before_meal",
+    "vo2max",
+)
+ROSTER_COLUMNS: tuple[str, ...] = (*REQUIRED_ROSTER_COLUMNS, *OPTIONAL_ROSTER_COLUMNS)
+# Optional athlete identifier; rows without it are identified by their zero-based row number.
+ROSTER_ID_COLUMN = "athlete_id"
+
+# Row-id column written in front of every columnar output table.
+ROW_ID_COLUMN = "row_id"
+PLAN_OUTPUT_COLUMNS: tuple[str, ...] = (
+    "TDEE",
+    "training_kcal",
+    "protein_g",
+    "carbs_g",
+    "fat_g",
+    "total_kcal",
+)
+MEAL_OUTPUT_COLUMNS: tuple[str, ...] = (
+    "meal",
+    "carbs_strategy",
+    "carbs_g",
+    "protein_g",
+    "fat_g",
+    "kcal",
+)
+
+
+def missing_required_columns(columns: list[str] | tuple[str, ...]) -> list[str]:
+    """Return required roster columns absent from ``columns``, in canonical order."""
+    present = set(columns)
+    return [name for name in REQUIRED_ROSTER_COLUMNS if name not in present]
+
+
+@dataclass(frozen=True, slots=True)
+class RosterChunk:
+    """One roster chunk: calculation columns plus athlete ids when the roster carries them."""
+
+    columns: ProfileColumns
+    athlete_ids: list[str] | None
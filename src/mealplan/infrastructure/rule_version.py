@@ -0,0 +1,33 @@
+"""Fingerprint of the calculation rule tables, used to invalidate cached results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from mealplan.domain.energy import ACTIVITY_FACTOR_BY_LEVEL
+from mealplan.domain.macros import CARBS_FACTOR_BY_MODE
+from mealplan.domain.services import (
+    CANONICAL_MEAL_SHARE_UNITS,
+    CARB_CALORIE_SHARE_BY_STRATEGY,
+    ZONE_INTENSITY_BY_ZONE,
+)
+
+
+def rule_version_hash() -> str:
+    """Return a stable hex hash of the rule tables that determine calculation results."""
+    tables: dict[str, object] = {
+        "ACTIVITY_FACTOR_BY_LEVEL": _canonical_table(ACTIVITY_FACTOR_BY_LEVEL),
+        "CARBS_FACTOR_BY_MODE": _canonical_table(CARBS_FACTOR_BY_MODE),
+        "ZONE_INTENSITY_BY_ZONE": _canonical_table(ZONE_INTENSITY_BY_ZONE),
+        "CARB_CALORIE_SHARE_BY_STRATEGY": _canonical_table(CARB_CALORIE_SHARE_BY_STRATEGY),
+        "CANONICAL_MEAL_SHARE_UNITS": list(CANONICAL_MEAL_SHARE_UNITS),
+    }
+    encoded = json.dumps(tables, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _canonical_table(table: Mapping[Any, float]) -> list[list[object]]:
+    return sorted([str(key), value] for key, value in table.items())
@@ -0,0 +1,305 @@
+"""Cross-process result cache in a memory-mapped file with fixed-size slots.
+
+Every process that opens the same path maps the same pages, so batch workers,
+coprocess pools and HTTP workers share one hit pool. The file is a 64-byte
+header, one 32-byte record per lock stripe (hit/miss/eviction counters and a
+recency clock), then ``bucket_count * ways`` slots of ``slot_size`` bytes:
+
+- slot header (32 bytes): 16-byte key, ``uint64`` recency stamp, ``uint32``
+  payload length, 4 padding bytes;
+- payload: ``response_json`` + ``"\\n"`` + warnings JSON.
+
+A key hashes to one bucket of ``ways`` slots; buckets are guarded by striped
+``fcntl`` byte-range locks (one per stripe record) plus a per-process thread
+lock, so independent buckets are updated concurrently. POSIX only; place the
+file on ``/dev/shm`` to keep it in memory.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import TracebackType
+
+from mealplan.application.cache import CachedResult, CacheStats
+from mealplan.application.contracts import MealPlanResponse
+from mealplan.infrastructure.rule_version import rule_version_hash
+from mealplan.shared.errors import ConfigError
+
+SHARED_CACHE_MAGIC = b"MPSHMC01"
+DEFAULT_SHARED_CACHE_ENTRIES = 16_384
+DEFAULT_SLOT_SIZE = 2048
+DEFAULT_WAYS = 4
+DEFAULT_STRIPES = 64
+
+# magic, bucket_count, ways, slot_size, stripes, rule version digest (16 bytes), padding.
+_HEADER = struct.Struct("<8sIIII16s24x")
+# hits, misses, evictions, recency clock.
+_STRIPE = struct.Struct("<QQQQ")
+# key, recency stamp, payload length, padding.
+_SLOT = struct.Struct("<16sQI4x")
+_EMPTY_KEY = bytes(16)
+
+
+class SharedMemoryResultCache:
+    """Fixed-capacity ``ResultCache`` shared by all processes mapping ``path``.
+
+    Contract:
+    - A new or empty file is laid out with the requested geometry; an existing
+      cache keeps its own geometry, so processes never disagree on offsets.
+    - Slot keys mix the rule version into the fingerprint, so processes running
+      different rule tables never see each other's results. Opening a cache
+      written under other rules clears it in place.
+    - Each bucket keeps its ``ways`` most recently used results; results larger
+      than a slot are not cached.
+    - Slot keys are written last and cleared first, so a writer dying mid-update
+      leaves an empty slot rather than a torn entry.
+    - A non-cache file at ``path`` raises ``ConfigError`` and is left untouched.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_entries: int = DEFAULT_SHARED_CACHE_ENTRIES,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        ways: int = DEFAULT_WAYS,
+        stripes: int = DEFAULT_STRIPES,
+    ) -> None:
+        if max_entries < 1 or ways < 1 or stripes < 1:
+            raise ValueError("max_entries, ways and stripes must be greater than or equal to 1")
+        if slot_size <= _SLOT.size:
+            raise ValueError(f"slot_size must be greater than {_SLOT.size}")
+        self.path = path
+        self._rule_digest = bytes.fromhex(rule_version_hash())
+        try:
+            self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as error:
+            raise ConfigError(f"shared cache {path}: {error}") from error
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, _HEADER.size, 0)
+            try:
+                self._attach_or_initialize(
+                    bucket_count=-(-max_entries // ways),
+                    ways=ways,
+                    slot_size=slot_size,
+                    stripes=stripes,
+                )
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, _HEADER.size, 0)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    @property
+    def max_entries(self) -> int:
+        """Total number of slots."""
+        return self.bucket_count * self.ways
+
+    def get(self, key: str) -> CachedResult | None:
+        """Return the cached result for ``key`` and refresh its recency."""
+        slot_key = self._slot_key(key)
+        bucket = self._bucket(slot_key)
+        payload: bytes | None = None
+        with self._stripe_locked(bucket % self.stripes) as stripe:
+            hits, misses, evictions, clock = self._read_stripe(stripe)
+            for offset in self._slot_offsets(bucket):
+                stored_key, _, length = _SLOT.unpack_from(self._map, offset)
+                if stored_key == slot_key:
+                    start = offset + _SLOT.size
+                    payload = self._map[start : start + length]
+                    clock += 1
+                    _SLOT.pack_into(self._map, offset, stored_key, clock, length)
+                    hits += 1
+                    break
+            else:
+                misses += 1
+            self._write_stripe(stripe, hits, misses, evictions, clock)
+        if payload is None:
+            return None
+        response_json, _, warnings_json = payload.partition(b"\n")
+        return CachedResult(
+            response=MealPlanResponse.from_engine_json(response_json),
+            warnings=tuple(json.loads(warnings_json)),
+        )
+
+    def put(self, key: str, result: CachedResult) -> None:
+        """Store ``result``, replacing the least recently used slot of its bucket."""
+        payload = (
+            result.response.model_dump_json().encode()
+            + b"\n"
+            + json.dumps(list(result.warnings)).encode()
+        )
+        if len(payload) > self.slot_size - _SLOT.size:
+            return
+        slot_key = self._slot_key(key)
+        bucket = self._bucket(slot_key)
+        with self._stripe_locked(bucket % self.stripes) as stripe:
+            hits, misses, evictions, clock = self._read_stripe(stripe)
+            victim_offset = -1
+            victim_stamp = -1
+            victim_key = _EMPTY_KEY
+            for offset in self._slot_offsets(bucket):
+                stored_key, stamp, _ = _SLOT.unpack_from(self._map, offset)
+                if stored_key in (slot_key, _EMPTY_KEY):
+                    victim_offset, victim_key = offset, stored_key
+                    break
+                if victim_offset < 0 or stamp < victim_stamp:
+                    victim_offset, victim_stamp, victim_key = offset, stamp, stored_key
+            if victim_key not in (_EMPTY_KEY, slot_key):
+                evictions += 1
+            clock += 1
+            start = victim_offset + _SLOT.size
+            _SLOT.pack_into(self._map, victim_offset, _EMPTY_KEY, 0, 0)
+            self._map[start : start + len(payload)] = payload
+            _SLOT.pack_into(self._map, victim_offset, slot_key, clock, len(payload))
+            self._write_stripe(stripe, hits, misses, evictions, clock)
+
+    def stats(self) -> CacheStats:
+        """Return counters summed over all stripes and the number of occupied slots."""
+        hits = misses = evictions = size = 0
+        for stripe in range(self.stripes):
+            with self._stripe_locked(stripe):
+                stripe_hits, stripe_misses, stripe_evictions, _ = self._read_stripe(stripe)
+            hits += stripe_hits
+            misses += stripe_misses
+            evictions += stripe_evictions
+        for bucket in range(self.bucket_count):
+            for offset in self._slot_offsets(bucket):
+                if self._map[offset : offset + 16] != _EMPTY_KEY:
+                    size += 1
+        return CacheStats(
+            hits=hits,
+            misses=misses,
+            evictions=evictions,
+            size=size,
+            max_entries=self.max_entries,
+        )
+
+    def clear(self) -> None:
+        """Empty every slot and reset the counters."""
+        for stripe in range(self.stripes):
+            with self._stripe_locked(stripe):
+                self._write_stripe(stripe, 0, 0, 0, 0)
+                for bucket in range(stripe, self.bucket_count, self.stripes):
+                    for offset in self._slot_offsets(bucket):
+                        _SLOT.pack_into(self._map, offset, _EMPTY_KEY, 0, 0)
+
+    def close(self) -> None:
+        """Unmap the file; other processes keep their mappings."""
+        self._map.close()
+        os.close(self._fd)
+
+    def __enter__(self) -> SharedMemoryResultCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _attach_or_initialize(
+        self,
+        *,
+        bucket_count: int,
+        ways: int,
+        slot_size: int,
+        stripes: int,
+    ) -> None:
+        file_size = os.fstat(self._fd).st_size
+        if file_size == 0:
+            self._set_geometry(bucket_count, ways, slot_size, stripes)
+            os.ftruncate(self._fd, self._file_size())
+            self._map = mmap.mmap(self._fd, self._file_size())
+            self._write_header()
+            return
+
+        if file_size < _HEADER.size:
+            raise ConfigError(f"shared cache {self.path}: not a mealplan shared cache")
+        header = os.pread(self._fd, _HEADER.size, 0)
+        magic, bucket_count, ways, slot_size, stripes, rule_digest = _HEADER.unpack(header)
+        if magic != SHARED_CACHE_MAGIC:
+            raise ConfigError(f"shared cache {self.path}: not a mealplan shared cache")
+        self._set_geometry(bucket_count, ways, slot_size, stripes)
+        if file_size != self._file_size():
+            raise ConfigError(
+                f"shared cache {self.path}: expected {self._file_size()} bytes, got {file_size}"
+            )
+        self._map = mmap.mmap(self._fd, file_size)
+        if rule_digest != self._rule_digest:
+            # Written under other rules: those entries are unreachable, so reclaim the space.
+            self.clear()
+            self._write_header()
+
+    def _set_geometry(self, bucket_count: int, ways: int, slot_size: int, stripes: int) -> None:
+        self.bucket_count = bucket_count
+        self.ways = ways
+        self.slot_size = slot_size
+        self.stripes = stripes
+        stripe_table_end = _HEADER.size + stripes * _STRIPE.size
+        self._slots_offset = -(-stripe_table_end // 64) * 64
+        self._thread_locks = [threading.Lock() for _ in range(stripes)]
+
+    def _write_header(self) -> None:
+        _HEADER.pack_into(
+            self._map,
+            0,
+            SHARED_CACHE_MAGIC,
+            self.bucket_count,
+            self.ways,
+            self.slot_size,
+            self.stripes,
+            self._rule_digest,
+        )
+
+    def _file_size(self) -> int:
+        return self._slots_offset + self.bucket_count * self.ways * self.slot_size
+
+    @contextmanager
+    def _stripe_locked(self, stripe: int) -> Iterator[int]:
+        offset = _HEADER.size + stripe * _STRIPE.size
+        # fcntl locks are per process, so threads in one process also need a lock.
+        with self._thread_locks[stripe]:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, offset)
+            try:
+                yield stripe
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, offset)
+
+    def _read_stripe(self, stripe: int) -> tuple[int, int, int, int]:
+        hits, misses, evictions, clock = _STRIPE.unpack_from(
+            self._map, _HEADER.size + stripe * _STRIPE.size
+        )
+        return int(hits), int(misses), int(evictions), int(clock)
+
+    def _write_stripe(
+        self,
+        stripe: int,
+        hits: int,
+        misses: int,
+        evictions: int,
+        clock: int,
+    ) -> None:
+        _STRIPE.pack_into(
+            self._map, _HEADER.size + stripe * _STRIPE.size, hits, misses, evictions, clock
+        )
+
+    def _slot_key(self, key: str) -> bytes:
+        return hashlib.blake2b(self._rule_digest + key.encode(), digest_size=16).digest()
+
+    def _bucket(self, slot_key: bytes) -> int:
+        return int.from_bytes(slot_key[:8], "little") % self.bucket_count
+
+    def _slot_offsets(self, bucket: int) -> range:
+        start = self._slots_offset + bucket * self.ways * self.slot_size
+        return range(start, start + self.ways * self.slot_size, self.slot_size)
@@ -0,0 +1,237 @@
+"""Persistent SQLite result cache keyed by request fingerprint and rule version.
+
+Entries are stored with a hash of the calculation rule tables, so a rule change
+makes every older entry unreachable; they are purged the next time the cache
+is opened. Only the standard library is required.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from types import TracebackType
+
+from mealplan.application.cache import CachedResult, CacheStats
+from mealplan.application.contracts import MealPlanResponse
+from mealplan.infrastructure.rule_version import rule_version_hash
+from mealplan.shared.errors import ConfigError
+
+CACHE_DB_ENV_VAR = "MEALPLAN_CACHE_DB"
+DEFAULT_SQLITE_CACHE_ENTRIES = 100_000
+# Bump when the stored row format changes; it is part of every stored rule version.
+CACHE_FORMAT_VERSION = 1
+# Eviction trims to this fraction of ``max_entries`` so it runs once per many inserts.
+EVICTION_LOW_WATERMARK = 0.9
+# Hit/miss counters are persisted after this many lookups and on close.
+COUNTER_FLUSH_INTERVAL = 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    fingerprint TEXT PRIMARY KEY,
+    rule_version TEXT NOT NULL,
+    response_json TEXT NOT NULL,
+    warnings_json TEXT NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_last_used ON results (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+_COUNTER_NAMES = ("hits", "misses", "evictions")
+
+
+def default_cache_path() -> str:
+    """Return ``$MEALPLAN_CACHE_DB`` or ``mealplan/results.sqlite3`` in the user cache dir."""
+    configured = os.environ.get(CACHE_DB_ENV_VAR)
+    if configured:
+        return configured
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "mealplan", "results.sqlite3")
+
+
+class SqliteResultCache:
+    """Bounded on-disk ``ResultCache`` shared by every process that opens the same file.
+
+    Contract:
+    - Lookups only match entries written under the current ``rule_version``; rows
+      from other rule versions are deleted when the cache is opened.
+    - Holds roughly ``max_entries`` results: once exceeded, the least recently
+      used rows are evicted down to ``EVICTION_LOW_WATERMARK`` of the limit.
+    - Uses WAL journaling and a busy timeout, so concurrent worker processes can
+      share one file; a connection is guarded by a lock for threaded callers.
+    - Database failures raise ``ConfigError``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_entries: int = DEFAULT_SQLITE_CACHE_ENTRIES,
+        rule_version: str | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than or equal to 1")
+        self.path = path
+        self.max_entries = max_entries
+        self.rule_version = rule_version or f"{rule_version_hash()}.{CACHE_FORMAT_VERSION}"
+        self._lock = threading.Lock()
+        self._pending = dict.fromkeys(_COUNTER_NAMES, 0)
+        self._lookups_since_flush = 0
+        try:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(
+                path, timeout=5.0, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(
+                "DELETE FROM results WHERE rule_version != ?", (self.rule_version,)
+            )
+            self._approximate_size = self._count()
+        except (OSError, sqlite3.Error) as error:
+            raise ConfigError(f"cache database {path}: {error}") from error
+
+    def get(self, key: str) -> CachedResult | None:
+        """Return the cached result for ``key`` and refresh its recency."""
+        with self._lock:
+            row = self._execute(
+                "SELECT response_json, warnings_json FROM results "
+                "WHERE fingerprint = ? AND rule_version = ?",
+                (key, self.rule_version),
+            ).fetchone()
+            if row is None:
+                self._record_lookup("misses")
+                return None
+            self._execute(
+                "UPDATE results SET last_used = ? WHERE fingerprint = ?", (time.time_ns(), key)
+            )
+            self._record_lookup("hits")
+        response_json, warnings_json = row
+        return CachedResult(
+            response=MealPlanResponse.from_engine_json(response_json),
+            warnings=tuple(json.loads(warnings_json)),
+        )
+
+    def put(self, key: str, result: CachedResult) -> None:
+        """Store ``result`` under ``key``, evicting old entries when over the limit."""
+        with self._lock:
+            self._execute(
+                "INSERT OR REPLACE INTO results "
+                "(fingerprint, rule_version, response_json, warnings_json, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    self.rule_version,
+                    result.response.model_dump_json(),
+                    json.dumps(list(result.warnings)),
+                    time.time_ns(),
+                ),
+            )
+            self._approximate_size += 1
+            if self._approximate_size > self.max_entries:
+                self._evict()
+
+    def stats(self) -> CacheStats:
+        """Return persisted counters (plus this process's unflushed ones) and occupancy."""
+        with self._lock:
+            persisted = dict(
+                self._execute("SELECT name, value FROM counters").fetchall()
+            )
+            counters = {
+                name: int(persisted.get(name, 0)) + self._pending[name] for name in _COUNTER_NAMES
+            }
+            return CacheStats(
+                hits=counters["hits"],
+                misses=counters["misses"],
+                evictions=counters["evictions"],
+                size=self._count(),
+                max_entries=self.max_entries,
+            )
+
+    def size_bytes(self) -> int:
+        """Return the on-disk size of the database file."""
+        with self._lock:
+            page_count = self._execute("PRAGMA page_count").fetchone()[0]
+            page_size = self._execute("PRAGMA page_size").fetchone()[0]
+        return int(page_count) * int(page_size)
+
+    def clear(self) -> int:
+        """Delete every entry and reset the counters; return the number of entries removed."""
+        with self._lock:
+            removed = self._execute("DELETE FROM results").rowcount
+            self._execute("DELETE FROM counters")
+            self._pending = dict.fromkeys(_COUNTER_NAMES, 0)
+            self._approximate_size = 0
+        return int(removed)
+
+    def vacuum(self) -> None:
+        """Rebuild the database file to return space freed by evictions and clears."""
+        with self._lock:
+            self._execute("VACUUM")
+
+    def close(self) -> None:
+        """Persist pending counters and close the connection."""
+        with self._lock:
+            self._flush_counters()
+            self._connection.close()
+
+    def __enter__(self) -> SqliteResultCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _execute(self, sql: str, parameters: tuple[object, ...] = ()) -> sqlite3.Cursor:
+        try:
+            return self._connection.execute(sql, parameters)
+        except sqlite3.Error as error:
+            raise ConfigError(f"cache database {self.path}: {error}") from error
+
+    def _count(self) -> int:
+        return int(self._execute("SELECT COUNT(*) FROM results").fetchone()[0])
+
+    def _evict(self) -> None:
+        # Other processes may share the file, so recount before trimming.
+        size = self._count()
+        target = max(int(self.max_entries * EVICTION_LOW_WATERMARK), 1)
+        if size > self.max_entries:
+            evicted = self._execute(
+                "DELETE FROM results WHERE fingerprint IN "
+                "(SELECT fingerprint FROM results ORDER BY last_used LIMIT ?)",
+                (size - target,),
+            ).rowcount
+            self._pending["evictions"] += int(evicted)
+            size -= int(evicted)
+        self._approximate_size = size
+
+    def _record_lookup(self, counter: str) -> None:
+        self._pending[counter] += 1
+        self._lookups_since_flush += 1
+        if self._lookups_since_flush >= COUNTER_FLUSH_INTERVAL:
+            self._flush_counters()
+
+    def _flush_counters(self) -> None:
+        for name, delta in self._pending.items():
+            if delta:
+                self._execute(
+                    "INSERT INTO counters (name, value) VALUES (?, ?) "
+                    "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+                    (name, delta),
+                )
+        self._pending = dict.fromkeys(_COUNTER_NAMES, 0)
+        self._lookups_since_flush = 0
+
@@ -0,0 +1,26 @@
+"""Process-wide switch for paranoid self-checks on engine output.
+
+Engine-produced responses satisfy the response contract by construction, so
+production builds them without re-validation. Paranoid mode re-runs full contract
+validation and domain invariants on every calculated response; the test suite
+enables it through ``MEALPLAN_PARANOID_CHECKS=1``.
+"""
+
+from __future__ import annotations
+
+import os
+
+PARANOID_CHECKS_ENV_VAR = "MEALPLAN_PARANOID_CHECKS"
+
+_paranoid_checks = os.environ.get(PARANOID_CHECKS_ENV_VAR, "") not in ("", "0")
+
+
+def paranoid_checks_enabled() -> bool:
+    """Return whether calculated responses are fully re-validated."""
+    return _paranoid_checks
+
+
+def set_paranoid_checks(enabled: bool) -> None:
+    """Override the ``MEALPLAN_PARANOID_CHECKS`` setting for this process."""
+    global _paranoid_checks
+    _paranoid_checks = enabled
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import IntEnum
+from http import HTTPStatus
 
 from mealplan.shared.errors import (
     ConfigError,
@@ -31,3 +32,17 @@ def map_exception_to_exit_code(error: Exception) -> ExitCode:
     if isinstance(error, (ConfigError, OutputError, MealPlanError)):
         return ExitCode.RUNTIME
     return ExitCode.RUNTIME
+
+
+# HTTP counterpart of each exit code, so the HTTP service classifies errors like the CLI.
+HTTP_STATUS_BY_EXIT_CODE: dict[ExitCode, HTTPStatus] = {
+    ExitCode.SUCCESS: HTTPStatus.OK,
+    ExitCode.VALIDATION: HTTPStatus.BAD_REQUEST,
+    ExitCode.DOMAIN: HTTPStatus.UNPROCESSABLE_ENTITY,
+    ExitCode.RUNTIME: HTTPStatus.INTERNAL_SERVER_ERROR,
+}
+
+
+def map_exception_to_http_status(error: Exception) -> HTTPStatus:
+    """Map known exception types to the HTTP status matching their exit code."""
+    return HTTP_STATUS_BY_EXIT_CODE[map_exception_to_exit_code(error)]
@@ -0,0 +1,286 @@
+"""CLI tests for the streaming NDJSON batch command."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.application.stage_timer import STAGE_ORDER
+from mealplan.cli.main import app
+
+runner = CliRunner()
+
+
+def _ndjson(payloads: list[dict[str, Any]]) -> str:
+    return "".join(f"{json.dumps(payload)}\n" for payload in payloads)
+
+
+def test_batch_reads_stdin_and_writes_one_response_line_per_request(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    result = runner.invoke(
+        app,
+        ["batch"],
+        input=_ndjson([meal_plan_request_payload, meal_plan_request_payload]),
+    )
+
+    assert result.exit_code == 0
+    expected = MealPlanCalculationService().calculate(
+        MealPlanRequest.model_validate(meal_plan_request_payload)
+    )
+    assert result.stdout.splitlines() == [expected.model_dump_json()] * 2
+
+
+def test_batch_reads_and_writes_files(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    input_path = tmp_path / "requests.ndjson"
+    output_path = tmp_path / "responses.ndjson"
+    input_path.write_text(_ndjson([meal_plan_request_payload]), encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        ["batch", "--input", str(input_path), "--output", str(output_path)],
+    )
+
+    assert result.exit_code == 0
+    assert result.stdout == ""
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    MealPlanResponse.model_validate_json(lines[0])
+
+
+def test_batch_uses_one_service_for_whole_run(
+    monkeypatch: pytest.MonkeyPatch,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    instances: list[object] = []
+
+    class FakeCalculationService:
+        def __init__(self) -> None:
+            instances.append(self)
+            self.warnings: tuple[str, ...] = ("simulated warning",)
+
+        def calculate(self, request: object) -> MealPlanResponse:
+            _ = request
+            return MealPlanResponse.placeholder()
+
+    monkeypatch.setattr("mealplan.cli.main.MealPlanCalculationService", FakeCalculationService)
+
+    result = runner.invoke(
+        app,
+        ["batch"],
+        input=_ndjson([meal_plan_request_payload, meal_plan_request_payload]),
+    )
+
+    assert result.exit_code == 0
+    assert len(instances) == 1
+    assert result.stderr == (
+        "Warning: line 1: simulated warning\nWarning: line 2: simulated warning\n"
+    )
+
+
+def test_batch_stops_at_first_invalid_line(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    invalid_payload = {**meal_plan_request_payload, "age": 0}
+
+    result = runner.invoke(
+        app,
+        ["batch"],
+        input=_ndjson([meal_plan_request_payload, invalid_payload, meal_plan_request_payload]),
+    )
+
+    assert result.exit_code != 0
+    assert len(result.stdout.splitlines()) == 1
+    assert str(result.exception) == "line 2: age: must be greater than 0"
+
+
+def test_batch_parallel_workers_output_matches_serial(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    payloads = [
+        {**meal_plan_request_payload, "carb_mode": carb_mode, "training_load_tomorrow": load}
+        for carb_mode in ("low", "normal", "periodized")
+        for load in ("low", "medium", "high")
+    ]
+
+    serial = runner.invoke(app, ["batch"], input=_ndjson(payloads))
+    parallel = runner.invoke(
+        app,
+        ["batch", "--workers", "2", "--chunk-size", "5"],
+        input=_ndjson(payloads),
+    )
+
+    assert serial.exit_code == 0
+    assert parallel.exit_code == 0
+    assert parallel.stdout == serial.stdout
+
+
+def test_batch_result_cache_keeps_output_identical(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    payloads = [meal_plan_request_payload, {**meal_plan_request_payload, "carb_mode": "low"}] * 3
+
+    uncached = runner.invoke(app, ["batch"], input=_ndjson(payloads))
+    cached = runner.invoke(app, ["batch", "--cache-size", "1"], input=_ndjson(payloads))
+    parallel = runner.invoke(
+        app,
+        ["batch", "--cache-size", "8", "--workers", "2", "--chunk-size", "2"],
+        input=_ndjson(payloads),
+    )
+
+    assert uncached.exit_code == cached.exit_code == parallel.exit_code == 0
+    assert cached.stdout == uncached.stdout
+    assert parallel.stdout == uncached.stdout
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_batch_profile_stages_reports_aggregates_on_stderr(
+    meal_plan_request_payload: dict[str, Any],
+    workers: str,
+) -> None:
+    payloads = [meal_plan_request_payload] * 5
+
+    plain = runner.invoke(app, ["batch"], input=_ndjson(payloads))
+    profiled = runner.invoke(
+        app,
+        ["batch", "--profile-stages", "--workers", workers, "--chunk-size", "2"],
+        input=_ndjson(payloads),
+    )
+
+    assert profiled.exit_code == 0
+    assert profiled.stdout == plain.stdout
+    rows = [line for line in profiled.stderr.splitlines() if line.startswith("| ")]
+    assert rows[0] == "| stage | count | min_us | p50_us | p99_us | total_ms |"
+    counts = {row.split(" | ")[0].removeprefix("| "): row.split(" | ")[1] for row in rows[2:]}
+    assert counts == dict.fromkeys(
+        (stage for stage in STAGE_ORDER if stage != "carb_strategy"), "5"
+    )
+
+
+def test_batch_rejects_profile_stages_for_columnar_input() -> None:
+    result = runner.invoke(app, ["batch", "--input-format", "csv", "--profile-stages"], input="")
+
+    assert result.exit_code != 0
+    assert str(result.exception) == "--profile-stages: stage timing applies to ndjson input only"
+
+
+def test_batch_rejects_zero_workers() -> None:
+    result = runner.invoke(app, ["batch", "--workers", "0"], input="")
+
+    assert result.exit_code == 2
+
+
+def _write_parquet_roster(path: Path, payloads: list[dict[str, Any]]) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = []
+    for payload in payloads:
+        session = payload["training_session"]
+        row = {key: value for key, value in payload.items() if key != "training_session"}
+        for zone in range(1, 6):
+            row[f"zone{zone}"] = session["zones_minutes"][str(zone)]
+        row["training_before_meal"] = session["training_before_meal"]
+        rows.append(row)
+    pq.write_table(pa.Table.from_pylist(rows), path)
+
+
+def test_batch_parquet_input_matches_ndjson_output(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    payloads = [
+        {**meal_plan_request_payload, "carb_mode": carb_mode}
+        for carb_mode in ("low", "normal", "periodized")
+    ]
+    roster_path = tmp_path / "roster.parquet"
+    _write_parquet_roster(roster_path, payloads)
+
+    ndjson = runner.invoke(app, ["batch"], input=_ndjson(payloads))
+    columnar = runner.invoke(
+        app,
+        ["batch", "--input-format", "parquet", "--input", str(roster_path), "--chunk-size", "2"],
+    )
+
+    assert ndjson.exit_code == 0
+    assert columnar.exit_code == 0
+    assert columnar.stdout == ndjson.stdout
+
+
+def test_batch_parquet_output_writes_plans_and_meals(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    roster_path = tmp_path / "roster.parquet"
+    output_dir = tmp_path / "out"
+    _write_parquet_roster(roster_path, [meal_plan_request_payload] * 2)
+
+    result = runner.invoke(
+        app,
+        [
+            "batch",
+            "--input-format",
+            "parquet",
+            "--input",
+            str(roster_path),
+            "--output-format",
+            "parquet",
+            "--output",
+            str(output_dir),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert pq.read_table(output_dir / "plans.parquet").num_rows == 2
+    assert pq.read_table(output_dir / "meals.parquet").column("row_id").to_pylist()[-1] == 1
+
+
+def test_batch_rejects_parquet_output_for_ndjson_input() -> None:
+    result = runner.invoke(app, ["batch", "--output-format", "parquet"], input="")
+
+    assert result.exit_code != 0
+    assert str(result.exception).startswith("--output-format: parquet output requires")
+
+
+def test_batch_csv_input_matches_ndjson_output(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    pytest.importorskip("numpy")
+    payloads = [
+        {**meal_plan_request_payload, "carb_mode": carb_mode}
+        for carb_mode in ("low", "normal", "periodized")
+    ]
+    csv_lines = [
+        "Age,gender,height_cm,weight_kg,activity_level,carb_mode,training_load_tomorrow,"
+        "zone1,zone2,training_before_meal"
+    ]
+    csv_lines.extend(
+        f"35,male,178,72.5,medium,{payload['carb_mode']},high,20,40,lunch" for payload in payloads
+    )
+
+    ndjson = runner.invoke(app, ["batch"], input=_ndjson(payloads))
+    columnar = runner.invoke(
+        app,
+        ["batch", "--input-format", "csv", "--column", "age=Age", "--chunk-size", "2"],
+        input="\n".join(csv_lines) + "\n",
+    )
+
+    assert ndjson.exit_code == 0
+    assert columnar.exit_code == 0
+    assert columnar.stdout == ndjson.stdout
+
+
+def test_batch_rejects_column_mapping_for_non_csv_input() -> None:
+    result = runner.invoke(app, ["batch", "--input-format", "parquet", "--column", "age=Age"])
+
+    assert result.exit_code != 0
+    assert str(result.exception) == "--column: header mapping applies to csv input only"
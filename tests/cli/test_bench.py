@@ -0,0 +1,145 @@
+"""CLI tests for the bench command group."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from mealplan.benchmarks.baseline import Metric, save_baseline
+from mealplan.cli.main import BENCH_REGRESSION_EXIT_CODE, app, run
+
+runner = CliRunner()
+
+
+def test_bench_micro_reports_filtered_benchmarks() -> None:
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            "micro",
+            "--filter",
+            "domain.tdee",
+            "--filter",
+            "render.json[low_carbs]",
+            "--min-time",
+            "0",
+        ],
+    )
+
+    assert result.exit_code == 0
+    rows = [line for line in result.stdout.splitlines() if line.startswith("| ")][2:]
+    names = [row.split(" | ")[0].removeprefix("| ") for row in rows]
+    assert "render.json[low_carbs]" in names
+    assert len(names) == 6
+    assert all(name.startswith(("domain.tdee[", "render.json[")) for name in names)
+
+
+def test_bench_micro_rejects_filter_without_matches() -> None:
+    result = runner.invoke(app, ["bench", "micro", "--filter", "no-such-benchmark"])
+
+    assert result.exit_code != 0
+    assert str(result.exception) == "--filter: no benchmark matches"
+
+
+def test_bench_startup_reports_wall_time_and_import_ranking() -> None:
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            "startup",
+            "--scenario",
+            "probe",
+            "--runs",
+            "1",
+            "--imports",
+            "probe",
+            "--import-runs",
+            "1",
+            "--top",
+            "50",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "| probe | 1 |" in result.stdout
+    modules = [
+        line.split(" | ")[1] for line in result.stdout.splitlines() if line.startswith("| ")
+    ]
+    assert "mealplan.cli.main" in modules
+    assert "typer" in modules
+
+
+def test_bench_startup_rejects_unknown_scenario() -> None:
+    result = runner.invoke(app, ["bench", "startup", "--scenario", "serve"])
+
+    assert result.exit_code != 0
+    assert str(result.exception) == "--scenario: unknown scenario serve"
+
+
+def test_bench_run_saves_baseline_and_compare_passes_against_itself(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+
+    saved = runner.invoke(
+        app, ["bench", "run", "--suite", "stage", "--trials", "1", "--save", str(baseline)]
+    )
+    compared = runner.invoke(
+        app, ["bench", "compare", str(baseline), "--trials", "1", "--threshold", "10"]
+    )
+
+    assert saved.exit_code == 0
+    assert "| stage.assembly | us |" in saved.stdout
+    assert compared.exit_code == 0
+    assert "| stage.assembly | us |" in compared.stdout
+    assert "render." not in compared.stdout
+
+
+def test_bench_compare_exits_with_regression_code(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    save_baseline(
+        str(baseline),
+        {"stage.assembly": Metric(name="stage.assembly", unit="us", trials=(0.001,))},
+    )
+
+    exit_code = run(["bench", "compare", str(baseline), "--trials", "1"])
+
+    assert exit_code == BENCH_REGRESSION_EXIT_CODE == 1
+
+
+def test_bench_run_rejects_unknown_suite() -> None:
+    result = runner.invoke(app, ["bench", "run", "--suite", "disk"])
+
+    assert result.exit_code != 0
+    assert str(result.exception) == "--suite: unknown suite disk"
+
+
+def test_bench_memory_reports_allocations_and_batch_peak_rss() -> None:
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            "memory",
+            "--request",
+            "low_carbs",
+            "--calls",
+            "5",
+            "--batch-requests",
+            "10",
+            "--batch-requests",
+            "20",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Allocations per call of 'low_carbs' (5 traced calls):" in result.stdout
+    assert "| stage.assembly | " in result.stdout
+    assert "| render.table | " in result.stdout
+    assert "| 10 | " in result.stdout
+    assert "| 20 | " in result.stdout
+
+
+def test_bench_memory_rejects_unknown_request() -> None:
+    result = runner.invoke(app, ["bench", "memory", "--request", "marathon"])
+
+    assert result.exit_code != 0
+    assert str(result.exception).startswith("--request: unknown request marathon;")
@@ -0,0 +1,103 @@
+"""CLI tests for the persistent cache commands."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from typer.testing import CliRunner
+
+from mealplan.cli.main import app
+from mealplan.infrastructure.shared_cache import SharedMemoryResultCache
+
+runner = CliRunner()
+
+REQUEST_PAYLOAD: dict[str, Any] = {
+    "age": 40,
+    "gender": "male",
+    "height_cm": 180,
+    "weight_kg": 75.0,
+    "activity_level": "medium",
+    "carb_mode": "periodized",
+    "training_load_tomorrow": "high",
+}
+
+
+def test_batch_cache_db_persists_results_between_runs(tmp_path: Path) -> None:
+    db = str(tmp_path / "cache.sqlite3")
+    requests = f"{json.dumps(REQUEST_PAYLOAD)}\n" * 3
+
+    uncached = runner.invoke(app, ["batch"], input=requests)
+    first = runner.invoke(app, ["batch", "--cache-db", db], input=requests)
+    second = runner.invoke(app, ["batch", "--cache-db", db], input=requests)
+    stats = runner.invoke(app, ["cache", "stats", "--db", db])
+
+    assert uncached.exit_code == first.exit_code == second.exit_code == stats.exit_code == 0
+    assert first.stdout == second.stdout == uncached.stdout
+    payload = json.loads(stats.stdout)
+    assert (payload["entries"], payload["hits"], payload["misses"]) == (1, 5, 1)
+
+
+def test_cache_clear_and_vacuum(tmp_path: Path) -> None:
+    db = str(tmp_path / "cache.sqlite3")
+    runner.invoke(app, ["batch", "--cache-db", db], input=f"{json.dumps(REQUEST_PAYLOAD)}\n")
+
+    cleared = runner.invoke(app, ["cache", "clear", "--db", db])
+    vacuumed = runner.invoke(app, ["cache", "vacuum", "--db", db])
+    stats = runner.invoke(app, ["cache", "stats", "--db", db])
+
+    assert cleared.exit_code == 0
+    assert cleared.stdout == "Removed 1 cached results\n"
+    assert vacuumed.exit_code == 0
+    assert vacuumed.stdout.startswith(f"Vacuumed {db}: ")
+    assert json.loads(stats.stdout)["entries"] == 0
+
+
+def test_cache_db_defaults_to_environment_path(tmp_path: Path) -> None:
+    db = tmp_path / "env.sqlite3"
+
+    result = runner.invoke(app, ["cache", "stats"], env={"MEALPLAN_CACHE_DB": str(db)})
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["path"] == str(db)
+    assert db.exists()
+
+
+def test_batch_workers_share_memory_mapped_cache(tmp_path: Path) -> None:
+    shared = str(tmp_path / "cache.shm")
+    payloads = [REQUEST_PAYLOAD, {**REQUEST_PAYLOAD, "carb_mode": "low"}] * 4
+    requests = "".join(f"{json.dumps(payload)}\n" for payload in payloads)
+
+    uncached = runner.invoke(app, ["batch"], input=requests)
+    shared_run = runner.invoke(
+        app,
+        ["batch", "--workers", "2", "--chunk-size", "2", "--shared-cache", shared],
+        input=requests,
+    )
+    conflicting = runner.invoke(
+        app,
+        ["batch", "--shared-cache", shared, "--cache-db", str(tmp_path / "c.sqlite3")],
+        input=requests,
+    )
+
+    assert shared_run.exit_code == 0
+    assert shared_run.stdout == uncached.stdout
+    with SharedMemoryResultCache(shared) as cache:
+        stats = cache.stats()
+    assert stats.hits + stats.misses == len(payloads)
+    assert stats.size == 2
+    assert str(conflicting.exception) == "--cache-db and --shared-cache are mutually exclusive"
+
+
+def test_batch_rejects_cache_db_for_columnar_input(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app,
+        ["batch", "--input-format", "csv", "--cache-db", str(tmp_path / "c.sqlite3")],
+        input="",
+    )
+
+    assert result.exit_code != 0
+    assert str(result.exception) == (
+        "--cache-size/--cache-db/--shared-cache: result caching applies to ndjson input only"
+    )
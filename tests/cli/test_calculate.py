@@ -609,3 +609,192 @@ def test_calculate_training_zones_invalid_json_returns_validation_exit_code() ->
 
     assert result.returncode == 2
     assert "Error: training_zones: invalid JSON" in result.stderr
+
+
+@pytest.mark.parametrize(
+    "extra_args",
+    [
+        [],
+        ["--format", "text"],
+        ["--format=table", "--vo2max", "55"],
+        ["--training-zones", '{"2": 45}', "--training-before", "lunch"],
+        ["--training-zones", '{"1":'],
+        ["--training-before", "training"],
+        ["--vo2max", "5"],
+        ["--compare", "carbs=all", "--format", "table"],
+        ["--compare=training_before=dinner,carbs=wrong"],
+    ],
+)
+def test_fast_calculate_path_matches_typer_output(
+    extra_args: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    from mealplan.cli import main
+
+    args = [*_required_calculate_args(), *extra_args]
+    assert main._fast_calculate_arguments(args) is not None
+    with monkeypatch.context() as typer_only:
+        typer_only.setattr(main, "_fast_calculate_arguments", lambda argv: None)
+        expected_exit_code = main.run(args)
+    expected = capsys.readouterr()
+
+    def fail_typer(**kwargs: object) -> None:
+        raise AssertionError("fast path fell back to Typer")
+
+    monkeypatch.setattr(main, "app", fail_typer)
+    exit_code = main.run(args)
+    captured = capsys.readouterr()
+
+    assert exit_code == expected_exit_code
+    assert captured.out == expected.out
+    assert captured.err == expected.err
+
+
+def test_calculate_profile_stages_reports_table_on_stderr_only() -> None:
+    from mealplan.application.stage_timer import STAGE_ORDER
+
+    plain = runner.invoke(app, _required_calculate_args())
+    profiled = runner.invoke(app, [*_required_calculate_args(), "--profile-stages"])
+
+    assert profiled.exit_code == 0
+    assert profiled.stdout == plain.stdout
+    rows = [line for line in profiled.stderr.splitlines() if line.startswith("| ")]
+    assert rows[0] == "| stage | us | share |"
+    assert [row.split(" | ")[0].removeprefix("| ") for row in rows[2:]] == [
+        *(stage for stage in STAGE_ORDER if stage != "carb_strategy"),
+        "total",
+    ]
+    assert rows[-1].endswith("| 100.0% |")
+
+
+def test_fast_calculate_path_accepts_profile_stages() -> None:
+    from mealplan.cli.main import _fast_calculate_arguments
+
+    arguments = _fast_calculate_arguments([*_required_calculate_args(), "--profile-stages"])
+
+    assert arguments is not None
+    assert arguments["profile_stages"] is True
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["calculate", "--help"],
+        ["calculate"],
+        _required_calculate_args()[:-2],
+        [*_required_calculate_args(), "--gender", "female"],
+        [*_required_calculate_args(), "--unknown", "1"],
+        [*_required_calculate_args(), "--vo2max", "fifty"],
+        [*_required_calculate_args(), "--format", "xml"],
+        [*_required_calculate_args(), "--vo2max", "-5"],
+        [*_required_calculate_args(), "--vo2max"],
+        [*_required_calculate_args(), "--no-debug"],
+        [*_required_calculate_args(), "extra"],
+        ["calculate", "--age", "40", "--gender", "MALE", *_required_calculate_args()[5:]],
+        ["probe"],
+    ],
+)
+def test_fast_calculate_path_falls_back_to_typer(args: list[str]) -> None:
+    from mealplan.cli.main import _fast_calculate_arguments
+
+    assert _fast_calculate_arguments(args) is None
+
+
+def test_calculate_compare_outputs_scenario_matrix() -> None:
+    args = [
+        *_required_calculate_args(),
+        "--training-zones",
+        '{"2": 60}',
+        "--training-before",
+        "lunch",
+    ]
+
+    result = runner.invoke(app, [*args, "--compare", "training_before=all,carbs=all"])
+
+    assert result.exit_code == 0
+    matrix = json.loads(result.stdout)
+    assert matrix["columns"][:3] == ["training_before_meal", "carb_mode", "training_load_tomorrow"]
+    assert len(matrix["rows"]) == len(CANONICAL_MEAL_ORDER) * 3
+    rows = {
+        (row[0], row[1]): dict(zip(matrix["columns"], row, strict=True)) for row in matrix["rows"]
+    }
+    single_args = [*_required_calculate_args(), "--training-zones", '{"2": 60}']
+    single_args[single_args.index("--carbs") + 1] = "periodized"
+    single = runner.invoke(app, [*single_args, "--training-before", "dinner"])
+    expected = json.loads(single.stdout)
+    dinner = rows["dinner", "periodized"]
+    assert dinner["training_load_tomorrow"] == "high"
+    assert dinner["total_kcal"] == expected["total_kcal"]
+    assert dinner["carbs_g"] == expected["carbs_g"]
+    assert [dinner[meal["meal"]] for meal in expected["meals"]] == [
+        meal["carbs_g"] for meal in expected["meals"]
+    ]
+
+
+def test_calculate_compare_renders_text_and_table() -> None:
+    args = [
+        *_required_calculate_args(),
+        "--compare",
+        "training_tomorrow=low,training_tomorrow=high",
+    ]
+
+    text = runner.invoke(app, [*args, "--format", "text"])
+    table = runner.invoke(app, [*args, "--format", "table"])
+
+    assert text.exit_code == table.exit_code == 0
+    assert text.stdout.splitlines()[1].startswith(
+        "training_before=none carbs=low training_tomorrow=high: total_kcal="
+    )
+    table_rows = table.stdout.splitlines()
+    assert table_rows[0].startswith("| training_before_meal | carb_mode | training_load_tomorrow |")
+    assert len(table_rows) == 4
+    assert table_rows[3].startswith("| none | low | high | ")
+
+
+def test_calculate_compare_reports_scenarios_that_break_domain_rules() -> None:
+    args = [
+        "calculate",
+        "--age",
+        "46",
+        "--gender",
+        "male",
+        "--height",
+        "187",
+        "--weight",
+        "122.4",
+        "--activity",
+        "medium",
+        "--carbs",
+        "low",
+        "--training-tomorrow",
+        "low",
+        "--compare",
+        "carbs=all",
+    ]
+
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0
+    matrix = json.loads(result.stdout)
+    rows = {row[1]: dict(zip(matrix["columns"], row, strict=True)) for row in matrix["rows"]}
+    assert rows["normal"]["error"] == (
+        "macro_targets.fat_g: residual fat target must be greater than or equal to 0"
+    )
+    assert rows["normal"]["total_kcal"] is None
+    assert rows["low"]["error"] is None
+    single = json.loads(runner.invoke(app, args[:-2]).stdout)
+    assert rows["low"]["total_kcal"] == single["total_kcal"]
+    assert (
+        "Error: training_before=none carbs=normal training_tomorrow=low: "
+        "macro_targets.fat_g: residual fat target"
+    ) in result.stderr
+
+
+def test_calculate_compare_rejects_unknown_dimension() -> None:
+    result = runner.invoke(app, [*_required_calculate_args(), "--compare", "load=all"])
+
+    assert result.exit_code != 0
+    assert str(result.exception) == (
+        "compare: unknown dimension load; expected one of training_before, carbs, training_tomorrow"
+    )
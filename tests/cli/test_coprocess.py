@@ -0,0 +1,45 @@
+"""CLI tests for the long-lived coprocess command."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from typing import Any
+
+REQUEST_PAYLOAD: dict[str, Any] = {
+    "age": 40,
+    "gender": "male",
+    "height_cm": 180,
+    "weight_kg": 75.0,
+    "activity_level": "medium",
+    "carb_mode": "periodized",
+    "training_load_tomorrow": "high",
+}
+
+
+def test_coprocess_replies_to_each_line_before_the_next_is_sent() -> None:
+    worker = subprocess.Popen(
+        [sys.executable, "-m", "mealplan", "coprocess"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert worker.stdin is not None and worker.stdout is not None
+    envelopes = []
+    try:
+        for line in (json.dumps(REQUEST_PAYLOAD), "{bad", json.dumps(REQUEST_PAYLOAD)):
+            # Each reply must be flushed on its own, or this readline would block forever.
+            worker.stdin.write(f"{line}\n")
+            worker.stdin.flush()
+            envelopes.append(json.loads(worker.stdout.readline()))
+    finally:
+        worker.stdin.close()
+        exit_code = worker.wait(timeout=30)
+
+    assert exit_code == 0
+    assert envelopes[0]["error"] is None
+    assert envelopes[0]["response"]["TDEE"] > 0
+    assert envelopes[1]["response"] is None
+    assert envelopes[1]["error"]["exit_code"] == 2
+    assert envelopes[2] == envelopes[0]
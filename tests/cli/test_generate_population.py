@@ -0,0 +1,86 @@
+"""CLI tests for the synthetic athlete population generator."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from mealplan.cli.main import app
+
+pytest.importorskip("numpy")
+
+runner = CliRunner()
+
+
+def test_generate_population_writes_ndjson_requests_to_stdout() -> None:
+    result = runner.invoke(app, ["generate-population", "--n", "25", "--seed", "42"])
+    again = runner.invoke(app, ["generate-population", "--n", "25", "--seed", "42"])
+
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert len(lines) == 25
+    assert {"age", "gender", "height_cm", "weight_kg"} <= set(json.loads(lines[0]))
+    assert again.stdout == result.stdout
+
+
+@pytest.mark.parametrize("output_format", ["ndjson", "csv", "binary"])
+def test_generated_population_feeds_batch(tmp_path: Path, output_format: str) -> None:
+    population = tmp_path / f"population.{output_format}"
+    output = tmp_path / "plans.ndjson"
+
+    generated = runner.invoke(
+        app,
+        [
+            "generate-population",
+            "--n",
+            "50",
+            "--seed",
+            "1",
+            "--format",
+            output_format,
+            "--output",
+            str(population),
+        ],
+    )
+    batch = runner.invoke(
+        app,
+        [
+            "batch",
+            "--input",
+            str(population),
+            "--input-format",
+            output_format,
+            "--output",
+            str(output),
+        ],
+    )
+
+    assert generated.exit_code == 0
+    assert batch.exit_code == 0
+    assert len(output.read_text(encoding="utf-8").splitlines()) == 50
+
+
+def test_generate_population_writes_parquet_roster(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    population = tmp_path / "population.parquet"
+
+    result = runner.invoke(
+        app,
+        ["generate-population", "--n", "30", "--format", "parquet", "--output", str(population)],
+    )
+    batch = runner.invoke(
+        app, ["batch", "--input", str(population), "--input-format", "parquet"]
+    )
+
+    assert result.exit_code == 0
+    assert len(batch.stdout.splitlines()) == 30
+
+
+def test_generate_population_requires_path_for_binary_output() -> None:
+    result = runner.invoke(app, ["generate-population", "--n", "5", "--format", "binary"])
+
+    assert result.exit_code != 0
+    assert str(result.exception) == "--output: binary output requires a file path"
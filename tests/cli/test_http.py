@@ -0,0 +1,229 @@
+"""Tests for the asyncio HTTP service."""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.cli import http_server
+from mealplan.cli.http_server import MealPlanHttpServer
+from mealplan.shared.errors import DomainRuleError
+
+REQUEST_PAYLOAD: dict[str, Any] = {
+    "age": 40,
+    "gender": "male",
+    "height_cm": 180,
+    "weight_kg": 75.0,
+    "activity_level": "medium",
+    "carb_mode": "periodized",
+    "training_load_tomorrow": "high",
+}
+
+
+class _DomainFailureOnYoungAthletes(MealPlanCalculationService):
+    def calculate(self, request: MealPlanRequest) -> MealPlanResponse:
+        if request.age < 18:
+            raise DomainRuleError("simulated domain failure")
+        return super().calculate(request)
+
+
+class _SlowCalculations(MealPlanCalculationService):
+    def calculate(self, request: MealPlanRequest) -> MealPlanResponse:
+        time.sleep(0.002)
+        return super().calculate(request)
+
+
+@contextmanager
+def _serving(
+    service: MealPlanCalculationService,
+    *,
+    keep_alive_timeout: float = 5.0,
+) -> Iterator[int]:
+    loop = asyncio.new_event_loop()
+    server = MealPlanHttpServer(service, keep_alive_timeout=keep_alive_timeout)
+    listener = loop.run_until_complete(server.start("127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield int(listener.sockets[0].getsockname()[1])
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        listener.close()
+        loop.run_until_complete(listener.wait_closed())
+        loop.close()
+
+
+@pytest.fixture
+def port() -> Iterator[int]:
+    with _serving(_DomainFailureOnYoungAthletes()) as bound_port:
+        yield bound_port
+
+
+def _expected_response() -> dict[str, Any]:
+    response = MealPlanCalculationService().calculate(
+        MealPlanRequest.model_validate(REQUEST_PAYLOAD)
+    )
+    return dict(json.loads(response.model_dump_json()))
+
+
+def test_single_plan_endpoint_reuses_keep_alive_connection(port: int) -> None:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    bodies = []
+    sockets = []
+    for _ in range(3):
+        connection.request("POST", "/v1/plan", body=json.dumps(REQUEST_PAYLOAD))
+        reply = connection.getresponse()
+        assert reply.status == 200
+        assert reply.getheader("Connection") == "keep-alive"
+        bodies.append(json.loads(reply.read()))
+        sockets.append(connection.sock)
+    connection.close()
+
+    assert sockets[0] is not None
+    assert sockets[1] is sockets[2] is sockets[0]
+    assert bodies[0] == {"response": _expected_response(), "warnings": [], "error": None}
+    assert bodies[1] == bodies[2] == bodies[0]
+
+
+@pytest.mark.parametrize(
+    ("body", "status", "exit_code"),
+    [
+        ("{bad", 400, 2),
+        (json.dumps({**REQUEST_PAYLOAD, "gender": "unknown"}), 400, 2),
+        (json.dumps({**REQUEST_PAYLOAD, "age": 16}), 422, 3),
+    ],
+)
+def test_single_plan_errors_map_to_http_status_like_exit_codes(
+    port: int,
+    body: str,
+    status: int,
+    exit_code: int,
+) -> None:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    connection.request("POST", "/v1/plan", body=body)
+    reply = connection.getresponse()
+    envelope = json.loads(reply.read())
+    connection.close()
+
+    assert reply.status == status
+    assert envelope["response"] is None
+    assert envelope["error"]["exit_code"] == exit_code
+
+
+def test_bulk_endpoint_answers_one_envelope_per_ndjson_line(port: int) -> None:
+    lines = [json.dumps(REQUEST_PAYLOAD), "", json.dumps({**REQUEST_PAYLOAD, "age": 16})]
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    connection.request("POST", "/v1/plans", body="\n".join(lines))
+    reply = connection.getresponse()
+    envelopes = [json.loads(line) for line in reply.read().decode().splitlines()]
+    connection.close()
+
+    assert reply.status == 200
+    assert reply.getheader("Content-Type") == "application/x-ndjson"
+    assert envelopes[0]["response"] == _expected_response()
+    assert envelopes[1]["error"] == {"message": "simulated domain failure", "exit_code": 3}
+
+
+def test_bulk_endpoint_does_not_block_other_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_server, "BULK_YIELD_LINES", 1)
+    body = "\n".join([json.dumps(REQUEST_PAYLOAD)] * 500)
+    bulk_done = threading.Event()
+
+    def post_bulk(port: int) -> None:
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        connection.request("POST", "/v1/plans", body=body)
+        connection.getresponse().read()
+        connection.close()
+        bulk_done.set()
+
+    with _serving(_SlowCalculations()) as port:
+        bulk = threading.Thread(target=post_bulk, args=(port,))
+        bulk.start()
+        time.sleep(0.1)
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        connection.request("GET", "/healthz")
+        health = connection.getresponse()
+        health.read()
+        connection.close()
+        answered_during_bulk = not bulk_done.is_set()
+        bulk.join()
+
+    assert health.status == 200
+    assert answered_during_bulk
+
+
+def test_pipelined_requests_are_answered_in_order(port: int) -> None:
+    body = json.dumps(REQUEST_PAYLOAD).encode()
+    plan = (
+        b"POST /v1/plan HTTP/1.1\r\nHost: x\r\nContent-Length: "
+        + str(len(body)).encode()
+        + b"\r\n\r\n"
+        + body
+    )
+    health = b"GET /healthz HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as client:
+        client.sendall(plan + plan + health)
+        received = b""
+        while chunk := client.recv(65536):
+            received += chunk
+
+    assert received.count(b"HTTP/1.1 ") == received.count(b"HTTP/1.1 200 OK") == 3
+    assert received.endswith(b'{"status":"ok"}')
+    assert received.count(b'"error":null') == 2
+
+
+def test_keep_alive_timeout_does_not_cut_off_slow_request_bodies() -> None:
+    body = json.dumps(REQUEST_PAYLOAD).encode()
+    head = (
+        b"POST /v1/plan HTTP/1.1\r\nHost: x\r\nConnection: close\r\nContent-Length: "
+        + str(len(body)).encode()
+        + b"\r\n\r\n"
+    )
+
+    with (
+        _serving(MealPlanCalculationService(), keep_alive_timeout=0.2) as bound_port,
+        socket.create_connection(("127.0.0.1", bound_port), timeout=5) as client,
+    ):
+        client.sendall(head + body[:10])
+        time.sleep(0.5)
+        client.sendall(body[10:])
+        received = b""
+        while chunk := client.recv(65536):
+            received += chunk
+
+    assert received.startswith(b"HTTP/1.1 200 OK")
+
+
+def test_unknown_route_wrong_method_and_chunked_body(port: int) -> None:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    connection.request("GET", "/v1/unknown")
+    missing = connection.getresponse()
+    missing.read()
+    connection.request("GET", "/v1/plan")
+    wrong_method = connection.getresponse()
+    wrong_method.read()
+    connection.close()
+
+    chunked = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    chunked.request("POST", "/v1/plan", body=iter([b"{}"]), encode_chunked=True)
+    not_implemented = chunked.getresponse()
+    not_implemented.read()
+    chunked.close()
+
+    assert missing.status == 404
+    assert wrong_method.status == 405
+    assert not_implemented.status == 501
+    assert not_implemented.getheader("Connection") == "close"
@@ -0,0 +1,89 @@
+"""CLI tests for the global --profile option."""
+
+from __future__ import annotations
+
+import json
+import pstats
+import re
+import signal
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from mealplan.cli.main import app, run
+from mealplan.cli.profiling import StackSampler
+
+runner = CliRunner()
+_COLLAPSED_LINE_RE = re.compile(r"^\S.* \d+$")
+_REQUEST_PAYLOAD = {
+    "age": 35,
+    "gender": "male",
+    "height_cm": 178,
+    "weight_kg": 72.5,
+    "activity_level": "medium",
+    "carb_mode": "periodized",
+    "training_load_tomorrow": "high",
+}
+
+
+def test_profile_writes_pstats_for_command(tmp_path: Path) -> None:
+    path = tmp_path / "probe.pstats"
+
+    result = runner.invoke(app, ["--profile", str(path), "probe"])
+
+    assert result.exit_code == 0
+    assert result.stdout.strip() == "mealplan stub: ready"
+    functions = {function for _, _, function in pstats.Stats(str(path)).stats}  # type: ignore[attr-defined]
+    assert "probe_command" in functions
+
+
+def test_profile_is_written_when_command_fails(tmp_path: Path) -> None:
+    path = tmp_path / "failure.pstats"
+
+    exit_code = run(["--profile", str(path), "probe", "--simulate-error", "validation"])
+
+    assert exit_code == 2
+    assert pstats.Stats(str(path)).total_calls > 0  # type: ignore[attr-defined]
+
+
+def test_profile_sample_mode_writes_collapsed_stacks(tmp_path: Path) -> None:
+    path = tmp_path / "batch.folded"
+
+    result = runner.invoke(
+        app,
+        ["--profile", str(path), "--profile-mode", "sample", "batch"],
+        input=f"{json.dumps(_REQUEST_PAYLOAD)}\n" * 200,
+    )
+
+    assert result.exit_code == 0
+    assert len(result.stdout.splitlines()) == 200
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert all(_COLLAPSED_LINE_RE.match(line) for line in lines)
+    assert signal.getsignal(signal.SIGPROF) is signal.SIG_DFL
+
+
+def test_stack_sampler_counts_busy_stacks_root_first(tmp_path: Path) -> None:
+    sampler = StackSampler(str(tmp_path / "busy.folded"), interval_s=0.001)
+
+    def busy_loop() -> int:
+        total = 0
+        while sum(sampler.stacks.values()) < 5:
+            total += sum(range(1000))
+        return total
+
+    sampler.start()
+    try:
+        busy_loop()
+    finally:
+        sampler.stop()
+
+    lines = (tmp_path / "busy.folded").read_text(encoding="utf-8").splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) >= 5
+    assert any("busy_loop" in line.rsplit(";", 1)[-1] for line in lines)
+    assert all(not line.startswith("test_stack_sampler") for line in lines)
+
+
+def test_stack_sampler_rejects_non_positive_interval() -> None:
+    with pytest.raises(ValueError, match="interval_s"):
+        StackSampler("unused", interval_s=0)
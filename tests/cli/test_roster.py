@@ -0,0 +1,100 @@
+"""CLI tests for building and querying binary rosters."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from mealplan.cli.main import app
+
+pytest.importorskip("numpy")
+
+runner = CliRunner()
+
+CSV_ROSTER = (
+    "athlete_id,age,gender,height_cm,weight_kg,activity_level,carb_mode,training_load_tomorrow,"
+    "zone1,zone2,training_before_meal\n"
+    "a-1,35,male,178,72.5,medium,periodized,high,20,40,lunch\n"
+    "a-2,40,male,180,75.0,medium,low,low,,,\n"
+)
+
+
+@pytest.fixture
+def roster_path(tmp_path: Path) -> Path:
+    csv_path = tmp_path / "roster.csv"
+    csv_path.write_text(CSV_ROSTER, encoding="utf-8")
+    path = tmp_path / "roster.mpr"
+    result = runner.invoke(
+        app, ["roster", "build", "--input", str(csv_path), "--output", str(path)]
+    )
+    assert result.exit_code == 0
+    return path
+
+
+def test_roster_calculate_matches_calculate_command(roster_path: Path) -> None:
+    direct = runner.invoke(
+        app,
+        [
+            "calculate",
+            "--age",
+            "35",
+            "--gender",
+            "male",
+            "--height",
+            "178",
+            "--weight",
+            "72.5",
+            "--activity",
+            "medium",
+            "--carbs",
+            "periodized",
+            "--training-tomorrow",
+            "high",
+            "--training-zones",
+            '{"1": 20, "2": 40}',
+            "--training-before",
+            "lunch",
+            "--format",
+            "table",
+        ],
+    )
+    from_roster = runner.invoke(
+        app,
+        [
+            "roster",
+            "calculate",
+            "--roster",
+            str(roster_path),
+            "--athlete-id",
+            "a-1",
+            "--format",
+            "table",
+        ],
+    )
+
+    assert direct.exit_code == 0
+    assert from_roster.exit_code == 0
+    assert from_roster.stdout == direct.stdout
+
+
+def test_roster_calculate_unknown_athlete_is_validation_error(roster_path: Path) -> None:
+    result = runner.invoke(
+        app, ["roster", "calculate", "--roster", str(roster_path), "--athlete-id", "a-9"]
+    )
+
+    assert result.exit_code != 0
+    assert str(result.exception) == "athlete_id: unknown athlete 'a-9'"
+
+
+def test_batch_binary_input_matches_csv_input(roster_path: Path) -> None:
+    from_binary = runner.invoke(
+        app, ["batch", "--input-format", "binary", "--input", str(roster_path)]
+    )
+    from_csv = runner.invoke(app, ["batch", "--input-format", "csv"], input=CSV_ROSTER)
+
+    assert from_binary.exit_code == 0
+    assert from_csv.exit_code == 0
+    assert from_binary.stdout == from_csv.stdout
+    assert len(from_binary.stdout.splitlines()) == 2
@@ -0,0 +1,167 @@
+"""Tests for the warm daemon and the forwarding client."""
+
+from __future__ import annotations
+
+import io
+import os
+import socket
+import threading
+from collections.abc import Iterator
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+import pytest
+
+from mealplan.cli import client, daemon
+from mealplan.cli.client import forward, is_trusted_socket, should_forward
+from mealplan.cli.daemon import CliDaemon
+from mealplan.cli.main import run
+from mealplan.shared.errors import ConfigError
+
+CALCULATE_ARGS = [
+    "calculate",
+    "--age",
+    "40",
+    "--gender",
+    "male",
+    "--height",
+    "180",
+    "--weight",
+    "75",
+    "--activity",
+    "medium",
+    "--carbs",
+    "periodized",
+    "--training-tomorrow",
+    "high",
+]
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Iterator[str]:
+    # AF_UNIX paths are length-limited, so keep the socket name short.
+    path = str(tmp_path / "d.sock")
+    daemon = CliDaemon(path, lambda argv, prog_name: run(argv, prog_name=prog_name))
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    daemon.shutdown()
+    daemon.server_close()
+    thread.join()
+
+
+def _run_in_process(argv: list[str]) -> tuple[str, str, int]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        exit_code = run(argv, prog_name="mealplan")
+    return stdout.getvalue(), stderr.getvalue(), exit_code
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [*CALCULATE_ARGS, "--format", "table"],
+        [*CALCULATE_ARGS, "--training-zones", "{bad"],
+        ["calculate", "--age", "x"],
+        ["probe", "--simulate-error", "domain"],
+    ],
+)
+def test_forwarded_invocation_matches_in_process_output_and_exit_code(
+    socket_path: str,
+    argv: list[str],
+) -> None:
+    result = forward(argv, prog_name="mealplan", socket_path=socket_path)
+
+    assert result is not None
+    assert (result.stdout, result.stderr, result.exit_code) == _run_in_process(argv)
+
+
+def test_forward_returns_none_without_daemon(tmp_path: Path) -> None:
+    assert forward(["probe"], prog_name="mealplan", socket_path=str(tmp_path / "x.sock")) is None
+
+
+def test_only_pure_commands_are_forwarded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MEALPLAN_NO_DAEMON", raising=False)
+    assert should_forward(CALCULATE_ARGS)
+    assert not should_forward(["calculate", "--help"])
+    assert not should_forward(["batch", "--input", "roster.ndjson"])
+    assert not should_forward([])
+
+    monkeypatch.setenv("MEALPLAN_NO_DAEMON", "1")
+    assert not should_forward(CALCULATE_ARGS)
+
+
+def test_daemon_refuses_live_socket_and_non_socket_paths(
+    socket_path: str,
+    tmp_path: Path,
+) -> None:
+    with pytest.raises(ConfigError, match="already served by a running daemon"):
+        CliDaemon(socket_path, lambda argv, prog_name: 0)
+
+    regular_file = tmp_path / "plain"
+    regular_file.write_text("keep me", encoding="utf-8")
+    with pytest.raises(ConfigError, match="exists and is not a socket"):
+        CliDaemon(str(regular_file), lambda argv, prog_name: 0)
+    assert regular_file.read_text(encoding="utf-8") == "keep me"
+
+
+def test_daemon_replaces_stale_socket(tmp_path: Path) -> None:
+    path = str(tmp_path / "s.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    daemon = CliDaemon(path, lambda argv, prog_name: 0)
+    daemon.server_close()
+
+    assert oct(os.stat(path).st_mode & 0o777) == "0o600"
+
+
+def test_forward_skips_sockets_other_users_could_control(
+    socket_path: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    directory = os.path.dirname(socket_path)
+    assert is_trusted_socket(socket_path)
+
+    os.chmod(directory, 0o777)
+    assert not is_trusted_socket(socket_path)
+    assert forward(["probe"], prog_name="mealplan", socket_path=socket_path) is None
+    os.chmod(directory, 0o1777)
+    assert is_trusted_socket(socket_path)
+    os.chmod(directory, 0o700)
+
+    other_uid = os.getuid() + 1
+    monkeypatch.setattr(client.os, "getuid", lambda: other_uid)
+    assert not is_trusted_socket(socket_path)
+    assert forward(["probe"], prog_name="mealplan", socket_path=socket_path) is None
+
+
+def test_daemon_drops_stalled_connections(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(daemon._ForwardedInvocationHandler, "timeout", 0.1)
+    path = str(tmp_path / "t.sock")
+    server = CliDaemon(path, lambda argv, prog_name: run(argv, prog_name=prog_name))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled:
+            stalled.connect(path)
+            result = forward(["probe"], prog_name="mealplan", socket_path=path)
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    assert result is not None
+    assert result.exit_code == 0
+
+
+def test_daemon_refuses_clients_of_other_code_versions(
+    socket_path: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert forward(["probe"], prog_name="mealplan", socket_path=socket_path) is not None
+
+    monkeypatch.setattr(client, "code_version_token", lambda: "edited-sources")
+
+    assert forward(["probe"], prog_name="mealplan", socket_path=socket_path) is None
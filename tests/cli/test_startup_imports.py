@@ -0,0 +1,118 @@
+"""Tests that CLI startup and package imports stay lazy."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import mealplan.application
+import mealplan.domain
+
+HEAVY_MODULES = (
+    "pydantic",
+    "mealplan.application.contracts",
+    "mealplan.application.orchestration",
+    "mealplan.domain.services",
+    "concurrent.futures.process",
+)
+# Every ``mealplan`` module ``import mealplan.cli.main`` is allowed to load.
+CLI_STARTUP_MODULES = frozenset(
+    {
+        "mealplan",
+        "mealplan.application",
+        "mealplan.application.contract_types",
+        "mealplan.application.parallel",
+        "mealplan.application.stage_timer",
+        "mealplan.cli",
+        "mealplan.cli.main",
+        "mealplan.cli.profiling",
+        "mealplan.domain",
+        "mealplan.domain.enums",
+        "mealplan.shared",
+        "mealplan.shared.errors",
+        "mealplan.shared.exit_codes",
+    }
+)
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Run ``code`` in a fresh interpreter and return the modules it left loaded."""
+    script = f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(completed.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import mealplan.cli.main",
+        "from mealplan.cli.main import run; run(['--help'])",
+        "from mealplan.cli.main import run; run(['calculate', '--help'])",
+    ],
+)
+def test_help_paths_do_not_load_calculation_stack(code: str) -> None:
+    assert _loaded_modules(code).isdisjoint(HEAVY_MODULES)
+
+
+def test_cli_import_loads_only_allowed_mealplan_modules() -> None:
+    loaded = _loaded_modules("import mealplan.cli.main")
+
+    assert {name for name in loaded if name.split(".")[0] == "mealplan"} <= CLI_STARTUP_MODULES
+
+
+def test_probe_loads_contracts_but_not_orchestration() -> None:
+    loaded = _loaded_modules("from mealplan.cli.main import run; run(['probe'])")
+
+    assert "mealplan.application.contracts" in loaded
+    assert "mealplan.application.orchestration" not in loaded
+
+
+def test_calculate_loads_only_the_modules_it_uses() -> None:
+    loaded = _loaded_modules(
+        "from mealplan.cli.main import run; run(['calculate', '--age', '40', '--gender', 'male', "
+        "'--height', '180', '--weight', '75', '--activity', 'medium', '--carbs', 'periodized', "
+        "'--training-tomorrow', 'high'])"
+    )
+
+    assert "mealplan.application.orchestration" in loaded
+    assert loaded.isdisjoint(
+        {
+            "mealplan.application.batch",
+            "mealplan.application.cache",
+            "mealplan.application.coprocess",
+            "mealplan.application.stub",
+        }
+    )
+
+
+def test_domain_submodule_import_does_not_load_siblings() -> None:
+    loaded = _loaded_modules("import mealplan.domain.enums")
+
+    assert "mealplan.domain.services" not in loaded
+    assert "mealplan.domain.macros" not in loaded
+
+
+@pytest.mark.parametrize("package", [mealplan.domain, mealplan.application])
+def test_lazy_package_exports_resolve(package: object) -> None:
+    for name in package.__all__:  # type: ignore[attr-defined]
+        assert getattr(package, name) is not None
+    assert set(package.__all__) <= set(dir(package))  # type: ignore[attr-defined]
+
+
+def test_unknown_package_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="no_such_name"):
+        _ = mealplan.domain.no_such_name  # type: ignore[attr-defined]
+
+
+def test_cli_module_resolves_deferred_names() -> None:
+    from mealplan.application.orchestration import MealPlanCalculationService
+    from mealplan.cli import main
+
+    assert main.MealPlanCalculationService is MealPlanCalculationService
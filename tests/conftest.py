@@ -1,11 +1,19 @@
-"""Shared canonical fixtures for contract boundary tests."""
+"""Suite-wide test configuration and shared canonical contract fixtures."""
 
 from __future__ import annotations
 
+import os
 from typing import Any
 
 import pytest
 
+from mealplan.shared.checks import PARANOID_CHECKS_ENV_VAR, set_paranoid_checks
+
+# Every calculation under test re-validates its response: in-process via the switch,
+# and in CLI subprocesses through the inherited environment.
+os.environ[PARANOID_CHECKS_ENV_VAR] = "1"
+set_paranoid_checks(True)
+
 
 @pytest.fixture
 def meal_plan_request_payload() -> dict[str, Any]:
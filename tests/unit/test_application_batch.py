@@ -0,0 +1,93 @@
+"""Unit tests for streaming NDJSON batch orchestration."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from mealplan.application.batch import iter_batch_records
+from mealplan.application.contracts import MealPlanRequest
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.shared.errors import DomainRuleError, ValidationError
+from mealplan.shared.exit_codes import ExitCode, map_exception_to_exit_code
+
+
+def test_iter_batch_records_matches_single_request_calculation(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    lines = [json.dumps(meal_plan_request_payload), "", json.dumps(meal_plan_request_payload)]
+
+    records = list(iter_batch_records(lines, MealPlanCalculationService()))
+
+    expected = MealPlanCalculationService().calculate(
+        MealPlanRequest.model_validate(meal_plan_request_payload)
+    )
+    assert [record.line_number for record in records] == [1, 3]
+    assert all(record.response_json == expected.model_dump_json() for record in records)
+
+
+def test_iter_batch_records_reuses_single_service_instance(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    calls: list[int] = []
+
+    class CountingService(MealPlanCalculationService):
+        def calculate(self, request: MealPlanRequest) -> Any:
+            calls.append(id(self))
+            return super().calculate(request)
+
+    lines = [json.dumps(meal_plan_request_payload)] * 3
+    list(iter_batch_records(lines, CountingService()))
+
+    assert len(calls) == 3
+    assert len(set(calls)) == 1
+
+
+def test_iter_batch_records_consumes_input_lazily(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    consumed: list[int] = []
+
+    def lines() -> Iterator[str]:
+        for index in range(3):
+            consumed.append(index)
+            yield json.dumps(meal_plan_request_payload)
+
+    records = iter_batch_records(lines(), MealPlanCalculationService())
+    next(records)
+
+    assert consumed == [0]
+
+
+def test_iter_batch_records_prefixes_invalid_json_with_line_number() -> None:
+    with pytest.raises(ValidationError, match=r"^line 2: invalid JSON: ") as error:
+        list(iter_batch_records(["", "{not json"], MealPlanCalculationService()))
+
+    assert map_exception_to_exit_code(error.value) is ExitCode.VALIDATION
+
+
+@pytest.mark.parametrize(
+    ("error_type", "expected_exit_code"),
+    [
+        (ValidationError, ExitCode.VALIDATION),
+        (DomainRuleError, ExitCode.DOMAIN),
+    ],
+    ids=["validation", "domain"],
+)
+def test_iter_batch_records_preserves_error_category_with_line_prefix(
+    meal_plan_request_payload: dict[str, Any],
+    error_type: type[Exception],
+    expected_exit_code: ExitCode,
+) -> None:
+    class FailingService(MealPlanCalculationService):
+        def calculate(self, request: MealPlanRequest) -> Any:
+            _ = request
+            raise error_type("simulated failure")
+
+    with pytest.raises(error_type, match=r"^line 1: simulated failure$") as error:
+        list(iter_batch_records([json.dumps(meal_plan_request_payload)], FailingService()))
+
+    assert map_exception_to_exit_code(error.value) is expected_exit_code
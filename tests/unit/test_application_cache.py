@@ -0,0 +1,170 @@
+"""Unit tests for fingerprint-keyed result caching."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+
+from mealplan.application.cache import (
+    CachedResult,
+    CachingCalculationService,
+    LruResultCache,
+    request_fingerprint,
+    validated_request_fingerprint,
+)
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
+from mealplan.application.orchestration import (
+    MealPlanCalculationService,
+    ValidatedMealPlanRequest,
+    validate_meal_plan_request,
+)
+from mealplan.shared.errors import ValidationError
+
+
+def _request(payload: dict[str, Any]) -> MealPlanRequest:
+    return MealPlanRequest.model_validate(payload)
+
+
+def test_fingerprint_normalizes_zones_and_missing_session(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    base = meal_plan_request_payload
+    without_session = {key: value for key, value in base.items() if key != "training_session"}
+    zero_zones = {
+        **without_session,
+        "training_session": {"zones_minutes": {"1": 0}, "training_before_meal": None},
+    }
+    sparse_zones = {
+        **base,
+        "training_session": {"zones_minutes": {"2": 40, "1": 20}, "training_before_meal": "lunch"},
+    }
+
+    assert request_fingerprint(_request(without_session)) == request_fingerprint(
+        _request(zero_zones)
+    )
+    assert request_fingerprint(_request(sparse_zones)) == request_fingerprint(_request(base))
+    assert validated_request_fingerprint(
+        validate_meal_plan_request(sparse_zones)
+    ) == request_fingerprint(_request(base))
+    assert request_fingerprint(_request({**base, "vo2max": None})) == request_fingerprint(
+        _request(base)
+    )
+
+
+def test_fingerprint_distinguishes_calculation_inputs(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    base = _request(meal_plan_request_payload)
+    variants = [
+        {**meal_plan_request_payload, "vo2max": 50},
+        {**meal_plan_request_payload, "weight_kg": 72.6},
+        {**meal_plan_request_payload, "carb_mode": "low"},
+        {
+            **meal_plan_request_payload,
+            "training_session": {
+                "zones_minutes": {"1": 20, "2": 40},
+                "training_before_meal": "dinner",
+            },
+        },
+    ]
+
+    fingerprints = {request_fingerprint(_request(variant)) for variant in variants}
+
+    assert request_fingerprint(base) not in fingerprints
+    assert len(fingerprints) == len(variants)
+
+
+def test_lru_cache_evicts_least_recently_used_and_counts() -> None:
+    cache = LruResultCache(max_entries=2)
+    result = CachedResult(response=MealPlanResponse.placeholder(), warnings=())
+
+    cache.put("a", result)
+    cache.put("b", result)
+    assert cache.get("a") is result
+    cache.put("c", result)
+
+    assert cache.get("b") is None
+    assert cache.get("c") is result
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 1, 1, 2)
+
+
+def test_lru_cache_rejects_non_positive_size() -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        LruResultCache(max_entries=0)
+
+
+def test_caching_service_returns_identical_response_and_restores_warnings(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    calls: list[int] = []
+    original_calculate = MealPlanCalculationService.calculate_validated
+
+    def counting_calculate(
+        self: MealPlanCalculationService, validated: ValidatedMealPlanRequest
+    ) -> MealPlanResponse:
+        calls.append(1)
+        response = original_calculate(self, validated)
+        self.warnings = ("simulated warning",)
+        return response
+
+    service = CachingCalculationService(max_entries=8)
+    request = _request(meal_plan_request_payload)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(MealPlanCalculationService, "calculate_validated", counting_calculate)
+        first = service.calculate(request)
+        service.warnings = ()
+        second = service.calculate(request)
+
+    expected = MealPlanCalculationService().calculate(request)
+    assert len(calls) == 1
+    assert second is first
+    assert second.model_dump_json() == expected.model_dump_json()
+    assert service.warnings == ("simulated warning",)
+
+
+def test_caching_service_does_not_cache_failures(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    service = CachingCalculationService(max_entries=8)
+    invalid = _request({**meal_plan_request_payload, "age": 0})
+
+    for _ in range(2):
+        with pytest.raises(ValidationError, match="age"):
+            service.calculate(invalid)
+
+    assert service.cache.stats().size == 0
+
+
+def test_shared_cache_is_consistent_across_threads(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    cache = LruResultCache(max_entries=4)
+    requests = [
+        _request({**meal_plan_request_payload, "carb_mode": mode})
+        for mode in ("low", "normal", "periodized")
+    ]
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        service = CachingCalculationService(cache)
+        try:
+            for _ in range(50):
+                for request in requests:
+                    service.calculate(request)
+        except BaseException as error:  # noqa: BLE001
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert errors == []
+    assert stats.hits + stats.misses == 4 * 50 * len(requests)
+    assert stats.size == len(requests)
+    assert stats.evictions == 0
@@ -446,3 +446,29 @@ def test_probe_request_rejects_unknown_fields() -> None:
     """Boundary models should fail when unexpected keys are provided."""
     with pytest.raises(PydanticValidationError):
         ProbeRequest.model_validate({"simulate_error": None, "unexpected": "x"})
+
+
+def test_meal_plan_response_from_engine_payload_skips_only_structural_validators(
+    meal_plan_response_payload: dict[str, Any],
+) -> None:
+    """Trusted construction matches full validation but still enforces field types."""
+    assert MealPlanResponse.from_engine_payload(
+        meal_plan_response_payload
+    ) == MealPlanResponse.model_validate(meal_plan_response_payload)
+
+    reordered = {
+        **meal_plan_response_payload,
+        "meals": meal_plan_response_payload["meals"][::-1],
+    }
+    assert [
+        allocation.meal for allocation in MealPlanResponse.from_engine_payload(reordered).meals
+    ] == [meal["meal"] for meal in reordered["meals"]]
+    with pytest.raises(PydanticValidationError, match="canonical meal order"):
+        MealPlanResponse.model_validate(reordered)
+
+    inconsistent = {**meal_plan_response_payload, "total_kcal": 1.0}
+    with pytest.raises(PydanticValidationError, match="total_kcal must equal TDEE"):
+        MealPlanResponse.from_engine_payload(inconsistent)
+
+    with pytest.raises(PydanticValidationError):
+        MealPlanResponse.from_engine_payload({**meal_plan_response_payload, "TDEE": "2500"})
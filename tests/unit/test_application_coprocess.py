@@ -0,0 +1,78 @@
+"""Unit tests for the line-delimited coprocess protocol."""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import Any
+
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
+from mealplan.application.coprocess import handle_coprocess_line, run_coprocess
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.shared.errors import DomainRuleError
+
+
+def test_success_envelope_carries_response_and_warnings(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    class WarningService(MealPlanCalculationService):
+        def calculate(self, request: MealPlanRequest) -> MealPlanResponse:
+            response = super().calculate(request)
+            self.warnings = ("simulated warning",)
+            return response
+
+    envelope = json.loads(
+        handle_coprocess_line(json.dumps(meal_plan_request_payload), WarningService())
+    )
+
+    expected = MealPlanCalculationService().calculate(
+        MealPlanRequest.model_validate(meal_plan_request_payload)
+    )
+    assert envelope == {
+        "response": json.loads(expected.model_dump_json()),
+        "warnings": ["simulated warning"],
+        "error": None,
+    }
+
+
+def test_error_envelopes_use_cli_exit_codes(meal_plan_request_payload: dict[str, Any]) -> None:
+    class DomainFailureService(MealPlanCalculationService):
+        def calculate(self, request: MealPlanRequest) -> MealPlanResponse:
+            raise DomainRuleError("simulated domain failure")
+
+    class CrashingService(MealPlanCalculationService):
+        def calculate(self, request: MealPlanRequest) -> MealPlanResponse:
+            raise RuntimeError("boom")
+
+    request_line = json.dumps(meal_plan_request_payload)
+    invalid_json = json.loads(handle_coprocess_line("{bad", MealPlanCalculationService()))
+    invalid_field = json.loads(
+        handle_coprocess_line(
+            json.dumps({**meal_plan_request_payload, "age": -1}), MealPlanCalculationService()
+        )
+    )
+    domain = json.loads(handle_coprocess_line(request_line, DomainFailureService()))
+    crash = json.loads(handle_coprocess_line(request_line, CrashingService()))
+
+    assert invalid_json["response"] is None
+    assert invalid_json["error"]["exit_code"] == 2
+    assert invalid_json["error"]["message"].startswith("invalid JSON:")
+    assert invalid_field["error"]["exit_code"] == 2
+    assert domain["error"] == {"message": "simulated domain failure", "exit_code": 3}
+    assert crash["error"] == {"message": "boom", "exit_code": 4}
+
+
+def test_run_coprocess_answers_each_non_blank_line_and_keeps_going(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    request_line = json.dumps(meal_plan_request_payload)
+    output = io.StringIO()
+
+    run_coprocess(
+        [f"{request_line}\n", "\n", "{bad\n", f"{request_line}\n"],
+        output,
+        MealPlanCalculationService(),
+    )
+
+    envelopes = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [envelope["error"] is None for envelope in envelopes] == [True, False, True]
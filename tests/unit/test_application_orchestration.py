@@ -6,16 +6,25 @@ import inspect
 from typing import Any, cast, get_type_hints
 
 import pytest
+from pydantic import ValidationError as PydanticValidationError
 
 from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
 from mealplan.application.orchestration import (
+    MEAL_PLAN_STAGE_GRAPH,
     MealPlanCalculationService,
+    MealPlanComputation,
     TrainingDemandContext,
+    ValidatedMealPlanRequest,
     ValidatedTrainingSession,
     _training_demand_context,
     _validated_training_session,
     validate_meal_plan_flow,
+    validate_meal_plan_request,
+    validate_response_invariants,
 )
+from mealplan.application.scenarios import ScenarioAxes
+from mealplan.application.stage_timer import StageTimer
+from mealplan.application.validation import normalize_training_zones
 from mealplan.domain import calculate_training_calorie_demand_kcal
 from mealplan.domain.enums import CarbMode, MealName, TrainingLoadTomorrow
 from mealplan.domain.model import CANONICAL_MEAL_ORDER, MacroTargets, UserProfile
@@ -110,14 +119,13 @@ def test_meal_plan_calculation_service_calculate_runs_validation_before_stages(
     request = MealPlanRequest.model_validate(meal_plan_request_payload)
     service = MealPlanCalculationService()
 
-    def fake_validate_meal_plan_flow(
-        request_payload: object,
-        response: MealPlanResponse,
-    ) -> MealPlanRequest:
+    def fake_validate_meal_plan_request(request_payload: object) -> ValidatedMealPlanRequest:
         assert request_payload is request
-        assert isinstance(response, MealPlanResponse)
         steps.append("validate")
-        return request
+        return ValidatedMealPlanRequest(
+            request=request,
+            training_session=_validated_training_session(request),
+        )
 
     def track_energy(_: MealPlanRequest) -> float:
         steps.append("energy")
@@ -156,8 +164,8 @@ def test_meal_plan_calculation_service_calculate_runs_validation_before_stages(
         return MealPlanResponse.placeholder()
 
     monkeypatch.setattr(
-        "mealplan.application.orchestration.validate_meal_plan_flow",
-        fake_validate_meal_plan_flow,
+        "mealplan.application.orchestration.validate_meal_plan_request",
+        fake_validate_meal_plan_request,
     )
     monkeypatch.setattr(service, "_run_energy_stage", track_energy)
     monkeypatch.setattr(service, "_run_macro_stage", track_macro)
@@ -662,6 +670,58 @@ def test_validated_training_session_omitted_training_uses_canonical_zero_default
     )
 
 
+def test_validate_meal_plan_request_normalizes_zones_once(
+    meal_plan_request_payload: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A typed request is not re-parsed and its zones are normalized exactly once."""
+    request = MealPlanRequest.model_validate(meal_plan_request_payload)
+    calls: list[object] = []
+
+    def fail_parse_contract(model_cls: type[MealPlanRequest], payload: object) -> MealPlanRequest:
+        raise AssertionError("typed request was parsed again")
+
+    def counting_normalize(zones_minutes: dict[int | str, object]) -> dict[int, int]:
+        calls.append(zones_minutes)
+        return normalize_training_zones(zones_minutes)
+
+    monkeypatch.setattr("mealplan.application.orchestration.parse_contract", fail_parse_contract)
+    monkeypatch.setattr(
+        "mealplan.application.validation.normalize_training_zones", counting_normalize
+    )
+
+    validated = validate_meal_plan_request(request)
+
+    assert validated.request is request
+    assert validated.training_session == _validated_training_session(request)
+    assert len(calls) == 1
+
+
+def test_validate_meal_plan_request_parses_payloads_and_raises_semantic_errors(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    """Raw payloads are parsed once; semantic failures keep their canonical messages."""
+    validated = validate_meal_plan_request(meal_plan_request_payload)
+    assert validated.request == MealPlanRequest.model_validate(meal_plan_request_payload)
+
+    with pytest.raises(ValidationError, match="^age: must be greater than 0$"):
+        validate_meal_plan_request({**meal_plan_request_payload, "age": 0})
+
+
+def test_calculate_validated_matches_calculate(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    """The trusted entry point returns exactly what ``calculate`` returns."""
+    request = MealPlanRequest.model_validate(meal_plan_request_payload)
+    service = MealPlanCalculationService()
+
+    expected = service.calculate(request)
+    actual = service.calculate_validated(validate_meal_plan_request(request))
+
+    assert isinstance(validate_meal_plan_request(request), ValidatedMealPlanRequest)
+    assert actual == expected
+
+
 def test_validate_meal_plan_flow_runs_schema_semantic_then_domain_checks(
     meal_plan_request_payload: dict[str, Any],
     meal_plan_response_payload: dict[str, Any],
@@ -1059,3 +1119,325 @@ def test_meal_plan_calculation_service_integration_uses_emitted_meal_totals_and_
     assert response.training_kcal == 0.0
     assert response.carbs_g == pytest.approx(sum(meal.carbs_g for meal in canonical_meals))
     assert response.fat_g == pytest.approx(sum(meal.fat_g for meal in canonical_meals))
+
+
+@pytest.mark.parametrize("with_training", [True, False])
+def test_trusted_response_construction_matches_full_validation(
+    meal_plan_request_payload: dict[str, Any],
+    with_training: bool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Production responses built without validation equal the paranoid-mode ones."""
+    if not with_training:
+        meal_plan_request_payload["training_session"] = None
+    request = MealPlanRequest.model_validate(meal_plan_request_payload)
+
+    monkeypatch.setattr("mealplan.application.orchestration.paranoid_checks_enabled", lambda: True)
+    validated = MealPlanCalculationService().calculate(request)
+    monkeypatch.setattr("mealplan.application.orchestration.paranoid_checks_enabled", lambda: False)
+    trusted = MealPlanCalculationService().calculate(request)
+
+    assert trusted == validated
+    assert trusted.model_dump_json() == validated.model_dump_json()
+    assert any(meal.meal == "training" for meal in trusted.meals) is with_training
+    validate_response_invariants(trusted)
+
+
+@pytest.mark.parametrize(("paranoid", "raises"), [(True, True), (False, False)])
+def test_paranoid_checks_gate_response_revalidation(
+    meal_plan_request_payload: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+    paranoid: bool,
+    raises: bool,
+) -> None:
+    """A reordered engine payload is only caught when paranoid checks are on."""
+    from mealplan.application import orchestration
+
+    original = orchestration.calculate_meal_split_and_response_payload_with_warnings
+
+    def corrupt_assembly(**kwargs: Any) -> dict[str, Any]:
+        result = original(**kwargs)
+        payload = result["payload"]
+        return {**result, "payload": {**payload, "meals": payload["meals"][::-1]}}
+
+    monkeypatch.setattr(
+        orchestration, "calculate_meal_split_and_response_payload_with_warnings", corrupt_assembly
+    )
+    monkeypatch.setattr(orchestration, "paranoid_checks_enabled", lambda: paranoid)
+    request = MealPlanRequest.model_validate(meal_plan_request_payload)
+
+    if raises:
+        with pytest.raises(Exception, match="canonical meal order"):
+            MealPlanCalculationService().calculate(request)
+    else:
+        assert MealPlanCalculationService().calculate(request).meals[0].meal == "evening-snack"
+
+
+def test_trusted_response_rejects_rounded_total_mismatch_without_paranoid_checks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Production calculation rejects a total that rounding pulled off TDEE + training."""
+    monkeypatch.setattr("mealplan.application.orchestration.paranoid_checks_enabled", lambda: False)
+    request = MealPlanRequest.model_validate(
+        {
+            "age": 27,
+            "gender": "male",
+            "height_cm": 152,
+            "weight_kg": 47.381,
+            "activity_level": "medium",
+            "carb_mode": "periodized",
+            "training_load_tomorrow": "medium",
+            "training_session": {
+                "zones_minutes": {"3": 99, "5": 178},
+                "training_before_meal": "lunch",
+            },
+        }
+    )
+
+    with pytest.raises(PydanticValidationError, match="total_kcal must equal TDEE"):
+        MealPlanCalculationService().calculate(request)
+
+
+def test_meal_plan_stage_graph_is_topologically_ordered() -> None:
+    seen: set[str] = set()
+    outputs = set(MealPlanComputation.__dataclass_fields__)
+
+    for node in MEAL_PLAN_STAGE_GRAPH:
+        assert set(node.dependencies) <= seen
+        assert node.output in outputs
+        seen.add(node.name)
+
+    assert [node.name for node in MEAL_PLAN_STAGE_GRAPH][-1] == "assembly"
+
+
+def test_calculate_incremental_matches_calculate(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    request = MealPlanRequest.model_validate(meal_plan_request_payload)
+    service = MealPlanCalculationService()
+
+    computation = service.calculate_incremental(request)
+
+    assert computation.response == service.calculate(request)
+    assert computation.warnings == service.warnings
+    assert computation.recomputed_stages == tuple(node.name for node in MEAL_PLAN_STAGE_GRAPH)
+
+
+def test_stage_runner_reruns_one_stage_on_memoized_outputs(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    service = MealPlanCalculationService()
+    computation = service.calculate_incremental(
+        MealPlanRequest.model_validate(meal_plan_request_payload)
+    )
+
+    for node in MEAL_PLAN_STAGE_GRAPH:
+        assert service.stage_runner(node.name, computation)() == getattr(computation, node.output)
+    with pytest.raises(ValueError, match="unknown stage parse"):
+        service.stage_runner("parse", computation)
+
+
+def test_recalculate_training_load_tomorrow_reruns_only_carb_strategy_and_assembly(
+    meal_plan_request_payload: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = MealPlanCalculationService()
+    previous = service.calculate_incremental(
+        MealPlanRequest.model_validate(meal_plan_request_payload)
+    )
+
+    def fail(*_: object) -> float:
+        raise AssertionError("upstream stage must be reused")
+
+    for stage in ("_run_energy_stage", "_run_macro_stage", "_run_fueling_stage"):
+        monkeypatch.setattr(service, stage, fail)
+    monkeypatch.setattr(service, "_run_training_demand_stage", fail)
+
+    computation = service.recalculate(previous, {"training_load_tomorrow": "low"})
+
+    meal_plan_request_payload["training_load_tomorrow"] = "low"
+    expected = MealPlanCalculationService().calculate(
+        MealPlanRequest.model_validate(meal_plan_request_payload)
+    )
+    assert computation.recomputed_stages == ("carb_strategy", "assembly")
+    assert computation.response == expected
+    assert computation.response != previous.response
+    assert computation.macro_targets is previous.macro_targets
+
+
+def test_recalculate_merges_training_session_delta(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    service = MealPlanCalculationService()
+    previous = service.calculate_incremental(
+        MealPlanRequest.model_validate(meal_plan_request_payload)
+    )
+
+    computation = service.recalculate(
+        previous, {"training_session": {"training_before_meal": "dinner"}}
+    )
+
+    assert computation.validated.training_session.zones_minutes == {1: 20, 2: 40, 3: 0, 4: 0, 5: 0}
+    assert computation.validated.training_session.training_before_meal == MealName.DINNER
+    assert computation.recomputed_stages == ("carb_strategy", "assembly")
+
+
+@pytest.mark.parametrize(
+    ("delta", "recomputed_stages"),
+    [
+        ({}, ()),
+        ({"vo2max": 58}, ("training_demand", "assembly")),
+        ({"activity_level": "high"}, ("energy", "macro", "assembly")),
+        ({"carb_mode": "low"}, ("macro", "carb_strategy", "assembly")),
+        (
+            {"weight_kg": 80.0},
+            ("energy", "macro", "training_demand", "assembly"),
+        ),
+        (
+            {"training_session": None},
+            ("fueling", "training_demand", "carb_strategy", "assembly"),
+        ),
+    ],
+)
+def test_recalculate_reruns_stages_downstream_of_changed_inputs(
+    meal_plan_request_payload: dict[str, Any],
+    delta: dict[str, Any],
+    recomputed_stages: tuple[str, ...],
+) -> None:
+    service = MealPlanCalculationService()
+    previous = service.calculate_incremental(
+        MealPlanRequest.model_validate(meal_plan_request_payload)
+    )
+
+    computation = service.recalculate(previous, delta)
+
+    expected = MealPlanCalculationService().calculate(
+        MealPlanRequest.model_validate({**meal_plan_request_payload, **delta})
+    )
+    assert computation.recomputed_stages == recomputed_stages
+    assert computation.response == expected
+
+
+def test_recalculate_skips_assembly_when_carb_strategy_is_unchanged(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    meal_plan_request_payload["carb_mode"] = "normal"
+    service = MealPlanCalculationService()
+    previous = service.calculate_incremental(
+        MealPlanRequest.model_validate(meal_plan_request_payload)
+    )
+    service.warnings = ("stale",)
+
+    computation = service.recalculate(previous, {"training_load_tomorrow": "low"})
+
+    assert computation.recomputed_stages == ("carb_strategy",)
+    assert computation.response is previous.response
+    assert service.warnings == previous.warnings
+    assert computation.validated.request.training_load_tomorrow is TrainingLoadTomorrow.LOW
+
+
+def test_recalculate_validates_updated_request(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    service = MealPlanCalculationService()
+    previous = service.calculate_incremental(
+        MealPlanRequest.model_validate(meal_plan_request_payload)
+    )
+
+    with pytest.raises(ValidationError, match="age: must be greater than 0"):
+        service.recalculate(previous, {"age": 0})
+    with pytest.raises(ValidationError, match="^distance_km: "):
+        service.recalculate(previous, {"distance_km": 10})
+
+
+@pytest.mark.parametrize("with_training", [True, False])
+def test_compare_scenarios_matches_independent_calculations(
+    meal_plan_request_payload: dict[str, Any],
+    with_training: bool,
+) -> None:
+    if not with_training:
+        del meal_plan_request_payload["training_session"]
+    request = MealPlanRequest.model_validate(meal_plan_request_payload)
+    service = MealPlanCalculationService()
+    service.stage_timer = StageTimer()
+    axes = ScenarioAxes(
+        training_before_meals=CANONICAL_MEAL_ORDER,
+        carb_modes=tuple(CarbMode),
+        training_loads_tomorrow=tuple(TrainingLoadTomorrow),
+    )
+
+    comparison = service.compare_scenarios(request, axes)
+
+    assert len(comparison.results) == 54
+    reference = MealPlanCalculationService()
+    session = meal_plan_request_payload.get("training_session", {"zones_minutes": {}})
+    for result in comparison.results:
+        expected = reference.calculate(
+            MealPlanRequest.model_validate(
+                {
+                    **meal_plan_request_payload,
+                    "carb_mode": result.carb_mode,
+                    "training_load_tomorrow": result.training_load_tomorrow,
+                    "training_session": {
+                        **session,
+                        "training_before_meal": result.training_before_meal,
+                    },
+                }
+            )
+        )
+        assert result.response == expected
+        assert result.warnings == reference.warnings
+    counts = {summary.stage: summary.count for summary in service.stage_timer.summaries()}
+    assert counts["validate"] == counts["energy"] == counts["fueling"] == 1
+    assert counts["training_demand"] == 1
+    assert counts["macro"] == len(CarbMode)
+    assert counts["assembly"] < len(comparison.results)
+
+
+def test_compare_scenarios_records_domain_rule_failures_per_scenario(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    del meal_plan_request_payload["training_session"]
+    request = MealPlanRequest.model_validate(
+        {
+            **meal_plan_request_payload,
+            "age": 46,
+            "height_cm": 187,
+            "weight_kg": 122.4,
+            "activity_level": "medium",
+            "carb_mode": "normal",
+            "training_load_tomorrow": "low",
+        }
+    )
+    service = MealPlanCalculationService()
+
+    comparison = service.compare_scenarios(request, ScenarioAxes(carb_modes=tuple(CarbMode)))
+
+    by_mode = {result.carb_mode: result for result in comparison.results}
+    failed = by_mode[CarbMode.NORMAL]
+    assert failed.response is None
+    assert failed.error == (
+        "macro_targets.fat_g: residual fat target must be greater than or equal to 0"
+    )
+    with pytest.raises(DomainRuleError, match=failed.error):
+        service.calculate(request)
+    for carb_mode in (CarbMode.LOW, CarbMode.PERIODIZED):
+        assert by_mode[carb_mode].error is None
+        assert by_mode[carb_mode].response == service.calculate(
+            request.model_copy(update={"carb_mode": carb_mode})
+        )
+
+
+def test_compare_scenarios_keeps_base_values_for_unset_axes(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    request = MealPlanRequest.model_validate(meal_plan_request_payload)
+    service = MealPlanCalculationService()
+
+    comparison = service.compare_scenarios(request, ScenarioAxes())
+
+    (result,) = comparison.results
+    assert result.training_before_meal == MealName.LUNCH
+    assert result.carb_mode is request.carb_mode
+    assert result.training_load_tomorrow is request.training_load_tomorrow
+    assert result.response == service.calculate(request)
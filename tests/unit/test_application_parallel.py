@@ -0,0 +1,82 @@
+"""Unit tests for process-pool batch execution."""
+
+from __future__ import annotations
+
+import itertools
+import json
+from typing import Any
+
+import pytest
+
+from mealplan.application.batch import iter_batch_records
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.application.parallel import ProcessPoolBatchExecutor
+from mealplan.shared.errors import ValidationError
+
+
+def _request_lines(payload: dict[str, Any], count: int) -> list[str]:
+    variants = itertools.product(
+        ("low", "normal", "periodized"),
+        ("breakfast", "lunch", "dinner", "evening-snack"),
+    )
+    lines: list[str] = []
+    for carb_mode, training_before_meal in itertools.islice(itertools.cycle(variants), count):
+        training_session = {
+            **payload["training_session"],
+            "training_before_meal": training_before_meal,
+        }
+        variant = {**payload, "carb_mode": carb_mode, "training_session": training_session}
+        lines.append(json.dumps(variant))
+    return lines
+
+
+@pytest.mark.parametrize(
+    ("workers", "chunk_size"),
+    [(1, 1), (2, 3), (3, 64)],
+    ids=["one-worker", "small-chunks", "large-chunks"],
+)
+def test_parallel_records_match_serial_order_and_bytes(
+    meal_plan_request_payload: dict[str, Any],
+    workers: int,
+    chunk_size: int,
+) -> None:
+    lines = _request_lines(meal_plan_request_payload, 20)
+    lines.insert(7, "")
+
+    serial = list(iter_batch_records(lines, MealPlanCalculationService()))
+    parallel = list(
+        ProcessPoolBatchExecutor(workers=workers, chunk_size=chunk_size).iter_records(lines)
+    )
+
+    assert parallel == serial
+
+
+def test_parallel_yields_records_before_first_failure_then_raises(
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    lines = _request_lines(meal_plan_request_payload, 10)
+    lines[5] = json.dumps({**meal_plan_request_payload, "age": 0})
+    executor = ProcessPoolBatchExecutor(workers=2, chunk_size=2)
+
+    line_numbers: list[int] = []
+    with pytest.raises(ValidationError, match=r"^line 6: age: must be greater than 0$"):
+        for record in executor.iter_records(lines):
+            line_numbers.append(record.line_number)
+
+    assert line_numbers == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize(
+    ("workers", "chunk_size", "message"),
+    [
+        (0, 1, "workers must be greater than or equal to 1"),
+        (1, 0, "chunk_size must be greater than or equal to 1"),
+    ],
+)
+def test_parallel_executor_rejects_invalid_configuration(
+    workers: int,
+    chunk_size: int,
+    message: str,
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        ProcessPoolBatchExecutor(workers=workers, chunk_size=chunk_size)
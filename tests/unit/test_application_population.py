@@ -0,0 +1,102 @@
+"""Tests for the seeded synthetic athlete population generator."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mealplan.application.contracts import MealPlanRequest  # noqa: E402
+from mealplan.application.parsing import parse_contract  # noqa: E402
+from mealplan.application.population import (  # noqa: E402
+    POPULATION_CHUNK_ROWS,
+    generate_population,
+    render_request_json,
+)
+from mealplan.application.validation import validate_semantic_input  # noqa: E402
+from mealplan.domain.vectorized import (  # noqa: E402
+    CARB_MODE_CODES,
+    NO_TRAINING_BEFORE_MEAL,
+    ProfileColumns,
+    calculate_many,
+)
+
+COLUMN_NAMES = (
+    "age",
+    "gender",
+    "height_cm",
+    "weight_kg",
+    "activity_level",
+    "carb_mode",
+    "training_load_tomorrow",
+    "zones_minutes",
+    "training_before_meal",
+    "vo2max",
+)
+
+
+def _concatenated(chunks: list[ProfileColumns]) -> dict[str, object]:
+    return {
+        name: np.concatenate([getattr(chunk, name) for chunk in chunks]) for name in COLUMN_NAMES
+    }
+
+
+def test_generate_population_is_seeded_chunked_and_prefix_stable() -> None:
+    rows = POPULATION_CHUNK_ROWS + 10
+    chunks = list(generate_population(rows, seed=42))
+    again = _concatenated(list(generate_population(rows, seed=42)))
+    prefix = next(generate_population(100, seed=42))
+    other_seed = next(generate_population(100, seed=43))
+
+    assert [chunk.row_count for chunk in chunks] == [POPULATION_CHUNK_ROWS, 10]
+    population = _concatenated(chunks)
+    for name in COLUMN_NAMES:
+        assert np.array_equal(population[name], again[name], equal_nan=True)
+        assert np.array_equal(getattr(prefix, name), population[name][:100], equal_nan=True)
+    assert not np.array_equal(other_seed.weight_kg, prefix.weight_kg)
+    assert list(generate_population(0, seed=42)) == []
+
+
+def test_generated_rows_are_plausible_and_calculable() -> None:
+    columns = next(generate_population(POPULATION_CHUNK_ROWS, seed=7))
+    trains = columns.zones_minutes.sum(axis=1) > 0
+
+    calculate_many(columns)
+    assert columns.age.min() >= 16 and columns.age.max() <= 80
+    assert columns.height_cm.min() >= 140 and columns.height_cm.max() <= 210
+    assert columns.weight_kg.min() > 30.0 and columns.weight_kg.max() < 160.0
+    assert (columns.zones_minutes >= 0).all()
+    assert (columns.training_before_meal[trains] != NO_TRAINING_BEFORE_MEAL).all()
+    assert (columns.training_before_meal[~trains] == NO_TRAINING_BEFORE_MEAL).all()
+    known_vo2max = columns.vo2max[~np.isnan(columns.vo2max)]
+    assert known_vo2max.min() >= 10 and known_vo2max.max() <= 100
+    assert 0.5 < trains.mean() < 0.8
+    assert set(np.unique(columns.carb_mode).tolist()) == set(range(len(CARB_MODE_CODES)))
+
+
+def test_render_request_json_emits_valid_requests_matching_columns() -> None:
+    columns = next(generate_population(200, seed=3))
+
+    lines = render_request_json(columns)
+
+    assert len(lines) == columns.row_count
+    for row, line in enumerate(lines):
+        request = parse_contract(MealPlanRequest, json.loads(line))
+        validate_semantic_input(request)
+        assert request.age == columns.age[row]
+        assert request.weight_kg == columns.weight_kg[row]
+        assert (request.vo2max is None) == bool(np.isnan(columns.vo2max[row]))
+        if request.training_session is None:
+            assert not columns.zones_minutes[row].any()
+        else:
+            zones = [request.training_session.zones_minutes[str(zone)] for zone in range(1, 6)]
+            assert zones == columns.zones_minutes[row].tolist()
+
+
+def test_generate_population_rejects_negative_arguments() -> None:
+    with pytest.raises(ValueError, match="n must be"):
+        next(generate_population(-1, seed=0))
+    with pytest.raises(ValueError, match="seed must be"):
+        next(generate_population(1, seed=-1))
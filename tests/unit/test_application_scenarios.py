@@ -0,0 +1,108 @@
+"""Unit tests for scenario axes parsing and comparison matrices."""
+
+from __future__ import annotations
+
+import pytest
+
+from mealplan.application.contracts import MealPlanRequest
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.application.scenarios import (
+    SCENARIO_MATRIX_COLUMNS,
+    ScenarioAxes,
+    parse_scenario_axes,
+)
+from mealplan.domain.enums import CarbMode, MealName, TrainingLoadTomorrow
+from mealplan.domain.model import CANONICAL_MEAL_ORDER
+from mealplan.shared.errors import ValidationError
+
+
+def test_parse_scenario_axes_expands_all_and_keeps_unset_axes() -> None:
+    axes = parse_scenario_axes("training_before=all, carbs=all")
+
+    assert axes == ScenarioAxes(
+        training_before_meals=CANONICAL_MEAL_ORDER,
+        carb_modes=(CarbMode.LOW, CarbMode.NORMAL, CarbMode.PERIODIZED),
+        training_loads_tomorrow=None,
+    )
+
+
+def test_parse_scenario_axes_merges_repeated_dimensions_in_first_seen_order() -> None:
+    axes = parse_scenario_axes("carbs=periodized,training_tomorrow=high,carbs=low,carbs=periodized")
+
+    assert axes.carb_modes == (CarbMode.PERIODIZED, CarbMode.LOW)
+    assert axes.training_loads_tomorrow == (TrainingLoadTomorrow.HIGH,)
+    assert axes.training_before_meals is None
+
+
+@pytest.mark.parametrize(
+    ("spec", "message"),
+    [
+        ("carbs", "compare: expected DIMENSION=VALUE, got 'carbs'"),
+        ("carbs=all,", "compare: expected DIMENSION=VALUE, got ''"),
+        (
+            "load=all",
+            "compare: unknown dimension load; "
+            "expected one of training_before, carbs, training_tomorrow",
+        ),
+        (
+            "training_before=training",
+            "compare: invalid training_before value training; expected all or one of "
+            "breakfast, morning-snack, lunch, afternoon-snack, dinner, evening-snack",
+        ),
+    ],
+)
+def test_parse_scenario_axes_rejects_malformed_specs(spec: str, message: str) -> None:
+    with pytest.raises(ValidationError) as error_info:
+        parse_scenario_axes(spec)
+
+    assert str(error_info.value) == message
+
+
+def test_scenarios_iterate_axes_in_order_with_base_values_for_unset_axes() -> None:
+    axes = ScenarioAxes(
+        training_before_meals=(MealName.LUNCH, MealName.DINNER),
+        training_loads_tomorrow=(TrainingLoadTomorrow.LOW, TrainingLoadTomorrow.HIGH),
+    )
+
+    scenarios = axes.scenarios(
+        training_before_meal=None,
+        carb_mode=CarbMode.NORMAL,
+        training_load_tomorrow=TrainingLoadTomorrow.MEDIUM,
+    )
+
+    assert scenarios == [
+        (MealName.LUNCH, CarbMode.NORMAL, TrainingLoadTomorrow.LOW),
+        (MealName.LUNCH, CarbMode.NORMAL, TrainingLoadTomorrow.HIGH),
+        (MealName.DINNER, CarbMode.NORMAL, TrainingLoadTomorrow.LOW),
+        (MealName.DINNER, CarbMode.NORMAL, TrainingLoadTomorrow.HIGH),
+    ]
+
+
+def test_comparison_matrix_summarizes_each_scenario(
+    meal_plan_request_payload: dict[str, object],
+) -> None:
+    request = MealPlanRequest.model_validate(meal_plan_request_payload)
+    comparison = MealPlanCalculationService().compare_scenarios(
+        request, ScenarioAxes(carb_modes=(CarbMode.LOW, CarbMode.PERIODIZED))
+    )
+
+    rows = comparison.matrix()
+
+    assert [result.label for result in comparison.results] == [
+        "training_before=lunch carbs=low training_tomorrow=high",
+        "training_before=lunch carbs=periodized training_tomorrow=high",
+    ]
+    assert all(len(row) == len(SCENARIO_MATRIX_COLUMNS) for row in rows)
+    low, periodized = (dict(zip(SCENARIO_MATRIX_COLUMNS, row, strict=True)) for row in rows)
+    response = comparison.results[1].response
+    assert periodized["training_before_meal"] == "lunch"
+    assert periodized["carb_mode"] == "periodized"
+    assert periodized["total_kcal"] == response.total_kcal
+    assert periodized["high_carb_meals"] == ["lunch", "afternoon-snack", "dinner"]
+    assert periodized["training"] == next(
+        meal.carbs_g for meal in response.meals if meal.meal == "training"
+    )
+    assert low["high_carb_meals"] == []
+    assert sum(float(low[str(meal)]) for meal in CANONICAL_MEAL_ORDER) + float(
+        low["training"]
+    ) == pytest.approx(float(low["carbs_g"]))
@@ -0,0 +1,91 @@
+"""Unit tests for pipeline stage timers."""
+
+from __future__ import annotations
+
+import pytest
+
+from mealplan.application.contracts import MealPlanRequest
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.application.stage_timer import DISABLED_STAGE_TIMER, STAGE_ORDER, StageTimer
+
+
+def test_stage_records_one_sample_per_use() -> None:
+    timer = StageTimer()
+
+    for _ in range(3):
+        with timer.stage("energy"):
+            pass
+
+    assert len(timer.samples()["energy"]) == 3
+    assert all(sample >= 0 for sample in timer.samples()["energy"])
+
+
+def test_stage_records_duration_when_body_raises() -> None:
+    timer = StageTimer()
+
+    with pytest.raises(RuntimeError), timer.stage("validate"):
+        raise RuntimeError("boom")
+
+    assert len(timer.samples()["validate"]) == 1
+
+
+def test_summaries_use_pipeline_order_and_nearest_rank_percentiles() -> None:
+    timer = StageTimer()
+    timer.merge({"custom": [5], "render": [4, 1, 3, 2], "parse": list(range(1, 101))})
+
+    summaries = timer.summaries()
+
+    assert [summary.stage for summary in summaries] == ["parse", "render", "custom"]
+    parse = summaries[0]
+    assert (parse.count, parse.min_ns, parse.p50_ns, parse.p99_ns) == (100, 1, 50, 99)
+    assert parse.total_ns == 5050
+    render = summaries[1]
+    assert (render.min_ns, render.p50_ns, render.p99_ns) == (1, 2, 4)
+
+
+def test_drain_returns_samples_and_keeps_spans_usable() -> None:
+    timer = StageTimer()
+    with timer.stage("macro"):
+        pass
+
+    drained = timer.drain()
+    with timer.stage("macro"):
+        pass
+
+    assert len(drained["macro"]) == 1
+    assert len(timer.samples()["macro"]) == 1
+
+
+def test_disabled_timer_records_nothing() -> None:
+    with DISABLED_STAGE_TIMER.stage("energy"):
+        pass
+
+    assert not DISABLED_STAGE_TIMER.enabled
+    assert DISABLED_STAGE_TIMER.samples() == {}
+    assert DISABLED_STAGE_TIMER.summaries() == []
+
+
+def test_service_times_validation_and_calculation_stages(
+    meal_plan_request_payload: dict[str, object],
+) -> None:
+    service = MealPlanCalculationService()
+    service.stage_timer = StageTimer()
+
+    service.calculate(meal_plan_request_payload)
+
+    timed = [summary.stage for summary in service.stage_timer.summaries()]
+    assert timed == [
+        stage for stage in STAGE_ORDER if stage not in {"parse", "carb_strategy", "render"}
+    ]
+
+
+def test_stage_graph_times_carb_strategy_in_stage_order(
+    meal_plan_request_payload: dict[str, object],
+) -> None:
+    service = MealPlanCalculationService()
+    service.stage_timer = StageTimer()
+
+    service.calculate_incremental(MealPlanRequest.model_validate(meal_plan_request_payload))
+
+    timed = [summary.stage for summary in service.stage_timer.summaries()]
+    assert timed == [stage for stage in STAGE_ORDER if stage not in {"parse", "render"}]
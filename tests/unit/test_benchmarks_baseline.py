@@ -0,0 +1,123 @@
+"""Unit tests for benchmark baselines and regression comparison."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mealplan.application.stage_timer import STAGE_ORDER
+from mealplan.benchmarks.baseline import (
+    Metric,
+    collect_metrics,
+    compare_metrics,
+    load_baseline,
+    save_baseline,
+)
+from mealplan.shared.errors import ConfigError
+
+
+def _metric(name: str, *trials: float) -> Metric:
+    return Metric(name=name, unit="us", trials=trials)
+
+
+def test_metric_median_and_noise() -> None:
+    metric = _metric("stage.energy", 10.0, 12.0, 11.0)
+
+    assert metric.median == 11.0
+    assert metric.noise == pytest.approx(2.0 / 11.0)
+
+
+def test_compare_flags_regressions_beyond_threshold_only() -> None:
+    baseline = {
+        "stage.energy": _metric("stage.energy", 10.0, 10.0, 10.0),
+        "stage.macro": _metric("stage.macro", 10.0, 10.0, 10.0),
+        "stage.assembly": _metric("stage.assembly", 100.0, 100.0, 100.0),
+    }
+    current = {
+        "stage.energy": _metric("stage.energy", 11.5, 11.5, 11.5),
+        "stage.macro": _metric("stage.macro", 10.5, 10.5, 10.5),
+        "stage.assembly": _metric("stage.assembly", 80.0, 80.0, 80.0),
+    }
+
+    statuses = {
+        comparison.name: comparison.status
+        for comparison in compare_metrics(baseline, current, threshold=0.10)
+    }
+
+    assert statuses == {
+        "stage.energy": "regression",
+        "stage.macro": "ok",
+        "stage.assembly": "improvement",
+    }
+
+
+def test_compare_widens_allowed_change_to_trial_noise() -> None:
+    baseline = {"render.json[x]": _metric("render.json[x]", 8.0, 10.0, 12.0)}
+    current = {"render.json[x]": _metric("render.json[x]", 11.5, 11.5, 11.5)}
+
+    (comparison,) = compare_metrics(baseline, current, threshold=0.10)
+
+    assert comparison.allowed == pytest.approx(0.4)
+    assert comparison.status == "ok"
+
+
+def test_compare_reports_unpaired_metrics_without_failing() -> None:
+    comparisons = compare_metrics(
+        {"stage.energy": _metric("stage.energy", 1.0)},
+        {"stage.macro": _metric("stage.macro", 1.0)},
+    )
+
+    assert [(c.name, c.status) for c in comparisons] == [
+        ("stage.energy", "missing"),
+        ("stage.macro", "new"),
+    ]
+
+
+def test_baseline_round_trips_through_json(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    metrics = {"startup.help": Metric(name="startup.help", unit="ms", trials=(180.0, 182.5))}
+
+    save_baseline(str(path), metrics)
+    environment, loaded = load_baseline(str(path))
+
+    assert loaded == metrics
+    assert environment["python"]
+    assert json.loads(path.read_text())["metrics"]["startup.help"]["median"] == 181.25
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("not json", "baseline"),
+        ('{"format": 99, "environment": {}, "metrics": {}}', "format 99 is not supported"),
+        ('{"format": 1, "environment": {}, "metrics": {"a": {"unit": "us"}}}', "malformed"),
+        (
+            '{"format": 1, "environment": {}, "metrics": {"a": {"unit": "us", "trials": []}}}',
+            "malformed",
+        ),
+    ],
+)
+def test_load_baseline_rejects_bad_documents(tmp_path: Path, content: str, message: str) -> None:
+    path = tmp_path / "baseline.json"
+    path.write_text(content)
+
+    with pytest.raises(ConfigError, match=message):
+        load_baseline(str(path))
+
+
+def test_collect_metrics_stage_suite_reports_each_service_stage() -> None:
+    metrics = collect_metrics(["stage"], trials=2)
+
+    assert list(metrics) == [
+        f"stage.{stage}"
+        for stage in STAGE_ORDER
+        if stage not in {"parse", "carb_strategy", "render"}
+    ]
+    assert all(len(metric.trials) == 2 and metric.median > 0 for metric in metrics.values())
+
+
+def test_collect_metrics_rejects_unknown_suite() -> None:
+    with pytest.raises(ValueError, match="unknown benchmark suite nope"):
+        collect_metrics(["nope"])
@@ -0,0 +1,54 @@
+"""Unit tests for the benchmark timing harness and microbenchmark cases."""
+
+from __future__ import annotations
+
+from mealplan.benchmarks.harness import (
+    MIN_SAMPLES,
+    BenchmarkCase,
+    format_results,
+    run_case,
+)
+from mealplan.benchmarks.micro import BENCHMARK_REQUESTS, microbenchmark_cases
+
+
+def test_run_case_counts_calls_and_orders_percentiles() -> None:
+    calls: list[None] = []
+
+    result = run_case(BenchmarkCase("append", lambda: calls.append(None)), min_time_s=0.0)
+
+    assert result.name == "append"
+    # Warm-up and calibration calls are not counted in the measured total.
+    assert MIN_SAMPLES <= result.calls < len(calls)
+    assert 0 < result.min_us <= result.p50_us <= result.p99_us
+    assert result.ops_per_sec > 0
+
+
+def test_format_results_renders_one_row_per_case() -> None:
+    result = run_case(BenchmarkCase("noop", lambda: None), min_time_s=0.0)
+
+    table = format_results([result]).splitlines()
+
+    assert table[0] == "| benchmark | ops/s | min_us | p50_us | p99_us |"
+    assert table[2].startswith("| noop | ")
+
+
+def test_microbenchmark_cases_cover_every_request_and_group() -> None:
+    cases = microbenchmark_cases()
+    names = {case.name for case in cases}
+
+    assert len(names) == len(cases)
+    for request_name in BENCHMARK_REQUESTS:
+        assert f"service.calculate[{request_name}]" in names
+        assert f"domain.meal_split[{request_name}]" in names
+        assert f"render.table[{request_name}]" in names
+    for case in cases:
+        case.func()
+
+
+def test_protein_reduction_request_exercises_warning_path() -> None:
+    from mealplan.application.orchestration import MealPlanCalculationService
+
+    service = MealPlanCalculationService()
+    service.calculate(BENCHMARK_REQUESTS["protein_reduction"])
+
+    assert service.warnings
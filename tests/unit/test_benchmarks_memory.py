@@ -0,0 +1,78 @@
+"""Unit tests for the tracemalloc allocation and batch peak-RSS benchmarks."""
+
+from __future__ import annotations
+
+import pytest
+
+from mealplan.benchmarks.harness import BenchmarkCase
+from mealplan.benchmarks.memory import (
+    AllocationResult,
+    BatchMemoryResult,
+    allocation_cases,
+    format_allocation_results,
+    format_batch_memory_results,
+    measure_allocations,
+    measure_batch_peak_rss,
+)
+
+
+def test_measure_allocations_reports_retained_result_size() -> None:
+    result = measure_allocations(BenchmarkCase("bytes", lambda: bytes(10_000)), calls=10)
+
+    assert result.name == "bytes"
+    assert 10_000 <= result.retained_bytes < 11_000
+    assert result.retained_blocks == pytest.approx(1.0, abs=0.5)
+    assert result.peak_bytes >= 10_000
+
+
+def test_measure_allocations_separates_transient_peak_from_retained_bytes() -> None:
+    def discard_buffer() -> int:
+        return len(bytearray(50_000))
+
+    result = measure_allocations(BenchmarkCase("discard", discard_buffer), calls=10)
+
+    assert result.peak_bytes >= 50_000
+    assert result.retained_bytes < 1_000
+
+
+def test_measure_allocations_rejects_non_positive_calls() -> None:
+    with pytest.raises(ValueError, match="calls must be greater than or equal to 1"):
+        measure_allocations(BenchmarkCase("noop", lambda: None), calls=0)
+
+
+def test_allocation_cases_cover_stages_assembly_parts_and_formats() -> None:
+    cases = allocation_cases("protein_reduction")
+    names = [case.name for case in cases]
+
+    assert names[:8] == [
+        "stage.parse",
+        "stage.validate",
+        "stage.energy",
+        "stage.macro",
+        "stage.fueling",
+        "stage.training_demand",
+        "stage.carb_strategy",
+        "stage.assembly",
+    ]
+    assert {"assembly.meal_split", "assembly.model_dump", "render.json", "render.table"} <= set(
+        names
+    )
+    for case in cases:
+        case.func()
+
+
+def test_measure_batch_peak_rss_streams_requests_through_batch() -> None:
+    result = measure_batch_peak_rss(12)
+
+    assert result.requests == 12
+    assert result.peak_rss_bytes > 1 << 20
+
+
+def test_formatters_render_one_row_per_result() -> None:
+    allocations = format_allocation_results(
+        [AllocationResult("stage.energy", 144, 28, 1.25)]
+    ).splitlines()
+    batches = format_batch_memory_results([BatchMemoryResult(10_000, 36 * 2**20)]).splitlines()
+
+    assert allocations[2] == "| stage.energy | 144 | 28 | 1.2 |"
+    assert batches[2] == "| 10,000 | 36.0 |"
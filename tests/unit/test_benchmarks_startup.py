@@ -0,0 +1,63 @@
+"""Unit tests for the cold-start benchmark helpers."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from mealplan.benchmarks.startup import (
+    ImportCost,
+    format_import_costs,
+    measure_startup,
+    parse_import_times,
+    startup_command,
+)
+
+IMPORT_TIME_LINES = [
+    "import time: self [us] | cumulative | imported package",
+    "import time:       100 |        100 |     pydantic_core._pydantic_core",
+    "import time:       200 |        300 |   pydantic_core",
+    "import time:       400 |        400 |     pydantic.fields",
+    "import time:       500 |       1200 |   pydantic.main",
+    "import time:       700 |       1900 | mealplan.application.contracts",
+    "import time:        50 |         50 | pydantic.networks",
+    "unrelated stderr line",
+]
+
+
+def test_parse_import_times_groups_third_party_and_keeps_mealplan_modules() -> None:
+    costs = parse_import_times(IMPORT_TIME_LINES)
+
+    assert costs["mealplan.application.contracts"] == (0.7, 1.9)
+    # pydantic.fields is nested in pydantic.main, so only outermost imports add cumulative time.
+    assert costs["pydantic"] == pytest.approx((0.95, 1.25))
+    assert costs["pydantic_core"] == pytest.approx((0.3, 0.3))
+    assert set(costs) == {"mealplan.application.contracts", "pydantic", "pydantic_core"}
+
+
+def test_format_import_costs_ranks_rows() -> None:
+    table = format_import_costs(
+        [ImportCost("pydantic", 1.0, 2.0), ImportCost("typer", 0.5, 0.75)]
+    ).splitlines()
+
+    assert table[2] == "| 1 | pydantic | 1.00 | 2.00 |"
+    assert table[3] == "| 2 | typer | 0.50 | 0.75 |"
+
+
+def test_startup_command_runs_package_module() -> None:
+    assert startup_command(["probe"], import_time=True) == [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-m",
+        "mealplan",
+        "probe",
+    ]
+
+
+def test_measure_startup_reports_ordered_distribution() -> None:
+    result = measure_startup("probe", ["probe"], runs=2)
+
+    assert result.runs == 2
+    assert 0 < result.min_ms <= result.p50_ms <= result.p90_ms <= result.max_ms
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import inspect
 from collections.abc import Mapping
-from typing import cast
+from typing import Any, cast
 
 import pytest
 
@@ -28,6 +28,7 @@ from mealplan.domain.services import (
     MEAL_ASSEMBLY_RECONCILIATION_TOLERANCE,
     _assemble_meal_split_response_payload,
     _validate_carb_reconciliation,
+    calculate_carb_strategy_by_meal,
     calculate_macro_targets,
     calculate_meal_split_and_response_payload,
     calculate_meal_split_and_response_payload_with_warnings,
@@ -935,6 +936,35 @@ def test_meal_split_reduces_protein_when_meal_budget_cannot_fit_assigned_protein
     assert assembly_result["warnings"] == expected_warnings
 
 
+@pytest.mark.parametrize("training_load_tomorrow", list(TrainingLoadTomorrow))
+def test_meal_split_with_precomputed_carb_strategy_matches_inline_strategy(
+    training_load_tomorrow: TrainingLoadTomorrow,
+) -> None:
+    arguments: dict[str, Any] = {
+        "tdee_kcal": 2600.0,
+        "training_carbs_g": 45.0,
+        "training_calorie_demand_kcal": 420.0,
+        "carb_mode": CarbMode.PERIODIZED,
+        "training_before_meal": MealName.AFTERNOON_SNACK,
+        "training_load_tomorrow": training_load_tomorrow,
+        "protein_g": 130.0,
+        "carbs_g": 320.0,
+        "fat_g": 75.0,
+    }
+    strategy = calculate_carb_strategy_by_meal(
+        carb_mode=CarbMode.PERIODIZED,
+        training_before_meal=MealName.AFTERNOON_SNACK,
+        training_load_tomorrow=training_load_tomorrow,
+    )
+
+    reused = calculate_meal_split_and_response_payload_with_warnings(
+        **arguments, carbs_strategy_by_meal=strategy
+    )
+
+    assert list(strategy) == list(CANONICAL_MEAL_ORDER)
+    assert reused == calculate_meal_split_and_response_payload_with_warnings(**arguments)
+
+
 def test_calculate_periodized_carb_allocation_marks_two_post_training_meals_high() -> None:
     allocation = calculate_periodized_carb_allocation(
         carb_mode=CarbMode.PERIODIZED,
@@ -0,0 +1,211 @@
+"""Parity tests for the vectorized struct-of-arrays meal plan engine."""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse  # noqa: E402
+from mealplan.application.orchestration import MealPlanCalculationService  # noqa: E402
+from mealplan.domain.enums import (  # noqa: E402
+    ActivityLevel,
+    CarbMode,
+    Gender,
+    MealName,
+    TrainingLoadTomorrow,
+)
+from mealplan.domain.model import CANONICAL_MEAL_ORDER  # noqa: E402
+from mealplan.domain.vectorized import (  # noqa: E402
+    ACTIVITY_LEVEL_CODES,
+    CARB_MODE_CODES,
+    GENDER_CODES,
+    NO_TRAINING_BEFORE_MEAL,
+    TRAINING_LOAD_TOMORROW_CODES,
+    ProfileColumns,
+    _round2,
+    calculate_many,
+    rejected_rows,
+)
+from mealplan.shared.errors import DomainRuleError, ValidationError  # noqa: E402
+
+
+def _columns_from_requests(requests: list[MealPlanRequest]) -> ProfileColumns:
+    zones: list[list[int]] = []
+    before_meal: list[int] = []
+    for request in requests:
+        session = request.training_session
+        raw_zones: dict[str, int] = dict(session.zones_minutes) if session is not None else {}
+        zones.append([raw_zones.get(str(zone), 0) for zone in range(1, 6)])
+        if session is None or session.training_before_meal is None:
+            before_meal.append(NO_TRAINING_BEFORE_MEAL)
+        else:
+            before_meal.append(CANONICAL_MEAL_ORDER.index(MealName(session.training_before_meal)))
+    return ProfileColumns.from_arrays(
+        age=[request.age for request in requests],
+        gender=[GENDER_CODES.index(request.gender) for request in requests],
+        height_cm=[request.height_cm for request in requests],
+        weight_kg=[request.weight_kg for request in requests],
+        activity_level=[ACTIVITY_LEVEL_CODES.index(request.activity_level) for request in requests],
+        carb_mode=[CARB_MODE_CODES.index(request.carb_mode) for request in requests],
+        training_load_tomorrow=[
+            TRAINING_LOAD_TOMORROW_CODES.index(request.training_load_tomorrow)
+            for request in requests
+        ],
+        zones_minutes=zones,
+        training_before_meal=before_meal,
+        vo2max=[np.nan if request.vo2max is None else request.vo2max for request in requests],
+    )
+
+
+def _request(**overrides: Any) -> MealPlanRequest:
+    payload: dict[str, Any] = {
+        "age": 40,
+        "gender": "male",
+        "height_cm": 180,
+        "weight_kg": 75.0,
+        "activity_level": "medium",
+        "carb_mode": "periodized",
+        "training_load_tomorrow": "high",
+    }
+    payload.update(overrides)
+    return MealPlanRequest.model_validate(payload)
+
+
+def _parity_requests() -> list[MealPlanRequest]:
+    requests = [
+        _request(
+            carb_mode=carb_mode.value,
+            training_load_tomorrow=tomorrow.value,
+            training_session={
+                "zones_minutes": {"1": 20, "2": 40},
+                "training_before_meal": meal.value,
+            },
+        )
+        for carb_mode, tomorrow, meal in itertools.product(
+            CarbMode, TrainingLoadTomorrow, CANONICAL_MEAL_ORDER
+        )
+    ]
+    requests.extend(
+        _request(gender=gender.value, activity_level=activity.value, carb_mode="low", vo2max=58)
+        for gender, activity in itertools.product(Gender, ActivityLevel)
+    )
+    requests.append(
+        _request(training_session={"zones_minutes": {"1": 45}, "training_before_meal": "dinner"})
+    )
+    return requests
+
+
+def test_calculate_many_matches_scalar_service_row_for_row() -> None:
+    requests = _parity_requests()
+    service = MealPlanCalculationService()
+
+    result = calculate_many(_columns_from_requests(requests))
+
+    assert result.row_count == len(requests)
+    for row, request in enumerate(requests):
+        expected = service.calculate(request)
+        actual = MealPlanResponse.model_validate(result.payload_at(row))
+        assert actual.model_dump_json() == expected.model_dump_json()
+        assert result.warnings.get(row, ()) == service.warnings
+
+
+def test_calculate_many_matches_scalar_protein_reduction_warnings() -> None:
+    request = _request(
+        age=70,
+        gender="female",
+        height_cm=150,
+        weight_kg=45.0,
+        activity_level="low",
+        carb_mode="low",
+        vo2max=12,
+        training_session={"zones_minutes": {"2": 240}, "training_before_meal": "lunch"},
+    )
+    service = MealPlanCalculationService()
+    expected = service.calculate(request)
+
+    result = calculate_many(_columns_from_requests([request]))
+
+    assert service.warnings
+    assert result.warnings == {0: service.warnings}
+    assert MealPlanResponse.model_validate(result.payload_at(0)) == expected
+
+
+def test_calculate_many_reports_first_failing_row_with_scalar_error_class() -> None:
+    requests = [_request(), _request(weight_kg=400.0, activity_level="low"), _request()]
+    columns = _columns_from_requests(requests)
+    failing_ages = columns.age.copy()
+    failing_ages[2] = 0
+    columns = ProfileColumns.from_arrays(
+        age=failing_ages,
+        gender=columns.gender,
+        height_cm=columns.height_cm,
+        weight_kg=columns.weight_kg,
+        activity_level=columns.activity_level,
+        carb_mode=columns.carb_mode,
+        training_load_tomorrow=columns.training_load_tomorrow,
+    )
+
+    with pytest.raises(DomainRuleError, match=r"^row 1: macro_targets\.fat_g: "):
+        calculate_many(columns)
+
+
+def test_rejected_rows_marks_every_row_calculate_many_would_reject() -> None:
+    requests = [_request(), _request(weight_kg=400.0, activity_level="low"), _request()]
+    columns = _columns_from_requests(requests)
+    failing_ages = columns.age.copy()
+    failing_ages[2] = 0
+    columns = ProfileColumns.from_arrays(
+        age=failing_ages,
+        gender=columns.gender,
+        height_cm=columns.height_cm,
+        weight_kg=columns.weight_kg,
+        activity_level=columns.activity_level,
+        carb_mode=columns.carb_mode,
+        training_load_tomorrow=columns.training_load_tomorrow,
+    )
+
+    assert rejected_rows(columns).tolist() == [False, True, True]
+
+
+def test_calculate_many_requires_training_before_meal_for_positive_zones() -> None:
+    columns = ProfileColumns.from_arrays(
+        age=[40],
+        gender=[0],
+        height_cm=[180],
+        weight_kg=[75.0],
+        activity_level=[1],
+        carb_mode=[2],
+        training_load_tomorrow=[2],
+        zones_minutes=[[0, 30, 0, 0, 0]],
+    )
+
+    with pytest.raises(
+        ValidationError,
+        match=r"^row 0: training_session\.training_before_meal: required",
+    ):
+        calculate_many(columns)
+
+
+def test_profile_columns_reject_misaligned_shapes() -> None:
+    with pytest.raises(ValidationError, match=r"^gender: expected shape \(2,\)"):
+        ProfileColumns.from_arrays(
+            age=[40, 41],
+            gender=[0],
+            height_cm=[180, 180],
+            weight_kg=[75.0, 75.0],
+            activity_level=[1, 1],
+            carb_mode=[0, 0],
+            training_load_tomorrow=[0, 0],
+        )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [0.125, 0.375, 1.005, 2.675, 1.115, 1234.565, -0.125, 2292.8125, 1e-9, 0.0],
+)
+def test_round2_matches_python_round(value: float) -> None:
+    assert _round2(np.asarray([value]))[0] == round(value, 2)
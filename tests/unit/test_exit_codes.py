@@ -1,5 +1,7 @@
 """Unit tests for shared exception-to-exit-code mapping."""
 
+from http import HTTPStatus
+
 from mealplan.shared.errors import (
     ConfigError,
     DomainRuleError,
@@ -7,7 +9,11 @@ from mealplan.shared.errors import (
     OutputError,
     ValidationError,
 )
-from mealplan.shared.exit_codes import ExitCode, map_exception_to_exit_code
+from mealplan.shared.exit_codes import (
+    ExitCode,
+    map_exception_to_exit_code,
+    map_exception_to_http_status,
+)
 
 
 def test_map_validation_error_to_validation_exit_code() -> None:
@@ -32,3 +38,9 @@ def test_map_base_mealplan_error_to_runtime_exit_code() -> None:
 
 def test_map_unhandled_error_to_runtime_exit_code() -> None:
     assert map_exception_to_exit_code(RuntimeError("boom")) is ExitCode.RUNTIME
+
+
+def test_map_exceptions_to_http_status_like_exit_codes() -> None:
+    assert map_exception_to_http_status(ValidationError("bad")) is HTTPStatus.BAD_REQUEST
+    assert map_exception_to_http_status(DomainRuleError("rule")) is HTTPStatus.UNPROCESSABLE_ENTITY
+    assert map_exception_to_http_status(RuntimeError("boom")) is HTTPStatus.INTERNAL_SERVER_ERROR
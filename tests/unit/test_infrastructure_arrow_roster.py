@@ -0,0 +1,193 @@
+"""Tests for the Arrow/Parquet roster adapters."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from mealplan.application.columnar import (  # noqa: E402
+    iter_calculated_chunks,
+    iter_chunk_records,
+)
+from mealplan.application.contracts import MealPlanRequest  # noqa: E402
+from mealplan.application.orchestration import MealPlanCalculationService  # noqa: E402
+from mealplan.infrastructure.arrow_roster import (  # noqa: E402
+    MEALS_FILE_NAME,
+    PLANS_FILE_NAME,
+    ROSTER_SCHEMA,
+    ParquetPlanWriter,
+    ParquetRosterWriter,
+    iter_parquet_profile_columns,
+    profile_columns_from_arrow,
+)
+from mealplan.shared.errors import ValidationError  # noqa: E402
+
+ROSTER_ROWS: list[dict[str, Any]] = [
+    {
+        "age": 35,
+        "gender": "male",
+        "height_cm": 178,
+        "weight_kg": 72.5,
+        "activity_level": "medium",
+        "carb_mode": carb_mode,
+        "training_load_tomorrow": "high",
+        "zone1": 20,
+        "zone2": 40,
+        "training_before_meal": meal,
+        "vo2max": None,
+    }
+    for carb_mode in ("low", "normal", "periodized")
+    for meal in ("breakfast", "lunch", "dinner")
+] + [
+    {
+        "age": 40,
+        "gender": "male",
+        "height_cm": 180,
+        "weight_kg": 75.0,
+        "activity_level": "medium",
+        "carb_mode": "low",
+        "training_load_tomorrow": "low",
+        "zone1": None,
+        "zone2": None,
+        "training_before_meal": None,
+        "vo2max": 58.0,
+    }
+]
+
+
+def _request_from_row(row: dict[str, Any]) -> MealPlanRequest:
+    payload = {key: row[key] for key in list(row)[:7]}
+    if row["vo2max"] is not None:
+        payload["vo2max"] = int(row["vo2max"])
+    zones = {"1": row["zone1"] or 0, "2": row["zone2"] or 0}
+    if row["training_before_meal"] is not None:
+        payload["training_session"] = {
+            "zones_minutes": zones,
+            "training_before_meal": row["training_before_meal"],
+        }
+    return MealPlanRequest.model_validate(payload)
+
+
+def _write_roster(path: Path, rows: list[dict[str, Any]]) -> None:
+    pq.write_table(pa.Table.from_pylist(rows), path)
+
+
+def test_parquet_roster_round_trips_to_scalar_identical_ndjson(tmp_path: Path) -> None:
+    roster_path = tmp_path / "roster.parquet"
+    _write_roster(roster_path, ROSTER_ROWS)
+    service = MealPlanCalculationService()
+
+    chunks = iter_calculated_chunks(iter_parquet_profile_columns(roster_path, batch_rows=4))
+    records = [record for chunk in chunks for record in iter_chunk_records(chunk)]
+
+    assert [record.row for record in records] == list(range(len(ROSTER_ROWS)))
+    for record, row in zip(records, ROSTER_ROWS, strict=True):
+        expected = service.calculate(_request_from_row(row))
+        assert record.response_json == expected.model_dump_json()
+
+
+def test_parquet_plan_writer_emits_plans_and_meals_tables(tmp_path: Path) -> None:
+    roster_path = tmp_path / "roster.parquet"
+    _write_roster(roster_path, ROSTER_ROWS)
+    output_dir = tmp_path / "plans"
+
+    with ParquetPlanWriter(output_dir) as writer:
+        for chunk in iter_calculated_chunks(
+            iter_parquet_profile_columns(roster_path, batch_rows=4)
+        ):
+            writer.write(chunk.result, first_row=chunk.first_row)
+
+    plans = pq.read_table(output_dir / PLANS_FILE_NAME).to_pylist()
+    meals = pq.read_table(output_dir / MEALS_FILE_NAME).to_pylist()
+    service = MealPlanCalculationService()
+    for row_id, row in enumerate(ROSTER_ROWS):
+        expected = json.loads(service.calculate(_request_from_row(row)).model_dump_json())
+        expected_meals = expected.pop("meals")
+        assert plans[row_id] == {"row_id": row_id, **expected}
+        assert [
+            {key: value for key, value in meal.items() if key != "row_id"}
+            for meal in meals
+            if meal["row_id"] == row_id
+        ] == expected_meals
+
+
+def test_profile_columns_reject_unknown_enum_value_with_row() -> None:
+    rows = [dict(ROSTER_ROWS[0]), {**ROSTER_ROWS[0], "carb_mode": "keto"}]
+
+    with pytest.raises(ValidationError, match=r"^row 11: carb_mode: invalid value 'keto'"):
+        profile_columns_from_arrow(pa.Table.from_pylist(rows), first_row=10)
+
+
+def test_profile_columns_reject_null_required_value() -> None:
+    rows = [{**ROSTER_ROWS[0], "age": None}]
+
+    with pytest.raises(ValidationError, match=r"^row 0: age: required$"):
+        profile_columns_from_arrow(pa.Table.from_pylist(rows))
+
+
+def test_profile_columns_reject_non_integral_vo2max() -> None:
+    batch = pa.RecordBatch.from_pylist(
+        [{**ROSTER_ROWS[0], "vo2max": vo2max} for vo2max in (45.0, None, float("nan"))]
+    )
+    assert np.array_equal(
+        profile_columns_from_arrow(batch).vo2max, [45.0, np.nan, np.nan], equal_nan=True
+    )
+
+    rows = [{**ROSTER_ROWS[0], "vo2max": 45.0}, {**ROSTER_ROWS[0], "vo2max": 45.7}]
+    with pytest.raises(ValidationError, match=r"^vo2max: expected int64 values: .*45\.7"):
+        profile_columns_from_arrow(pa.Table.from_pylist(rows))
+
+
+def test_profile_columns_accept_dictionary_encoded_enums_and_missing_optional_columns() -> None:
+    table = pa.table(
+        {
+            "age": [40],
+            "gender": pa.array(["female"]).dictionary_encode(),
+            "height_cm": [165],
+            "weight_kg": [60.0],
+            "activity_level": ["high"],
+            "carb_mode": ["normal"],
+            "training_load_tomorrow": ["medium"],
+        }
+    )
+
+    columns = profile_columns_from_arrow(table)
+
+    assert columns.gender.tolist() == [1]
+    assert columns.zones_minutes.tolist() == [[0, 0, 0, 0, 0]]
+    assert columns.training_before_meal.tolist() == [-1]
+
+
+def test_parquet_roster_requires_roster_columns(tmp_path: Path) -> None:
+    roster_path = tmp_path / "roster.parquet"
+    pq.write_table(pa.table({"age": [40]}), roster_path)
+
+    with pytest.raises(ValidationError, match=r"^roster: missing required columns: gender, "):
+        next(iter_parquet_profile_columns(roster_path, batch_rows=8))
+
+
+def test_parquet_roster_writer_round_trips_profile_columns(tmp_path: Path) -> None:
+    roster_path = tmp_path / "roster.parquet"
+    _write_roster(roster_path, ROSTER_ROWS)
+    columns = list(iter_parquet_profile_columns(roster_path, batch_rows=4))
+    written_path = tmp_path / "written.parquet"
+
+    with ParquetRosterWriter(written_path) as writer:
+        for chunk in columns:
+            writer.write(chunk)
+    round_tripped = list(iter_parquet_profile_columns(written_path, batch_rows=4))
+
+    assert pq.read_schema(written_path).equals(ROSTER_SCHEMA)
+    assert pq.read_table(written_path).column("vo2max").to_pylist()[-2:] == [None, 58]
+    assert len(round_tripped) == len(columns)
+    for expected, actual in zip(columns, round_tripped, strict=True):
+        for name in ("age", "gender", "carb_mode", "zones_minutes", "training_before_meal"):
+            assert np.array_equal(getattr(actual, name), getattr(expected, name))
+        assert np.array_equal(actual.vo2max, expected.vo2max, equal_nan=True)
@@ -0,0 +1,167 @@
+"""Tests for the memory-mapped fixed-width binary roster."""
+
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mealplan.application.columnar import (  # noqa: E402
+    iter_calculated_chunks,
+    iter_chunk_records,
+)
+from mealplan.application.contracts import MealPlanRequest  # noqa: E402
+from mealplan.application.orchestration import MealPlanCalculationService  # noqa: E402
+from mealplan.domain.vectorized import ProfileColumns  # noqa: E402
+from mealplan.infrastructure.binary_roster import (  # noqa: E402
+    HEADER_SIZE,
+    RECORD_DTYPE,
+    RECORD_SIZE,
+    BinaryRoster,
+    BinaryRosterWriter,
+    index_path_for,
+)
+from mealplan.shared.errors import ValidationError  # noqa: E402
+
+
+def _columns(carb_modes: list[int]) -> ProfileColumns:
+    row_count = len(carb_modes)
+    return ProfileColumns.from_arrays(
+        age=[35] * row_count,
+        gender=[0] * row_count,
+        height_cm=[178] * row_count,
+        weight_kg=[72.5] * row_count,
+        activity_level=[1] * row_count,
+        carb_mode=carb_modes,
+        training_load_tomorrow=[2] * row_count,
+        zones_minutes=[[20, 40, 0, 0, 0]] * row_count,
+        training_before_meal=[2] * row_count,
+        vo2max=[np.nan] * row_count,
+    )
+
+
+@pytest.fixture
+def roster_path(tmp_path: Path) -> Path:
+    path = tmp_path / "roster.mpr"
+    with BinaryRosterWriter(path) as writer:
+        writer.write(_columns([0, 1, 2]), ["carol", "alice", "bob"])
+        writer.write(_columns([2, 0]), ["dave", "erin"])
+    return path
+
+
+def test_records_are_page_aligned_and_fixed_width(roster_path: Path) -> None:
+    assert RECORD_SIZE == 32
+    assert mmap.PAGESIZE % RECORD_SIZE == 0
+    assert HEADER_SIZE % RECORD_SIZE == 0
+    assert roster_path.stat().st_size == HEADER_SIZE + 5 * RECORD_SIZE
+    assert index_path_for(roster_path).exists()
+
+
+def test_offset_index_finds_each_athlete_record(roster_path: Path) -> None:
+    with BinaryRoster(roster_path) as roster:
+        assert len(roster) == 5
+        assert roster.offset_of("carol") == HEADER_SIZE
+        assert roster.offset_of("erin") == HEADER_SIZE + 4 * RECORD_SIZE
+        assert roster.request_payload("alice")["carb_mode"] == "normal"
+        with pytest.raises(ValidationError, match=r"^athlete_id: unknown athlete 'zed'$"):
+            roster.offset_of("zed")
+        with pytest.raises(ValidationError, match=r"unknown athlete"):
+            roster.offset_of("a-much-longer-id-than-any-stored")
+
+
+def test_request_payload_matches_scalar_request(roster_path: Path) -> None:
+    with BinaryRoster(roster_path) as roster:
+        request = MealPlanRequest.model_validate(roster.request_payload("bob"))
+
+    assert request == MealPlanRequest.model_validate(
+        {
+            "age": 35,
+            "gender": "male",
+            "height_cm": 178,
+            "weight_kg": 72.5,
+            "activity_level": "medium",
+            "carb_mode": "periodized",
+            "training_load_tomorrow": "high",
+            "training_session": {
+                "zones_minutes": {"1": 20, "2": 40},
+                "training_before_meal": "lunch",
+            },
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    ("field", "code"),
+    [("carb_mode", -1), ("gender", 7), ("training_before_meal", -2)],
+)
+def test_request_payload_rejects_codes_outside_code_tables(
+    roster_path: Path,
+    field: str,
+    code: int,
+) -> None:
+    with roster_path.open("r+b") as stream:
+        stream.seek(HEADER_SIZE + RECORD_DTYPE.fields[field][1])
+        stream.write(np.int8(code).tobytes())
+
+    message = rf"^athlete 'carol': {field}: invalid code {code}; expected 0 to "
+    with BinaryRoster(roster_path) as roster, pytest.raises(ValidationError, match=message):
+        roster.request_payload("carol")
+
+
+def test_batch_chunks_are_views_over_the_mapped_file(roster_path: Path) -> None:
+    service = MealPlanCalculationService()
+    with BinaryRoster(roster_path) as roster:
+        chunks = list(roster.iter_profile_columns(batch_rows=2))
+        assert [chunk.row_count for chunk in chunks] == [2, 2, 1]
+        assert np.shares_memory(chunks[0].carb_mode, roster.records)
+        assert np.shares_memory(chunks[0].weight_kg, roster.records)
+        records = [
+            record
+            for chunk in iter_calculated_chunks(chunks)
+            for record in iter_chunk_records(chunk)
+        ]
+        expected = [
+            service.calculate(MealPlanRequest.model_validate(roster.request_payload(athlete)))
+            for athlete in ("carol", "alice", "bob", "dave", "erin")
+        ]
+
+    assert [record.response_json for record in records] == [
+        response.model_dump_json() for response in expected
+    ]
+
+
+def test_writer_defaults_ids_to_row_numbers_and_rejects_duplicates(tmp_path: Path) -> None:
+    path = tmp_path / "roster.mpr"
+    with BinaryRosterWriter(path) as writer:
+        writer.write(_columns([0, 1]))
+    with BinaryRoster(path) as roster:
+        assert roster.offset_of("1") == HEADER_SIZE + RECORD_SIZE
+
+    with (
+        pytest.raises(ValidationError, match=r"^athlete_id: duplicate athlete 'a'$"),
+        BinaryRosterWriter(tmp_path / "dupes.mpr") as writer,
+    ):
+        writer.write(_columns([0, 1]), ["a", "a"])
+        writer.close()
+
+
+def test_writer_rejects_values_outside_fixed_width_range(tmp_path: Path) -> None:
+    columns = _columns([0, 0])
+    columns.zones_minutes[1, 3] = 70_000
+
+    with (
+        pytest.raises(ValidationError, match=r"^row 1: zones_minutes: must be between 0 and "),
+        BinaryRosterWriter(tmp_path / "roster.mpr") as writer,
+    ):
+        writer.write(columns)
+
+
+def test_open_rejects_foreign_files(tmp_path: Path) -> None:
+    path = tmp_path / "roster.mpr"
+    path.write_bytes(b"not a roster" * 4)
+
+    with pytest.raises(ValidationError, match=r"not a mealplan binary roster file$"):
+        BinaryRoster(path)
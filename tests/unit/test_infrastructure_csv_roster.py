@@ -0,0 +1,164 @@
+"""Tests for the streaming CSV roster reader."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mealplan.application.columnar import (  # noqa: E402
+    iter_calculated_chunks,
+    iter_chunk_records,
+)
+from mealplan.application.contracts import MealPlanRequest  # noqa: E402
+from mealplan.application.orchestration import MealPlanCalculationService  # noqa: E402
+from mealplan.infrastructure.csv_roster import (  # noqa: E402
+    CSV_ROSTER_HEADER,
+    csv_roster_lines,
+    iter_csv_profile_columns,
+    resolve_csv_columns,
+)
+from mealplan.shared.errors import ValidationError  # noqa: E402
+
+HEADER = (
+    "age,gender,height_cm,weight_kg,activity_level,carb_mode,training_load_tomorrow,"
+    "zone1,zone2,zone3,zone4,zone5,training_before_meal,vo2max\n"
+)
+ROWS = (
+    "35,male,178,72.5,medium,periodized,high,20,40,0,0,0,lunch,\n"
+    "35,male,178,72.5,medium,low,high,20,40,,,,breakfast,\n"
+    "\n"
+    "40, male ,180,75.0,medium,low,low,,,,,,,58\n"
+)
+
+
+def _expected_requests() -> list[MealPlanRequest]:
+    base = {
+        "age": 35,
+        "gender": "male",
+        "height_cm": 178,
+        "weight_kg": 72.5,
+        "activity_level": "medium",
+        "training_load_tomorrow": "high",
+    }
+    zones = {"1": 20, "2": 40}
+    return [
+        MealPlanRequest.model_validate(
+            {
+                **base,
+                "carb_mode": "periodized",
+                "training_session": {"zones_minutes": zones, "training_before_meal": "lunch"},
+            }
+        ),
+        MealPlanRequest.model_validate(
+            {
+                **base,
+                "carb_mode": "low",
+                "training_session": {"zones_minutes": zones, "training_before_meal": "breakfast"},
+            }
+        ),
+        MealPlanRequest.model_validate(
+            {
+                "age": 40,
+                "gender": "male",
+                "height_cm": 180,
+                "weight_kg": 75.0,
+                "activity_level": "medium",
+                "carb_mode": "low",
+                "training_load_tomorrow": "low",
+                "vo2max": 58,
+            }
+        ),
+    ]
+
+
+def test_csv_roster_matches_scalar_service_across_chunks() -> None:
+    service = MealPlanCalculationService()
+
+    roster = iter_csv_profile_columns(io.StringIO(HEADER + ROWS), batch_rows=2)
+    chunks = iter_calculated_chunks(roster)
+    records = [record for chunk in chunks for record in iter_chunk_records(chunk)]
+
+    assert [record.row for record in records] == [0, 1, 2]
+    for record, request in zip(records, _expected_requests(), strict=True):
+        assert record.response_json == service.calculate(request).model_dump_json()
+
+
+def test_csv_roster_applies_header_mapping_and_ignores_unknown_columns() -> None:
+    csv_text = (
+        "athlete,Age,gender,height_cm,weight_kg,activity_level,carb_mode,training_load_tomorrow\n"
+        "a-1,40,female,165,60.0,high,normal,medium\n"
+    )
+
+    (columns,) = iter_csv_profile_columns(
+        io.StringIO(csv_text), batch_rows=8, column_mapping={"age": "Age"}
+    )
+
+    assert columns.age.tolist() == [40]
+    assert columns.gender.tolist() == [1]
+    assert columns.zones_minutes.tolist() == [[0, 0, 0, 0, 0]]
+    assert np.isnan(columns.vo2max).all()
+
+
+@pytest.mark.parametrize(
+    ("row", "message"),
+    [
+        ("40,male,180,75.0,medium,keto,low", r"^row 1: carb_mode: invalid value 'keto'; "),
+        ("40,male,180,75.0,medium,low,", r"^row 1: training_load_tomorrow: required$"),
+        ("40.5,male,180,75.0,medium,low,low", r"^row 1: age: expected integer, got '40.5'$"),
+        ("40,male,180,heavy,medium,low,low", r"^row 1: weight_kg: expected number, got 'heavy'$"),
+        (
+            "99999999999999999999,male,180,75.0,medium,low,low",
+            r"^row 1: age: expected integer, got '99999999999999999999'$",
+        ),
+        (
+            "40,male,180,nan,medium,low,low",
+            r"^row 1: weight_kg: expected finite number, got 'nan'$",
+        ),
+        (
+            "40,male,180,1e400,medium,low,low",
+            r"^row 1: weight_kg: expected finite number, got '1e400'$",
+        ),
+        ("40,male,180", r"^row 1: expected 7 fields, got 3$"),
+    ],
+)
+def test_csv_roster_reports_first_invalid_row(row: str, message: str) -> None:
+    csv_text = (
+        "age,gender,height_cm,weight_kg,activity_level,carb_mode,training_load_tomorrow\n"
+        "40,male,180,75.0,medium,low,low\n"
+        f"{row}\n"
+    )
+
+    with pytest.raises(ValidationError, match=message):
+        list(iter_csv_profile_columns(io.StringIO(csv_text), batch_rows=8))
+
+
+def test_resolve_csv_columns_rejects_missing_required_and_unknown_mapping() -> None:
+    with pytest.raises(ValidationError, match=r"^roster: missing required columns: gender, "):
+        resolve_csv_columns(["age"])
+    with pytest.raises(ValidationError, match=r"unknown roster fields in column mapping"):
+        resolve_csv_columns(HEADER.strip().split(","), {"sex": "gender"})
+    with pytest.raises(ValidationError, match=r"mapped CSV column 'Sex' not found"):
+        resolve_csv_columns(HEADER.strip().split(","), {"gender": "Sex"})
+
+
+def test_csv_roster_rejects_empty_input() -> None:
+    with pytest.raises(ValidationError, match=r"^roster: empty CSV"):
+        list(iter_csv_profile_columns(io.StringIO(""), batch_rows=8))
+
+
+def test_csv_roster_lines_round_trip_through_reader() -> None:
+    columns = next(iter_csv_profile_columns(io.StringIO(HEADER + ROWS), batch_rows=10))
+
+    lines = csv_roster_lines(columns)
+    text = "\n".join([CSV_ROSTER_HEADER, *lines]) + "\n"
+    (round_tripped,) = iter_csv_profile_columns(io.StringIO(text), batch_rows=10)
+
+    assert f"{CSV_ROSTER_HEADER}\n" == HEADER
+    assert lines[0] == "35,male,178,72.5,medium,periodized,high,20,40,0,0,0,lunch,"
+    assert lines[2] == "40,male,180,75.0,medium,low,low,0,0,0,0,0,,58"
+    for name in ("age", "gender", "weight_kg", "zones_minutes", "training_before_meal"):
+        assert np.array_equal(getattr(round_tripped, name), getattr(columns, name))
+    assert np.array_equal(round_tripped.vo2max, columns.vo2max, equal_nan=True)
@@ -0,0 +1,146 @@
+"""Unit tests for the cross-process shared-memory result cache."""
+
+from __future__ import annotations
+
+import multiprocessing
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mealplan.application.cache import CachedResult, CachingCalculationService
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.domain.energy import ACTIVITY_FACTOR_BY_LEVEL
+from mealplan.domain.enums import ActivityLevel
+from mealplan.infrastructure.shared_cache import SharedMemoryResultCache
+from mealplan.shared.errors import ConfigError
+
+
+def _result(payload: dict[str, Any]) -> CachedResult:
+    response = MealPlanCalculationService().calculate(MealPlanRequest.model_validate(payload))
+    return CachedResult(response=response, warnings=("simulated warning",))
+
+
+def _calculate_in_child(path: str, payload: dict[str, Any], repeats: int) -> None:
+    service = CachingCalculationService(SharedMemoryResultCache(path))
+    request = MealPlanRequest.model_validate(payload)
+    for _ in range(repeats):
+        service.calculate(request)
+    service.close()
+
+
+def test_results_round_trip_between_mappings(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    path = str(tmp_path / "cache.shm")
+    result = _result(meal_plan_request_payload)
+
+    with SharedMemoryResultCache(path) as writer, SharedMemoryResultCache(path) as reader:
+        writer.put("key", result)
+        cached = reader.get("key")
+        missing = reader.get("other")
+        stats = writer.stats()
+
+    assert cached is not None
+    assert cached.response.model_dump_json() == result.response.model_dump_json()
+    assert cached.warnings == ("simulated warning",)
+    assert missing is None
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_stored_engine_response_reads_back_unchanged(
+    tmp_path: Path,
+    meal_plan_response_payload: dict[str, Any],
+) -> None:
+    """Hits decode through trusted construction, like the response that was stored."""
+    trusted = MealPlanResponse.from_engine_payload(
+        {**meal_plan_response_payload, "meals": meal_plan_response_payload["meals"][::-1]}
+    )
+    path = str(tmp_path / "cache.shm")
+
+    with SharedMemoryResultCache(path) as writer, SharedMemoryResultCache(path) as reader:
+        writer.put("key", CachedResult(response=trusted, warnings=()))
+        cached = reader.get("key")
+
+    assert cached is not None
+    assert cached.response == trusted
+
+
+def test_worker_processes_share_one_hit_pool(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    path = str(tmp_path / "cache.shm")
+    context = multiprocessing.get_context("spawn")
+
+    for _ in range(2):
+        child = context.Process(
+            target=_calculate_in_child, args=(path, meal_plan_request_payload, 5)
+        )
+        child.start()
+        child.join(timeout=60)
+        assert child.exitcode == 0
+
+    with SharedMemoryResultCache(path) as cache:
+        stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (9, 1, 1)
+
+
+def test_bucket_keeps_most_recently_used_entries(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    result = _result(meal_plan_request_payload)
+    with SharedMemoryResultCache(
+        str(tmp_path / "cache.shm"), max_entries=2, ways=2, stripes=1
+    ) as cache:
+        cache.put("a", result)
+        cache.put("b", result)
+        assert cache.get("a") is not None
+        cache.put("c", result)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats().evictions == 1
+
+
+def test_results_larger_than_a_slot_are_not_cached(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    with SharedMemoryResultCache(str(tmp_path / "cache.shm"), slot_size=256) as cache:
+        cache.put("key", _result(meal_plan_request_payload))
+
+        assert cache.get("key") is None
+
+
+def test_rule_change_clears_existing_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    path = str(tmp_path / "cache.shm")
+    with SharedMemoryResultCache(path) as cache:
+        cache.put("key", _result(meal_plan_request_payload))
+
+    monkeypatch.setitem(ACTIVITY_FACTOR_BY_LEVEL, ActivityLevel.MEDIUM, 1.4)
+    with SharedMemoryResultCache(path) as cache:
+        assert cache.get("key") is None
+        assert cache.stats().size == 0
+
+
+def test_existing_geometry_wins_and_foreign_files_are_refused(tmp_path: Path) -> None:
+    path = str(tmp_path / "cache.shm")
+    with SharedMemoryResultCache(path, max_entries=8, ways=2):
+        pass
+    with SharedMemoryResultCache(path, max_entries=1024) as cache:
+        assert cache.max_entries == 8
+
+    foreign = tmp_path / "notes.txt"
+    foreign.write_text("keep me" * 100, encoding="utf-8")
+    with pytest.raises(ConfigError, match="not a mealplan shared cache"):
+        SharedMemoryResultCache(str(foreign))
+    assert foreign.read_text(encoding="utf-8") == "keep me" * 100
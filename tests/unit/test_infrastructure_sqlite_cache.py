@@ -0,0 +1,143 @@
+"""Unit tests for the persistent SQLite result cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mealplan.application.cache import CachedResult, CachingCalculationService
+from mealplan.application.contracts import MealPlanRequest, MealPlanResponse
+from mealplan.application.orchestration import MealPlanCalculationService
+from mealplan.domain.energy import ACTIVITY_FACTOR_BY_LEVEL
+from mealplan.domain.enums import ActivityLevel
+from mealplan.infrastructure.rule_version import rule_version_hash
+from mealplan.infrastructure.sqlite_cache import SqliteResultCache
+from mealplan.shared.errors import ConfigError
+
+
+def _result(payload: dict[str, Any]) -> CachedResult:
+    response = MealPlanCalculationService().calculate(MealPlanRequest.model_validate(payload))
+    return CachedResult(response=response, warnings=("simulated warning",))
+
+
+def test_results_round_trip_across_connections(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    path = str(tmp_path / "cache.sqlite3")
+    result = _result(meal_plan_request_payload)
+
+    with SqliteResultCache(path) as cache:
+        cache.put("key", result)
+    with SqliteResultCache(path) as cache:
+        cached = cache.get("key")
+        missing = cache.get("other")
+
+    assert cached is not None
+    assert cached.response.model_dump_json() == result.response.model_dump_json()
+    assert cached.warnings == ("simulated warning",)
+    assert missing is None
+
+
+def test_stored_engine_response_reads_back_unchanged(
+    tmp_path: Path,
+    meal_plan_response_payload: dict[str, Any],
+) -> None:
+    """Hits decode through trusted construction, like the response that was stored."""
+    trusted = MealPlanResponse.from_engine_payload(
+        {**meal_plan_response_payload, "meals": meal_plan_response_payload["meals"][::-1]}
+    )
+    path = str(tmp_path / "cache.sqlite3")
+
+    with SqliteResultCache(path) as cache:
+        cache.put("key", CachedResult(response=trusted, warnings=()))
+    with SqliteResultCache(path) as cache:
+        cached = cache.get("key")
+
+    assert cached is not None
+    assert cached.response == trusted
+
+
+def test_rule_change_invalidates_entries(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    path = str(tmp_path / "cache.sqlite3")
+    original_version = rule_version_hash()
+    with SqliteResultCache(path) as cache:
+        cache.put("key", _result(meal_plan_request_payload))
+
+    monkeypatch.setitem(ACTIVITY_FACTOR_BY_LEVEL, ActivityLevel.MEDIUM, 1.4)
+    assert rule_version_hash() != original_version
+    with SqliteResultCache(path) as cache:
+        assert cache.get("key") is None
+        assert cache.stats().size == 0
+
+
+def test_eviction_keeps_most_recently_used_entries(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    result = _result(meal_plan_request_payload)
+    with SqliteResultCache(str(tmp_path / "cache.sqlite3"), max_entries=10) as cache:
+        for index in range(10):
+            cache.put(f"key-{index}", result)
+        assert cache.get("key-0") is not None
+        cache.put("key-10", result)
+
+        stats = cache.stats()
+        assert stats.size == 9
+        assert stats.evictions == 2
+        assert cache.get("key-0") is not None
+        assert cache.get("key-1") is None
+        assert cache.get("key-10") is not None
+
+
+def test_counters_persist_and_clear_resets_them(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    path = str(tmp_path / "cache.sqlite3")
+    with SqliteResultCache(path) as cache:
+        cache.put("key", _result(meal_plan_request_payload))
+        cache.get("key")
+        cache.get("missing")
+
+    with SqliteResultCache(path) as cache:
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert cache.clear() == 1
+        cleared = cache.stats()
+        cache.vacuum()
+
+    assert (cleared.hits, cleared.misses, cleared.size) == (0, 0, 0)
+
+
+def test_caching_service_reads_through_sqlite(
+    tmp_path: Path,
+    meal_plan_request_payload: dict[str, Any],
+) -> None:
+    path = str(tmp_path / "cache.sqlite3")
+    request = MealPlanRequest.model_validate(meal_plan_request_payload)
+
+    first_run = CachingCalculationService(SqliteResultCache(path))
+    first = first_run.calculate(request)
+    first_run.close()
+    second_run = CachingCalculationService(SqliteResultCache(path))
+    second = second_run.calculate(request)
+    stats = second_run.cache.stats()
+    second_run.close()
+
+    assert second.model_dump_json() == first.model_dump_json()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_unusable_database_raises_config_error(tmp_path: Path) -> None:
+    path = tmp_path / "not-a-db.sqlite3"
+    path.write_bytes(b"definitely not sqlite" * 100)
+
+    with pytest.raises(ConfigError, match="cache database"):
+        SqliteResultCache(str(path))
@@ -0,0 +1,44 @@
+"""Tests for the paranoid self-check switch."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from mealplan.shared.checks import (
+    PARANOID_CHECKS_ENV_VAR,
+    paranoid_checks_enabled,
+    set_paranoid_checks,
+)
+
+
+def test_test_suite_runs_with_paranoid_checks() -> None:
+    assert paranoid_checks_enabled()
+
+
+def test_set_paranoid_checks_overrides_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("mealplan.shared.checks._paranoid_checks", True)
+
+    set_paranoid_checks(False)
+
+    assert not paranoid_checks_enabled()
+
+
+@pytest.mark.parametrize(("value", "expected"), [("", "False"), ("0", "False"), ("1", "True")])
+def test_paranoid_checks_read_from_environment(value: str, expected: str) -> None:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from mealplan.shared.checks import paranoid_checks_enabled; "
+            "print(paranoid_checks_enabled())",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={PARANOID_CHECKS_ENV_VAR: value},
+    )
+
+    assert completed.stdout.strip() == expected